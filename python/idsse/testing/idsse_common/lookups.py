@@ -0,0 +1,117 @@
+"""Read-only lookup tables compiled once from FORECAST_VAR_CONFIG, so every question about
+weather elements, units and operators is a single dict or set lookup"""
+
+# --------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved. (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# --------------------------------------------------------------------------------
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from .constants import FORECAST_VAR_CONFIG
+
+_FIELDS = FORECAST_VAR_CONFIG["field"]
+_UNITS = FORECAST_VAR_CONFIG["units"]
+_RELATIONAL = FORECAST_VAR_CONFIG["relational"]
+
+
+def _freeze(mapping: dict) -> Mapping:
+    return MappingProxyType(mapping)
+
+
+# units allowed for each field, e.g. "Temp": {"Fahrenheit", "Celsius"}
+FIELD_UNITS: Mapping[str, frozenset[str]] = _freeze(
+    {field: frozenset(config["units"]) for field, config in _FIELDS.items()}
+)
+# short display name of each field, e.g. "WindGust": "Wnd Gst"
+FIELD_ABBREVIATIONS: Mapping[str, str] = _freeze(
+    {field: config["abvName"] for field, config in _FIELDS.items()}
+)
+FIELD_TIME_WINDOW: Mapping[str, int] = _freeze(
+    {field: config["timeWindowHours"] for field, config in _FIELDS.items()}
+)
+# fields accumulated (or aggregated) over each window length, e.g. 24: ("Ice:24HR", "MaxTemp", ...)
+FIELDS_BY_TIME_WINDOW: Mapping[int, tuple[str, ...]] = _freeze(
+    {
+        hours: tuple(field for field, window in FIELD_TIME_WINDOW.items() if window == hours)
+        for hours in sorted(set(FIELD_TIME_WINDOW.values()))
+    }
+)
+# criteria builder category of each field, e.g. "Ceiling": "aviation". Reverse of
+# `criteriaBuilderFields`; fields in no category are not keys
+FIELD_CATEGORY: Mapping[str, str] = _freeze(
+    {
+        field: category
+        for category, fields in FORECAST_VAR_CONFIG["criteriaBuilderFields"].items()
+        for field in fields
+    }
+)
+# field names by lower case, since requests and profiles aren't consistent, e.g. "WINDSPEED"
+FIELDS_BY_LOWER_NAME: Mapping[str, str] = _freeze({field.lower(): field for field in _FIELDS})
+
+UNIT_ABBREVIATIONS: Mapping[str, str] = _freeze(
+    {unit: config["abv"] for unit, config in _UNITS.items()}
+)
+UNIT_NAMES: Mapping[str, str] = _freeze({unit: config["name"] for unit, config in _UNITS.items()})
+# every spelling of each unit, lower case: key, display name and abbreviation (unless empty),
+# e.g. "milesperhour", "miles per hour" and "mph" are all "MilesPerHour". Fields use
+# a few keys with different capitalization than the units table (e.g. "KiloFeet"), so always
+# look units up through here, lower case
+UNITS_BY_SPELLING: Mapping[str, str] = _freeze(
+    {
+        spelling.lower(): unit
+        for unit, config in reversed(_UNITS.items())
+        for spelling in (config["abv"], config["name"], unit)
+        if spelling
+    }
+)
+
+# symbol of each relational, e.g. "GREATER THAN OR EQUAL": ">="
+RELATIONAL_SYMBOLS: Mapping[str, str] = _freeze(
+    {relational: config["symbol"] for relational, config in _RELATIONAL.items()}
+)
+RELATIONAL_TEXT: Mapping[str, str] = _freeze(
+    {relational: config["text"] for relational, config in _RELATIONAL.items()}
+)
+# operator used in Profile thresholds for each relational, e.g. "GREATER THAN OR EQUAL":
+# "GREATER_THAN_OR_EQUAL_TO"
+RELATIONAL_OPERATORS: Mapping[str, str] = _freeze(
+    {
+        relational: relational.replace(" ", "_") + ("_TO" if relational.endswith("EQUAL") else "")
+        for relational in _RELATIONAL
+    }
+)
+# relational of every spelling of it: `relational` key, Profile operator (with or without
+# trailing "_TO") or symbol, e.g. "GREATER_THAN_OR_EQUAL_TO": "GREATER THAN OR EQUAL"
+OPERATOR_RELATIONALS: Mapping[str, str] = _freeze(
+    {
+        spelling: relational
+        for relational, operator in RELATIONAL_OPERATORS.items()
+        for spelling in (
+            relational,
+            operator,
+            operator.removesuffix("_TO"),
+            RELATIONAL_SYMBOLS[relational],
+        )
+    }
+)
+
+
+def resolve_units(units: str) -> str | None:
+    """Units key in FORECAST_VAR_CONFIG for any spelling of units, e.g. "mph" or "Miles Per Hour"
+    are "MilesPerHour". None if unrecognized
+    """
+    return UNITS_BY_SPELLING.get(units.lower())
+
+
+def resolve_relational(operator: str) -> str | None:
+    """Relational key in FORECAST_VAR_CONFIG for a Profile operator, relational or symbol, e.g.
+    "GREATER_THAN_OR_EQUAL_TO" or ">=" are "GREATER THAN OR EQUAL". None if unrecognized
+    """
+    return OPERATOR_RELATIONALS.get(operator.strip().upper())
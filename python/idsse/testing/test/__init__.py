@@ -0,0 +1 @@
+"""Tests for idsse.testing"""
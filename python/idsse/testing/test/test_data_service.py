@@ -0,0 +1,256 @@
+"""Tests for utils/data_service.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring,redefined-outer-name,protected-access
+
+from copy import deepcopy
+
+import numpy as np
+import xarray as xr
+from pytest import approx, fixture, importorskip, mark, raises
+
+from idsse.testing.utils.data_service import (
+    RESPONSE_OFFSET,
+    RESPONSE_SCALE,
+    LocalDataService,
+    _evaluate_expression,
+    _threat_level,
+)
+from idsse.testing.utils.resources import get_resource_from_file
+
+# constants
+VALID_DT = "2023-01-11T06:00:00.000Z"
+
+
+def _data_source(field: str, units: str, product: str = "NBM", **extra) -> dict:
+    return {
+        "sourceType": "data",
+        "sourceObj": {
+            "product": product,
+            "units": units,
+            "field": field,
+            "issueDt": "2023-01-10T08:00:00.000Z",
+            "validDt": [VALID_DT],
+            "slice": "[910:920,829:839]",
+            **extra,
+        },
+    }
+
+
+def _decode(response: dict, valid: str) -> np.ndarray:
+    return np.array(response["data"][valid]) * response["scale"] + response["offset"]
+
+
+# fixtures
+@fixture(scope="module")
+def service() -> LocalDataService:
+    # GRIB2 fixtures are decoded once per service, so share one across tests
+    importorskip("cfgrib")
+    return LocalDataService()
+
+
+@fixture
+def dsd_request() -> dict:
+    return get_resource_from_file("idsse.testing.data_access", "dsd_request.json")
+
+
+# tests
+def test_dsd_request(service: LocalDataService, dsd_request: dict):
+    original = deepcopy(dsd_request)
+
+    response = service.handle(dsd_request)
+
+    assert dsd_request == original  # request isn't modified
+    assert (response["scale"], response["offset"]) == (RESPONSE_SCALE, RESPONSE_OFFSET)
+    assert response["parts"] == dsd_request["parts"]
+    assert list(response["data"]) == dsd_request["valids"]
+    for valid in dsd_request["valids"]:
+        encoded = np.array(response["data"][valid])
+        assert encoded.shape == (100, 100)
+        assert encoded.min() >= 0 and encoded.max() <= 200  # threat levels -1 to 1
+    # fixtures have one valid time, so every valid time is the same
+    assert response["data"][dsd_request["valids"][0]] == response["data"][dsd_request["valids"][1]]
+
+
+def test_dsd_request_expressions(service: LocalDataService, dsd_request: dict):
+    valid = dsd_request["valids"][0]
+    levels = {}
+    for expression in ["A", "B", "A AND B", "A OR B", "(B OR A) AND A"]:
+        levels[expression] = _decode(
+            service.handle({**dsd_request, "dataRequest": expression}), valid
+        )
+
+    assert not np.array_equal(levels["A"], levels["B"])
+    np.testing.assert_allclose(levels["A AND B"], np.minimum(levels["A"], levels["B"]))
+    np.testing.assert_allclose(levels["A OR B"], np.maximum(levels["A"], levels["B"]))
+    np.testing.assert_allclose(levels["(B OR A) AND A"], levels["A"])
+
+
+@mark.parametrize("expression", ["A AND", "(A AND B", "A B", "A AND C", "A XOR B", ""])
+def test_invalid_expressions(expression: str):
+    operands = {"A": np.zeros(2), "B": np.ones(2)}
+
+    with raises(ValueError):
+        _evaluate_expression(expression, operands)
+
+
+def test_expression_precedence():
+    operands = {"A": np.array([0.0]), "B": np.array([1.0]), "C": np.array([0.5])}
+
+    # AND binds tighter than OR
+    assert _evaluate_expression("B OR A AND C", operands)[0] == 1.0
+    assert _evaluate_expression("(B OR A) AND C", operands)[0] == 0.5
+    assert _evaluate_expression("A AND C OR B", operands)[0] == 1.0
+
+
+def test_threat_level():
+    values = np.array([-10.0, 0.0, 5.0, 10.0, 20.0, 30.0])
+    mapping = {"min": 0.0, "max": 20.0}
+
+    greater = _threat_level(values, "GT", 10, mapping)
+    np.testing.assert_allclose(greater, [-1, -1, -0.5, 0, 1, 1])
+    assert greater.dtype == np.float32
+    np.testing.assert_allclose(
+        _threat_level(values, "less than or equal", 10, mapping), [1, 1, 0.5, 0, -1, -1]
+    )
+    np.testing.assert_allclose(
+        _threat_level(values, "GTE", 10, {**mapping, "clip": "false"}), [-2, -1, -0.5, 0, 1, 2]
+    )
+    with raises(ValueError):
+        _threat_level(values, "ABOUT", 10, mapping)
+
+
+def test_task_request(service: LocalDataService):
+    request = get_resource_from_file(
+        "idsse.testing.data_access", "task_handler_request_windspeed_and_temp.json"
+    )
+
+    response = service.handle(request)
+
+    assert response["request"] == request
+    result = response["data_requested"]
+    assert result["units"] == "Probability"
+    assert result["dataName"] == "AND(WINDSPEED, TEMP)"
+    assert result["validDt"] == [VALID_DT]
+    assert result["data"].shape == (1, 100, 100)
+    assert result["data"].min() >= 0 and result["data"].max() <= 1
+    assert "filenames" not in result
+
+
+def test_available_leads(service: LocalDataService):
+    response = service.handle({"sourceType": "availableLeads"})
+
+    assert response["availableLeads"]
+
+
+def test_data_units_and_members(service: LocalDataService):
+    kelvin = service.evaluate(_data_source("TEMP", "Kelvin"))
+    fahrenheit = service.evaluate(_data_source("TEMP", "F"))
+
+    assert kelvin.shape == (1, 1, 10, 10)
+    np.testing.assert_allclose(fahrenheit, (kelvin - 273.15) * 9 / 5 + 32, rtol=1e-5)
+    low, middle, high = service.evaluate(_data_source("TEMP:[p010,DTRM,p090]", "Kelvin"))
+    np.testing.assert_allclose(middle, kelvin[0], rtol=1e-6)
+    assert np.all(low < middle) and np.all(middle < high)
+    with raises(ValueError):
+        service.evaluate(_data_source("TEMP", "MilesPerHour"))
+
+
+def test_units_and_slice_wrappers(service: LocalDataService):
+    data = _data_source("WINDSPEED", "MetersPerSecond")
+    wrapped = {
+        "sourceType": "units",
+        "sourceObj": {
+            "units": "Knots",
+            "source": {
+                "sourceType": "slice",
+                "sourceObj": {"slice": "[910:915,829:831]", "source": data},
+            },
+        },
+    }
+    del data["sourceObj"]["units"], data["sourceObj"]["slice"]
+    context = {}
+
+    knots = service.evaluate(wrapped, context)
+
+    assert knots.shape == (1, 1, 2, 5)  # slice is columns, then rows
+    assert (context["units"], context["slice"]) == ("Knots", "[910:915,829:831]")
+    meters_per_second = service.evaluate(_data_source("WINDSPEED", "MetersPerSecond"))
+    np.testing.assert_allclose(
+        knots[0, 0], meters_per_second[0, 0, :2, :5] * 3600 / 1852, rtol=1e-6
+    )
+
+
+def test_synthetic_field(service: LocalDataService):
+    source = _data_source("DEWPOINT", "Fahrenheit")
+    source["sourceObj"]["validDt"] = [VALID_DT, "2023-01-11T07:00:00.000Z"]
+
+    values = service.evaluate(source)
+
+    assert values.shape == (1, 2, 10, 10)
+    assert not np.array_equal(values[0, 0], values[0, 1])  # varies by lead time
+    with raises(ValueError, match="No fixture or synthetic grid"):
+        service.evaluate(_data_source("SNOWFALL", "Inches"))
+
+
+def test_field_aliases(service: LocalDataService):
+    values = service.evaluate(_data_source("MAXREF", "DBZ", product="MRMS.HTTP.GRIB"))
+
+    assert values.shape == (1, 1, 10, 10)
+    grid = service._fixture_grid("MRMS", "REFLECTIVITY")
+    assert grid is service._fixture_grid("MRMS", "REFLECTIVITY")  # decoded only once
+    assert not grid.flags.writeable
+
+
+def test_condition_and_unsupported_source(service: LocalDataService):
+    condition = {
+        "sourceType": "condition",
+        "sourceObj": {
+            "relational": "GT",
+            "thresh": 280.0,
+            "mapping": {"min": 270.0, "max": 290.0},
+            "source": _data_source("TEMP:[DTRM,p010,p090]", "Kelvin"),
+        },
+    }
+    context = {}
+
+    levels = service.evaluate(condition, context)
+
+    assert levels.shape == (1, 10, 10)
+    assert context["units"] == "ThreatLevel"
+    mean = service.evaluate(_data_source("TEMP:[DTRM,p010,p090]", "Kelvin")).mean(axis=0)
+    np.testing.assert_allclose(levels, np.clip((mean - 280) / 10, -1, 1), atol=1e-5)
+    with raises(ValueError, match="Unsupported sourceType"):
+        service.evaluate({"sourceType": "mystery", "sourceObj": {}})
+
+
+def test_output_dir(tmp_path):
+    importorskip("cfgrib")
+    service = LocalDataService(str(tmp_path))
+    request = {
+        "label": "freezing",
+        "corrId": {"uuid": "abc"},
+        "sourceType": "probability",
+        "sourceObj": {
+            "relational": "LTE",
+            "thresh": 0.0,
+            "sources": [_data_source("TEMP:[DTRM,p010,p090]", "Celsius")],
+        },
+    }
+
+    result = service.handle(request)["freezing"]
+
+    assert result["filenames"]["dtrm"] == str(tmp_path / "gridstore-abc.nc")
+    with xr.open_dataset(result["filenames"]["dtrm"]) as dataset:
+        assert dataset["grid"].shape == (1, 10, 10)
+        assert dataset.attrs["units"] == "Probability"
+        assert dataset.attrs["dataName"] == "TEMP"
+        assert float(dataset["grid"].values.mean()) == approx(float(result["data"].mean()))
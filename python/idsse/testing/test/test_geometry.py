@@ -0,0 +1,208 @@
+"""Tests for utils/geometry.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring
+
+import numpy as np
+import xarray as xr
+from pytest import mark, raises
+
+from idsse.testing.utils import geometry as geometry_module
+from idsse.testing.utils.geometry import (
+    GeometryIndex,
+    GridDefinition,
+    RasterCache,
+    parse_geojson,
+    parse_geometry,
+    parse_wkt,
+)
+from idsse.testing.utils.resources import get_resource_from_file
+
+# constants
+# same cases nwsc_proxy's spatial index is tested against, so both parse WKT alike
+GEOMETRY_CASES = get_resource_from_file("idsse.testing.nwsc_gateway", "geometry_cases.json")
+
+SQUARE = "POLYGON ((-106 39, -104 39, -104 41, -106 41, -106 39))"
+# square with a square hole in the middle
+DONUT = (
+    "POLYGON ((-106 39, -104 39, -104 41, -106 41, -106 39), "
+    "(-105.5 39.5, -104.5 39.5, -104.5 40.5, -105.5 40.5, -105.5 39.5))"
+)
+SQUARE_GEOJSON = {
+    "type": "Polygon",
+    "coordinates": [[[-106, 39], [-104, 39], [-104, 41], [-106, 41], [-106, 39]]],
+}
+
+
+def _grid(name: str = "test") -> GridDefinition:
+    """0.1 degree grid around the square"""
+    lon, lat = np.meshgrid(np.arange(-107, -102.95, 0.1), np.arange(38, 42.05, 0.1))
+    return GridDefinition(name, lon, lat)
+
+
+# tests
+@mark.parametrize("case", GEOMETRY_CASES["valid"], ids=lambda case: case["name"])
+def test_valid_geometry_cases(case: dict):
+    geometry = parse_wkt(case["wkt"])
+
+    assert geometry.bounds == tuple(case["bounds"])
+    for lon, lat in case["inside"]:
+        assert geometry.contains(lon, lat), (lon, lat)
+    for lon, lat in case["outside"]:
+        assert not geometry.contains(lon, lat), (lon, lat)
+    # many points at once are the same as one at a time
+    points = np.array(case["inside"] + case["outside"], dtype=np.float64)
+    assert geometry.contains(points[:, 0], points[:, 1]).tolist() == [True] * len(
+        case["inside"]
+    ) + [False] * len(case["outside"])
+
+
+@mark.parametrize("case", GEOMETRY_CASES["invalid"], ids=lambda case: case["name"])
+def test_invalid_geometry_cases(case: dict):
+    with raises(ValueError):
+        parse_wkt(case["wkt"])
+
+
+def test_parse_wkt_is_cached():
+    assert parse_wkt(SQUARE) is parse_wkt(SQUARE)
+    (exterior,) = parse_wkt(SQUARE).polygons[0]
+    assert not exterior.flags.writeable  # shared by every caller
+
+
+def test_geojson_matches_wkt():
+    square = parse_wkt(SQUARE)
+
+    assert parse_geojson(SQUARE_GEOJSON).key == square.key
+    assert parse_geojson({"type": "Feature", "geometry": SQUARE_GEOJSON}).key == square.key
+    multi = {"type": "MultiPolygon", "coordinates": [SQUARE_GEOJSON["coordinates"]]}
+    assert parse_geometry(multi).key == square.key
+    assert parse_geometry(SQUARE) is square
+    # same shape, written differently
+    assert parse_wkt("POLYGON((-106.0 39.00,-104 39,-104 41,-106 41))").key == square.key
+    assert parse_wkt(DONUT).key != square.key
+
+
+@mark.parametrize(
+    "geojson",
+    [
+        {"type": "Point", "coordinates": [-105, 40]},
+        {"type": "Feature", "geometry": None},
+        {"type": "Polygon", "coordinates": []},
+        {"type": "Polygon", "coordinates": [[[0, 0], [1, 1]]]},
+        {"type": "Polygon", "coordinates": [[[0, 0], [190, 0], [0, 1]]]},
+    ],
+)
+def test_invalid_geojson(geojson: dict):
+    with raises(ValueError):
+        parse_geojson(geojson)
+
+
+def test_contains_holes():
+    donut = parse_wkt(DONUT)
+    lon, lat = np.meshgrid(np.linspace(-106.5, -103.5, 31), np.linspace(38.5, 41.5, 31))
+
+    inside = donut.contains(lon, lat)
+
+    assert inside.shape == lon.shape
+    in_square = (lon > -106) & (lon < -104) & (lat > 39) & (lat < 41)
+    in_hole = (lon > -105.5) & (lon < -104.5) & (lat > 39.5) & (lat < 40.5)
+    # even-odd rule: inside the exterior, but not the hole
+    on_edge = np.isclose(lon % 0.5, 0) | np.isclose(lat % 0.5, 0)
+    np.testing.assert_array_equal(inside[~on_edge], (in_square & ~in_hole)[~on_edge])
+
+
+def test_contains_large_inputs(monkeypatch):
+    donut = parse_wkt(DONUT)
+    rng = np.random.default_rng(0)
+    lon, lat = rng.uniform(-107, -103, 5000), rng.uniform(38, 42, 5000)
+    broadcast = donut.contains(lon, lat)
+
+    # too many points to test against every edge at once, so each edge is tested in turn
+    monkeypatch.setattr(geometry_module, "_BROADCAST_MAX_ELEMENTS", 0)
+
+    np.testing.assert_array_equal(donut.contains(lon, lat), broadcast)
+    assert 0 < broadcast.sum() < len(broadcast)
+
+
+def test_contains_broadcasts():
+    square = parse_wkt(SQUARE)
+
+    assert square.contains(-105, 40) is True
+    assert square.contains(np.array([-105, -103]), 40).tolist() == [True, False]
+    assert square.contains(-105, np.array([[40], [42]])).shape == (2, 1)
+
+
+def test_geometry_index():
+    index = GeometryIndex()
+    index.add("square", SQUARE)
+    index.add("donut", parse_wkt(DONUT))
+    index.add("east", {"type": "Polygon", "coordinates": [[[10, 50], [11, 50], [11, 51]]]})
+
+    assert len(index) == 3 and "donut" in index
+    assert sorted(index.query_bbox(-105.1, 39.9, -104.9, 40.1)) == ["donut", "square"]
+    assert index.query_point(-105, 40) == ["square"]  # in the donut's hole
+    assert sorted(index.query_point(-105.8, 40)) == ["donut", "square"]
+    assert not index.query_bbox(0, 0, 9.9, 60)
+    assert index.query_bbox(-180, -90, 180, 90).count("east") == 1
+
+    index.remove("square")
+    index.remove("not_indexed")
+    assert not index.query_point(-105, 40)
+    assert index.get("square") is None
+    index.add("square", SQUARE)  # rebuilt on next query
+    assert index.query_point(-105, 40) == ["square"]
+
+
+def test_geometry_index_from_profiles():
+    profiles = [
+        {"id": "square", "geometry": SQUARE},
+        {"id": "no_geometry"},
+        {"id": "point", "geometry": "POINT (-105 40)"},
+        {"id": "null", "geometry": None},
+    ]
+
+    index = GeometryIndex.from_profiles(profiles)
+
+    assert len(index) == 1
+    assert index.get("square") is parse_wkt(SQUARE)
+
+
+def test_grid_from_dataset():
+    dataset = xr.Dataset(
+        coords={"latitude": [41.0, 40.0, 39.0], "longitude": [254.0, 255.0, 256.0, 257.0]}
+    )
+
+    grid = GridDefinition.from_dataset("mrms", dataset)
+
+    assert grid.lon.shape == grid.lat.shape == (3, 4)
+    assert grid.lon[0].tolist() == [-106, -105, -104, -103]  # 0 to 360 becomes -180 to 180
+    assert grid.lat[:, 0].tolist() == [41, 40, 39]
+    assert grid.key == ("mrms", (3, 4))
+
+
+def test_raster_cache():
+    cache = RasterCache()
+    grid = _grid()
+
+    mask = cache.mask(DONUT, grid)
+
+    np.testing.assert_array_equal(mask, parse_wkt(DONUT).contains(grid.lon, grid.lat))
+    assert not mask.flags.writeable
+    assert 0 < mask.sum() < mask.size
+    # same geometry, however given, is rasterized once per grid
+    np.testing.assert_array_equal(cache.mask(parse_wkt(DONUT), grid), mask)
+    assert not cache.mask(DONUT, grid).flags.writeable
+    assert (cache.info()["hits"], cache.info()["entries"]) == (2, 1)
+    cache.mask(DONUT, _grid("other"))
+    assert cache.info()["entries"] == 2
+
+    cache.clear()
+    assert cache.info()["entries"] == 0
@@ -0,0 +1,153 @@
+"""Tests for utils/grid_generator.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring
+
+import os
+from datetime import datetime, UTC
+
+import numpy as np
+import xarray as xr
+import zarr
+from pytest import approx, mark, raises
+
+from idsse.testing.utils.grid_generator import (
+    DEFAULT_MEMBERS,
+    GridGenerator,
+    member_z_score,
+    parse_field_spec,
+)
+
+# constants
+ISSUE_DT = datetime(2026, 10, 19, 12, tzinfo=UTC)
+SMALL_GRID = {"width": 40, "height": 30, "lead_count": 3, "chunk_size": 16, "issue_dt": ISSUE_DT}
+
+
+# tests
+def test_parse_field_spec():
+    assert parse_field_spec("TEMP") == ("TEMP", list(DEFAULT_MEMBERS))
+    assert parse_field_spec(" WINDSPEED:[DTRM, p010,p090] ") == (
+        "WINDSPEED",
+        ["DTRM", "p010", "p090"],
+    )
+    for spec in ["TEMP:[DTRM", "TEMP:DTRM", "[DTRM]", ""]:
+        with raises(ValueError):
+            parse_field_spec(spec)
+
+
+def test_member_z_score():
+    assert member_z_score("DTRM") == member_z_score("dtrm") == 0
+    assert member_z_score("p050") == approx(0)
+    assert member_z_score("p090") == approx(1.2816, abs=1e-4)
+    assert member_z_score("P010") == approx(-member_z_score("p090"))
+    for member in ["p000", "p100", "p5", "mean"]:
+        with raises(ValueError):
+            member_z_score(member)
+
+
+@mark.parametrize(
+    "kwargs",
+    [
+        {"field": "SNOW"},
+        {"field": "TEMP:[p100]"},
+        {"grid": "hrrr"},
+        {"lead_count": 0},
+        {"chunk_size": 0},
+    ],
+)
+def test_invalid_arguments(kwargs: dict):
+    with raises(ValueError):
+        GridGenerator(**kwargs)
+
+
+def test_default_grid_size():
+    generator = GridGenerator(grid="mrms")
+
+    assert generator.data().shape == (1, 12, 3500, 7000)  # lazy, so nothing is computed
+
+
+def test_data_reproducible():
+    data = GridGenerator("TEMP:[DTRM,p010]", seed=1, **SMALL_GRID).data()
+
+    assert data.shape == (2, 3, 30, 40)
+    assert data.dtype == np.float32
+    assert data.chunksize == (1, 1, 16, 16)
+    np.testing.assert_array_equal(
+        data.compute(), GridGenerator("TEMP:[DTRM,p010]", seed=1, **SMALL_GRID).data().compute()
+    )
+    assert not np.array_equal(
+        data.compute(), GridGenerator("TEMP:[DTRM,p010]", seed=2, **SMALL_GRID).data().compute()
+    )
+
+
+def test_members_ordered_and_bounded():
+    generator = GridGenerator("WINDSPEED:[p010,DTRM,p090]", **SMALL_GRID)
+
+    low, middle, high = generator.data().compute()
+    assert np.all(low <= middle) and np.all(middle <= high)
+    assert np.all(low >= 0)  # wind speed is never negative
+    assert np.any(low < middle)
+
+
+def test_dataset():
+    generator = GridGenerator("REFLECTIVITY:[DTRM,p090]", "mrms", **SMALL_GRID)
+
+    dataset = generator.dataset()
+
+    assert dataset["grid"].dims == ("member", "validDt", "latitude", "longitude")
+    assert list(dataset["member"].values) == ["DTRM", "p090"]
+    assert dataset["validDt"].values[0] == np.datetime64("2026-10-19T13:00")
+    assert dataset["latitude"].values[[0, -1]].tolist() == [54.995, 54.705]
+    assert dataset["longitude"].values[[0, -1]].tolist() == [230.005, 230.395]
+    assert dataset.attrs["gridSpec"].startswith("+dx=0.01 +dy=0.01 +w=40 +h=30 ")
+    assert dataset.attrs["members"] == "DTRM,p090"
+    # NBM grids are projected, so have no coordinates
+    assert not GridGenerator(**SMALL_GRID).dataset().coords.keys() - {"member", "validDt"}
+
+
+def test_write_netcdf(tmp_path):
+    generator = GridGenerator("TEMP:[DTRM,p090]", **SMALL_GRID)
+
+    filepaths = generator.write_netcdf(str(tmp_path))
+
+    assert [os.path.basename(path) for path in filepaths] == [
+        "2026_10_19_13_00_TEMP_DTRM.nc",
+        "2026_10_19_14_00_TEMP_DTRM.nc",
+        "2026_10_19_15_00_TEMP_DTRM.nc",
+        "2026_10_19_13_00_TEMP_P090.nc",
+        "2026_10_19_14_00_TEMP_P090.nc",
+        "2026_10_19_15_00_TEMP_P090.nc",
+    ]
+    with xr.open_dataset(filepaths[4], engine="netcdf4") as dataset:
+        assert dataset["grid"].dims == ("y", "x")
+        assert dataset.attrs["field"] == "TEMP:p090"
+        assert dataset.attrs["validDt"] == "2026-10-19 14:00:00+00:00"
+        assert dataset.attrs["dataKey"] == (
+            "NBM.AWS.GRIB:CONUS:TEMP:p090::Fahrenheit::20261019120000.20261019140000"
+        )
+        np.testing.assert_array_equal(dataset["grid"].values, generator.data()[1, 1].compute())
+
+
+@mark.parametrize("filename", ["grid.zarr", "grid.zarr.zip"])
+def test_write_zarr(tmp_path, filename: str):
+    generator = GridGenerator("TEMP:[DTRM,p090]", **SMALL_GRID)
+    path = os.path.join(tmp_path, "nested", filename)
+
+    assert generator.write_zarr(path) == path
+
+    # zipped stores are read like the Zarr fixtures, see `resources.open_dataset_resource`
+    store = zarr.storage.ZipStore(path, mode="r") if path.endswith(".zip") else path
+    with xr.open_zarr(store) as dataset:
+        assert dataset.attrs["product"] == "NBM.AWS.GRIB"
+        np.testing.assert_array_equal(dataset["grid"].values, generator.data().compute())
+    if store is not path:
+        store.close()
+    assert os.listdir(os.path.dirname(path)) == [filename]  # temporary store is removed
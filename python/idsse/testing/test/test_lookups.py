@@ -0,0 +1,129 @@
+"""Tests for idsse_common/lookups.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring
+
+from pytest import mark, raises
+
+from idsse.testing.idsse_common.constants import FORECAST_VAR_CONFIG
+from idsse.testing.idsse_common.lookups import (
+    FIELD_ABBREVIATIONS,
+    FIELD_CATEGORY,
+    FIELD_TIME_WINDOW,
+    FIELD_UNITS,
+    FIELDS_BY_LOWER_NAME,
+    FIELDS_BY_TIME_WINDOW,
+    RELATIONAL_OPERATORS,
+    RELATIONAL_SYMBOLS,
+    RELATIONAL_TEXT,
+    UNIT_ABBREVIATIONS,
+    UNIT_NAMES,
+    resolve_relational,
+    resolve_units,
+)
+
+
+# tests
+def test_field_lookups():
+    fields = set(FORECAST_VAR_CONFIG["field"])
+
+    assert set(FIELD_UNITS) == set(FIELD_ABBREVIATIONS) == set(FIELD_TIME_WINDOW) == fields
+    assert FIELD_UNITS["Temp"] == frozenset({"Fahrenheit", "Celsius"})
+    assert FIELD_ABBREVIATIONS["WindGust"] == "Wnd Gst"
+    assert FIELDS_BY_LOWER_NAME["windspeed"] == "WindSpeed"
+    assert FIELDS_BY_LOWER_NAME["ice:24hr"] == "Ice:24HR"
+    assert FIELD_CATEGORY["Ceiling"] == "aviation"
+    assert FIELD_CATEGORY["Snow:48HR"] == "precipitation"
+    assert set(FIELD_CATEGORY) <= fields
+
+
+def test_fields_by_time_window():
+    assert list(FIELDS_BY_TIME_WINDOW) == sorted(FIELDS_BY_TIME_WINDOW)
+    assert FIELDS_BY_TIME_WINDOW[48] == ("Snow:48HR",)
+    assert {"Ice:24HR", "MaxTemp", "Precip:24HR"} <= set(FIELDS_BY_TIME_WINDOW[24])
+    # every field is in exactly one window, the one configured for it
+    listed = [field for fields in FIELDS_BY_TIME_WINDOW.values() for field in fields]
+    assert sorted(listed) == sorted(FIELD_TIME_WINDOW)
+    for hours, fields in FIELDS_BY_TIME_WINDOW.items():
+        assert all(FIELD_TIME_WINDOW[field] == hours for field in fields)
+
+
+def test_lookups_are_read_only():
+    with raises(TypeError):
+        FIELD_UNITS["Temp"] = frozenset()  # type: ignore[index]
+    with raises(AttributeError):
+        FIELD_UNITS["Temp"].add("Kelvin")  # type: ignore[attr-defined]
+
+
+@mark.parametrize(
+    "spelling, expected",
+    [
+        ("MilesPerHour", "MilesPerHour"),
+        ("milesperhour", "MilesPerHour"),
+        ("Miles Per Hour", "MilesPerHour"),
+        ("MPH", "MilesPerHour"),
+        ("°F", "Fahrenheit"),
+        ("nmi", "NauticalMiles"),
+        ("KiloFeet", "Kilofeet"),  # fields spell it differently than the units table
+        ("kft", "Kilofeet"),
+        ("dBZ", "DBZ"),
+        ("Furlongs", None),
+        ("", None),
+    ],
+)
+def test_resolve_units(spelling: str, expected: str | None):
+    assert resolve_units(spelling) == expected
+
+
+def test_every_unit_resolves():
+    for unit in FORECAST_VAR_CONFIG["units"]:
+        assert resolve_units(unit) == unit  # no abbreviation or name shadows another unit
+        if UNIT_ABBREVIATIONS[unit]:
+            assert resolve_units(UNIT_ABBREVIATIONS[unit]) == unit
+        if UNIT_NAMES[unit]:
+            assert resolve_units(UNIT_NAMES[unit]) == unit
+    for units in FIELD_UNITS.values():
+        assert all(resolve_units(unit) is not None for unit in units)
+
+
+def test_relational_lookups():
+    assert RELATIONAL_SYMBOLS["GREATER THAN OR EQUAL"] == ">="
+    assert RELATIONAL_TEXT["LESS THAN"] == "less than"
+    assert RELATIONAL_OPERATORS == {
+        "GREATER THAN OR EQUAL": "GREATER_THAN_OR_EQUAL_TO",
+        "LESS THAN OR EQUAL": "LESS_THAN_OR_EQUAL_TO",
+        "GREATER THAN": "GREATER_THAN",
+        "LESS THAN": "LESS_THAN",
+    }
+
+
+@mark.parametrize(
+    "operator, expected",
+    [
+        ("GREATER_THAN_OR_EQUAL_TO", "GREATER THAN OR EQUAL"),
+        ("GREATER_THAN_OR_EQUAL", "GREATER THAN OR EQUAL"),
+        (" less_than ", "LESS THAN"),
+        ("LESS THAN OR EQUAL", "LESS THAN OR EQUAL"),
+        (">=", "GREATER THAN OR EQUAL"),
+        ("<", "LESS THAN"),
+        ("EQUAL", None),
+        ("=>", None),
+    ],
+)
+def test_resolve_relational(operator: str, expected: str | None):
+    assert resolve_relational(operator) == expected
+
+
+def test_every_relational_resolves():
+    for relational, operator in RELATIONAL_OPERATORS.items():
+        assert resolve_relational(relational) == relational
+        assert resolve_relational(operator) == relational
+        assert resolve_relational(RELATIONAL_SYMBOLS[relational]) == relational
@@ -0,0 +1,167 @@
+"""Tests for utils/manifest.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring,protected-access
+
+import os
+
+from pytest import raises
+
+from idsse.testing.utils.manifest import (
+    LFS_POINTER_PREFIX,
+    SKIPPED_EXTENSIONS,
+    TESTING_ROOT,
+    MANIFEST_PATH,
+    _changed_entries,
+    build_manifest,
+    find_resources,
+    get_resource_entry,
+    load_manifest,
+    verify_resource,
+)
+
+
+def _write(path: str, content: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(content)
+
+
+# tests
+def test_manifest_lists_every_resource():
+    on_disk = set()
+    for dirpath, dirnames, filenames in os.walk(TESTING_ROOT):
+        dirnames[:] = [name for name in dirnames if name != "__pycache__"]
+        for filename in filenames:
+            abs_path = os.path.join(dirpath, filename)
+            if not filename.endswith(SKIPPED_EXTENSIONS) and abs_path != MANIFEST_PATH:
+                on_disk.add(os.path.relpath(abs_path, TESTING_ROOT).replace(os.sep, "/"))
+
+    # if this fails, rebuild it: `python -m idsse.testing.utils.manifest`
+    assert {entry["path"] for entry in load_manifest()["resources"]} == on_disk
+
+
+def test_manifest_matches_resource_contents():
+    for entry in load_manifest()["resources"]:
+        assert verify_resource(entry["package"], entry["filename"]), entry["path"]
+
+
+def test_get_resource_entry():
+    entry = get_resource_entry("idsse.testing.nwsc_gateway", "geometry_cases.json")
+
+    assert entry["path"] == "nwsc_gateway/geometry_cases.json"
+    assert entry["json"] == {"valid": True, "type": "object", "keys": ["invalid", "valid"]}
+    assert get_resource_entry("idsse.testing.nwsc_gateway", "not_a_file.json") is None
+    with raises(KeyError):
+        verify_resource("idsse.testing.nwsc_gateway", "not_a_file.json")
+
+
+def test_find_resources_by_pattern_and_format():
+    grib_files = find_resources(pattern="data_access/nbm_aws_grib/*", resource_format="grib2")
+
+    assert len(grib_files) == 2
+    assert all("t2m" in entry["grid"]["variables"] for entry in grib_files)
+    assert not find_resources(pattern="data_access/nbm_aws_grib/*", resource_format="netcdf")
+
+
+def test_find_resources_by_variables_and_predicate():
+    wind_files = find_resources(variables=["t2m", "si10"])
+
+    assert [entry["path"] for entry in wind_files] == [
+        "data_access/nbm_aws_grib/20230401/temp_wind.blend.20230401.t12z.core.f001.co.grib2"
+    ]
+    assert not find_resources(variables=["t2m", "not_a_variable"])
+    # empty placeholder files have no grid, so only match on their path
+    empty = find_resources(resource_format="netcdf", predicate=lambda entry: entry.get("empty"))
+    assert len(empty) == 6
+    assert all("grid" not in entry for entry in empty)
+
+
+def test_find_resources_by_attrs():
+    entry = find_resources(variables=["t2m", "si10"])[0]
+    institution = entry["grid"]["attrs"]["institution"]
+
+    # attributes are not case sensitive
+    assert entry in find_resources(institution=institution.upper())
+    assert entry not in find_resources(institution=f"not {institution}")
+    # falls back to directories in path if attribute is not known, e.g. for empty placeholders
+    guam_files = find_resources(resource_format="netcdf", product="NBM.AWS.GRIB", region="guam")
+    assert [entry["path"] for entry in guam_files] == [
+        "data_access/validation/NBM.AWS.GRIB/GUAM/TEMP/Kelvin/gridstore723294178.nc"
+    ]
+    lfs_entries = find_resources(resource_format="git-lfs-pointer", product="NBM_AWS_ZARR")
+    assert [entry["path"] for entry in lfs_entries] == [
+        "data_access/nbm_aws_zarr/20260310_0100.zarr.zip"
+    ]
+
+
+def test_build_manifest(tmp_path):
+    root = os.path.join(tmp_path, "idsse", "testing")
+    _write(os.path.join(root, "gateway", "object.json"), b'{"b": 1, "a": 2}')
+    _write(os.path.join(root, "gateway", "array.json"), b"[1, 2, 3]")
+    _write(os.path.join(root, "gateway", "broken.json"), b"{")
+    _write(os.path.join(root, "gateway", "empty.nc"), b"")
+    _write(os.path.join(root, "gateway", "module.py"), b"")
+    _write(os.path.join(root, "data-2026", "values.csv"), b"1,2\n")
+    _write(
+        os.path.join(root, "zarr", "grid.zarr.zip"),
+        LFS_POINTER_PREFIX + b"v1\noid sha256:abc123\nsize 2048\n",
+    )
+
+    manifest = build_manifest(root)
+    entries = {entry["path"]: entry for entry in manifest["resources"]}
+
+    assert list(entries) == [  # sorted, skipping Python files
+        "data-2026/values.csv",
+        "gateway/array.json",
+        "gateway/broken.json",
+        "gateway/empty.nc",
+        "gateway/object.json",
+        "zarr/grid.zarr.zip",
+    ]
+    assert entries["gateway/object.json"]["json"] == {
+        "valid": True,
+        "type": "object",
+        "keys": ["a", "b"],
+    }
+    assert entries["gateway/object.json"]["package"] == "idsse.testing.gateway"
+    assert entries["gateway/array.json"]["json"] == {"valid": True, "type": "array", "length": 3}
+    assert entries["gateway/broken.json"]["json"] == {"valid": False}
+    assert entries["gateway/empty.nc"]["empty"]
+    assert "grid" not in entries["gateway/empty.nc"]
+    # directory isn't a valid package name, so file is found relative to its parent package
+    assert entries["data-2026/values.csv"]["package"] == "idsse.testing"
+    assert entries["data-2026/values.csv"]["filename"] == "data-2026/values.csv"
+    assert entries["data-2026/values.csv"]["format"] == "csv"
+    assert entries["zarr/grid.zarr.zip"]["format"] == "git-lfs-pointer"
+    assert entries["zarr/grid.zarr.zip"]["lfs"] == {
+        "format": "zarr.zip",
+        "size": 2048,
+        "sha256": "abc123",
+    }
+
+
+def test_changed_entries(tmp_path):
+    root = os.path.join(tmp_path, "idsse", "testing")
+    _write(os.path.join(root, "gateway", "first.json"), b"{}")
+    _write(os.path.join(root, "gateway", "second.json"), b"{}")
+    old_manifest = build_manifest(root)
+
+    _write(os.path.join(root, "gateway", "first.json"), b"[]")
+    os.remove(os.path.join(root, "gateway", "second.json"))
+    _write(os.path.join(root, "gateway", "third.json"), b"{}")
+
+    assert list(_changed_entries(old_manifest, build_manifest(root))) == [
+        "gateway/first.json",
+        "gateway/second.json",
+        "gateway/third.json",
+    ]
+    assert not list(_changed_entries(old_manifest, old_manifest))
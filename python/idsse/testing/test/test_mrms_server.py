@@ -0,0 +1,240 @@
+"""Tests for utils/mrms_server.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring,redefined-outer-name,protected-access
+
+import gzip
+import re
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from pytest import approx, fixture, mark, raises
+
+from idsse.testing.utils.mrms_server import (
+    GRIB_FILENAME,
+    GRIB_PACKAGE,
+    MRMS_LATENCY,
+    MrmsArchive,
+    MrmsServer,
+    SimulatedClock,
+    _format_size,
+    _parse_range,
+)
+from idsse.testing.utils.resources import get_filepath
+
+# constants
+START = datetime(2024, 12, 16, 20, 0, tzinfo=UTC)
+LISTED_NAME = re.compile(r'<a href="(MRMS_[^"]+)">')
+
+
+def _get(url: str, **headers) -> tuple[int, dict, bytes]:
+    """Status, headers and body of response, including error responses"""
+    try:
+        with urlopen(Request(url, headers=headers), timeout=10) as response:
+            return response.status, dict(response.headers), response.read()
+    except HTTPError as error:
+        with error:
+            return error.code, dict(error.headers), error.read()
+
+
+# fixtures
+@fixture(scope="module")
+def grib_content() -> bytes:
+    with open(get_filepath(GRIB_PACKAGE, GRIB_FILENAME), "rb") as file:
+        return file.read()
+
+
+@fixture
+def archive() -> MrmsArchive:
+    return MrmsArchive(START, count=10)
+
+
+@fixture
+def server(archive: MrmsArchive):
+    # halfway through the archive: file 4 (valid 20:08) appeared at 20:08:30
+    now = archive.modified(4) + timedelta(seconds=10)
+    with MrmsServer(archive, clock=lambda: now) as running_server:
+        yield running_server
+
+
+# tests
+def test_archive_times(archive: MrmsArchive):
+    assert archive.filename(0) == "MRMS_MergedReflectivityQC_00.50_20241216-200000.grib2"
+    assert archive.filename(3) == "MRMS_MergedReflectivityQC_00.50_20241216-200600.grib2"
+    assert archive.modified(3) == START + timedelta(minutes=6) + MRMS_LATENCY
+    assert archive.end == archive.modified(9)
+
+    assert archive.available(START) == 0
+    assert archive.available(archive.modified(0) - timedelta(microseconds=1)) == 0
+    assert archive.available(archive.modified(0)) == 1
+    assert archive.available(archive.modified(3) + timedelta(seconds=119)) == 4
+    assert archive.available(archive.end + timedelta(days=1)) == 10
+
+
+def test_archive_naive_start_is_utc():
+    assert MrmsArchive(START.replace(tzinfo=None), count=1).start == START
+
+
+def test_invalid_cadence():
+    with raises(ValueError):
+        MrmsArchive(START, cadence=timedelta(0))
+
+
+def test_find(archive: MrmsArchive):
+    now = archive.modified(4)
+
+    assert archive.find(archive.filename(4), now) == 4
+    assert archive.find(archive.filename(5), now) is None  # not yet appeared
+    assert archive.find("MRMS_MergedReflectivityQC_00.50.latest.grib2", now) == 4
+    assert archive.find("MRMS_MergedReflectivityQC_00.50.latest.grib2", START) is None
+    assert archive.find("not_a_file.grib2", now) is None
+
+
+def test_listing(archive: MrmsArchive):
+    listing, last_modified = archive.listing(archive.modified(2))
+
+    html = listing.decode()
+    assert last_modified == archive.modified(2)
+    assert "<title>Index of /data/3DRefl/MergedReflectivityQC_00.50</title>" in html
+    assert '<a href="/data/3DRefl/">Parent Directory</a>' in html
+    assert LISTED_NAME.findall(html) == [
+        "MRMS_MergedReflectivityQC_00.50.latest.grib2",
+        archive.filename(0),
+        archive.filename(1),
+        archive.filename(2),
+    ]
+    # as on the NSSL server, latest is listed under the name of the newest file
+    assert f'latest.grib2">{archive.filename(2)}</a>' in html
+    assert "16-Dec-2024 20:04" in html
+    assert ">1.8M</td>" in html
+
+    # listing is only rendered again once a new file appears
+    assert archive.listing(archive.modified(2) + timedelta(seconds=1))[0] is listing
+    assert archive.listing(archive.modified(3))[0] is not listing
+
+
+def test_empty_listing(archive: MrmsArchive):
+    listing, last_modified = archive.listing(START)
+
+    assert last_modified is None
+    assert not LISTED_NAME.findall(listing.decode())
+
+
+def test_compressed_archive(grib_content: bytes):
+    archive = MrmsArchive(START, count=3, compress=True)
+    now = archive.end
+
+    assert archive.filename(0).endswith(".grib2.gz")
+    assert gzip.decompress(archive.content) == grib_content
+    assert archive.find(archive.filename(1), now) == 1
+    assert archive.find("MRMS_MergedReflectivityQC_00.50.latest.grib2.gz", now) == 2
+    assert "latest.grib2.gz" in archive.listing(now)[0].decode()
+
+
+def test_simulated_clock(monkeypatch):
+    monotonic = iter([100.0, 100.0, 102.5])
+    monkeypatch.setattr("idsse.testing.utils.mrms_server.time.monotonic", lambda: next(monotonic))
+    clock = SimulatedClock(START.replace(tzinfo=None), speedup=60)
+
+    assert clock() == START
+    assert clock() == START + timedelta(minutes=2, seconds=30)
+
+
+def test_server_listing(server: MrmsServer, archive: MrmsArchive):
+    status, headers, body = _get(server.url)
+
+    assert status == 200
+    assert headers["Content-Type"] == "text/html;charset=UTF-8"
+    assert parsedate_to_datetime(headers["Last-Modified"]) == archive.modified(4)
+    assert LISTED_NAME.findall(body.decode())[1:] == [archive.filename(i) for i in range(5)]
+    # listing is also served without the trailing slash
+    assert _get(server.url.rstrip("/"))[2] == body
+
+
+def test_server_files(server: MrmsServer, archive: MrmsArchive, grib_content: bytes):
+    status, headers, body = _get(server.url + archive.filename(2))
+
+    assert status == 200
+    assert body == grib_content
+    assert headers["Content-Type"] == "application/octet-stream"
+    assert headers["Accept-Ranges"] == "bytes"
+    assert parsedate_to_datetime(headers["Last-Modified"]) == archive.modified(2)
+    assert _get(server.url + "MRMS_MergedReflectivityQC_00.50.latest.grib2")[2] == grib_content
+    assert _get(server.url + archive.filename(5))[0] == 404  # not yet appeared
+    assert _get(server.url.replace("3DRefl", "2D") + archive.filename(2))[0] == 404
+
+
+def test_server_head(server: MrmsServer, archive: MrmsArchive, grib_content: bytes):
+    with urlopen(Request(server.url + archive.filename(0), method="HEAD"), timeout=10) as response:
+        assert response.status == 200
+        assert int(response.headers["Content-Length"]) == len(grib_content)
+        assert not response.read()
+
+
+@mark.parametrize(
+    "offset, status",
+    [(timedelta(0), 304), (timedelta(seconds=1), 304), (-timedelta(seconds=1), 200)],
+)
+def test_server_if_modified_since(
+    server: MrmsServer, archive: MrmsArchive, offset: timedelta, status: int
+):
+    since = format_datetime(archive.modified(4) + offset, usegmt=True)
+
+    assert _get(server.url, **{"If-Modified-Since": since})[0] == status
+    assert _get(server.url + archive.filename(4), **{"If-Modified-Since": since})[0] == status
+    # invalid dates are ignored
+    assert _get(server.url, **{"If-Modified-Since": "yesterday"})[0] == 200
+
+
+def test_server_ranges(server: MrmsServer, archive: MrmsArchive, grib_content: bytes):
+    url = server.url + archive.filename(0)
+    size = len(grib_content)
+
+    status, headers, body = _get(url, Range="bytes=0-15")
+    assert (status, body) == (206, grib_content[:16])
+    assert headers["Content-Range"] == f"bytes 0-15/{size}"
+    assert body[:4] == b"GRIB"
+    assert _get(url, Range="bytes=-10")[2] == grib_content[-10:]
+    assert _get(url, Range=f"bytes={size - 5}-")[2] == grib_content[-5:]
+    status, headers, _ = _get(url, Range=f"bytes={size}-")
+    assert status == 416
+    assert headers["Content-Range"] == f"bytes */{size}"
+
+
+@mark.parametrize(
+    "header, expected",
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=10-", (10, 999)),
+        ("bytes=990-2000", (990, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=-5000", (0, 999)),
+        ("bytes=-0", None),
+        ("bytes=1000-", None),
+        ("bytes=50-10", None),
+        ("bytes=-", None),
+        ("bytes=0-1,5-9", None),
+        ("items=0-1", None),
+    ],
+)
+def test_parse_range(header: str, expected: tuple[int, int] | None):
+    assert _parse_range(header, 1000) == expected
+
+
+def test_format_size():
+    assert _format_size(0) == "0"
+    assert _format_size(1023) == "1023"
+    assert _format_size(390_000) == "381K"
+    assert _format_size(1_899_604) == "1.8M"
+    assert _format_size(5 * 1024**4) == "5120G"
+    assert float(_format_size(2048)[:-1]) == approx(2.0)
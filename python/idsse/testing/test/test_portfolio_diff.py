@@ -0,0 +1,184 @@
+"""Tests for utils/portfolio_diff.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+import json
+import os
+import shutil
+from glob import glob
+
+from pytest import fixture
+
+from idsse.testing.utils.portfolio_diff import (
+    diff_portfolio_dirs,
+    diff_portfolios,
+)
+from idsse.testing.utils.portfolio_table import PORTFOLIO_DIR
+
+# constants
+PORTFOLIO_PATHS = sorted(glob(os.path.join(PORTFOLIO_DIR, "*.json")))
+VALID_DTS = ["2026-10-19T13:00:00.000Z", "2026-10-19T14:00:00.000Z", "2026-10-19T15:00:00.000Z"]
+
+
+def _portfolio(values: list[float | None], location: str = "Denver", uuid: str = "abc") -> dict:
+    """Event portfolio with one condition series at one location"""
+    return {
+        "corrId": {"uuid": uuid},
+        "riskResults": [
+            {
+                "conditionKey": "Icy Roads",
+                "productKey": "NBM",
+                "locationKey": location,
+                "dataSummary": [
+                    {
+                        "validDt": VALID_DTS[: len(values)],
+                        "data": [
+                            {"name": "Icy Roads", "type": "condition", "singleValue": values}
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+
+
+# fixtures
+@fixture(params=PORTFOLIO_PATHS, ids=os.path.basename)
+def portfolio_path(request) -> str:
+    return request.param
+
+
+# tests
+def test_portfolio_equals_itself(portfolio_path: str):
+    diff = diff_portfolios(portfolio_path, portfolio_path)
+
+    assert diff.equal
+    assert diff.matched > 0
+    assert diff.expected == diff.actual == os.path.basename(portfolio_path)
+    assert not diff.details
+
+
+def test_loaded_portfolio_equals_file(portfolio_path: str):
+    with open(portfolio_path, "r", encoding="utf-8") as file:
+        portfolio = json.load(file)
+
+    assert diff_portfolios(portfolio_path, portfolio).equal
+
+
+def test_tolerances():
+    expected = _portfolio([1.0, 100.0, None])
+    actual = _portfolio([1.0 + 1e-9, 101.0, None])  # nulls are equal to each other
+
+    assert not diff_portfolios(expected, actual).equal
+    assert diff_portfolios(expected, actual, atol=1.0).equal
+    assert diff_portfolios(expected, actual, rtol=0.01).equal
+    diff = diff_portfolios(expected, actual, atol=0, rtol=0)
+    assert (diff.matched, diff.mismatched) == (3, 2)
+    assert diff.max_abs_diff == 1.0
+    assert diff.max_rel_diff == 0.01
+
+
+def test_mismatched_details():
+    diff = diff_portfolios(_portfolio([1.0, 2.0, 3.0]), _portfolio([1.0, None, 4.0]))
+
+    assert diff.mismatched == 2
+    assert diff.max_abs_diff == 1.0  # differences with null are counted, but have no size
+    assert diff.details == [
+        {
+            "kind": "mismatched",
+            "conditionKey": "Icy Roads",
+            "productKey": "NBM",
+            "locationKey": "Denver",
+            "name": "Icy Roads",
+            "type": "condition",
+            "dataType": "",
+            "validDt": "2026-10-19T14:00:00.000Z",
+            "expected": 2.0,
+            "actual": None,
+        },
+        {
+            "kind": "mismatched",
+            "conditionKey": "Icy Roads",
+            "productKey": "NBM",
+            "locationKey": "Denver",
+            "name": "Icy Roads",
+            "type": "condition",
+            "dataType": "",
+            "validDt": "2026-10-19T15:00:00.000Z",
+            "expected": 3.0,
+            "actual": 4.0,
+        },
+    ]
+
+
+def test_missing_and_extra():
+    expected = _portfolio([1.0, 2.0, 3.0])
+    actual = _portfolio([1.0, 2.0])
+    actual["riskResults"].extend(_portfolio([5.0], location="Boulder")["riskResults"])
+
+    diff = diff_portfolios(expected, actual)
+
+    assert not diff.equal
+    assert (diff.matched, diff.mismatched, diff.missing, diff.extra) == (2, 0, 1, 1)
+    assert [
+        (detail["kind"], detail["locationKey"], detail["validDt"]) for detail in diff.details
+    ] == [
+        ("missing", "Denver", "2026-10-19T15:00:00.000Z"),
+        ("extra", "Boulder", "2026-10-19T13:00:00.000Z"),
+    ]
+
+
+def test_max_details():
+    diff = diff_portfolios(_portfolio([1.0, 2.0, 3.0]), _portfolio([0.0, 0.0]), max_details=2)
+
+    assert (diff.mismatched, diff.missing) == (2, 1)  # all are counted
+    assert [detail["kind"] for detail in diff.details] == ["mismatched", "mismatched"]
+    assert not diff_portfolios(_portfolio([1.0]), _portfolio([2.0]), max_details=0).details
+
+
+def test_empty_portfolios():
+    assert diff_portfolios({}, {}).equal
+    diff = diff_portfolios(_portfolio([1.0, 2.0]), {})
+    assert (diff.matched, diff.missing, diff.extra) == (0, 2, 0)
+
+
+def test_to_dict_is_json():
+    diff = diff_portfolios(_portfolio([1.0, None], uuid="first"), _portfolio([2.0, 3.0]))
+
+    summary = json.loads(json.dumps(diff.to_dict(), allow_nan=False))
+    assert summary["expected"] == "first"
+    assert summary["actual"] == "abc"
+    assert not summary["equal"]
+    assert (summary["mismatched"], summary["maxAbsDiff"]) == (2, 1.0)
+    assert summary["error"] is None
+
+
+def test_diff_portfolio_dirs(tmp_path):
+    expected_dir, actual_dir = os.path.join(tmp_path, "expected"), os.path.join(tmp_path, "actual")
+    os.makedirs(expected_dir)
+    os.makedirs(actual_dir)
+    for name, values in [("same.json", [1.0]), ("changed.json", [1.0]), ("gone.json", [1.0])]:
+        with open(os.path.join(expected_dir, name), "w", encoding="utf-8") as file:
+            json.dump(_portfolio(values), file)
+    shutil.copy(os.path.join(expected_dir, "same.json"), actual_dir)
+    for name, values in [("changed.json", [2.0]), ("new.json", [1.0])]:
+        with open(os.path.join(actual_dir, name), "w", encoding="utf-8") as file:
+            json.dump(_portfolio(values), file)
+
+    diffs = {diff.expected: diff for diff in diff_portfolio_dirs(expected_dir, actual_dir)}
+
+    assert list(diffs) == ["changed.json", "gone.json", "new.json", "same.json"]
+    assert diffs["same.json"].equal
+    assert diffs["changed.json"].mismatched == 1
+    assert "missing from" in diffs["gone.json"].error
+    assert "not expected" in diffs["new.json"].error
+    assert not diffs["gone.json"].equal and not diffs["new.json"].equal
@@ -0,0 +1,131 @@
+"""Tests for utils/portfolio_stream.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+import io
+import json
+import os
+import sys
+from glob import glob
+
+from pytest import fixture, mark, param, raises
+
+from idsse.testing.utils.portfolio_stream import (
+    STREAMED_ARRAYS,
+    iter_location_features,
+    iter_portfolio,
+    iter_risk_results,
+    iter_valid_times,
+)
+
+# constants
+PORTFOLIO_DIR = os.path.join(os.path.dirname(__file__), "..", "event_portfolios")
+PORTFOLIO_PATHS = sorted(glob(os.path.join(PORTFOLIO_DIR, "*.json")))
+
+
+def _has_ijson() -> bool:
+    try:
+        import ijson  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        return False
+    return True
+
+
+# ijson backend is only tested if ijson is installed
+BACKENDS = ["python", param("ijson", marks=mark.skipif(not _has_ijson(), reason="needs ijson"))]
+
+
+def _rebuild(items) -> dict:
+    """Reassemble the JSON object that iter_portfolio yielded (path, value) pairs of"""
+    document = {}
+    for path, value in items:
+        *parents, key = path.split(".")
+        parent = document
+        for name in parents:
+            parent = parent.setdefault(name, {})
+        if path in STREAMED_ARRAYS:
+            parent.setdefault(key, []).append(value)
+        else:
+            parent[key] = value
+    return document
+
+
+# fixtures
+@fixture(params=PORTFOLIO_PATHS, ids=os.path.basename)
+def portfolio_path(request) -> str:
+    return request.param
+
+
+# tests
+@mark.parametrize("backend", BACKENDS)
+def test_stream_matches_json_load(portfolio_path: str, backend: str):
+    with open(portfolio_path, "r", encoding="utf-8") as file:
+        expected = json.load(file)
+
+    assert _rebuild(iter_portfolio(portfolio_path, backend)) == expected
+
+
+def test_small_chunks_match_json_load(portfolio_path: str):
+    # values (including numbers) are split across many reads
+    with open(portfolio_path, "r", encoding="utf-8") as file:
+        expected = json.load(file)
+
+    assert _rebuild(iter_portfolio(portfolio_path, "python", chunk_size=7)) == expected
+
+
+@mark.parametrize("backend", BACKENDS)
+def test_iter_arrays(portfolio_path: str, backend: str):
+    with open(portfolio_path, "r", encoding="utf-8") as file:
+        expected = json.load(file)
+
+    features = list(iter_location_features(portfolio_path, backend=backend))
+    assert features == expected["location"]["features"]
+    assert list(iter_valid_times(portfolio_path, backend=backend)) == expected["validDt"]
+    assert list(iter_risk_results(portfolio_path, backend=backend)) == expected["riskResults"]
+
+
+@mark.parametrize("backend", ["auto"] + BACKENDS)
+def test_streams_and_document_order(backend: str):
+    document = {"corrId": {"a": [1, 2.5e3]}, "validDt": [], "riskResults": [{"x": 1}, None]}
+    text = json.dumps(document, indent=2)
+    sources = [io.BytesIO(text.encode())]
+    if backend != "ijson":
+        sources.append(io.StringIO(text))  # ijson only reads bytes, so auto doesn't use it
+
+    for source in sources:
+        assert list(iter_portfolio(source, backend)) == [
+            ("corrId", {"a": [1, 2500.0]}),
+            ("riskResults", {"x": 1}),
+            ("riskResults", None),
+        ]
+        assert not source.closed  # caller's stream is left open
+
+
+@mark.parametrize("backend", BACKENDS)
+def test_malformed_json(backend: str):
+    for text in ['["not", "an", "object"]', '{"riskResults": [{"x": 1}', '{"a" 1}']:
+        with raises(ValueError):
+            list(iter_portfolio(io.BytesIO(text.encode()), backend))
+
+
+def test_unknown_backend():
+    with raises(ValueError):
+        list(iter_portfolio(io.BytesIO(b"{}"), "simdjson"))
+
+
+def test_ijson_backend_not_installed(monkeypatch):
+    monkeypatch.setitem(sys.modules, "ijson", None)  # import fails, even if installed
+
+    with raises(ImportError, match="pip install"):
+        list(iter_portfolio(io.BytesIO(b"{}"), "ijson"))
+    # auto falls back to built-in parser
+    assert list(iter_portfolio(io.BytesIO(b'{"issueDt": "x"}'), "auto")) == [("issueDt", "x")]
@@ -0,0 +1,164 @@
+"""Tests for utils/portfolio_table.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+import json
+import os
+from glob import glob
+
+import numpy as np
+from pytest import fixture, importorskip, mark, raises
+
+from idsse.testing.utils import portfolio_table
+from idsse.testing.utils.portfolio_table import (
+    COLUMNS,
+    KEY_COLUMNS,
+    PORTFOLIO_DIR,
+    flatten_portfolio,
+    portfolio_to_table,
+    portfolios_to_table,
+    read_portfolio_table,
+    write_portfolio_table,
+)
+
+# constants
+PORTFOLIO_PATHS = sorted(glob(os.path.join(PORTFOLIO_DIR, "*.json")))
+RESULT = {
+    "evaluatedAt": "2026-10-19T12:00:00.000Z",
+    "conditionKey": "Icy Roads",
+    "productKey": "NBM",
+    "locationKey": "Denver",
+    "dataSummary": [
+        {
+            "validDt": ["2026-10-19T13:00:00.000Z", "2026-10-19T14:00:00.000Z"],
+            "data": [
+                {"name": "Icy Roads", "type": "condition", "singleValue": [1, None]},
+                {
+                    "name": "Temperature",
+                    "type": "part",
+                    "dataType": "TEMP",
+                    "validDt": ["2026-10-19T15:00:00.000Z"],
+                    "singleValue": [-2.5],
+                },
+            ],
+        }
+    ],
+}
+PORTFOLIO = {
+    "corrId": {"uuid": "abc"},
+    "issueDt": "2026-10-19T12:00:00.000Z",
+    "riskResults": [RESULT],
+}
+
+
+# fixtures
+@fixture(params=PORTFOLIO_PATHS, ids=os.path.basename)
+def portfolio_path(request) -> str:
+    return request.param
+
+
+# tests
+def test_flatten_portfolio_file(portfolio_path: str):
+    with open(portfolio_path, "r", encoding="utf-8") as file:
+        portfolio = json.load(file)
+    expected_rows = sum(
+        len(series.get("validDt", summary.get("validDt", [])))
+        for result in portfolio["riskResults"]
+        for summary in result.get("dataSummary", [])
+        for series in summary.get("data", [])
+    )
+
+    columns = flatten_portfolio(portfolio_path)
+
+    assert list(columns) == list(COLUMNS)
+    assert all(len(column) == expected_rows for column in columns.values())
+    assert columns["validDt"].dtype == columns["evaluatedAt"].dtype == "datetime64[ms]"
+    assert columns["value"].dtype == np.float64
+    assert set(columns["source"]) <= {os.path.basename(portfolio_path)}
+    assert set(columns["corrId"]) <= {portfolio["corrId"]["uuid"]}
+
+    # loaded JSON flattens the same, except the source file name isn't known
+    loaded = flatten_portfolio(portfolio)
+    assert set(loaded["source"]) <= {""}
+    for column in COLUMNS[1:]:
+        np.testing.assert_array_equal(loaded[column], columns[column])
+
+
+def test_flatten_portfolio_values():
+    columns = flatten_portfolio(PORTFOLIO)
+
+    assert list(columns["name"]) == ["Icy Roads", "Icy Roads", "Temperature"]
+    assert list(columns["dataType"]) == ["", "", "TEMP"]
+    assert list(columns["corrId"]) == ["abc"] * 3
+    # series' own validDt overrides the summary's
+    assert list(columns["validDt"]) == [
+        np.datetime64("2026-10-19T13:00"),
+        np.datetime64("2026-10-19T14:00"),
+        np.datetime64("2026-10-19T15:00"),
+    ]
+    np.testing.assert_array_equal(columns["value"], [1.0, np.nan, -2.5])
+
+
+def test_flatten_portfolio_empty():
+    columns = flatten_portfolio({})
+
+    assert list(columns) == list(COLUMNS)
+    assert all(len(column) == 0 for column in columns.values())
+
+
+def test_flatten_portfolio_mismatched_lengths():
+    series = {"name": "Icy Roads", "singleValue": [1, 2, 3]}
+    result = {
+        **RESULT,
+        "dataSummary": [{"validDt": ["2026-10-19T13:00:00.000Z"], "data": [series]}],
+    }
+
+    with raises(ValueError, match="3 values but 1 validDts"):
+        flatten_portfolio({"riskResults": [result]})
+
+
+@mark.parametrize("extension", [".parquet", ".arrow", ".feather"])
+def test_table_round_trip(tmp_path, extension: str):
+    importorskip("pyarrow")
+    table = portfolios_to_table(PORTFOLIO_PATHS)
+    filepath = os.path.join(tmp_path, f"portfolios{extension}")
+
+    write_portfolio_table(table, filepath)
+
+    assert read_portfolio_table(filepath).equals(table)
+    subset = read_portfolio_table(filepath, columns=["name", "value"])
+    assert subset.column_names == ["name", "value"]
+    assert subset.num_rows == table.num_rows
+
+
+def test_portfolios_to_table():
+    importorskip("pyarrow")
+    table = portfolios_to_table([PORTFOLIO, PORTFOLIO_PATHS[0]])
+
+    assert table.column_names == list(COLUMNS)
+    assert table.num_rows == 3 + portfolio_to_table(PORTFOLIO_PATHS[0]).num_rows
+    assert table.column("value").null_count == 1  # NaN is stored as null
+    assert all(
+        str(table.schema.field(column).type).startswith("dictionary") for column in KEY_COLUMNS
+    )
+    assert portfolios_to_table([]).num_rows == 0
+
+
+def test_tables_need_pyarrow(monkeypatch, tmp_path):
+    monkeypatch.setattr(portfolio_table, "pa", None)
+
+    with raises(ImportError, match="pip install"):
+        portfolio_to_table(PORTFOLIO)
+    with raises(ImportError, match="pip install"):
+        read_portfolio_table(os.path.join(tmp_path, "portfolios.parquet"))
+    # flattening to NumPy columns doesn't need pyarrow
+    assert len(flatten_portfolio(PORTFOLIO)["value"]) == 3
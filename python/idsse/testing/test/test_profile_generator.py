@@ -0,0 +1,134 @@
+"""Tests for utils/profile_generator.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring
+
+import json
+import os
+import re
+from datetime import datetime, UTC
+from glob import glob
+
+from pytest import raises
+
+from idsse.testing.utils.profile_generator import (
+    OFFICE_LOCATIONS,
+    ProfileGenerator,
+    write_profiles,
+)
+from nwsc_proxy.src.profile_validation import ProfileValidator
+
+# constants
+NOW = datetime(2026, 10, 19, 12, tzinfo=UTC)
+COORDINATE = re.compile(r"(-?\d+\.\d+) (-?\d+\.\d+)")
+
+
+def _coordinates(wkt: str) -> list[tuple[float, float]]:
+    return [(float(lon), float(lat)) for lon, lat in COORDINATE.findall(wkt)]
+
+
+# tests
+def test_seeded_generators_match():
+    first = list(ProfileGenerator(seed=1, now=NOW).generate(20))
+
+    assert first == list(ProfileGenerator(seed=1, now=NOW).generate(20))
+    assert first != list(ProfileGenerator(seed=2, now=NOW).generate(20))
+
+
+def test_profiles_are_valid():
+    validator = ProfileValidator()
+
+    for profile in ProfileGenerator(seed=3, now=NOW).generate(200):
+        assert not validator.validate(profile), profile["id"]
+
+
+def test_geometry_near_office():
+    generator = ProfileGenerator(seed=4, now=NOW, min_vertices=5, max_vertices=8)
+
+    for office, (office_lon, office_lat) in OFFICE_LOCATIONS.items():
+        coordinates = _coordinates(generator.geometry(office))
+
+        assert 6 <= len(coordinates) <= 9  # ring is closed, so first vertex is repeated
+        assert coordinates[0] == coordinates[-1]
+        for lon, lat in coordinates:
+            assert abs(lon - office_lon) < 4
+            assert abs(lat - office_lat) < 3
+
+
+def test_invalid_vertex_counts():
+    for min_vertices, max_vertices in [(2, 10), (8, 4)]:
+        with raises(ValueError):
+            ProfileGenerator(min_vertices=min_vertices, max_vertices=max_vertices)
+
+
+def test_active_times():
+    generator = ProfileGenerator(seed=5, now=NOW)
+    kinds = set()
+
+    for _ in range(500):
+        active_time = generator.active_time()
+        if active_time["startTime"] is None:
+            assert active_time["endTime"] is None
+            kinds.add("never_ending")
+            continue
+        start = datetime.fromisoformat(active_time["startTime"])
+        end = datetime.fromisoformat(active_time["endTime"])
+        assert start < end
+        assert start.minute == start.second == 0
+        kinds.add("past" if end < NOW else "future" if start > NOW else "current")
+
+    assert kinds == {"never_ending", "past", "current", "future"}
+
+
+def test_impact_levels_more_severe():
+    generator = ProfileGenerator(seed=6, now=NOW)
+
+    for _ in range(200):
+        levels = generator.hazard()["impactLevels"]
+        assert [level["impactLevelValue"] for level in levels] == list(range(1, len(levels) + 1))
+
+        # each level has the same weather elements, with thresholds stepping in one direction
+        for thresholds in zip(*(level["thresholdSet"] for level in levels)):
+            assert len({threshold["weatherElement"] for threshold in thresholds}) == 1
+            magnitudes = [threshold["magnitude"] for threshold in thresholds]
+            if thresholds[0]["operator"].startswith("LESS"):
+                assert magnitudes == sorted(magnitudes, reverse=True)
+            else:
+                assert magnitudes == sorted(magnitudes)
+
+
+def test_write_profiles(tmp_path):
+    count = write_profiles(str(tmp_path), 25, seed=7, now=NOW, chunk_size=10)
+
+    filepaths = glob(os.path.join(tmp_path, "profiles", "*.json"))
+    assert count == len(filepaths) == 25
+    for filepath in filepaths:
+        with open(filepath, "r", encoding="utf-8") as file:
+            assert os.path.basename(filepath) == f'{json.load(file)["id"]}.json'
+
+
+def test_write_profiles_bulk_matches_any_workers(tmp_path):
+    profiles_by_workers = []
+    for workers in (1, 2):
+        base_dir = os.path.join(tmp_path, str(workers))
+        count = write_profiles(
+            base_dir, 25, seed=8, now=NOW, bulk=True, chunk_size=10, workers=workers
+        )
+
+        assert count == 3  # chunks of 10, 10 and 5 profiles
+        profiles = []
+        for filepath in sorted(glob(os.path.join(base_dir, "synthetic_profiles_*.json"))):
+            with open(filepath, "r", encoding="utf-8") as file:
+                profiles.extend(json.load(file))
+        profiles_by_workers.append(profiles)
+
+    assert len(profiles_by_workers[0]) == 25
+    assert profiles_by_workers[0] == profiles_by_workers[1]
@@ -0,0 +1,476 @@
+"""Tests for utils/resources.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring,redefined-outer-name,protected-access,unused-argument
+
+import importlib.util
+import json
+import os
+import zipfile
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+import xarray as xr
+import zarr
+from pytest import fixture, importorskip, mark, raises, MonkeyPatch
+
+from idsse.testing.utils import resources as resources_module
+from idsse.testing.utils.resources import (
+    ResourceCache,
+    clear_resource_cache,
+    configure_resource_cache,
+    get_array_from_file,
+    get_filepath,
+    get_resource_from_file,
+    open_dataset_resource,
+    parse_slice,
+    read_slice,
+    resource_cache_info,
+)
+from idsse.testing.utils.grid_generator import GridGenerator
+
+# constants
+DATA_ACCESS = "idsse.testing.data_access"
+RISK_PROCESSOR = "idsse.testing.risk_processor"
+SYRACUSE_NC = "syracuse/2022_12_23_13_00_SYRACUSE_WINDGUST.nc"
+NBM_GRIB = "nbm_aws_grib/20230401/temp_wind.blend.20230401.t12z.core.f001.co.grib2"
+ZARR_ZIP = "20260518_Temps.zarr.zip"
+# slice of the full NBM grid the Syracuse fixture was cut from: x 1722:2122, y 802:1102
+SYRACUSE_SLICE = "[1722:2122,802:1102]"
+I87_NCS = [f"i87/2022_12_23_{hour}_00_I87_TEMP.nc" for hour in (13, 14, 15)]
+
+
+def _grid(package: str, filename: str) -> np.ndarray:
+    """Whole `grid` variable of a NetCDF fixture, read directly"""
+    with xr.open_dataset(get_filepath(package, filename)) as dataset:
+        return dataset["grid"].values
+
+
+def _touch_later(filepath: Path):
+    """Move file's modified time a second later, as if it was just rewritten"""
+    stat = os.stat(filepath)
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+# fixtures
+@fixture
+def package(tmp_path: Path, monkeypatch: MonkeyPatch) -> tuple[str, Path]:
+    """Name and directory of an importable package of test resources, which tests can change"""
+    name = f"resources_{uuid4().hex[:8]}"
+    package_dir = tmp_path / name
+    package_dir.mkdir()
+    (package_dir / "__init__.py").touch()
+    (package_dir / "data.json").write_text('{"values": [1, 2, 3]}', encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return name, package_dir
+
+
+@fixture
+def zip_stores(monkeypatch: MonkeyPatch) -> list[zarr.storage.ZipStore]:
+    """Every ZipStore opened during the test"""
+    stores = []
+    zip_store = zarr.storage.ZipStore
+
+    def recording_zip_store(*args, **kwargs) -> zarr.storage.ZipStore:
+        stores.append(zip_store(*args, **kwargs))
+        return stores[-1]
+
+    monkeypatch.setattr(zarr.storage, "ZipStore", recording_zip_store)
+    return stores
+
+
+@fixture
+def resource_cache():
+    """Start from an empty process-wide resource cache, and restore its settings after"""
+    info = resource_cache_info()
+    clear_resource_cache()
+    yield
+    configure_resource_cache(info["enabled"], info["max_bytes"])
+    clear_resource_cache()
+
+
+# tests
+def test_cache_hit_and_miss(package: tuple[str, Path], resource_cache):
+    name, _ = package
+
+    assert get_resource_from_file(name, "data.json", cache=True) == {"values": [1, 2, 3]}
+    assert get_resource_from_file(name, "data.json", cache=True) == {"values": [1, 2, 3]}
+    get_resource_from_file(name, "data.json", cache=False)  # skips the cache
+
+    info = resource_cache_info()
+    assert (info["misses"], info["hits"], info["entries"]) == (1, 1, 1)
+    assert info["size_bytes"] > 0
+
+
+def test_configure_resource_cache(package: tuple[str, Path], resource_cache):
+    name, _ = package
+
+    configure_resource_cache(enabled=False)
+    get_resource_from_file(name, "data.json")
+    assert resource_cache_info()["entries"] == 0
+
+    configure_resource_cache(enabled=True)
+    get_resource_from_file(name, "data.json")
+    get_resource_from_file(name, "data.json")
+    assert resource_cache_info()["hits"] == 1
+    get_resource_from_file(name, "data.json", cache=False)
+    assert resource_cache_info()["hits"] == 1
+
+
+def test_cache_invalidated_when_file_changes(package: tuple[str, Path], resource_cache):
+    name, package_dir = package
+    get_resource_from_file(name, "data.json", cache=True)
+
+    (package_dir / "data.json").write_text('{"values": []}', encoding="utf-8")
+    _touch_later(package_dir / "data.json")
+
+    assert get_resource_from_file(name, "data.json", cache=True) == {"values": []}
+    assert resource_cache_info()["misses"] == 2
+
+
+def test_cached_copy_not_mutated(package: tuple[str, Path], resource_cache):
+    name, _ = package
+    resource = get_resource_from_file(name, "data.json", cache=True)
+
+    resource["values"].append(4)
+    resource["other"] = True
+
+    assert get_resource_from_file(name, "data.json", cache=True) == {"values": [1, 2, 3]}
+    # every hit is its own copy too
+    hit = get_resource_from_file(name, "data.json", cache=True)
+    hit["values"].clear()
+    assert get_resource_from_file(name, "data.json", cache=True) == {"values": [1, 2, 3]}
+
+
+def test_lru_eviction_by_size():
+    cache = ResourceCache(enabled=True, max_bytes=10)
+    cache.put(("a",), "aaaa")
+    cache.put(("b",), b"bbbb")
+    assert cache.get(("a",)) == (True, "aaaa")  # now most recently used
+
+    cache.put(("c",), "cccc")
+
+    assert cache.get(("b",)) == (False, None)
+    assert cache.get(("a",)) == (True, "aaaa")
+    assert cache.get(("c",)) == (True, "cccc")
+    assert cache.info()["size_bytes"] == 8
+    # replacing a value replaces its size
+    cache.put(("c",), "cc")
+    assert (cache.info()["entries"], cache.info()["size_bytes"]) == (2, 6)
+
+
+def test_uncacheable_values_skipped(tmp_path: Path):
+    cache = ResourceCache(enabled=True, max_bytes=100)
+
+    cache.put(("function",), lambda: None)
+    cache.put(("oversized",), "x" * 101)
+    with open(tmp_path / "file.txt", "w", encoding="utf-8") as file:
+        cache.put(("file",), file)
+
+    assert cache.info()["entries"] == 0
+    assert cache.get(("oversized",)) == (False, None)
+
+
+def test_uncacheable_resource_still_returned(package: tuple[str, Path], resource_cache):
+    name, _ = package
+
+    def load_lines(traversable):
+        with traversable.open("r") as file:
+            return (line for line in file.read().splitlines())  # generators can't be pickled
+
+    resource = get_resource_from_file(name, "data.json", load_lines, cache=True)
+
+    assert list(resource) == ['{"values": [1, 2, 3]}']
+    assert resource_cache_info()["entries"] == 0
+
+
+@mark.parametrize("cache", [True, False])
+def test_file_closed(
+    package: tuple[str, Path], resource_cache, monkeypatch: MonkeyPatch, cache: bool
+):
+    name, _ = package
+    streams = []
+
+    def load_json(stream):
+        streams.append(stream)
+        return json.load(stream)
+
+    monkeypatch.setitem(resources_module._LOADERS, ".json", load_json)
+
+    assert get_resource_from_file(name, "data.json", cache=cache) == {"values": [1, 2, 3]}
+    assert len(streams) == 1
+    assert streams[0].closed
+
+
+def test_get_array_matches_list_loader():
+    legacy = get_resource_from_file(DATA_ACCESS, "netcdf_array_data.csv", cache=False)
+
+    array = get_array_from_file(DATA_ACCESS, "netcdf_array_data.csv")
+
+    assert array.dtype == np.float64 and array.shape == (len(legacy), len(legacy[0]))
+    np.testing.assert_array_equal(array, np.array(legacy))
+    np.testing.assert_allclose(
+        get_array_from_file(DATA_ACCESS, "netcdf_array_data.csv", "float32"), legacy, rtol=1e-6
+    )
+
+
+def test_get_array_not_csv():
+    with raises(ValueError):
+        get_array_from_file("idsse.testing.nwsc_gateway", "geometry_cases.json")
+
+
+def test_sidecar_memory_mapped(tmp_path: Path, monkeypatch: MonkeyPatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    parsed = get_array_from_file(DATA_ACCESS, "netcdf_array_data.csv", sidecar=True)
+
+    (sidecar,) = (tmp_path / "idsse_testing" / DATA_ACCESS).glob("*netcdf_array_data.csv.f8.npy")
+    # CSV is not parsed again
+    monkeypatch.setattr(resources_module, "_load_csv_array", None)
+    array = get_array_from_file(DATA_ACCESS, "netcdf_array_data.csv", sidecar=True)
+
+    assert isinstance(array, np.memmap) and array.filename == str(sidecar)
+    assert not array.flags.writeable
+    np.testing.assert_array_equal(array, parsed)
+
+
+def test_sidecar_rebuilt_when_csv_newer(
+    package: tuple[str, Path], tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    name, package_dir = package
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    (package_dir / "grid.csv").write_text("1,2\n3,4\n", encoding="utf-8")
+    assert get_array_from_file(name, "grid.csv", sidecar=True).tolist() == [[1, 2], [3, 4]]
+
+    (package_dir / "grid.csv").write_text("5,6\n7,8\n", encoding="utf-8")
+    _touch_later(package_dir / "grid.csv")
+
+    assert get_array_from_file(name, "grid.csv", sidecar=True).tolist() == [[5, 6], [7, 8]]
+    assert len(list((tmp_path / "cache").rglob("*.npy"))) == 1  # replaced, not added
+
+
+def test_sidecar_in_package(package: tuple[str, Path], tmp_path: Path, monkeypatch: MonkeyPatch):
+    name, package_dir = package
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    (package_dir / "grid.csv").write_text("1,2\n3,4\n", encoding="utf-8")
+
+    array = get_array_from_file(name, "grid.csv", "float32", sidecar=True, sidecar_in_package=True)
+
+    assert array.dtype == np.float32
+    assert array.filename == str(package_dir / "grid.csv.f4.npy")
+    assert not (tmp_path / "cache").exists()
+
+
+def test_cached_arrays_read_only(package: tuple[str, Path], resource_cache):
+    name, package_dir = package
+    (package_dir / "grid.csv").write_text("1,2\n3,4\n", encoding="utf-8")
+
+    arrays = [get_array_from_file(name, "grid.csv", cache=True) for _ in range(2)]
+
+    assert (resource_cache_info()["misses"], resource_cache_info()["hits"]) == (1, 1)
+    for array in arrays:
+        assert not array.flags.writeable
+        with raises(ValueError):
+            array[0, 0] = 0
+        assert array.tolist() == [[1, 2], [3, 4]]
+    # other dtypes are cached separately
+    assert get_array_from_file(name, "grid.csv", "int32", cache=True).dtype == np.int32
+
+
+def test_open_netcdf():
+    with xr.open_dataset(get_filepath(RISK_PROCESSOR, SYRACUSE_NC)) as expected:
+        expected_grid = expected["grid"].values
+
+    with open_dataset_resource(RISK_PROCESSOR, SYRACUSE_NC) as dataset:
+        assert dataset["grid"].chunks is not None  # lazy, dask-backed
+        np.testing.assert_array_equal(dataset["grid"].values, expected_grid)
+    with get_resource_from_file(RISK_PROCESSOR, SYRACUSE_NC) as dataset:
+        assert isinstance(dataset, xr.Dataset)
+
+
+def test_open_netcdf_chunks_and_selection():
+    with xr.open_dataset(get_filepath(RISK_PROCESSOR, SYRACUSE_NC)) as expected:
+        expected_grid = expected["grid"].values
+
+    with open_dataset_resource(
+        RISK_PROCESSOR, SYRACUSE_NC, chunks={"y": 100, "x": 200}
+    ) as dataset:
+        assert dataset["grid"].chunks == ((100, 100, 100), (200, 200))
+    with open_dataset_resource(RISK_PROCESSOR, SYRACUSE_NC, chunks=None) as dataset:
+        assert dataset["grid"].chunks is None
+    with open_dataset_resource(
+        RISK_PROCESSOR,
+        SYRACUSE_NC,
+        variables=["grid"],
+        isel={"y": slice(10, 20), "x": 5},
+    ) as dataset:
+        assert list(dataset.data_vars) == ["grid"]
+        assert dataset["grid"].dims == ("y",)
+        np.testing.assert_array_equal(dataset["grid"].values, expected_grid[10:20, 5])
+    with open_dataset_resource(RISK_PROCESSOR, SYRACUSE_NC, variables=[]) as dataset:
+        assert not dataset.data_vars
+
+
+# writing the store warns that Zarr format 3 has no consolidated metadata yet
+@mark.filterwarnings("ignore:Consolidated metadata:UserWarning")
+def test_open_zarr_zip(package: tuple[str, Path], zip_stores: list):
+    name, package_dir = package
+    generator = GridGenerator("TEMP:[DTRM,p090]", "mrms", width=40, height=30, lead_count=3)
+    generator.write_zarr(str(package_dir / "grid.zarr.zip"))
+    expected = generator.dataset()
+
+    dataset = open_dataset_resource(
+        name,
+        "grid.zarr.zip",
+        chunks={},
+        sel={"member": "p090", "latitude": slice(54.99, 54.95)},
+        isel={"validDt": [0, 2]},
+    )
+
+    assert dict(dataset.sizes) == {"validDt": 2, "latitude": 4, "longitude": 40}
+    np.testing.assert_array_equal(
+        dataset["grid"].values,
+        expected["grid"].sel(member="p090", latitude=slice(54.99, 54.95)).isel(validDt=[0, 2]),
+    )
+    (store,) = zip_stores
+    assert store._is_open
+    dataset.close()
+    assert not store._is_open  # closed with the dataset
+
+
+def test_open_zarr_zip_error_closes_store(package: tuple[str, Path], zip_stores: list):
+    name, package_dir = package
+    with zipfile.ZipFile(package_dir / "empty.zarr.zip", "w") as zip_file:
+        zip_file.writestr("README", "not a Zarr store")
+
+    with raises(Exception):
+        open_dataset_resource(name, "empty.zarr.zip")
+    assert not zip_stores[0]._is_open
+
+
+@mark.skipif(
+    not zipfile.is_zipfile(get_filepath(RISK_PROCESSOR, ZARR_ZIP)),
+    reason="Zarr fixture is a Git LFS pointer; fetch it with git lfs pull",
+)
+def test_open_zarr_zip_fixture(zip_stores: list):
+    with open_dataset_resource(RISK_PROCESSOR, ZARR_ZIP, chunks={}) as dataset:
+        assert dataset.data_vars
+        variable = next(iter(dataset.data_vars))
+        window = {dim: slice(0, 2) for dim in dataset[variable].dims}
+        with open_dataset_resource(
+            RISK_PROCESSOR, ZARR_ZIP, variables=[variable], isel=window
+        ) as selected:
+            np.testing.assert_array_equal(selected[variable], dataset[variable].isel(window))
+    assert not any(store._is_open for store in zip_stores)
+
+
+def test_open_grib():
+    importorskip("cfgrib")
+    grib_dir = os.path.dirname(get_filepath(DATA_ACCESS, NBM_GRIB))
+
+    with open_dataset_resource(
+        DATA_ACCESS,
+        NBM_GRIB,
+        filter_by_keys={"typeOfLevel": "heightAboveGround", "level": 2},
+        isel={"y": slice(0, 10), "x": slice(0, 20)},
+    ) as dataset:
+        assert list(dataset.data_vars) == ["t2m"]
+        assert dict(dataset["t2m"].sizes) == {"y": 10, "x": 20}
+        assert float(dataset["t2m"].mean()) > 200  # Kelvin
+    assert not [name for name in os.listdir(grib_dir) if name.endswith(".idx")]
+
+
+def test_open_grib_without_cfgrib(monkeypatch: MonkeyPatch):
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name, *args: None if name == "cfgrib" else find_spec(name, *args),
+    )
+
+    with raises(ImportError, match="idsse-testing\\[grib\\]"):
+        open_dataset_resource(DATA_ACCESS, NBM_GRIB)
+
+
+def test_open_unsupported_dataset():
+    with raises(ValueError):
+        open_dataset_resource("idsse.testing.nwsc_gateway", "geometry_cases.json")
+
+
+@mark.parametrize(
+    "grid_slice, expected",
+    [
+        ("[1722:2122,802:1102]", (slice(802, 1102), slice(1722, 2122))),
+        (" [ 1 : 2 , 3 : 4 ] ", (slice(3, 4), slice(1, 2))),
+        ("[:10,5:]", (slice(5, None), slice(None, 10))),
+        ("[:,:]", (slice(None), slice(None))),
+    ],
+)
+def test_parse_slice(grid_slice: str, expected: tuple[slice, slice]):
+    assert parse_slice(grid_slice) == expected
+
+
+@mark.parametrize(
+    "grid_slice",
+    ["1722:2122,802:1102", "[1:2]", "[a:b,c:d]", "[-1:2,3:4]", "[1:2,3:4", "(1:2,3:4)", ""],
+)
+def test_parse_invalid_slice(grid_slice: str):
+    with raises(ValueError, match="Invalid slice"):
+        parse_slice(grid_slice)
+
+
+def test_read_slice_shifts_to_file():
+    grid = _grid(RISK_PROCESSOR, SYRACUSE_NC)
+    with open_dataset_resource(RISK_PROCESSOR, SYRACUSE_NC) as dataset:
+        assert dataset.attrs["slice"] == SYRACUSE_SLICE
+
+    # in full grid coordinates, so 78 columns and 98 rows into the file
+    window = read_slice(RISK_PROCESSOR, SYRACUSE_NC, "[1800:1810,900:905]")
+
+    assert isinstance(window["grid"].data, np.ndarray)  # loaded, not lazy
+    np.testing.assert_array_equal(window["grid"].values, grid[98:103, 78:88])
+    whole = read_slice(RISK_PROCESSOR, SYRACUSE_NC, SYRACUSE_SLICE)
+    np.testing.assert_array_equal(whole["grid"].values, grid)
+    np.testing.assert_array_equal(
+        read_slice(RISK_PROCESSOR, SYRACUSE_NC, "[2100:,:803]")["grid"].values, grid[:1, 378:]
+    )
+
+
+@mark.parametrize("grid_slice", ["[0:10,0:10]", "[2100:2130,900:905]", "[1800:1810,1101:1103]"])
+def test_read_slice_outside_grid(grid_slice: str):
+    with raises(ValueError, match="outside of grid"):
+        read_slice(RISK_PROCESSOR, SYRACUSE_NC, grid_slice)
+
+
+def test_read_slice_stacks_files():
+    window = read_slice(RISK_PROCESSOR, I87_NCS, "[0:10,290:]", variables=["grid"])
+
+    assert window["grid"].dims == ("source", "y", "x")
+    assert window["source"].values.tolist() == I87_NCS
+    for index, filename in enumerate(I87_NCS):
+        np.testing.assert_array_equal(
+            window["grid"][index].values, _grid(RISK_PROCESSOR, filename)[290:, 0:10]
+        )
+
+
+@mark.filterwarnings("ignore:Consolidated metadata:UserWarning")
+def test_read_slice_zarr_zip(package: tuple[str, Path], zip_stores: list):
+    name, package_dir = package
+    generator = GridGenerator("TEMP:[DTRM,p090]", "mrms", width=40, height=30, lead_count=3)
+    generator.write_zarr(str(package_dir / "grid.zarr.zip"))
+
+    window = read_slice(name, "grid.zarr.zip", "[10:20,0:5]", sel={"member": ["p090"]})
+
+    assert dict(window.sizes) == {"member": 1, "validDt": 3, "latitude": 5, "longitude": 10}
+    np.testing.assert_array_equal(
+        window["grid"].values, generator.data()[1:, :, 0:5, 10:20].compute()
+    )
+    assert not zip_stores[0]._is_open
@@ -0,0 +1,45 @@
+"""Tests that finding test resources doesn't import heavy modules, checked in a fresh
+interpreter"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring
+
+import json
+import os
+import subprocess
+import sys
+
+# constants
+PYTHON_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..")
+
+# only needed to read resources into arrays or datasets, not to find their paths
+DEFERRED_MODULES = {"numpy", "xarray", "dask", "zarr", "pandas", "pyarrow", "netCDF4", "cfgrib"}
+
+
+def test_get_filepath_defers_heavy_imports():
+    statement = (
+        "from idsse.testing.utils.resources import get_filepath\n"
+        "get_filepath('idsse.testing.nwsc_gateway', 'geometry_cases.json')\n"
+        "import json, sys\n"
+        "print(json.dumps(list(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", statement],
+        cwd=PYTHON_DIR,
+        env={**os.environ, "PYTHONPATH": PYTHON_DIR},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {module.split(".")[0] for module in json.loads(result.stdout)}
+
+    assert "idsse" in modules
+    assert not modules & DEFERRED_MODULES
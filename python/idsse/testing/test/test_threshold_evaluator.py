@@ -0,0 +1,285 @@
+"""Tests for utils/threshold_evaluator.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+import numpy as np
+from pytest import fixture, mark, raises
+
+from idsse.testing.utils.profile_generator import ProfileGenerator
+from idsse.testing.utils.threshold_evaluator import (
+    Hazard,
+    ImpactLevel,
+    Threshold,
+    ThresholdEvaluator,
+    _held_for,
+    benchmark,
+    compile_hazards,
+    compile_threshold,
+)
+
+# constants
+SHAPE = (6, 4, 5)
+
+
+def _threshold(element: str, operator: str, magnitude: float, units: str, **extra) -> dict:
+    return {
+        "weatherElement": element,
+        "operator": operator,
+        "magnitude": magnitude,
+        "units": units,
+        **extra,
+    }
+
+
+def _held_reference(mask: np.ndarray, steps: int) -> np.ndarray:
+    """True where mask is True at this and the previous `steps - 1` time steps, the slow way"""
+    held = np.zeros_like(mask)
+    for index in range(steps - 1, len(mask)):
+        held[index] = mask[index - steps + 1 : index + 1].all(axis=0)
+    return held
+
+
+# fixtures
+@fixture
+def grids() -> dict[str, tuple[np.ndarray, str]]:
+    rng = np.random.default_rng(0)
+    return {
+        "Temp": (rng.uniform(-20, 20, SHAPE).astype(np.float32), "Celsius"),
+        "WindGust": (rng.uniform(0, 40, SHAPE).astype(np.float32), "MilesPerHour"),
+    }
+
+
+# tests
+def test_compile_threshold():
+    threshold = compile_threshold(
+        _threshold("WINDGST", "GREATER_THAN_OR_EQUAL_TO", 20, "mph", minDurationHours=3)
+    )
+
+    assert threshold == Threshold("WindGust", "GREATER THAN OR EQUAL", 20.0, "MilesPerHour", 3.0)
+    assert compile_threshold(_threshold("cold", "<", "32", "°F")) == Threshold(
+        "Temp", "LESS THAN", 32.0, "Fahrenheit", 0
+    )
+    assert compile_threshold(_threshold("ice:6hr", "GREATER_THAN", 0.1, "in")).element == "Ice:6HR"
+
+
+@mark.parametrize(
+    "threshold",
+    [
+        _threshold("Humidex", "GREATER_THAN", 1, "Celsius"),
+        _threshold("Temp", "EQUAL_TO", 1, "Celsius"),
+        _threshold("Temp", "GREATER_THAN", 1, "Furlongs"),
+        {"operator": "GREATER_THAN", "magnitude": 1, "units": "Celsius"},
+    ],
+)
+def test_compile_invalid_threshold(threshold: dict):
+    with raises(ValueError):
+        compile_threshold(threshold)
+
+
+def test_compile_hazards():
+    profile = {
+        "hazards": [
+            {
+                "id": "wind",
+                "impactLevels": [
+                    {
+                        "impactLevelValue": 2,
+                        "thresholdSet": [_threshold("WindGust", ">", 30, "mph")],
+                    },
+                    {
+                        "impactLevelValue": 1,
+                        "thresholdSet": [_threshold("WindGust", ">", 20, "mph")],
+                    },
+                ],
+            }
+        ]
+    }
+
+    (hazard,) = compile_hazards(profile)
+
+    assert hazard.id == "wind"
+    assert [level.value for level in hazard.impact_levels] == [1, 2]  # least severe first
+    assert hazard.impact_levels[1].thresholds[0].magnitude == 30
+    assert not compile_hazards({})
+
+
+def test_mask_converts_units(grids: dict):
+    evaluator = ThresholdEvaluator(grids)
+    celsius, _ = grids["Temp"]
+
+    mask = evaluator.mask(Threshold("Temp", "LESS THAN OR EQUAL", 32, "Fahrenheit"))
+
+    assert mask.shape == SHAPE and mask.dtype == np.bool_
+    np.testing.assert_array_equal(mask, celsius <= 0)
+    np.testing.assert_array_equal(
+        evaluator.mask(Threshold("WindGust", "GREATER THAN", 10, "MetersPerSecond")),
+        grids["WindGust"][0] > 10 * 3600 / 1609.344,
+    )
+
+
+def test_masks_are_read_only_and_cached(grids: dict):
+    evaluator = ThresholdEvaluator(grids)
+    threshold = Threshold("Temp", "LESS THAN OR EQUAL", 0, "Celsius")
+
+    mask = evaluator.mask(threshold)
+
+    assert not mask.flags.writeable
+    with raises(ValueError):
+        mask[0, 0, 0] = not mask[0, 0, 0]
+    # same threshold in other units is the same mask
+    np.testing.assert_array_equal(
+        evaluator.mask(Threshold("Temp", "LESS THAN OR EQUAL", 32, "Fahrenheit")), mask
+    )
+    assert not evaluator.mask(threshold).flags.writeable
+    assert evaluator.masks_computed == 1
+
+    evaluator.clear()
+    evaluator.mask(threshold)
+    assert evaluator.masks_computed == 2
+
+
+def test_mask_cache_size(grids: dict):
+    evaluator = ThresholdEvaluator(grids, max_cache_bytes=0)
+    threshold = Threshold("Temp", "GREATER THAN", 0, "Celsius")
+
+    evaluator.mask(threshold)
+    evaluator.mask(threshold)
+
+    assert evaluator.masks_computed == 2  # no room to cache anything
+
+
+def test_mask_missing_grid(grids: dict):
+    with raises(KeyError):
+        ThresholdEvaluator(grids).mask(Threshold("Visibility", "LESS THAN", 1, "Miles"))
+
+
+def test_min_duration_hold():
+    temp = np.array([1, 1, 0, 1, 1, 1], dtype=np.float32).reshape((6, 1, 1))
+    evaluator = ThresholdEvaluator({"Temp": (temp, "Celsius")})
+
+    def met(hours: float) -> list[bool]:
+        threshold = Threshold("Temp", "GREATER THAN", 0.5, "Celsius", hours)
+        return evaluator.mask(threshold).ravel().tolist()
+
+    assert met(0) == met(1) == [True, True, False, True, True, True]
+    assert met(2) == [False, True, False, False, True, True]
+    assert met(2.5) == met(3) == [False, False, False, False, False, True]
+    assert met(7) == [False] * 6  # longer than the forecast
+    # with 3 hour time steps, 6 hours is 2 steps
+    three_hourly = ThresholdEvaluator({"Temp": (temp, "Celsius")}, step_hours=3)
+    np.testing.assert_array_equal(
+        three_hourly.mask(Threshold("Temp", "GREATER THAN", 0.5, "Celsius", 6)),
+        evaluator.mask(Threshold("Temp", "GREATER THAN", 0.5, "Celsius", 2)),
+    )
+
+
+@mark.parametrize("steps", [1, 2, 3, 6, 10])
+def test_held_for_matches_reference(steps: int):
+    mask = np.random.default_rng(steps).random((10, 8, 8)) < 0.8
+
+    np.testing.assert_array_equal(_held_for(mask, steps), _held_reference(mask, steps))
+
+
+def test_durations_share_comparison(grids: dict):
+    evaluator = ThresholdEvaluator(grids)
+    instant = Threshold("WindGust", "GREATER THAN", 20, "MilesPerHour")
+    held = Threshold("WindGust", "GREATER THAN", 20, "MilesPerHour", 3)
+
+    held_mask = evaluator.mask(held)
+    instant_mask = evaluator.mask(instant)
+
+    assert evaluator.masks_computed == 1  # comparison was cached while computing the hold
+    np.testing.assert_array_equal(held_mask, _held_reference(instant_mask, 3))
+    assert not held_mask.flags.writeable
+
+
+def test_evaluate_hazard(grids: dict):
+    celsius, _ = grids["Temp"]
+    mph, _ = grids["WindGust"]
+    hazard = Hazard(
+        "cold_wind",
+        (
+            ImpactLevel(1, (Threshold("Temp", "LESS THAN", 10, "Celsius"),)),
+            ImpactLevel(
+                2,
+                (
+                    Threshold("Temp", "LESS THAN", 0, "Celsius"),
+                    Threshold("WindGust", "GREATER THAN", 20, "MilesPerHour"),
+                ),
+            ),
+            ImpactLevel(3, ()),  # no thresholds, so never reached
+        ),
+    )
+
+    levels = ThresholdEvaluator(grids).evaluate_hazard(hazard)
+
+    assert levels.dtype == np.int8
+    expected = np.where((celsius < 0) & (mph > 20), 2, np.where(celsius < 10, 1, 0))
+    np.testing.assert_array_equal(levels, expected)
+
+
+def test_evaluate_profile(grids: dict):
+    profile = {
+        "id": "profile",
+        "hazards": [
+            {
+                "id": "freeze",
+                "impactLevels": [
+                    {"impactLevelValue": 1, "thresholdSet": [_threshold("Temp", "<=", 32, "F")]}
+                ],
+            }
+        ],
+    }
+
+    levels = ThresholdEvaluator(grids).evaluate_profile(profile)
+
+    assert list(levels) == ["freeze"]
+    np.testing.assert_array_equal(levels["freeze"], grids["Temp"][0] <= 0)
+
+
+def test_batch_matches_separate():
+    profiles = list(ProfileGenerator(seed=2).generate(10))
+    thresholds = [
+        threshold
+        for profile in profiles
+        for hazard in compile_hazards(profile)
+        for level in hazard.impact_levels
+        for threshold in level.thresholds
+    ]
+    # a grid of every weather element the Profiles use, in the units of one of their thresholds
+    rng = np.random.default_rng(1)
+    grids = {
+        threshold.element: (rng.uniform(-50, 100, (12, 8, 8)), threshold.units)
+        for threshold in thresholds
+    }
+    # repeat every Profile, so the batch has thresholds to share
+    batch = profiles + [{**profile, "id": f'{profile["id"]}-copy'} for profile in profiles]
+
+    evaluator = ThresholdEvaluator(grids)
+    results = evaluator.evaluate_profiles(batch)
+
+    for profile in profiles:
+        expected = ThresholdEvaluator(grids).evaluate_profile(profile)
+        for profile_id in (profile["id"], f'{profile["id"]}-copy'):
+            assert list(results[profile_id]) == list(expected)
+            for hazard_id, levels in expected.items():
+                np.testing.assert_array_equal(results[profile_id][hazard_id], levels)
+    # pylint: disable-next=protected-access
+    assert evaluator.masks_computed == len({evaluator._key(threshold) for threshold in thresholds})
+
+
+def test_benchmark():
+    results = benchmark(num_profiles=5, shape=(4, 16, 16), repeat=1)
+
+    assert results["profiles"] == 5
+    assert 0 < results["masks computed"] <= results["thresholds"]
+    assert results["batch ms"] >= 0 and results["separately ms"] >= 0
@@ -0,0 +1,146 @@
+"""Tests for utils/units.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring
+
+from itertools import permutations
+
+import numpy as np
+from pytest import approx, mark, raises
+
+from idsse.testing.utils.units import (
+    UNIT_CONVERSIONS,
+    UNITS_ALIASES,
+    benchmark,
+    conversion,
+    convert,
+    resolve,
+)
+
+
+# tests
+@mark.parametrize(
+    "units, expected",
+    [
+        ("Fahrenheit", "Fahrenheit"),
+        ("F", "Fahrenheit"),
+        ("°F", "Fahrenheit"),
+        ("deg_F", "Fahrenheit"),
+        ("degC", "Celsius"),
+        ("k", "Kelvin"),
+        ("KTS", "Knots"),
+        ("kt", "Knots"),
+        ("mps", "MetersPerSecond"),
+        ("m/s", "MetersPerSecond"),
+        ("Miles Per Hour", "MilesPerHour"),
+        ("KiloFeet", "Kilofeet"),
+        ("pct", "Percent"),
+        ("%", "Percent"),
+    ],
+)
+def test_resolve(units: str, expected: str):
+    assert resolve(units) == expected
+
+
+def test_resolve_unrecognized():
+    for units in ["Furlongs", "", "degrees F"]:
+        with raises(ValueError, match="Unrecognized units"):
+            resolve(units)
+
+
+def test_aliases_are_units():
+    assert all(resolve(alias) == units for alias, units in UNITS_ALIASES.items())
+
+
+@mark.parametrize(
+    "value, from_units, to_units, expected",
+    [
+        (32, "F", "C", 0),
+        (212, "Fahrenheit", "Kelvin", 373.15),
+        (-40, "Celsius", "Fahrenheit", -40),
+        (0, "C", "K", 273.15),
+        (1, "Miles", "Meters", 1609.344),
+        (1, "Kilofeet", "Feet", 1000),
+        (12, "Inches", "Centimeters", 30.48),
+        (10, "m/s", "kts", 19.438445),
+        (60, "MilesPerHour", "MetersPerSecond", 26.8224),
+        (180, "deg", "Radians", np.pi),
+        (5, "Percent", "pct", 5),
+    ],
+)
+def test_convert_scalars(value: float, from_units: str, to_units: str, expected: float):
+    converted = convert(value, from_units, to_units)
+
+    assert isinstance(converted, float)
+    assert converted == approx(expected)
+
+
+def test_round_trips():
+    values = np.linspace(-100, 100, 11)
+    units_by_quantity: dict[str, list[str]] = {}
+    for units, (quantity, _, _) in UNIT_CONVERSIONS.items():
+        units_by_quantity.setdefault(quantity, []).append(units)
+
+    for units in units_by_quantity.values():
+        for from_units, to_units in permutations(units, 2):
+            there = convert(values, from_units, to_units)
+            np.testing.assert_allclose(convert(there, to_units, from_units), values, atol=1e-9)
+
+
+@mark.parametrize(
+    "from_units, to_units",
+    [("Fahrenheit", "Meters"), ("Knots", "Hours"), ("Percent", "Meters"), ("DBZ", "Kelvin")],
+)
+def test_incompatible_units(from_units: str, to_units: str):
+    with raises(ValueError):
+        convert(1.0, from_units, to_units)
+
+
+def test_convert_arrays():
+    kelvin = np.array([[233.15, 273.15], [293.15, 310.0]], dtype=np.float32)
+
+    fahrenheit = convert(kelvin, "Kelvin", "Fahrenheit")
+
+    assert fahrenheit.dtype == np.float32 and fahrenheit.shape == kelvin.shape
+    np.testing.assert_allclose(fahrenheit, [[-40, 32], [68, 98.33]], atol=1e-3)
+    assert convert(kelvin, "K", "Kelvin") is kelvin  # same units are not copied
+    assert kelvin[0, 0] == np.float32(233.15)  # input not modified
+
+
+def test_convert_out():
+    celsius = np.array([0.0, 100.0])
+    out = np.empty_like(celsius)
+
+    assert convert(celsius, "C", "F", out=out) is out
+    np.testing.assert_allclose(out, [32, 212])
+    # in place
+    assert convert(celsius, "Celsius", "Kelvin", out=celsius) is celsius
+    np.testing.assert_allclose(celsius, [273.15, 373.15])
+    # scalar into 0-d array
+    scalar_out = np.empty(())
+    convert(1.0, "Kilometers", "Meters", out=scalar_out)
+    assert scalar_out == 1000
+
+
+def test_conversion_is_folded_and_cached():
+    assert conversion("Celsius", "Fahrenheit") == approx((1.8, 32))
+    assert conversion("Fahrenheit", "°F") == (1.0, 0.0)
+
+    # cached, so the same scale and offset are returned
+    assert conversion("Knots", "mph") is conversion("Knots", "mph")
+
+
+def test_benchmark():
+    results = benchmark(shape=(20, 30), repeat=2)
+
+    assert "Kelvin->Fahrenheit (naive)" in results
+    assert len(results) == 5
+    assert all(millis >= 0 for millis in results.values())
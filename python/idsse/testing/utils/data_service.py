@@ -0,0 +1,372 @@
+"""In-process stand-in for the IDSSe data access service, answering data requests from the
+packaged NBM and MRMS fixture grids, so end-to-end tests run offline with no HTTP or AMQP"""
+
+# --------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved. (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# --------------------------------------------------------------------------------
+
+import logging
+import os
+import re
+from collections.abc import Callable
+from copy import deepcopy
+from threading import Lock
+
+import numpy as np
+
+from .grid_generator import (
+    FIELDS as SYNTHETIC_FIELDS,
+    GridGenerator,
+    member_z_score,
+    parse_field_spec,
+)
+from .resources import (
+    get_resource_from_file,
+    open_dataset_resource,
+    parse_slice,
+)
+from .units import convert
+
+logger = logging.getLogger(__name__)
+
+# fixture grid of each (product, field): package, filename, variable, GRIB keys, units
+FIXTURE_GRIDS = {
+    ("NBM", "TEMP"): (
+        "idsse.testing.data_access.nbm_aws_grib",
+        "20230401/temp_wind.blend.20230401.t12z.core.f001.co.grib2",
+        "t2m",
+        {"typeOfLevel": "heightAboveGround", "level": 2},
+        "Kelvin",
+    ),
+    ("NBM", "WINDSPEED"): (
+        "idsse.testing.data_access.nbm_aws_grib",
+        "20230401/temp_wind.blend.20230401.t12z.core.f001.co.grib2",
+        "si10",
+        {"typeOfLevel": "heightAboveGround", "level": 10},
+        "MetersPerSecond",
+    ),
+    ("MRMS", "REFLECTIVITY"): (
+        "idsse.testing.data_access.mrms_nssl_grib",
+        "MRMS_MergedReflectivityQCComposite_00.50_20241216-201839.grib2",
+        "unknown",
+        None,
+        "DBZ",
+    ),
+}
+
+# spelling of fields in requests (upper cased) to names above
+FIELD_ALIASES = {"MAXREF": "REFLECTIVITY", "DEWPT": "DEWPOINT"}
+
+RELATIONALS: dict[str, Callable[[np.ndarray, float], np.ndarray]] = {
+    "GT": np.greater,
+    "GTE": np.greater_equal,
+    "LT": np.less,
+    "LTE": np.less_equal,
+    "EQ": np.equal,
+}
+RELATIONAL_ALIASES = {
+    "GREATER THAN": "GT",
+    "GREATER THAN OR EQUAL": "GTE",
+    "GREATER THAN OR EQUAL TO": "GTE",
+    "LESS THAN": "LT",
+    "LESS THAN OR EQUAL": "LTE",
+    "LESS THAN OR EQUAL TO": "LTE",
+    "EQUAL": "EQ",
+}
+
+# threat levels [-1, 1] are encoded as integers in responses: level = n * scale + offset
+RESPONSE_SCALE = 0.01
+RESPONSE_OFFSET = -1.0
+
+_EXPRESSION_TOKEN = re.compile(r"\s*(\(|\)|AND\b|OR\b|[^\s()]+)")
+
+
+class LocalDataService:
+    """Answers data service requests (`dsd_request.json` style, with `parts` combined by a
+    `dataRequest` expression) and task handler requests (`task_handler_request_*.json` style,
+    a tree of `sourceType`/`sourceObj`), by evaluating them with NumPy over fixture grids.
+
+    Decoded fixture grids are cached for the life of the service, so every request after the
+    first only slices and computes. Fixtures hold one valid time each, so the same grid is used
+    for every requested valid time; percentile members (e.g. `WINDSPEED:[DTRM,p010,p090]`) are
+    offset from it by the member's z-score. Fields with no fixture grid are generated (see
+    `GridGenerator`), varying by lead time.
+
+    Args:
+        output_dir (str | None): if set, task handler results are also written to NetCDF files
+            in this directory, and their paths returned in `filenames` like the real service.
+            Defaults to None (results only returned as arrays, under `data`).
+    """
+
+    def __init__(self, output_dir: str | None = None):
+        self.output_dir = output_dir
+        self._grids: dict[tuple, np.ndarray] = {}
+        self._lock = Lock()
+
+    def handle(self, request: dict) -> dict:
+        """Answer a data service request, or a task handler request
+
+        Raises:
+            ValueError: if request is malformed, or asks for unknown units, fields or operators
+        """
+        if "dataRequest" in request:
+            return self.handle_dsd_request(request)
+        return self.handle_task_request(request)
+
+    def handle_dsd_request(self, request: dict) -> dict:
+        """Evaluate each of the `parts` over the `bbox` at every `valids` time, as threat levels
+        from -1 to 1 (0 at the threshold, scaled by the part's `mapping` min and max), combine
+        them with the `dataRequest` expression (AND is minimum, OR is maximum), and encode them
+        as integers as in `dsd_response.json`.
+        """
+        bbox = request["bbox"]
+        (col_0, row_0), (col_1, row_1) = bbox["botLeft"], bbox["topRight"]
+        window = (slice(row_0, row_1), slice(col_0, col_1))
+        valids = request["valids"]
+
+        levels = {
+            part["name"]: _threat_level(
+                self._data(part["product"], part["field"], part["units"], valids, window)[0],
+                part["relational"],
+                part["thresh"],
+                part.get("mapping", {}),
+            )
+            for part in request["parts"]
+        }
+        combined = _evaluate_expression(request["dataRequest"], levels)
+        encoded = np.rint((combined - RESPONSE_OFFSET) / RESPONSE_SCALE).astype(np.int16)
+
+        response = deepcopy(request)
+        response.update(
+            {
+                "data": {valid: encoded[index].tolist() for index, valid in enumerate(valids)},
+                "scale": RESPONSE_SCALE,
+                "offset": RESPONSE_OFFSET,
+            }
+        )
+        return response
+
+    def handle_task_request(self, request: dict) -> dict:
+        """Evaluate a task handler request, and respond like `task_handler_response.json`: the
+        result (keyed by the request's `label`) has the grid metadata, and the values in `data`,
+        shaped (validDt, row, column)
+        """
+        if request.get("sourceType") == "availableLeads":
+            leads = get_resource_from_file(
+                "idsse.testing.data_access", "task_handler_leads_response.json"
+            )
+            return {"request": request, "availableLeads": leads["availableLeads"]}
+
+        context: dict = {}
+        values = self.evaluate(request, context)
+        result = {
+            "issueDt": context.get("issueDt"),
+            "validDt": context.get("validDt", []),
+            "product": context.get("product"),
+            "region": context.get("region", "CONUS"),
+            "units": context.get("units"),
+            "dataName": context.get("dataName"),
+            "slice": context.get("slice"),
+            "data": values,
+        }
+        if self.output_dir:
+            result["filenames"] = {"dtrm": self._write_netcdf(result, request)}
+        return {request.get("label", "data_requested"): result, "request": request}
+
+    def evaluate(self, source: dict, context: dict | None = None) -> np.ndarray:
+        """Evaluate one `sourceType`/`sourceObj` node of a task handler request, recursively.
+        `data` nodes give (member, validDt, row, column) arrays, and every other node reduces
+        members away: `probability` is the fraction of members meeting the threshold, `condition`
+        the threat level, and `join` combines its sources (AND is minimum, OR is maximum).
+
+        Args:
+            source (dict): request node, with `sourceType` and `sourceObj`
+            context (dict | None): filled with metadata (units, issueDt, etc.) of the result
+        """
+        # pylint: disable=too-many-locals
+        context = {} if context is None else context
+        source_type, obj = source.get("sourceType"), source.get("sourceObj", {})
+
+        if source_type == "data":
+            grid_slice = obj.get("slice") or context.get("slice") or "[:,:]"
+            window = parse_slice(grid_slice)
+            valids = obj["validDt"] if isinstance(obj["validDt"], list) else [obj["validDt"]]
+            units = obj.get("units") or context.get("units")
+            context.update(
+                {
+                    "issueDt": obj.get("issueDt"),
+                    "validDt": valids,
+                    "product": obj.get("product"),
+                    "region": obj.get("region", context.get("region")),
+                    "dataName": parse_field_spec(obj["field"])[0],
+                    "units": units,
+                    "slice": grid_slice,
+                }
+            )
+            return self._data(obj["product"], obj["field"], units, valids, window)
+
+        if source_type in ("units", "slice"):
+            # these wrap a data node, only overriding its units or window
+            context[source_type] = obj[source_type]
+            return self.evaluate(obj["source"], context)
+
+        if source_type == "probability":
+            members = np.concatenate([self.evaluate(child, context) for child in obj["sources"]])
+            exceeds = _relational(obj["relational"])(members, obj["thresh"])
+            context["units"] = "Probability"
+            return exceeds.mean(axis=0, dtype=np.float32)
+
+        if source_type == "condition":
+            values = self.evaluate(obj["source"], context)
+            context["units"] = "ThreatLevel"
+            return _threat_level(
+                values.mean(axis=0) if values.ndim == 4 else values,
+                obj["relational"],
+                obj["thresh"],
+                obj.get("mapping", {}),
+            )
+
+        if source_type == "join":
+            children = []
+            for child in obj["sources"]:
+                child_context = dict(context)
+                values = self.evaluate(child, child_context)
+                children.append(values.mean(axis=0) if values.ndim == 4 else values)
+                names = [context.get("dataName"), child_context.get("dataName")]
+                context.update(child_context)
+                context["dataName"] = ", ".join(name for name in names if name)
+            context["dataName"] = f'{obj["join"].upper()}({context.get("dataName", "")})'
+            return _combine(obj["join"], children)
+
+        raise ValueError(f"Unsupported sourceType {source_type}")
+
+    def _data(  # pylint: disable=too-many-locals
+        self, product: str, field_spec: str, units: str, valids: list[str], window: tuple
+    ) -> np.ndarray:
+        """Values of field in requested units, shaped (member, validDt, row, column)"""
+        field, members = parse_field_spec(field_spec)
+        product = product.split(".")[0].upper()
+        field = FIELD_ALIASES.get(field.upper(), field.upper())
+        if field not in SYNTHETIC_FIELDS and (product, field) not in FIXTURE_GRIDS:
+            raise ValueError(f"No fixture or synthetic grid for {product} {field}")
+        canonical_units = SYNTHETIC_FIELDS[field][0] if field in SYNTHETIC_FIELDS else None
+
+        if (product, field) in FIXTURE_GRIDS:
+            fixture_units = FIXTURE_GRIDS[(product, field)][4]
+            grid = self._fixture_grid(product, field)[window]
+            if canonical_units:
+                grid = convert(grid, fixture_units, canonical_units)
+            else:
+                canonical_units = fixture_units
+            base = np.broadcast_to(grid, (len(valids), *grid.shape))
+        else:
+            generator = GridGenerator(field, "mrms" if product == "MRMS" else "nbm")
+            base = generator.data()[0, : len(valids)][(slice(None), *window)].compute()
+
+        spread = SYNTHETIC_FIELDS[field][2][2] if field in SYNTHETIC_FIELDS else 0.0
+        offsets = np.array([member_z_score(member) * spread for member in members], np.float32)
+        values = base[np.newaxis] + offsets[:, np.newaxis, np.newaxis, np.newaxis]
+        # values is a new array, so convert it in place
+        return convert(values, canonical_units, units or canonical_units, out=values)
+
+    def _fixture_grid(self, product: str, field: str) -> np.ndarray:
+        """Full decoded fixture grid. GRIB2 decoding is slow, so each is only decoded once"""
+        key = (product, field)
+        with self._lock:
+            if key not in self._grids:
+                package, filename, variable, filter_by_keys, _ = FIXTURE_GRIDS[key]
+                with open_dataset_resource(
+                    package, filename, chunks=None, filter_by_keys=filter_by_keys
+                ) as dataset:
+                    grid = dataset[variable].values.astype(np.float32)
+                grid.flags.writeable = False  # shared by every request
+                self._grids[key] = grid
+            return self._grids[key]
+
+    def _write_netcdf(self, result: dict, request: dict) -> str:
+        import xarray as xr  # pylint: disable=import-outside-toplevel
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        uuid = request.get("corrId", {}).get("uuid", f"{len(os.listdir(self.output_dir))}")
+        filepath = os.path.join(self.output_dir, f"gridstore-{uuid}.nc")
+        attrs = {key: str(value) for key, value in result.items() if key != "data" and value}
+        xr.Dataset({"grid": (("validDt", "y", "x"), result["data"])}, attrs=attrs).to_netcdf(
+            filepath
+        )
+        return filepath
+
+
+def _relational(relational: str) -> Callable[[np.ndarray, float], np.ndarray]:
+    name = relational.strip().upper().replace("_", " ")
+    name = RELATIONAL_ALIASES.get(name, name)
+    if name not in RELATIONALS:
+        raise ValueError(f"Unsupported relational {relational}")
+    return RELATIONALS[name]
+
+
+def _threat_level(values: np.ndarray, relational: str, thresh: float, mapping: dict) -> np.ndarray:
+    """Map values to threat level [-1, 1]: 0 at the threshold, 1 at the mapping's `max` (for
+    GT/GTE, `min` for LT/LTE) and -1 at the other end, linear in between, as in the risk
+    processor's `criteria` results
+    """
+    is_greater = _relational(relational) in (np.greater, np.greater_equal)
+    low, high = float(mapping.get("min", thresh - 1)), float(mapping.get("max", thresh + 1))
+    toward, away = (high - thresh, thresh - low) if is_greater else (thresh - low, high - thresh)
+    distance = (values - thresh) if is_greater else (thresh - values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        levels = np.where(
+            distance >= 0, distance / (toward or np.inf), distance / (away or np.inf)
+        )
+    if str(mapping.get("clip", "true")).lower() == "true":
+        np.clip(levels, -1, 1, out=levels)
+    return levels.astype(np.float32)
+
+
+def _combine(join: str, arrays: list[np.ndarray]) -> np.ndarray:
+    if join.upper() == "AND":
+        return np.minimum.reduce(arrays)
+    if join.upper() == "OR":
+        return np.maximum.reduce(arrays)
+    raise ValueError(f"Unsupported join {join}")
+
+
+def _evaluate_expression(expression: str, operands: dict[str, np.ndarray]) -> np.ndarray:
+    """Evaluate boolean expression of part names, e.g. `(A AND B) OR C`. AND binds tighter"""
+    tokens = _EXPRESSION_TOKEN.findall(expression)
+    position = 0
+
+    def parse(precedence: int) -> np.ndarray:
+        nonlocal position
+        if position >= len(tokens):
+            raise ValueError(f"Incomplete dataRequest expression {expression}")
+        token = tokens[position]
+        position += 1
+        if token == "(":
+            value = parse(0)
+            if position >= len(tokens) or tokens[position] != ")":
+                raise ValueError(f"Unbalanced parentheses in dataRequest {expression}")
+            position += 1
+        elif token in operands:
+            value = operands[token]
+        else:
+            raise ValueError(f"Unknown part {token} in dataRequest {expression}")
+
+        while position < len(tokens) and tokens[position] in ("AND", "OR"):
+            operator_precedence = 2 if tokens[position] == "AND" else 1
+            if operator_precedence <= precedence:
+                break
+            operator = tokens[position]
+            position += 1
+            value = _combine(operator, [value, parse(operator_precedence)])
+        return value
+
+    result = parse(0)
+    if position != len(tokens):
+        raise ValueError(f"Unexpected {tokens[position]} in dataRequest {expression}")
+    return result
@@ -0,0 +1,344 @@
+"""Parse Profile WKT and event portfolio GeoJSON polygons once, index them by bounding box, and
+cache their rasterization onto forecast grids"""
+
+# --------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved. (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# --------------------------------------------------------------------------------
+
+import hashlib
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+
+import numpy as np
+
+from .resources import DEFAULT_CACHE_MAX_BYTES, ResourceCache
+
+# largest (points x edges) tested in one broadcast NumPy operation; bigger inputs loop over edges
+_BROADCAST_MAX_ELEMENTS = 1 << 20
+
+# WKT grammar and point-in-polygon rule are the same as nwsc_proxy's spatial index, which can't
+# import this module. Both are tested against the same cases, in nwsc_gateway/geometry_cases.json
+_WKT_PATTERN = re.compile(r"^\s*(MULTIPOLYGON|POLYGON)\s*(?:Z|M|ZM)?\s*(\(.*\))\s*$", re.I | re.S)
+# quantifiers are possessive (e.g. `++`), so matching never backtracks and stays fast even if WKT
+# is malformed
+_WKT_NUMBER = r"[-+]?+(?:\d++\.?+\d*+|\.\d++)(?:[eE][-+]?+\d++)?+"
+# one WKT coordinate: x y, with optional z and m, which are dropped
+_WKT_COORDINATE = re.compile(rf"({_WKT_NUMBER})\s++({_WKT_NUMBER})(?:\s++{_WKT_NUMBER}){{0,2}}+")
+_WKT_RING = re.compile(
+    rf"\(\s*+{_WKT_COORDINATE.pattern}(?:\s*+,\s*+{_WKT_COORDINATE.pattern})*+\s*+\)"
+)
+_WKT_POLYGON = re.compile(rf"\(\s*+{_WKT_RING.pattern}(?:\s*+,\s*+{_WKT_RING.pattern})*+\s*+\)")
+_WKT_MULTIPOLYGON = re.compile(
+    rf"\(\s*+{_WKT_POLYGON.pattern}(?:\s*+,\s*+{_WKT_POLYGON.pattern})*+\s*+\)"
+)
+
+
+@dataclass(frozen=True, eq=False)
+class Geometry:
+    """Polygon or multipolygon, as arrays of (lon, lat) vertices.
+
+    Args:
+        polygons (tuple[tuple[np.ndarray, ...], ...]): each polygon's rings, each ring an array
+            shaped (vertices, 2) and closed (last vertex equals the first). The first ring is the
+            exterior, and any others are holes
+    """
+
+    polygons: tuple[tuple[np.ndarray, ...], ...]
+    bounds: tuple[float, float, float, float] = field(init=False)
+
+    def __post_init__(self):
+        vertices = np.concatenate([ring for polygon in self.polygons for ring in polygon])
+        (min_x, min_y), (max_x, max_y) = vertices.min(axis=0), vertices.max(axis=0)
+        object.__setattr__(
+            self, "bounds", (float(min_x), float(min_y), float(max_x), float(max_y))
+        )
+        if not (-180 <= min_x and max_x <= 180 and -90 <= min_y and max_y <= 90):
+            raise ValueError(
+                f"Geometry coordinates out of range (bounds {self.bounds}), expected longitude "
+                "in [-180, 180] and latitude in [-90, 90]"
+            )
+
+    @cached_property
+    def key(self) -> str:
+        """Hash of the vertices, equal for the same shape however it was written (WKT or
+        GeoJSON, with any whitespace or precision)
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for polygon in self.polygons:
+            digest.update(b"P")
+            for ring in polygon:
+                digest.update(b"R")
+                digest.update(ring.tobytes())
+        return digest.hexdigest()
+
+    def contains(self, lon: float | np.ndarray, lat: float | np.ndarray) -> bool | np.ndarray:
+        """True for each point inside the geometry (even-odd rule, so holes are excluded).
+        Points exactly on an edge may be either in or out
+        """
+        lon, lat = np.asarray(lon, dtype=np.float64), np.asarray(lat, dtype=np.float64)
+        min_x, min_y, max_x, max_y = self.bounds
+        inside = np.zeros(np.broadcast_shapes(lon.shape, lat.shape), dtype=bool)
+        # only test points within the bounding box against the edges
+        in_bounds = (lon >= min_x) & (lon <= max_x) & (lat >= min_y) & (lat <= max_y)
+        if in_bounds.any():
+            x, y = (
+                np.broadcast_to(lon, inside.shape)[in_bounds],
+                np.broadcast_to(lat, inside.shape)[in_bounds],
+            )
+            inside_polygons = np.zeros(x.shape, dtype=bool)
+            for polygon in self.polygons:
+                crossings = np.zeros(x.shape, dtype=bool)
+                for ring in polygon:
+                    crossings ^= _ring_crossings(ring, x, y)
+                inside_polygons |= crossings
+            inside[in_bounds] = inside_polygons
+        return bool(inside) if inside.ndim == 0 else inside
+
+
+@lru_cache(maxsize=4096)
+def parse_wkt(wkt: str) -> Geometry:
+    """Parse WKT `POLYGON` or `MULTIPOLYGON` (as in Profile `geometry`). Cached, so each
+    distinct string is only parsed once
+
+    Raises:
+        ValueError: if not a non-empty WKT polygon or multipolygon, with longitudes in
+            [-180, 180] and latitudes in [-90, 90]
+    """
+    return _to_geometry(_wkt_polygons(wkt))
+
+
+def parse_geojson(geojson: dict) -> Geometry:
+    """Parse GeoJSON `Polygon` or `MultiPolygon` geometry, or a Feature with one (as in event
+    portfolio `location.features`)
+
+    Raises:
+        ValueError: if not a non-empty GeoJSON polygon or multipolygon
+    """
+    if geojson.get("type") == "Feature":
+        geojson = geojson.get("geometry") or {}
+    if geojson.get("type") == "Polygon":
+        return _to_geometry([geojson["coordinates"]])
+    if geojson.get("type") == "MultiPolygon":
+        return _to_geometry(geojson["coordinates"])
+    raise ValueError(f'Unsupported GeoJSON geometry type: {geojson.get("type")}')
+
+
+def parse_geometry(geometry: str | dict) -> Geometry:
+    """Parse WKT string or GeoJSON geometry (see `parse_wkt` and `parse_geojson`)"""
+    return parse_wkt(geometry) if isinstance(geometry, str) else parse_geojson(geometry)
+
+
+class GeometryIndex:
+    """Bounding-box index of many geometries, e.g. every Profile in a VulnerabilityStore, for
+    fast bounding-box and point queries. Bounding boxes are held in NumPy arrays sorted by
+    minimum longitude, so a query only tests the boxes that start west of its east edge, all at
+    once; point queries then test only the candidates' polygons.
+
+    Geometries can be added and removed at any time; arrays are rebuilt on the next query.
+    """
+
+    def __init__(self):
+        self._geometries: dict[str, Geometry] = {}
+        self._ids = np.empty(0, dtype=object)
+        self._bounds = np.empty((0, 4), dtype=np.float64)
+        self._dirty = False
+
+    @classmethod
+    def from_profiles(cls, profiles: Iterable[dict]) -> "GeometryIndex":
+        """Index of Profiles' `geometry`, by Profile `id`. Profiles with no (or an unsupported)
+        geometry are skipped
+        """
+        index = cls()
+        for profile in profiles:
+            try:
+                index.add(profile["id"], parse_wkt(profile["geometry"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return index
+
+    def __len__(self) -> int:
+        return len(self._geometries)
+
+    def __contains__(self, geometry_id: str) -> bool:
+        return geometry_id in self._geometries
+
+    def add(self, geometry_id: str, geometry: Geometry | str | dict):
+        """Add geometry (or replace the one with this id), parsing it if WKT or GeoJSON"""
+        if not isinstance(geometry, Geometry):
+            geometry = parse_geometry(geometry)
+        self._geometries[geometry_id] = geometry
+        self._dirty = True
+
+    def remove(self, geometry_id: str):
+        """Remove geometry, if indexed"""
+        if self._geometries.pop(geometry_id, None) is not None:
+            self._dirty = True
+
+    def get(self, geometry_id: str) -> Geometry | None:
+        """The indexed geometry with this id, if any"""
+        return self._geometries.get(geometry_id)
+
+    def query_bbox(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list[str]:
+        """Ids of geometries whose bounding box intersects this one"""
+        self._build()
+        # boxes are sorted by min_x, so only those before this point can intersect
+        end = np.searchsorted(self._bounds[:, 0], max_x, side="right")
+        bounds = self._bounds[:end]
+        hits = (bounds[:, 2] >= min_x) & (bounds[:, 1] <= max_y) & (bounds[:, 3] >= min_y)
+        return self._ids[:end][hits].tolist()
+
+    def query_point(self, lon: float, lat: float) -> list[str]:
+        """Ids of geometries containing this point"""
+        return [
+            geometry_id
+            for geometry_id in self.query_bbox(lon, lat, lon, lat)
+            if self._geometries[geometry_id].contains(lon, lat)
+        ]
+
+    def _build(self):
+        if not self._dirty:
+            return
+        ids = list(self._geometries)
+        bounds = np.array(
+            [self._geometries[geometry_id].bounds for geometry_id in ids], dtype=np.float64
+        ).reshape(len(ids), 4)
+        order = np.argsort(bounds[:, 0], kind="stable")
+        self._ids = np.array(ids, dtype=object)[order]
+        self._bounds = bounds[order]
+        self._dirty = False
+
+
+@dataclass(frozen=True, eq=False)
+class GridDefinition:
+    """Forecast grid, as the longitude and latitude of every cell center.
+
+    Args:
+        name (str): unique name of the grid, e.g. "NBM CONUS". Part of raster cache keys
+        lon (np.ndarray): longitude of each cell, shaped (y, x), in -180 to 180
+        lat (np.ndarray): latitude of each cell, shaped (y, x)
+    """
+
+    name: str
+    lon: np.ndarray
+    lat: np.ndarray
+
+    @classmethod
+    def from_dataset(cls, name: str, dataset) -> "GridDefinition":
+        """Grid of an xarray Dataset with `longitude` and `latitude` coordinates (as decoded from
+        GRIB2 by cfgrib), either 2-D or 1-D (regular lat/lon grids, e.g. MRMS)
+        """
+        lon = np.asarray(dataset["longitude"].values, dtype=np.float64)
+        lat = np.asarray(dataset["latitude"].values, dtype=np.float64)
+        if lon.ndim == 1:
+            lon, lat = np.meshgrid(lon, lat)
+        # GRIB2 longitudes are 0 to 360
+        return cls(name, np.where(lon > 180, lon - 360, lon), lat)
+
+    @property
+    def key(self) -> tuple:
+        """Identifies this grid in cache keys"""
+        return (self.name, self.lon.shape)
+
+
+class RasterCache:
+    """Cache of geometry masks on forecast grids, keyed by geometry hash (`Geometry.key`) and
+    grid, so each polygon is only rasterized once per grid however many Profiles or requests
+    use it. Least recently used masks are evicted once the cache exceeds `max_bytes`.
+
+    Args:
+        max_bytes (int): max total size of cached masks
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self._cache = ResourceCache(enabled=True, max_bytes=max_bytes)
+
+    def mask(self, geometry: Geometry | str | dict, grid: GridDefinition) -> np.ndarray:
+        """Read-only boolean (y, x) mask of grid cells whose centers are inside geometry"""
+        if not isinstance(geometry, Geometry):
+            geometry = parse_geometry(geometry)
+        key = (geometry.key, *grid.key)
+        found, mask = self._cache.get(key)
+        if not found:
+            mask = geometry.contains(grid.lon, grid.lat)
+            self._cache.put(key, mask)
+            mask.flags.writeable = False
+        return mask
+
+    def clear(self):
+        """Drop every cached mask"""
+        self._cache.clear()
+
+    def info(self) -> dict:
+        """Cache statistics: hits, misses, number of entries, and total size in bytes"""
+        return self._cache.info()
+
+
+def _to_geometry(coordinates: list) -> Geometry:
+    polygons = []
+    for polygon in coordinates:
+        rings = []
+        for ring in polygon:
+            if len(ring) < 3:
+                raise ValueError(f"Polygon ring has only {len(ring)} vertices")
+            vertices = np.asarray(ring, dtype=np.float64)[:, :2]
+            if not np.array_equal(vertices[0], vertices[-1]):
+                vertices = np.vstack([vertices, vertices[:1]])
+            vertices.flags.writeable = False
+            rings.append(vertices)
+        if rings:
+            polygons.append(tuple(rings))
+    if not polygons:
+        raise ValueError("Geometry has no polygons")
+    return Geometry(tuple(polygons))
+
+
+def _ring_crossings(ring: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """For each point, True if a ray from it toward +x crosses the ring an odd number of times"""
+    x_0, y_0, x_1, y_1 = ring[:-1, 0], ring[:-1, 1], ring[1:, 0], ring[1:, 1]
+    if x.size * len(x_0) <= _BROADCAST_MAX_ELEMENTS:
+        # every point against every edge at once
+        x, y = x[:, np.newaxis], y[:, np.newaxis]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crosses = ((y_0 > y) != (y_1 > y)) & (x < x_0 + (y - y_0) * (x_1 - x_0) / (y_1 - y_0))
+        return np.logical_xor.reduce(crosses, axis=1)
+
+    crossings = np.zeros(x.shape, dtype=bool)
+    for edge_x_0, edge_y_0, edge_x_1, edge_y_1 in zip(x_0, y_0, x_1, y_1):
+        if edge_y_0 == edge_y_1:
+            continue  # horizontal edge is never crossed
+        straddles = (edge_y_0 > y) != (edge_y_1 > y)
+        x_cross = edge_x_0 + (y - edge_y_0) * ((edge_x_1 - edge_x_0) / (edge_y_1 - edge_y_0))
+        crossings ^= straddles & (x < x_cross)
+    return crossings
+
+
+def _wkt_polygons(wkt: str) -> list[list[list[tuple[str, str]]]]:
+    """Rings of each polygon of WKT POLYGON or MULTIPOLYGON, as lists of (x, y) strings
+
+    Raises:
+        ValueError: if `wkt` is not a (multi)polygon, or is malformed
+    """
+    match = _WKT_PATTERN.match(wkt)
+    if not match:
+        raise ValueError(f"Unsupported WKT geometry: {wkt[:40]}")
+    geometry_type, body = match.group(1).upper(), match.group(2)
+    if not (_WKT_POLYGON if geometry_type == "POLYGON" else _WKT_MULTIPOLYGON).fullmatch(body):
+        raise ValueError(f"Malformed WKT geometry: {wkt[:40]}")
+    # body is well formed, so each polygon (and each ring in it) is simply the next match
+    polygons = [body] if geometry_type == "POLYGON" else _matches(_WKT_POLYGON, body)
+    return [
+        [_WKT_COORDINATE.findall(ring) for ring in _matches(_WKT_RING, polygon)]
+        for polygon in polygons
+    ]
+
+
+def _matches(pattern: re.Pattern, text: str) -> list[str]:
+    return [match.group(0) for match in pattern.finditer(text)]
@@ -0,0 +1,371 @@
+"""Generate synthetic gridded forecasts, laid out like the NBM and MRMS test fixtures, at any
+scale for benchmarking"""
+
+# --------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved. (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# --------------------------------------------------------------------------------
+
+import os
+import re
+from argparse import ArgumentParser
+from datetime import datetime, timedelta, UTC
+from functools import partial
+from statistics import NormalDist
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+from zipfile import ZIP_STORED, ZipFile
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    # dask and xarray are slow to import, so only import them once grids are generated
+    import dask.array as da
+    import xarray as xr
+
+# grid layouts of the fixtures in idsse.testing.data_access and idsse.testing.risk_processor.
+# NBM is Lambert conformal with no coordinates (like the IDSSe gridstore NetCDF files), MRMS is a
+# regular lat/lon grid with 1-D coordinates (like the MRMS GRIB2 files)
+GRID_LAYOUTS = {
+    "nbm": {
+        "product": "NBM.AWS.GRIB",
+        "region": "CONUS",
+        "width": 2345,
+        "height": 1597,
+        "dims": ("y", "x"),
+        "projName": "NBM CONUS",
+        "projSpec": "+proj=lcc +lat_0=25.0 +lon_0=-95.0 +lat_1=25.0 +a=6371200",
+        "gridSpec": "+dx=2539.703 +dy=2539.703 +w={width} +h={height} "
+        "+lat_ll=19.229 +lon_ll=-126.2766",
+        "dataLoc": "arn:aws:s3:::noaa-nbm-grib2-pds:",
+    },
+    "mrms": {
+        "product": "MRMS.HTTP.GRIB",
+        "region": "CONUS",
+        "width": 7000,
+        "height": 3500,
+        "dims": ("latitude", "longitude"),
+        "projName": "MRMS CONUS",
+        "projSpec": "+proj=longlat +a=6371229",
+        "gridSpec": "+dx=0.01 +dy=0.01 +w={width} +h={height} +lat_ul=54.995 +lon_ul=-129.995",
+        "dataLoc": "https://mrms.ncep.noaa.gov/data/2D/",
+    },
+}
+
+# units, description and (mean, amplitude, ensemble spread, minimum) of generated values
+FIELDS = {
+    "TEMP": ("Fahrenheit", "Temperature: 2m", (50.0, 30.0, 4.0, None)),
+    "DEWPOINT": ("Fahrenheit", "Dew point temperature: 2m", (40.0, 25.0, 4.0, None)),
+    "WINDSPEED": ("MilesPerHour", "Wind speed: 10m", (12.0, 10.0, 4.0, 0.0)),
+    "WINDGUST": ("MilesPerHour", "Wind gust: 10m", (20.0, 15.0, 6.0, 0.0)),
+    "CEILING": ("KiloFeet", "Ceiling height", (8.0, 8.0, 2.0, 0.0)),
+    "REFLECTIVITY": ("DBZ", "Merged reflectivity QC composite", (5.0, 30.0, 5.0, -10.0)),
+}
+
+DEFAULT_MEMBERS = ("DTRM",)
+DEFAULT_CHUNK_SIZE = 512
+
+_FIELD_SPEC = re.compile(r"^(?P<field>[^:\[\]]+)(?::\[(?P<members>[^\]]*)\])?$")
+_PERCENTILE = re.compile(r"^p(\d{2,3})$", re.IGNORECASE)
+
+
+def parse_field_spec(spec: str) -> tuple[str, list[str]]:
+    """Parse the `field` of a data request, with optional percentile members, e.g.
+    `WINDSPEED:[DTRM,p010,p025,p075,p090]` is `("WINDSPEED", ["DTRM", "p010", ...])`.
+
+    Raises:
+        ValueError: if spec is not in this format
+    """
+    match = _FIELD_SPEC.match(spec.strip())
+    if not match:
+        raise ValueError(f"Invalid field spec {spec}, expected e.g. FIELD:[DTRM,p010,p090]")
+    members = match.group("members")
+    if members is None:
+        return match.group("field"), list(DEFAULT_MEMBERS)
+    return match.group("field"), [member.strip() for member in members.split(",")]
+
+
+def member_z_score(member: str) -> float:
+    """Offset of an ensemble member from the deterministic forecast, in standard deviations.
+    `DTRM` is 0, and a percentile (e.g. `p090`) is the inverse normal CDF of its probability.
+    """
+    if member.upper() == "DTRM":
+        return 0.0
+    match = _PERCENTILE.match(member)
+    if not match or not 0 < int(match.group(1)) < 100:
+        raise ValueError(f"Invalid member {member}, expected DTRM or a percentile like p010")
+    return NormalDist().inv_cdf(int(match.group(1)) / 100)
+
+
+class GridGenerator:  # pylint: disable=too-many-instance-attributes
+    """Generates synthetic forecasts of one field, as lazy (Dask-backed) grids: every chunk is
+    computed only when written, from the seed and its position, so output of any size can be
+    written without holding it in memory. Values are smooth, drift with lead time, and
+    percentile members are ordered (p010 <= DTRM <= p090), so they exercise the same code paths
+    as real NBM data.
+
+    Args:
+        field (str): field name (a key of `FIELDS`), optionally with members, e.g.
+            `WINDSPEED:[DTRM,p010,p025,p075,p090]`
+        grid (str): key of `GRID_LAYOUTS`. Defaults to "nbm".
+        width (int | None): number of columns. Defaults to full CONUS grid of the layout.
+        height (int | None): number of rows. Defaults to full CONUS grid of the layout.
+        lead_count (int): number of hourly valid times, starting 1 hour after issue
+        issue_dt (datetime | None): issue time. Defaults to a fixed time, so output is
+            reproducible.
+        chunk_size (int): rows and columns per chunk, both in memory and on disk
+        seed (int): seed of random noise added to every value
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        field: str = "TEMP",
+        grid: str = "nbm",
+        *,
+        width: int | None = None,
+        height: int | None = None,
+        lead_count: int = 12,
+        issue_dt: datetime | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        seed: int = 0,
+    ):
+        self.field, self.members = parse_field_spec(field)
+        if self.field not in FIELDS:
+            raise ValueError(f"Unknown field {self.field}, expected one of {sorted(FIELDS)}")
+        if grid not in GRID_LAYOUTS:
+            raise ValueError(f"Unknown grid {grid}, expected one of {sorted(GRID_LAYOUTS)}")
+        if lead_count < 1 or chunk_size < 1:
+            raise ValueError("lead_count and chunk_size must be positive")
+
+        self.layout = GRID_LAYOUTS[grid]
+        self.width = width or self.layout["width"]
+        self.height = height or self.layout["height"]
+        self.issue_dt = issue_dt or datetime(2026, 1, 1, 12, tzinfo=UTC)
+        self.valid_dts = [
+            self.issue_dt + timedelta(hours=lead) for lead in range(1, lead_count + 1)
+        ]
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self._z_scores = [member_z_score(member) for member in self.members]
+
+    def data(self) -> "da.Array":
+        """All generated values, as lazy array of shape (member, validDt, row, column)"""
+        import dask.array as da  # pylint: disable=import-outside-toplevel
+
+        chunks = (1, 1, min(self.chunk_size, self.height), min(self.chunk_size, self.width))
+        template = da.empty(
+            (len(self.members), len(self.valid_dts), self.height, self.width),
+            dtype=np.float32,
+            chunks=chunks,
+        )
+        return template.map_blocks(
+            partial(
+                _generate_block,
+                field_params=FIELDS[self.field][2],
+                z_scores=self._z_scores,
+                shape=(self.height, self.width),
+                seed=self.seed,
+            ),
+            dtype=np.float32,
+        )
+
+    def dataset(self) -> "xr.Dataset":
+        """Every member and valid time in one lazy dataset, with `grid` variable of dims
+        (member, validDt, row, column)
+        """
+        import xarray as xr  # pylint: disable=import-outside-toplevel
+
+        dims = self.layout["dims"]
+        return xr.Dataset(
+            {"grid": (("member", "validDt", *dims), self.data())},
+            coords={
+                "member": np.array(self.members, dtype=object),
+                "validDt": np.array([dt.replace(tzinfo=None) for dt in self.valid_dts], "M8[ns]"),
+                **self._coords(),
+            },
+            attrs=self._attrs(),
+        )
+
+    def write_netcdf(  # pylint: disable=too-many-locals
+        self, base_dir: str, complevel: int = 4
+    ) -> list[str]:
+        """Write one compressed, chunked NetCDF file per member and valid time, in the IDSSe
+        gridstore layout of the fixtures in idsse.testing.risk_processor: a single 2-D `grid`
+        variable, with product, field, validDt, units, etc. as global attributes.
+
+        Returns:
+            list[str]: paths of files written
+        """
+        import xarray as xr  # pylint: disable=import-outside-toplevel
+
+        os.makedirs(base_dir, exist_ok=True)
+        data = self.data()
+        dims = self.layout["dims"]
+        chunks = (min(self.chunk_size, self.height), min(self.chunk_size, self.width))
+        filepaths = []
+        for member_index, member in enumerate(self.members):
+            for valid_index, valid_dt in enumerate(self.valid_dts):
+                field = self.field if member.upper() == "DTRM" else f"{self.field}:{member}"
+                units = FIELDS[self.field][0]
+                dataset = xr.Dataset(
+                    {"grid": (dims, data[member_index, valid_index])},
+                    coords=self._coords(),
+                    attrs={
+                        **self._attrs(),
+                        "field": field,
+                        "validDt": str(valid_dt),
+                        "dataKey": f'{self.layout["product"]}:{self.layout["region"]}:{field}'
+                        f"::{units}::{self.issue_dt:%Y%m%d%H%M%S}.{valid_dt:%Y%m%d%H%M%S}",
+                    },
+                )
+                filepath = os.path.join(
+                    base_dir, f"{valid_dt:%Y_%m_%d_%H_%M}_{self.field}_{member.upper()}.nc"
+                )
+                dataset.to_netcdf(
+                    filepath,
+                    engine="netcdf4",
+                    encoding={
+                        "grid": {
+                            "zlib": complevel > 0,
+                            "complevel": complevel,
+                            "shuffle": True,
+                            "chunksizes": chunks,
+                        }
+                    },
+                )
+                filepaths.append(filepath)
+        return filepaths
+
+    def write_zarr(self, path: str) -> str:
+        """Write every member and valid time to one compressed, chunked Zarr store (see
+        `dataset`). If path ends with `.zarr.zip`, the store is zipped, like the Zarr fixtures.
+
+        Returns:
+            str: path written
+        """
+        if not path.endswith(".zip"):
+            self.dataset().to_zarr(path, mode="w")
+            return path
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # chunks are already compressed, so zip the directory store without compressing again
+        with TemporaryDirectory(dir=os.path.dirname(os.path.abspath(path))) as tmp_dir:
+            store_dir = self.write_zarr(os.path.join(tmp_dir, "store.zarr"))
+            with ZipFile(path, "w", compression=ZIP_STORED, allowZip64=True) as zip_file:
+                for dirpath, _, filenames in os.walk(store_dir):
+                    for filename in filenames:
+                        filepath = os.path.join(dirpath, filename)
+                        zip_file.write(filepath, os.path.relpath(filepath, store_dir))
+        return path
+
+    def _coords(self) -> dict:
+        if self.layout["dims"] != ("latitude", "longitude"):
+            return {}
+        # MRMS cell centers, from the north west corner at 0.01 degree spacing
+        return {
+            "latitude": np.round(54.995 - 0.01 * np.arange(self.height), 3),
+            "longitude": np.round(230.005 + 0.01 * np.arange(self.width), 3),
+        }
+
+    def _attrs(self) -> dict:
+        units, data_name, _ = FIELDS[self.field]
+        return {
+            "product": self.layout["product"],
+            "field": self.field,
+            "region": self.layout["region"],
+            "issueDt": str(self.issue_dt),
+            "task": "data_task",
+            "units": units,
+            "projName": self.layout["projName"],
+            "projSpec": self.layout["projSpec"],
+            "gridSpec": self.layout["gridSpec"].format(width=self.width, height=self.height),
+            "dataName": data_name,
+            "dataLoc": self.layout["dataLoc"],
+            "dataOrder": "latitude,longitude",
+            "members": ",".join(self.members),
+        }
+
+
+def _generate_block(  # pylint: disable=too-many-arguments,too-many-locals
+    block: np.ndarray,
+    block_info: dict | None = None,
+    *,
+    field_params: tuple,
+    z_scores: list[float],
+    shape: tuple[int, int],
+    seed: int,
+) -> np.ndarray:
+    """Compute one (member, lead, rows, columns) chunk from its position in the whole grid.
+    Smooth part is a function of global position, so chunks join seamlessly.
+    """
+    mean, amplitude, spread, minimum = field_params
+    (member_0, _), (lead_0, _), (row_0, row_1), (col_0, col_1) = block_info[None]["array-location"]
+    lead_hours = lead_0 + 1
+
+    rows = (np.arange(row_0, row_1, dtype=np.float32) / shape[0])[:, np.newaxis]
+    cols = (np.arange(col_0, col_1, dtype=np.float32) / shape[1])[np.newaxis, :]
+    phase = np.float32(2 * np.pi)
+    values = mean + amplitude * (
+        0.6
+        * np.sin(phase * (1.5 * cols + lead_hours / 48))
+        * np.cos(phase * (1.2 * rows - lead_hours / 72))
+        + 0.4 * np.sin(phase * (4 * cols + 3 * rows) + seed)
+    )
+
+    # same noise for every member of a lead time, so percentiles stay in order
+    rng = np.random.default_rng([seed, lead_0, row_0, col_0])
+    values += rng.normal(0, spread / 4, values.shape).astype(np.float32)
+    values += z_scores[member_0] * spread * (1 + lead_hours / 48)
+    if minimum is not None:
+        np.maximum(values, minimum, out=values)
+    return values.astype(np.float32).reshape(block.shape)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = ArgumentParser(description="Generate synthetic gridded forecasts for benchmarking")
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="Directory to write NetCDF files to, or path of Zarr store if ends with "
+        ".zarr or .zarr.zip",
+    )
+    parser.add_argument(
+        "--field",
+        default="TEMP",
+        help=f"One of {sorted(FIELDS)}, optionally with members, e.g. "
+        "WINDSPEED:[DTRM,p010,p025,p075,p090]",
+    )
+    parser.add_argument("--grid", default="nbm", choices=sorted(GRID_LAYOUTS))
+    parser.add_argument("--width", type=int, default=None, help="Columns. Default is full CONUS")
+    parser.add_argument("--height", type=int, default=None, help="Rows. Default is full CONUS")
+    parser.add_argument("--leads", type=int, default=12, help="Number of hourly valid times")
+    parser.add_argument(
+        "--issue_dt",
+        type=datetime.fromisoformat,
+        default=None,
+        help="ISO 8601 issue time, e.g. 2023-01-10T08:00:00+00:00",
+    )
+    parser.add_argument("--chunk_size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--complevel", type=int, default=4, help="NetCDF zlib compression level")
+    parser.add_argument("--seed", type=int, default=0)
+    _args = parser.parse_args()
+
+    _generator = GridGenerator(
+        _args.field,
+        _args.grid,
+        width=_args.width,
+        height=_args.height,
+        lead_count=_args.leads,
+        issue_dt=_args.issue_dt,
+        chunk_size=_args.chunk_size,
+        seed=_args.seed,
+    )
+    if _args.output.endswith((".zarr", ".zarr.zip")):
+        print(f"Wrote {_generator.write_zarr(_args.output)}")
+    else:
+        print(f"Wrote {len(_generator.write_netcdf(_args.output, _args.complevel))} files")
@@ -0,0 +1,303 @@
+"""Manifest of every test resource packaged in idsse.testing, with precomputed metadata"""
+
+# --------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved. (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# --------------------------------------------------------------------------------
+
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+from argparse import ArgumentParser
+from collections.abc import Callable, Iterator
+from datetime import datetime, UTC
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# root of all idsse.testing packages, and where the manifest is written (shipped with package)
+TESTING_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resource_manifest.json")
+MANIFEST_VERSION = 1
+
+# format of each file, by extension. Checked in order, so longer extensions come first
+FORMATS = {
+    ".zarr.zip": "zarr.zip",
+    ".grib2": "grib2",
+    ".nc": "netcdf",
+    ".json": "json",
+    ".csv": "csv",
+    ".html": "html",
+    ".md": "markdown",
+}
+GRIDDED_FORMATS = {"netcdf", "grib2", "zarr.zip"}
+LFS_POINTER_PREFIX = b"version https://git-lfs.github.com/spec/"
+SKIPPED_EXTENSIONS = (".py", ".pyc", ".npy", ".idx")
+
+
+def build_manifest(root: str = TESTING_ROOT) -> dict:
+    """Scan every test resource under `root`, recording its size, SHA-256 hash and format, and
+    for gridded files (NetCDF, GRIB2, zipped Zarr) the dims, variables (shape and dtype), global
+    attributes and time range. Opening every gridded file is slow, so this is meant to run at
+    build time (see `python -m idsse.testing.utils.manifest`), not by consumers.
+
+    Returns:
+        dict: the manifest, with a `resources` list of one entry per file
+    """
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name != "__pycache__")
+        for filename in sorted(filenames):
+            abs_path = os.path.join(dirpath, filename)
+            if filename.endswith(SKIPPED_EXTENSIONS) or abs_path == MANIFEST_PATH:
+                continue
+            entries.append(_describe_file(root, abs_path))
+
+    return {"version": MANIFEST_VERSION, "resources": entries}
+
+
+@lru_cache(maxsize=1)
+def load_manifest(manifest_path: str = MANIFEST_PATH) -> dict:
+    """Read the (pre-built) resource manifest. Cached, so only read from disk once per process.
+
+    Raises:
+        FileNotFoundError: if the manifest has not been built
+    """
+    with open(manifest_path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def find_resources(
+    pattern: str | None = None,
+    resource_format: str | None = None,
+    variables: list[str] | None = None,
+    predicate: Callable[[dict], bool] | None = None,
+    **attrs: str,
+) -> list[dict]:
+    """Find test resources matching every criterion given, without opening any of them.
+
+    E.g. all NBM temperature grids over CONUS:
+    ```
+    find_resources(product="NBM.AWS.GRIB", field="TEMP", region="CONUS")
+    ```
+
+    Args:
+        pattern (optional, str | None): glob pattern matched against the path relative to
+            idsse/testing, e.g. `risk_processor/*/*.nc`
+        resource_format (optional, str | None): one of the values of `FORMATS`, or
+            "git-lfs-pointer" for files whose content was never pulled from Git LFS
+        variables (optional, list[str] | None): gridded resources having all of these variables
+        predicate (optional, Callable[[dict], bool] | None): custom filter given each entry
+        **attrs (str): gridded resources whose global attributes (or, if not set, the
+            directories in their path) match these values, not case sensitive
+
+    Returns:
+        list[dict]: matching manifest entries, each having `package` and `filename` that can be
+            passed to `get_resource_from_file` or `open_dataset_resource`
+    """
+    return [
+        entry
+        for entry in load_manifest()["resources"]
+        if (pattern is None or fnmatch.fnmatch(entry["path"], pattern))
+        and (resource_format is None or entry["format"] == resource_format)
+        and (
+            variables is None or set(variables) <= set(entry.get("grid", {}).get("variables", {}))
+        )
+        and all(_attr_matches(entry, key, value) for key, value in attrs.items())
+        and (predicate is None or predicate(entry))
+    ]
+
+
+def get_resource_entry(package: str, filename: str) -> dict | None:
+    """Look up the manifest entry of one test resource, or None if it is not in the manifest"""
+    return _entries_by_key().get((package, filename))
+
+
+def verify_resource(package: str, filename: str) -> bool:
+    """Check that a test resource on disk still matches the size and hash in the manifest
+
+    Raises:
+        KeyError: if resource is not in the manifest
+    """
+    entry = get_resource_entry(package, filename)
+    if entry is None:
+        raise KeyError(f"Resource {package}/{filename} is not in the manifest")
+    abs_path = os.path.join(TESTING_ROOT, entry["path"])
+    return os.path.getsize(abs_path) == entry["size"] and _sha256(abs_path) == entry["sha256"]
+
+
+@lru_cache(maxsize=1)
+def _entries_by_key() -> dict[tuple[str, str], dict]:
+    return {(entry["package"], entry["filename"]): entry for entry in load_manifest()["resources"]}
+
+
+def _attr_matches(entry: dict, key: str, value: str) -> bool:
+    attr_value = entry.get("grid", {}).get("attrs", {}).get(key)
+    if attr_value is not None:
+        return str(attr_value).lower() == str(value).lower()
+    # attribute unknown (e.g. empty placeholder file), so fall back to directory names in path
+    return str(value).lower() in (part.lower() for part in entry["path"].split("/")[:-1])
+
+
+def _describe_file(root: str, abs_path: str) -> dict:
+    rel_path = os.path.relpath(abs_path, root).replace(os.sep, "/")
+    package, filename = _split_package(root, abs_path)
+    with open(abs_path, "rb") as file:
+        head = file.read(1024)
+
+    entry = {
+        "path": rel_path,
+        "package": package,
+        "filename": filename,
+        "size": os.path.getsize(abs_path),
+        "sha256": _sha256(abs_path),
+        "format": next(
+            (fmt for ext, fmt in FORMATS.items() if abs_path.endswith(ext)),
+            os.path.splitext(abs_path)[1].lstrip(".") or "unknown",
+        ),
+    }
+    if head.startswith(LFS_POINTER_PREFIX):
+        # content was never pulled from Git LFS, so can't be opened. Record what it should be
+        pointer = dict(line.split(" ", 1) for line in head.decode().splitlines() if " " in line)
+        entry["lfs"] = {
+            "format": entry["format"],
+            "size": int(pointer.get("size", 0)),
+            "sha256": pointer.get("oid", "").removeprefix("sha256:"),
+        }
+        entry["format"] = "git-lfs-pointer"
+    elif entry["size"] == 0:
+        entry["empty"] = True
+    elif entry["format"] in GRIDDED_FORMATS:
+        try:
+            entry["grid"] = _describe_grid(package, filename, entry["format"])
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning("Unable to read gridded resource %s: %s", rel_path, exc)
+            entry["error"] = str(exc)
+    elif entry["format"] == "json":
+        entry["json"] = _describe_json(abs_path)
+    return entry
+
+
+def _describe_grid(package: str, filename: str, resource_format: str) -> dict:
+    # pylint: disable=import-outside-toplevel
+    from .resources import get_filepath, open_dataset_resource
+
+    if resource_format == "grib2":
+        import cfgrib
+
+        # GRIB2 files may hold fields that cfgrib can only open as separate datasets
+        datasets = cfgrib.open_datasets(
+            get_filepath(package, filename), backend_kwargs={"indexpath": ""}
+        )
+    else:
+        datasets = [open_dataset_resource(package, filename, chunks=None)]
+
+    grid = {"dims": {}, "variables": {}, "attrs": {}, "timeRange": None}
+    times = []
+    for dataset in datasets:
+        with dataset:
+            grid["dims"].update({str(dim): int(size) for dim, size in dataset.sizes.items()})
+            grid["variables"].update(
+                {
+                    str(name): {
+                        "dims": [str(dim) for dim in var.dims],
+                        "shape": [int(size) for size in var.shape],
+                        "dtype": str(var.dtype),
+                    }
+                    for name, var in dataset.data_vars.items()
+                }
+            )
+            grid["attrs"].update({str(key): str(value) for key, value in dataset.attrs.items()})
+            times.extend(
+                value
+                for coord in dataset.coords.values()
+                if coord.dtype.kind == "M"
+                for value in coord.values.ravel()
+            )
+
+    if times:
+        grid["timeRange"] = [_to_iso(min(times)), _to_iso(max(times))]
+    elif "validDt" in grid["attrs"]:
+        # IDSSe gridstore NetCDF files have no time coordinate, just issue and valid attributes
+        valid_dt = datetime.fromisoformat(grid["attrs"]["validDt"])
+        issue_dt = datetime.fromisoformat(grid["attrs"].get("issueDt", grid["attrs"]["validDt"]))
+        grid["timeRange"] = [
+            issue_dt.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            valid_dt.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        ]
+    return grid
+
+
+def _describe_json(abs_path: str) -> dict:
+    try:
+        with open(abs_path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+    except ValueError:
+        return {"valid": False}
+    if isinstance(data, dict):
+        return {"valid": True, "type": "object", "keys": sorted(data)}
+    if isinstance(data, list):
+        return {"valid": True, "type": "array", "length": len(data)}
+    return {"valid": True, "type": type(data).__name__}
+
+
+def _split_package(root: str, abs_path: str) -> tuple[str, str]:
+    """Find the deepest importable package (all directory names valid Python identifiers)
+    containing a file, and the file's path relative to it
+    """
+    python_root = os.path.dirname(os.path.dirname(root))
+    parts = os.path.relpath(os.path.dirname(abs_path), python_root).split(os.sep)
+    depth = next(
+        (index for index, part in enumerate(parts) if not part.isidentifier()), len(parts)
+    )
+    package_dir = os.path.join(python_root, *parts[:depth])
+    return ".".join(parts[:depth]), os.path.relpath(abs_path, package_dir).replace(os.sep, "/")
+
+
+def _sha256(abs_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(abs_path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _to_iso(value) -> str:
+    return str(value.astype("datetime64[s]")) + "Z"
+
+
+def _changed_entries(old: dict, new: dict) -> Iterator[str]:
+    """Paths of resources added, removed or changed between two manifests"""
+    old_entries = {entry["path"]: entry for entry in old["resources"]}
+    new_entries = {entry["path"]: entry for entry in new["resources"]}
+    for rel_path in sorted(old_entries.keys() | new_entries.keys()):
+        if old_entries.get(rel_path) != new_entries.get(rel_path):
+            yield rel_path
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = ArgumentParser(description="Build the manifest of idsse.testing resources")
+    parser.add_argument("--output", default=MANIFEST_PATH, help="Path to write manifest JSON")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Don't write anything, just exit with error if existing manifest is out of date",
+    )
+    _args = parser.parse_args()
+
+    _manifest = build_manifest()
+    if _args.check:
+        _changed = list(_changed_entries(load_manifest(_args.output), _manifest))
+        if _changed:
+            raise SystemExit(f"Resource manifest out of date, changed resources: {_changed}")
+    else:
+        with open(_args.output, "w", encoding="utf-8") as _file:
+            json.dump(_manifest, _file, indent=2)
+            _file.write("\n")
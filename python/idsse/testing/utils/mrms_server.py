@@ -0,0 +1,428 @@
+"""Local stand-in for the NSSL MRMS data server: Apache-style directory listings of a synthetic
+archive of GRIB2 files (like `idsse_common/mrms_response.html`), and the files themselves"""
+
+# --------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved. (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# --------------------------------------------------------------------------------
+
+import gzip
+import logging
+import re
+import time
+from argparse import ArgumentParser
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+
+from .resources import get_filepath
+
+logger = logging.getLogger(__name__)
+
+MRMS_PRODUCT = "MergedReflectivityQC_00.50"
+# as named on the NSSL server. Valid time can be used more than once, e.g. to match
+# `mrms_valid_response.html`: "MRMS_{product}_{valid:%Y%m%d-%H%M%S}_{valid:%Y%m%d-%H%M%S}.grib2"
+MRMS_FILENAME_FORMAT = "MRMS_{product}_{valid:%Y%m%d-%H%M%S}.grib2"
+MRMS_CADENCE = timedelta(minutes=2)
+# delay from a file's valid time until it is listed (and its Last-Modified time)
+MRMS_LATENCY = timedelta(seconds=30)
+
+GRIB_PACKAGE = "idsse.testing.data_access.mrms_nssl_grib"
+GRIB_FILENAME = "MRMS_MergedReflectivityQCComposite_00.50_20241216-201839.grib2"
+
+_LISTING_HEADER = """<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 3.2 Final//EN">
+<html>
+ <head>
+  <title>Index of {directory}</title>
+ </head>
+ <body>
+<h1>Index of {directory}</h1>
+<tr><td><a href="{parent}">Parent Directory</a></td><td>&nbsp;</td><td align="right">  - </td></tr>
+"""
+_LISTING_ROW = (
+    '<tr><td><a href="{href}">{name}</a></td>'
+    '<td align="right">{modified:%d-%b-%Y %H:%M}  </td><td align="right">{size}</td></tr>\n'
+)
+_LISTING_FOOTER = """    <tr><th colspan="3"><hr></th></tr>
+</table>
+</body></html>
+"""
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class MrmsArchive:  # pylint: disable=too-many-instance-attributes
+    """Synthetic archive of MRMS files, one every `cadence` from `start`. Every file has the same
+    content, a GRIB2 fixture, and file `index` is listed from `start + index * cadence + latency`
+    onward, so polling clients see new files appear on the real cadence (or faster, see
+    `SimulatedClock`).
+
+    Listings of thousands of files are cheap to serve repeatedly: each row is rendered once,
+    and the whole listing only re-rendered when a new file appears.
+
+    Args:
+        start (datetime): valid time of the first file
+        count (int): total number of files in the archive
+        cadence (timedelta): time between files. Default 2 minutes
+        latency (timedelta): time from a file's valid time until it appears. Default 30 seconds
+        product (str): MRMS product, in file names and the directory
+        filename_format (str): format of file names, given `product` and `valid` time
+        compress (bool): if True, serve files gzipped with `.gz` names, as NSSL does.
+            Default False
+        grib_package (str): package of the GRIB2 file served as every file's content
+        grib_filename (str): name of the GRIB2 file in `grib_package`
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        start: datetime,
+        count: int = 1000,
+        *,
+        cadence: timedelta = MRMS_CADENCE,
+        latency: timedelta = MRMS_LATENCY,
+        product: str = MRMS_PRODUCT,
+        filename_format: str = MRMS_FILENAME_FORMAT,
+        compress: bool = False,
+        grib_package: str = GRIB_PACKAGE,
+        grib_filename: str = GRIB_FILENAME,
+    ):
+        if cadence <= timedelta(0):
+            raise ValueError(f"Cadence must be positive, got {cadence}")
+        self.start = start if start.tzinfo else start.replace(tzinfo=UTC)
+        self.count = count
+        self.cadence = cadence
+        self.latency = latency
+        self.product = product
+        self.directory = f"/data/3DRefl/{product}/"
+        self.compress = compress
+
+        with open(get_filepath(grib_package, grib_filename), "rb") as file:
+            content = file.read()
+        self.content = gzip.compress(content, mtime=0) if compress else content
+
+        self._filename_format = filename_format + (".gz" if compress else "")
+        self._names: dict[str, int] = {}  # filled in as rows are rendered
+        self._rows: list[str] = []
+        self._listing: tuple[int, bytes] = (-1, b"")
+        self._lock = Lock()
+
+    @property
+    def end(self) -> datetime:
+        """Time the last file appears, after which the archive stops growing"""
+        return self.modified(self.count - 1)
+
+    def filename(self, index: int) -> str:
+        """Name of file `index`"""
+        valid = self.start + index * self.cadence
+        return self._filename_format.format(product=self.product, valid=valid)
+
+    def modified(self, index: int) -> datetime:
+        """Time file `index` appears, which is also its modification time"""
+        return self.start + index * self.cadence + self.latency
+
+    def available(self, now: datetime) -> int:
+        """Number of files listed at time `now`"""
+        elapsed = now - self.start - self.latency
+        if elapsed < timedelta(0):
+            return 0
+        return min(elapsed // self.cadence + 1, self.count)
+
+    def find(self, name: str, now: datetime) -> int | None:
+        """Index of file with this name, if it has appeared by `now`. The name `latest` (as in
+        `MRMS_MergedReflectivityQC_00.50.latest.grib2`) is the newest file
+        """
+        available = self.available(now)
+        if name.endswith(".latest.grib2" + (".gz" if self.compress else "")):
+            return available - 1 if available else None
+        with self._lock:
+            self._render_rows(available)
+            index = self._names.get(name)
+        return index if index is not None and index < available else None
+
+    def listing(self, now: datetime) -> tuple[bytes, datetime | None]:
+        """HTML directory listing of every file available at time `now`, and the modification
+        time of the newest (None if the directory is empty)
+        """
+        available = self.available(now)
+        last_modified = self.modified(available - 1) if available else None
+        with self._lock:
+            if self._listing[0] != available:
+                self._render_rows(available)
+                header = _LISTING_HEADER.format(
+                    directory=self.directory.rstrip("/"),
+                    parent=self.directory.rstrip("/").rsplit("/", 1)[0] + "/",
+                )
+                latest = ""
+                if available:
+                    latest = self._row(
+                        f"MRMS_{self.product}.latest.grib2{'.gz' if self.compress else ''}",
+                        self.filename(available - 1),
+                        last_modified,
+                    )
+                listing = "".join([header, latest, *self._rows[:available], _LISTING_FOOTER])
+                self._listing = (available, listing.encode())
+            return self._listing[1], last_modified
+
+    def _render_rows(self, available: int):
+        for index in range(len(self._rows), available):
+            name = self.filename(index)
+            self._names[name] = index
+            self._rows.append(self._row(name, name, self.modified(index)))
+
+    def _row(self, href: str, name: str, modified: datetime) -> str:
+        return _LISTING_ROW.format(
+            href=href, name=name, modified=modified, size=_format_size(len(self.content))
+        )
+
+
+class SimulatedClock:  # pylint: disable=too-few-public-methods
+    """Clock starting at `start` and running `speedup` times faster than real time, e.g. with
+    speedup 60 a file on a 2 minute cadence appears every 2 seconds
+
+    Args:
+        start (datetime): simulated time when clock is created
+        speedup (float): simulated seconds per real second. Default 1.0
+    """
+
+    def __init__(self, start: datetime, speedup: float = 1.0):
+        self.start = start if start.tzinfo else start.replace(tzinfo=UTC)
+        self.speedup = speedup
+        self._started = time.monotonic()
+
+    def __call__(self) -> datetime:
+        return self.start + timedelta(seconds=(time.monotonic() - self._started) * self.speedup)
+
+
+class MrmsServer:
+    """HTTP server for an MrmsArchive, running in a background thread. Serves the directory
+    listing at `archive.directory`, and each file below it, with `Last-Modified` headers.
+    Requests with `If-Modified-Since` get 304 Not Modified if nothing is newer, and file
+    requests with `Range: bytes=...` get 206 Partial Content.
+
+    Use as a context manager, or call `start()` and `stop()`:
+
+        with MrmsServer(MrmsArchive(start, count=5000)) as server:
+            requests.get(server.url)
+
+    Args:
+        archive (MrmsArchive): files to serve
+        clock (Callable[[], datetime] | None): current time, deciding which files have
+            appeared, e.g. a SimulatedClock. Default None serves the whole archive
+        host (str): address to listen on. Default localhost
+        port (int): port to listen on. Default 0, any free port (see `url`)
+    """
+
+    def __init__(
+        self,
+        archive: MrmsArchive,
+        clock: Callable[[], datetime] | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.archive = archive
+        self.clock = clock or (lambda: archive.end)
+        handler = type(
+            "MrmsRequestHandler",
+            (_MrmsRequestHandler,),
+            {"archive": archive, "clock": staticmethod(self.clock)},
+        )
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self._thread: Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """URL of the archive's directory listing"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{self.archive.directory}"
+
+    def start(self) -> "MrmsServer":
+        """Start serving in a daemon thread"""
+        self._thread = Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info("Serving %d MRMS files at %s", self.archive.count, self.url)
+        return self
+
+    def stop(self):
+        """Stop serving, and release the port"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "MrmsServer":
+        return self.start()
+
+    def __exit__(self, *_):
+        self.stop()
+
+
+class _MrmsRequestHandler(BaseHTTPRequestHandler):
+    """Serves the listing and files of one archive, set by subclassing (see MrmsServer)"""
+
+    archive: MrmsArchive
+    clock: Callable[[], datetime]
+
+    def do_HEAD(self):  # pylint: disable=invalid-name
+        """Same headers as GET, without the body"""
+        self._respond(include_body=False)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Directory listing, or (part of) a file"""
+        self._respond(include_body=True)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        logger.debug(format, *args)
+
+    def _respond(self, include_body: bool):
+        now = self.clock()
+        path = self.path.split("?", 1)[0]
+        if path in (self.archive.directory, self.archive.directory.rstrip("/")):
+            body, last_modified = self.archive.listing(now)
+            self._send(body, "text/html;charset=UTF-8", last_modified, include_body)
+            return
+
+        index = None
+        if path.startswith(self.archive.directory):
+            index = self.archive.find(path.removeprefix(self.archive.directory), now)
+        if index is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        content_type = (
+            "application/x-gzip" if self.archive.compress else "application/octet-stream"
+        )
+        self._send(
+            self.archive.content,
+            content_type,
+            self.archive.modified(index),
+            include_body,
+            ranges=True,
+        )
+
+    def _send(  # pylint: disable=too-many-arguments
+        self,
+        body: bytes,
+        content_type: str,
+        last_modified: datetime | None,
+        include_body: bool,
+        ranges: bool = False,
+    ):
+        """Send body, or only the requested Range of it (if `ranges` is True), unless it has
+        not been modified since the request's If-Modified-Since
+        """
+        if last_modified and self._not_modified_since(last_modified):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("Last-Modified", format_datetime(last_modified, usegmt=True))
+            self.end_headers()
+            return
+
+        status, headers = HTTPStatus.OK, {}
+        if ranges:
+            headers["Accept-Ranges"] = "bytes"
+        if ranges and "Range" in self.headers:
+            byte_range = _parse_range(self.headers["Range"], len(body))
+            if byte_range is None:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            first, last = byte_range
+            status = HTTPStatus.PARTIAL_CONTENT
+            headers["Content-Range"] = f"bytes {first}-{last}/{len(body)}"
+            body = memoryview(body)[first : last + 1]
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if last_modified:
+            self.send_header("Last-Modified", format_datetime(last_modified, usegmt=True))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if include_body:
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                # client only wanted the headers, e.g. checking Last-Modified
+                logger.debug("Client closed connection before %s was sent", self.path)
+
+    def _not_modified_since(self, last_modified: datetime) -> bool:
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if not if_modified_since:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False  # ignored if invalid, as in RFC 9110
+        # HTTP dates have whole seconds only
+        return last_modified.replace(microsecond=0) <= since
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """First and last byte (inclusive) of a single `bytes=first-last`, `bytes=first-` or
+    `bytes=-suffix_length` range, or None if it is malformed or not satisfiable
+    """
+    match = _RANGE_PATTERN.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if not first:  # suffix range: the last N bytes
+        return (max(size - int(last), 0), size - 1) if int(last) and size else None
+    first, last = int(first), min(int(last) if last else size - 1, size - 1)
+    return (first, last) if first <= last else None
+
+
+def _format_size(size: int) -> str:
+    """Size as Apache lists it, e.g. 381K or 1.8M"""
+    for unit in ("", "K", "M", "G"):
+        if size < 1024 or unit == "G":
+            break
+        size /= 1024
+    if unit and size < 10:
+        return f"{size:.1f}{unit}"
+    return f"{size:.0f}{unit}"
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = ArgumentParser(description="Serve a synthetic MRMS archive, like the NSSL server")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--count", type=int, default=5000, help="Number of files in the archive")
+    parser.add_argument(
+        "--start",
+        default=None,
+        help="Valid time of first file, e.g. 2024-12-16T00:00:00. Default is now",
+    )
+    parser.add_argument(
+        "--cadence", type=float, default=120, help="Seconds between files. Default 120"
+    )
+    parser.add_argument(
+        "--speedup",
+        type=float,
+        default=None,
+        help="Start at the first file, and add files this many times faster than real time. "
+        "Default is to serve the whole archive at once",
+    )
+    parser.add_argument("--gzip", action="store_true", help="Serve gzipped .grib2.gz files")
+    _args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    _start = datetime.fromisoformat(_args.start) if _args.start else datetime.now(UTC)
+    _archive = MrmsArchive(
+        _start, _args.count, cadence=timedelta(seconds=_args.cadence), compress=_args.gzip
+    )
+    _clock = SimulatedClock(_start, _args.speedup) if _args.speedup else None
+    with MrmsServer(_archive, _clock, _args.host, _args.port) as _server:
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,271 @@
+"""Compare event portfolios value by value, within absolute and relative tolerances"""
+
+# --------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved. (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# --------------------------------------------------------------------------------
+
+import glob
+import json
+import os
+import sys
+from argparse import ArgumentParser
+from dataclasses import dataclass, field
+from typing import BinaryIO, TextIO
+
+import numpy as np
+
+from .portfolio_table import PORTFOLIO_DIR, flatten_portfolio
+
+# columns (see `portfolio_table.COLUMNS`) identifying one series: a hazard's condition, criteria
+# or raw value, at one location. Rows are matched on these plus validDt
+ALIGN_COLUMNS = ("conditionKey", "productKey", "locationKey", "name", "type", "dataType")
+
+DEFAULT_ATOL = 1e-6
+DEFAULT_RTOL = 1e-6
+# max number of individual differences listed in each diff (all are always counted)
+DEFAULT_MAX_DETAILS = 20
+
+
+@dataclass
+class PortfolioDiff:  # pylint: disable=too-many-instance-attributes
+    """Differences between an expected and an actual event portfolio.
+
+    Args:
+        expected (str): name of expected portfolio
+        actual (str): name of actual portfolio
+        matched (int): number of values (series x validDt) found in both
+        mismatched (int): number of matched values not equal within tolerance
+        missing (int): number of expected values not in actual
+        extra (int): number of actual values not in expected
+        max_abs_diff (float): largest absolute difference of any matched value
+        max_rel_diff (float): largest difference relative to the expected value
+        details (list[dict]): up to `max_details` of the mismatched, missing or extra values
+        error (str | None): why portfolios couldn't be compared at all (e.g. file missing)
+    """
+
+    expected: str
+    actual: str
+    matched: int = 0
+    mismatched: int = 0
+    missing: int = 0
+    extra: int = 0
+    max_abs_diff: float = 0.0
+    max_rel_diff: float = 0.0
+    details: list[dict] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def equal(self) -> bool:
+        """True if every value matched within tolerance, and none were missing or extra"""
+        return self.error is None and not (self.mismatched or self.missing or self.extra)
+
+    def to_dict(self) -> dict:
+        """Summary as JSON-serializable dict, with camelCase keys like the portfolios"""
+        return {
+            "expected": self.expected,
+            "actual": self.actual,
+            "equal": self.equal,
+            "matched": self.matched,
+            "mismatched": self.mismatched,
+            "missing": self.missing,
+            "extra": self.extra,
+            "maxAbsDiff": self.max_abs_diff,
+            "maxRelDiff": self.max_rel_diff,
+            "details": self.details,
+            "error": self.error,
+        }
+
+
+def diff_portfolios(  # pylint: disable=too-many-locals
+    expected: str | dict | BinaryIO | TextIO,
+    actual: str | dict | BinaryIO | TextIO,
+    atol: float = DEFAULT_ATOL,
+    rtol: float = DEFAULT_RTOL,
+    max_details: int = DEFAULT_MAX_DETAILS,
+) -> PortfolioDiff:
+    """Align two event portfolios by location, valid time and hazard (condition, criteria or raw
+    value of each part), and compare every value with NumPy. Values are equal if
+    `abs(actual - expected) <= atol + rtol * abs(expected)`, or both are null.
+
+    Args:
+        expected (str | dict | BinaryIO | TextIO): expected portfolio: path, stream or JSON
+        actual (str | dict | BinaryIO | TextIO): actual portfolio: path, stream or JSON
+        atol (optional, float): absolute tolerance
+        rtol (optional, float): relative tolerance
+        max_details (optional, int): max number of differences listed in `details`
+
+    Returns:
+        PortfolioDiff: counts and largest differences found, with some examples
+    """
+    result = PortfolioDiff(_name(expected), _name(actual))
+    exp_cols = flatten_portfolio(expected)
+    act_cols = flatten_portfolio(actual)
+    num_expected = len(exp_cols["value"])
+
+    # encode every row's alignment key as one integer, so rows can be matched by sorting
+    row_ids = _row_ids(exp_cols, act_cols)
+    exp_index = _first_unique(row_ids[:num_expected])
+    act_index = _first_unique(row_ids[num_expected:])
+    _, exp_matched, act_matched = np.intersect1d(
+        row_ids[:num_expected][exp_index],
+        row_ids[num_expected:][act_index],
+        assume_unique=True,
+        return_indices=True,
+    )
+    exp_matched, act_matched = exp_index[exp_matched], act_index[act_matched]
+
+    exp_values = exp_cols["value"][exp_matched]
+    act_values = act_cols["value"][act_matched]
+    is_close = np.isclose(act_values, exp_values, rtol=rtol, atol=atol, equal_nan=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        abs_diff = np.abs(act_values - exp_values)
+        rel_diff = abs_diff / np.abs(exp_values)
+
+    result.matched = len(exp_matched)
+    result.mismatched = int(np.count_nonzero(~is_close))
+    result.max_abs_diff = _nanmax(abs_diff)
+    result.max_rel_diff = _nanmax(rel_diff[np.isfinite(rel_diff)])
+
+    missing = np.setdiff1d(np.arange(num_expected), exp_matched, assume_unique=True)
+    extra = np.setdiff1d(np.arange(len(act_cols["value"])), act_matched, assume_unique=True)
+    result.missing, result.extra = len(missing), len(extra)
+
+    # only build Python objects for the few differences actually reported
+    for exp_row, act_row in zip(
+        exp_matched[~is_close][:max_details], act_matched[~is_close][:max_details]
+    ):
+        result.details.append(
+            {
+                "kind": "mismatched",
+                **_describe_row(exp_cols, exp_row),
+                "expected": _to_json_float(exp_cols["value"][exp_row]),
+                "actual": _to_json_float(act_cols["value"][act_row]),
+            }
+        )
+    for kind, columns, rows in (("missing", exp_cols, missing), ("extra", act_cols, extra)):
+        for row in rows[: max(max_details - len(result.details), 0)]:
+            result.details.append({"kind": kind, **_describe_row(columns, row)})
+    return result
+
+
+def diff_portfolio_dirs(
+    expected_dir: str,
+    actual_dir: str,
+    pattern: str = "*.json",
+    **kwargs,
+) -> list[PortfolioDiff]:
+    """Compare every event portfolio in one directory to the file with the same name in another.
+    Files missing from either directory are reported as an error in their PortfolioDiff.
+
+    Args:
+        expected_dir (str): directory of expected portfolios
+        actual_dir (str): directory of actual portfolios
+        pattern (optional, str): glob pattern of portfolio file names
+        **kwargs: tolerances and max_details, passed to `diff_portfolios`
+    """
+    expected_names = {
+        os.path.basename(path) for path in glob.glob(os.path.join(expected_dir, pattern))
+    }
+    actual_names = {
+        os.path.basename(path) for path in glob.glob(os.path.join(actual_dir, pattern))
+    }
+
+    diffs = []
+    for name in sorted(expected_names | actual_names):
+        if name not in actual_names:
+            diffs.append(PortfolioDiff(name, name, error=f"{name} missing from {actual_dir}"))
+        elif name not in expected_names:
+            diffs.append(PortfolioDiff(name, name, error=f"{name} not expected in {actual_dir}"))
+        else:
+            diffs.append(
+                diff_portfolios(
+                    os.path.join(expected_dir, name), os.path.join(actual_dir, name), **kwargs
+                )
+            )
+    return diffs
+
+
+def _row_ids(exp_cols: dict[str, np.ndarray], act_cols: dict[str, np.ndarray]) -> np.ndarray:
+    """Integer id of each row's alignment key (ALIGN_COLUMNS and validDt), expected rows first.
+    Rows with equal keys get equal ids.
+    """
+    codes = []
+    for column in ALIGN_COLUMNS:
+        _, inverse = np.unique(
+            np.concatenate([exp_cols[column], act_cols[column]]).astype(str), return_inverse=True
+        )
+        codes.append(inverse.ravel())
+    codes.append(np.concatenate([exp_cols["validDt"], act_cols["validDt"]]).astype(np.int64))
+    if codes[-1].size == 0:
+        return np.empty(0, dtype=np.int64)
+    _, row_ids = np.unique(np.column_stack(codes), axis=0, return_inverse=True)
+    return row_ids.ravel()
+
+
+def _first_unique(row_ids: np.ndarray) -> np.ndarray:
+    """Indexes of the first row with each id. Duplicate keys (not expected in valid portfolios)
+    are then reported as missing or extra
+    """
+    _, index = np.unique(row_ids, return_index=True)
+    return index
+
+
+def _describe_row(columns: dict[str, np.ndarray], row: int) -> dict:
+    described = {column: str(columns[column][row]) for column in ALIGN_COLUMNS}
+    described["validDt"] = f"{columns['validDt'][row]}Z"
+    return described
+
+
+def _name(source: str | dict | BinaryIO | TextIO) -> str:
+    if isinstance(source, str):
+        return os.path.basename(source)
+    if isinstance(source, dict):
+        return source.get("corrId", {}).get("uuid", "")
+    return getattr(source, "name", "")
+
+
+def _nanmax(values: np.ndarray) -> float:
+    values = values[~np.isnan(values)]
+    return float(values.max()) if len(values) else 0.0
+
+
+def _to_json_float(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = ArgumentParser(
+        description="Compare event portfolios to the expected ones. Exits with error if any differ"
+    )
+    parser.add_argument("actual", help="Event portfolio JSON file, or directory of them")
+    parser.add_argument(
+        "--expected",
+        default=PORTFOLIO_DIR,
+        help="Expected portfolio file or directory. Default is the portfolios in idsse.testing",
+    )
+    parser.add_argument("--atol", type=float, default=DEFAULT_ATOL, help="Absolute tolerance")
+    parser.add_argument("--rtol", type=float, default=DEFAULT_RTOL, help="Relative tolerance")
+    parser.add_argument(
+        "--max_details", type=int, default=DEFAULT_MAX_DETAILS, help="Differences listed per file"
+    )
+    _args = parser.parse_args()
+
+    _kwargs = {"atol": _args.atol, "rtol": _args.rtol, "max_details": _args.max_details}
+    if os.path.isdir(_args.actual):
+        _diffs = diff_portfolio_dirs(_args.expected, _args.actual, **_kwargs)
+    else:
+        _expected = _args.expected
+        if os.path.isdir(_expected):
+            _expected = os.path.join(_expected, os.path.basename(_args.actual))
+        _diffs = [diff_portfolios(_expected, _args.actual, **_kwargs)]
+
+    json.dump([_diff.to_dict() for _diff in _diffs], sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    if not all(_diff.equal for _diff in _diffs):
+        sys.exit(1)
@@ -0,0 +1,258 @@
+"""Streaming parser for event portfolio JSON, yielding location features, valid times and
+risk results one at a time instead of loading the whole document"""
+
+# --------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved. (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# --------------------------------------------------------------------------------
+
+import io
+import json
+from collections.abc import Iterator
+from typing import Any, BinaryIO, TextIO
+
+# arrays in an event portfolio whose items are yielded one at a time. Anything else at the top
+# level (e.g. `corrId`, `conditions`, `parts`) is small, and yielded whole
+STREAMED_ARRAYS = ("location.features", "validDt", "riskResults")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+
+
+def iter_portfolio(
+    source: str | BinaryIO | TextIO,
+    backend: str = "auto",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[str, Any]]:
+    """Incrementally parse an event portfolio, holding at most one item (e.g. one risk result)
+    in memory at a time.
+
+    Yields (path, value) tuples, in document order: for every item of the arrays in
+    `STREAMED_ARRAYS` the path is the array's path (e.g. `("riskResults", {...})` once per risk
+    result); for every other property it is the property's path with its whole value
+    (e.g. `("issueDt", "2025-06-24T14:00:00.000Z")`).
+
+    Args:
+        source (str | BinaryIO | TextIO): path to JSON file, or an open file/stream
+        backend (optional, str): "ijson" to use the ijson library (much faster if its C backend
+            is available), "python" for the built-in parser, or "auto" (default) to use ijson
+            if it is installed, unless `source` is a text stream (ijson only reads bytes)
+        chunk_size (optional, int): number of characters read from the stream at a time, for the
+            built-in parser
+
+    Raises:
+        ImportError: if backend is "ijson" but ijson is not installed
+        ValueError: if backend is unknown, or the JSON is malformed or not an object
+    """
+    if backend not in ("auto", "ijson", "python"):
+        raise ValueError(f"Unknown JSON backend {backend}, expected one of: auto, ijson, python")
+
+    ijson = None
+    if backend != "python":
+        try:
+            import ijson  # pylint: disable=import-outside-toplevel
+        except ImportError as exc:
+            if backend == "ijson":
+                raise ImportError(
+                    "ijson backend requires the ijson library: pip install idsse-testing[stream]"
+                ) from exc
+
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            yield from iter_portfolio(file, backend, chunk_size)
+        return
+
+    if ijson is not None and not (backend == "auto" and isinstance(source, io.TextIOBase)):
+        yield from _iter_ijson(ijson, source)
+    elif isinstance(source, (io.RawIOBase, io.BufferedIOBase)):
+        text_source = io.TextIOWrapper(source, encoding="utf-8")
+        try:
+            yield from _StreamParser(text_source, chunk_size).iter_object()
+        finally:
+            text_source.detach()  # so `source` is left open, for its owner to close
+    else:
+        yield from _StreamParser(source, chunk_size).iter_object()
+
+
+def iter_location_features(source: str | BinaryIO | TextIO, **kwargs) -> Iterator[dict]:
+    """Yield each GeoJSON feature of an event portfolio's `location`"""
+    return _iter_path(source, "location.features", **kwargs)
+
+
+def iter_valid_times(source: str | BinaryIO | TextIO, **kwargs) -> Iterator[dict]:
+    """Yield each `{"start": ..., "end": ...}` time range of an event portfolio's `validDt`"""
+    return _iter_path(source, "validDt", **kwargs)
+
+
+def iter_risk_results(source: str | BinaryIO | TextIO, **kwargs) -> Iterator[dict]:
+    """Yield each entry of an event portfolio's `riskResults`, including its time series of
+    `dataSummary`
+    """
+    return _iter_path(source, "riskResults", **kwargs)
+
+
+def _iter_path(source: str | BinaryIO | TextIO, path: str, **kwargs) -> Iterator[Any]:
+    return (value for item_path, value in iter_portfolio(source, **kwargs) if item_path == path)
+
+
+def _is_parent(path: str) -> bool:
+    """True if some streamed array is nested somewhere inside this path"""
+    return any(streamed.startswith(f"{path}.") for streamed in STREAMED_ARRAYS)
+
+
+class _StreamParser:  # pylint: disable=too-few-public-methods
+    """Minimal incremental JSON parser: walks the objects and arrays leading to the streamed
+    arrays itself, and hands every other value to the stdlib C decoder (`raw_decode`) once
+    enough of the stream has been buffered to hold it.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def iter_object(self, path: str = "") -> Iterator[tuple[str, Any]]:
+        """Parse the object starting at the current position, yielding its properties (or
+        items of its streamed arrays)
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self._decode()
+            self._expect(":")
+            child_path = f"{path}.{key}" if path else key
+
+            next_char = self._peek()
+            if child_path in STREAMED_ARRAYS and next_char == "[":
+                for item in self._iter_array():
+                    yield child_path, item
+            elif _is_parent(child_path) and next_char == "{":
+                yield from self.iter_object(child_path)
+            else:
+                yield child_path, self._decode()
+
+            if self._next_delimiter("}"):
+                return
+
+    def _iter_array(self) -> Iterator[Any]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode()
+            if self._next_delimiter("]"):
+                return
+
+    def _next_delimiter(self, closing: str) -> bool:
+        """Consume a `,` or the closing bracket. Returns True if it was the closing bracket"""
+        char = self._peek()
+        self._pos += 1
+        if char == closing:
+            return True
+        if char != ",":
+            raise ValueError(f"Expected ',' or '{closing}' in JSON, got {char!r}")
+        return False
+
+    def _decode(self) -> Any:
+        """Decode the next complete JSON value, reading more of the stream until it fits"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # a number at end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError as exc:
+                if self._eof:
+                    raise ValueError(f"Malformed JSON: {exc}") from exc
+            # grow reads geometrically, so a value much bigger than chunk_size isn't re-decoded
+            # once per chunk
+            self._read(max(self._chunk_size, len(self._buffer) - self._pos))
+
+    def _peek(self) -> str:
+        """Skip whitespace, and return the next character without consuming it"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                raise ValueError("Unexpected end of JSON")
+            self._read(self._chunk_size)
+
+    def _expect(self, char: str):
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON, got {found!r}")
+        self._pos += 1
+
+    def _read(self, size: int):
+        chunk = self._stream.read(size)
+        if not chunk:
+            self._eof = True
+        # drop everything already parsed, so buffer never holds more than the current value
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+
+
+def _iter_ijson(ijson, stream: BinaryIO | TextIO) -> Iterator[tuple[str, Any]]:
+    """Same as _StreamParser, driven by ijson's parse events"""
+    try:
+        yield from _iter_ijson_events(ijson, stream)
+    except ijson.JSONError as exc:
+        raise ValueError(f"Malformed JSON: {exc}") from exc
+
+
+def _iter_ijson_events(ijson, stream: BinaryIO | TextIO) -> Iterator[tuple[str, Any]]:
+    # pylint: disable=import-outside-toplevel
+    from ijson.common import ObjectBuilder
+
+    item_paths = {f"{streamed}.item": streamed for streamed in STREAMED_ARRAYS}
+    events = ijson.parse(stream, use_float=True)
+
+    def next_event() -> tuple[str, str, Any]:
+        try:
+            return next(events)
+        except StopIteration as exc:
+            raise ValueError("Unexpected end of JSON") from exc
+
+    def build(event: str, value: Any) -> Any:
+        if event not in ("start_map", "start_array"):
+            return value  # scalar
+        builder = ObjectBuilder()
+        depth = 1
+        while depth:
+            builder.event(event, value)
+            _, event, value = next_event()
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+        return builder.value
+
+    first_event = next(events, (None, None, None))[1]
+    if first_event != "start_map":
+        raise ValueError("Expected JSON object at top level of event portfolio")
+
+    for prefix, event, value in events:
+        if prefix in item_paths and event not in ("end_array",):
+            yield item_paths[prefix], build(event, value)
+        elif event == "map_key":
+            path = f"{prefix}.{value}" if prefix else value
+            if path in STREAMED_ARRAYS or _is_parent(path):
+                continue  # descend; its items (or nested properties) are handled as they arrive
+            _, event, value = next_event()
+            yield path, build(event, value)
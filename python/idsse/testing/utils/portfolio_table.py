@@ -0,0 +1,246 @@
+"""Flatten event portfolios into columnar tables, stored as Parquet or Arrow IPC"""
+
+# --------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved. (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# --------------------------------------------------------------------------------
+
+import glob
+import os
+from argparse import ArgumentParser
+from collections.abc import Iterable
+from typing import Any, BinaryIO, TextIO
+
+import numpy as np
+
+from .portfolio_stream import iter_portfolio
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+PORTFOLIO_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "event_portfolios"
+)
+
+# one row per location x valid time x impact (condition, criteria or raw value of a part)
+KEY_COLUMNS = (
+    "source",
+    "corrId",
+    "issueDt",
+    "conditionKey",
+    "productKey",
+    "locationKey",
+    "region",
+    "slice",
+    "name",
+    "type",
+    "dataType",
+)
+COLUMNS = (*KEY_COLUMNS, "evaluatedAt", "validDt", "value")
+
+# file extensions written as Arrow IPC (a.k.a. Feather v2), rather than Parquet
+ARROW_EXTENSIONS = (".arrow", ".feather", ".ipc")
+
+
+def flatten_portfolio(  # pylint: disable=too-many-locals
+    source: str | dict | BinaryIO | TextIO,
+) -> dict[str, np.ndarray]:
+    """Flatten an event portfolio's `riskResults` into columns, one row per location, valid time
+    and impact (each `dataSummary` series, identified by its name, type and dataType). Risk
+    results are streamed, so the whole portfolio JSON is never held in memory at once.
+
+    The per-cell spatial distributions (`geoDist`) and `metaData` states are not included.
+
+    Args:
+        source (str | dict | BinaryIO | TextIO): path to event portfolio JSON, an open stream,
+            or the already loaded JSON
+
+    Returns:
+        dict[str, np.ndarray]: each column in `COLUMNS`, all the same length. `validDt` and
+            `evaluatedAt` are `datetime64[ms]` (UTC), `value` is float64 (NaN if null), and the
+            rest are object arrays of strings ("" if not set).
+    """
+    if isinstance(source, dict):
+        items = [("corrId", source.get("corrId")), ("issueDt", source.get("issueDt"))]
+        items.extend(("riskResults", result) for result in source.get("riskResults", []))
+        source_name = ""
+    else:
+        items = iter_portfolio(source)
+        source_name = os.path.basename(source) if isinstance(source, str) else ""
+
+    header = {"source": source_name, "corrId": "", "issueDt": ""}
+    keys: list[tuple] = []  # one tuple of string columns per series
+    lengths: list[int] = []
+    valid_dts: list[np.ndarray] = []
+    values: list[np.ndarray] = []
+    parsed_times: dict[tuple[str, ...], np.ndarray] = {}  # most series share their validDt
+
+    for path, item in items:
+        if path == "corrId":
+            header["corrId"] = (item or {}).get("uuid", "")
+        elif path == "issueDt":
+            header["issueDt"] = item or ""
+        elif path == "riskResults":
+            result_key = (
+                header["source"],
+                header["corrId"],
+                header["issueDt"],
+                *(item.get(prop) or "" for prop in ("conditionKey", "productKey", "locationKey")),
+                *(item.get(prop) or "" for prop in ("region", "slice")),
+            )
+            for summary in item.get("dataSummary", []):
+                for series in summary.get("data", []):
+                    raw_times = tuple(series.get("validDt", summary.get("validDt", [])))
+                    if raw_times not in parsed_times:
+                        parsed_times[raw_times] = _to_datetime64(raw_times)
+                    series_values = _to_float64(series.get("singleValue", []))
+                    if len(series_values) != len(raw_times):
+                        raise ValueError(
+                            f"{item.get('conditionKey')} {series.get('name')}: "
+                            f"{len(series_values)} values but {len(raw_times)} validDts"
+                        )
+
+                    keys.append(
+                        (
+                            *result_key,
+                            series.get("name") or "",
+                            series.get("type") or "",
+                            series.get("dataType") or "",
+                            item.get("evaluatedAt") or "",
+                        )
+                    )
+                    lengths.append(len(raw_times))
+                    valid_dts.append(parsed_times[raw_times])
+                    values.append(series_values)
+
+    # string columns are repeated once per valid time of each series
+    counts = np.asarray(lengths, dtype=np.int64)
+    key_matrix = np.array(keys, dtype=object).reshape(len(keys), len(KEY_COLUMNS) + 1)
+    columns = {
+        column: np.repeat(key_matrix[:, index], counts) for index, column in enumerate(KEY_COLUMNS)
+    }
+    columns["evaluatedAt"] = np.repeat(_to_datetime64(key_matrix[:, -1]), counts)
+    columns["validDt"] = (
+        np.concatenate(valid_dts) if valid_dts else np.empty(0, dtype="datetime64[ms]")
+    )
+    columns["value"] = np.concatenate(values) if values else np.empty(0, dtype=np.float64)
+    return columns
+
+
+def portfolio_to_table(source: str | dict | BinaryIO | TextIO) -> "pa.Table":
+    """Flatten one event portfolio (see `flatten_portfolio`) into an Arrow table"""
+    return _columns_to_table(flatten_portfolio(source))
+
+
+def portfolios_to_table(sources: Iterable[str | dict]) -> "pa.Table":
+    """Flatten many event portfolios into one Arrow table. Use the `source` column (file name)
+    or `corrId` and `issueDt` to tell them apart.
+    """
+    columns = [flatten_portfolio(source) for source in sources]
+    return _columns_to_table(
+        {
+            column: np.concatenate([portfolio[column] for portfolio in columns])
+            for column in COLUMNS
+        }
+        if columns
+        else flatten_portfolio({})
+    )
+
+
+def write_portfolio_table(table: "pa.Table", filepath: str):
+    """Write table to Parquet, or to Arrow IPC if the file extension is one of `ARROW_EXTENSIONS`.
+    Arrow IPC files are bigger, but can be memory-mapped with no decoding at all.
+    """
+    _require_pyarrow()
+    # pylint: disable=import-outside-toplevel
+    if filepath.endswith(ARROW_EXTENSIONS):
+        from pyarrow import feather
+
+        feather.write_feather(table, filepath, compression="uncompressed")
+    else:
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, filepath)
+
+
+def read_portfolio_table(filepath: str, columns: list[str] | None = None) -> "pa.Table":
+    """Read table written by `write_portfolio_table`, memory-mapping the file rather than
+    reading it into memory. Arrow IPC files are zero-copy: columns are only paged in as used.
+
+    Args:
+        filepath (str): path to Parquet or Arrow IPC file
+        columns (optional, list[str] | None): only read these columns. Default is all
+    """
+    _require_pyarrow()
+    # pylint: disable=import-outside-toplevel
+    if filepath.endswith(ARROW_EXTENSIONS):
+        from pyarrow import feather
+
+        return feather.read_table(filepath, columns=columns, memory_map=True)
+
+    import pyarrow.parquet as pq
+
+    return pq.read_table(filepath, columns=columns, memory_map=True)
+
+
+def _columns_to_table(columns: dict[str, np.ndarray]) -> "pa.Table":
+    _require_pyarrow()
+    timestamp = pa.timestamp("ms", tz="UTC")
+    arrays = {
+        # few distinct values per column, so dictionary encoding keeps files (and memory) small
+        column: pa.array(columns[column], type=pa.string()).dictionary_encode()
+        for column in KEY_COLUMNS
+    }
+    arrays["evaluatedAt"] = pa.array(columns["evaluatedAt"], type=timestamp)
+    arrays["validDt"] = pa.array(columns["validDt"], type=timestamp)
+    arrays["value"] = pa.array(columns["value"], type=pa.float64(), from_pandas=True)
+    return pa.table(arrays)
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "Arrow/Parquet portfolio tables require pyarrow: pip install idsse-testing[arrow]"
+        )
+
+
+def _to_datetime64(raw_times: Iterable[str]) -> np.ndarray:
+    """Parse ISO 8601 UTC strings (e.g. `2022-12-23T13:00:00.000Z`) all at once, "" to NaT"""
+    # NumPy only parses timezone-naive strings, and these are all UTC
+    return np.array(
+        [raw.removesuffix("Z") if raw else "NaT" for raw in raw_times], dtype="datetime64[ms]"
+    )
+
+
+def _to_float64(raw_values: list[Any]) -> np.ndarray:
+    try:
+        return np.array(raw_values, dtype=np.float64)
+    except TypeError:  # some values are null
+        return np.array([np.nan if value is None else value for value in raw_values], np.float64)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = ArgumentParser(description="Convert event portfolio JSON to a Parquet or Arrow table")
+    parser.add_argument(
+        "portfolios",
+        nargs="*",
+        help="Event portfolio JSON files. Default is all packaged in idsse.testing",
+    )
+    parser.add_argument(
+        "--output",
+        required=True,
+        help=f"File to write. Arrow IPC if extension is one of {ARROW_EXTENSIONS}, else Parquet",
+    )
+    _args = parser.parse_args()
+
+    _paths = _args.portfolios or sorted(glob.glob(os.path.join(PORTFOLIO_DIR, "*.json")))
+    _table = portfolios_to_table(_paths)
+    write_portfolio_table(_table, _args.output)
+    print(f"Wrote {_table.num_rows} rows from {len(_paths)} portfolios to {_args.output}")
@@ -0,0 +1,395 @@
+"""Generate synthetic, but realistic, Vulnerability (a.k.a. DSS Profile) JSON for scale testing"""
+
+# --------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved. (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# --------------------------------------------------------------------------------
+
+import json
+import math
+import os
+import random
+from argparse import ArgumentParser
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, UTC
+from functools import partial
+from uuid import UUID
+
+import numpy as np
+
+from ..idsse_common.constants import FORECAST_VAR_CONFIG
+from ..idsse_common.lookups import RELATIONAL_OPERATORS
+
+# NWS Weather Forecast Offices, with approximate (lon, lat) so generated geometries land near
+# the office that owns them
+OFFICE_LOCATIONS = {
+    "BOU": (-105.0, 39.8),
+    "BOX": (-71.1, 42.0),
+    "BYZ": (-108.5, 45.8),
+    "CHS": (-80.0, 32.9),
+    "FWD": (-97.3, 32.8),
+    "GSL": (-105.3, 40.0),
+    "LOT": (-88.1, 41.6),
+    "LWX": (-77.5, 38.9),
+    "MFL": (-80.4, 25.8),
+    "MSO": (-114.1, 46.9),
+    "OKX": (-72.9, 40.9),
+    "PHI": (-74.9, 40.0),
+    "PSR": (-112.1, 33.4),
+    "SEW": (-122.3, 47.7),
+    "SGX": (-117.1, 32.8),
+    "SLC": (-111.9, 40.8),
+    "STO": (-121.5, 38.6),
+    "TBW": (-82.4, 27.7),
+    "TFX": (-111.4, 47.5),
+    "TWC": (-110.9, 32.2),
+}
+
+# realistic (min, max) magnitude of a threshold, by unit
+UNIT_MAGNITUDE_RANGES = {
+    "Fahrenheit": (-20, 110),
+    "Celsius": (-30, 45),
+    "Percent": (5, 100),
+    "MilesPerHour": (5, 80),
+    "Knots": (5, 70),
+    "Inches": (0.01, 12),
+    "Feet": (0.5, 4),
+    "Millimeters": (1, 100),
+    "Miles": (0.25, 10),
+    "Kilometers": (0.5, 16),
+    "Meters": (0.5, 10),
+    "KiloFeet": (0.5, 30),
+    "DBZ": (20, 65),
+    "KgPerMeter2": (1, 60),
+    "Degrees": (0, 360),
+    "Lightning": (1, 6),
+}
+
+# weather elements that are only observed by radar, so thresholds use MRMS rather than NBM
+MRMS_FIELDS = {"EchoTop", "MaxRef", "VIL"}
+
+# profile operators, e.g. "GREATER_THAN_OR_EQUAL_TO"
+OPERATORS = list(RELATIONAL_OPERATORS.values())
+
+RECURRENCE_RULES = [
+    "FREQ=DAILY;COUNT=7",
+    "FREQ=WEEKLY;BYDAY=SA,SU",
+    "FREQ=WEEKLY;BYDAY=MO,WE,FR;COUNT=12",
+    "FREQ=MONTHLY;BYMONTHDAY=1",
+]
+
+
+class ProfileGenerator:  # pylint: disable=too-many-instance-attributes
+    """Generates synthetic Vulnerability profiles, with randomized geometry, offices, active
+    times and hazards drawn from the weather elements and units in `FORECAST_VAR_CONFIG`.
+    Seeded generators always make the same random draws, so produce the same sequence of
+    profiles relative to `now`.
+
+    Args:
+        seed (int | str | None): seed of random number generator. Defaults to None (not
+            reproducible)
+        now (datetime | None): reference time that active time windows are placed around (in the
+            past, ongoing or in the future). Defaults to current time, so active profiles are
+            active when used. Pass a fixed time as well as `seed` for byte-identical output.
+        min_vertices (int): fewest vertices in a generated polygon. Defaults to 4.
+        max_vertices (int): most vertices in a generated polygon. Defaults to 64.
+    """
+
+    def __init__(
+        self,
+        seed: int | str | None = None,
+        now: datetime | None = None,
+        min_vertices: int = 4,
+        max_vertices: int = 64,
+    ):
+        if not 3 <= min_vertices <= max_vertices:
+            raise ValueError("Vertex counts must satisfy 3 <= min_vertices <= max_vertices")
+
+        self._rng = random.Random(seed)
+        # geometry vertices are drawn in bulk from numpy, seeded from the main generator
+        self._np_rng = np.random.default_rng(self._rng.getrandbits(64))
+        self._wkt_formats: dict[int, str] = {}  # WKT ring printf format, by vertex count
+        self._now = (now or datetime.now(UTC)).replace(minute=0, second=0, microsecond=0)
+        self._min_vertices = min_vertices
+        self._max_vertices = max_vertices
+
+        self._offices = list(OFFICE_LOCATIONS)
+        self._fields: list[tuple[str, tuple[str, ...]]] = [
+            (name, tuple(units))
+            for name, config in FORECAST_VAR_CONFIG["field"].items()
+            if (units := config.get("units"))
+            and all(unit in UNIT_MAGNITUDE_RANGES for unit in units)
+        ]
+
+    def generate(self, count: int) -> Iterator[dict]:
+        """Lazily generate `count` profiles, one at a time"""
+        for index in range(count):
+            yield self.profile(index)
+
+    def profile(self, index: int = 0) -> dict:
+        """Generate a single Vulnerability profile"""
+        rng = self._rng
+        profile_id = self._uuid()
+        office = rng.choice(self._offices)
+
+        return {
+            "id": profile_id,
+            "name": f"Synthetic {office} Profile {index}",
+            "description": "",
+            "primaryOfficeId": office,
+            "geometry": self.geometry(office),
+            "activeTime": self.active_time(),
+            "support": {
+                "briefings": [],
+                "summary": "",
+                "recipients": {"partners": [], "externals": []},
+                "notes": "",
+            },
+            "notes": "",
+            "hazards": [self.hazard() for _ in range(rng.randint(1, 4))],
+            "scheduledEventData": {
+                "url": None,
+                "dailyAttendance": rng.choice([0, 500, 5000, 50000]),
+                "venueType": rng.choice(["OUTDOOR", "INDOOR", "MIXED"]),
+                "venueAddress": {
+                    "line1": "",
+                    "line2": "",
+                    "line3": "",
+                    "city": "",
+                    "state": "",
+                    "zipCode": 0,
+                    "countryCode": "US",
+                    "geometry": None,
+                    "elevation": 0,
+                },
+                "isNsseEvent": False,
+                "isSearEvent": False,
+                "searEventLevel": None,
+                "evacuationTimeMinutes": None,
+                "timezone": None,
+                "originalRequestId": profile_id,
+            },
+        }
+
+    def geometry(self, office: str) -> str:
+        """WKT MULTIPOLYGON of one star-shaped (so never self-intersecting) polygon near the
+        given NWS office, with a random number of vertices and size from a city block to a county
+        """
+        rng = self._rng
+        office_lon, office_lat = OFFICE_LOCATIONS[office]
+        center_lon = office_lon + rng.uniform(-2, 2)
+        center_lat = office_lat + rng.uniform(-1.5, 1.5)
+        # log-uniform radius between ~1km and ~50km (in degrees)
+        radius = math.exp(rng.uniform(math.log(0.01), math.log(0.5)))
+        # shrink longitude span with latitude, so shapes aren't stretched east-west
+        lon_scale = 1 / math.cos(math.radians(center_lat))
+
+        num_vertices = rng.randint(self._min_vertices, self._max_vertices)
+        angles = np.sort(self._np_rng.uniform(0, 2 * np.pi, num_vertices))
+        radii = radius * self._np_rng.uniform(0.6, 1.0, num_vertices)
+        coords = np.empty((num_vertices + 1, 2))
+        coords[:-1, 0] = center_lon + radii * lon_scale * np.cos(angles)
+        coords[:-1, 1] = center_lat + radii * np.sin(angles)
+        coords[-1] = coords[0]  # close the ring
+
+        # formatting the whole ring with one printf-style operation is far faster than
+        # formatting each vertex separately
+        wkt_format = self._wkt_formats.get(num_vertices)
+        if wkt_format is None:
+            wkt_format = ", ".join(["%.6f %.6f"] * (num_vertices + 1))
+            self._wkt_formats[num_vertices] = wkt_format
+        return f"MULTIPOLYGON ((({wkt_format % tuple(coords.ravel().tolist())})))"
+
+    def active_time(self) -> dict:
+        """Active time window: never-ending, already ended, ongoing, or in the future"""
+        rng = self._rng
+        kind = rng.choices(["never_ending", "past", "current", "future"], [2, 1, 4, 2])[0]
+        if kind == "never_ending":
+            return {"startTime": None, "endTime": None, "recurrenceRule": ""}
+
+        duration = timedelta(hours=rng.choice([1, 3, 6, 12, 24, 72, 24 * 7, 24 * 30]))
+        if kind == "past":
+            start = self._now - duration - timedelta(hours=rng.randint(1, 24 * 30))
+        elif kind == "current":
+            start = self._now - duration * rng.uniform(0, 0.9)
+        else:
+            start = self._now + timedelta(hours=rng.randint(1, 24 * 14))
+        start = start.replace(minute=0, second=0, microsecond=0)
+
+        return {
+            "startTime": _to_iso(start),
+            "endTime": _to_iso(start + duration),
+            "recurrenceRule": rng.choice(RECURRENCE_RULES) if rng.random() < 0.1 else "",
+        }
+
+    def hazard(self) -> dict:  # pylint: disable=too-many-locals
+        """Hazard of 1-4 impact levels, where each level uses the same weather elements but
+        thresholds that are progressively more severe
+        """
+        rng = self._rng
+        roll = rng.random()
+        num_elements = 1 if roll < 0.6 else 2 if roll < 0.9 else 3
+        num_levels = rng.randint(1, 4)
+
+        # pick units, operator and base magnitude once per weather element for the whole hazard,
+        # then step the magnitude by 1/8th of the unit's range for each more severe level
+        threshold_sets = [[] for _ in range(num_levels)]
+        # sample indexes rather than the fields themselves (same draws), to keep their types
+        for field_index in rng.sample(range(len(self._fields)), num_elements):
+            field, units_options = self._fields[field_index]
+            units = units_options[int(rng.random() * len(units_options))]
+            operator = OPERATORS[int(rng.random() * len(OPERATORS))]
+            low, high = UNIT_MAGNITUDE_RANGES[units]
+            magnitude = low + rng.random() * (high - low) / 2
+            # "less than" thresholds get more severe as magnitude decreases
+            step = (high - low) / (-8 if operator.startswith("LESS") else 8)
+            duration = 0 if rng.random() < 0.6 else rng.choice([1, 2, 3, 6])
+            if field in MRMS_FIELDS:
+                source = "MRMS"
+            else:
+                source = "NBM" if rng.random() < 0.7 else ""
+
+            for level, threshold_set in enumerate(threshold_sets):
+                threshold_set.append(
+                    {
+                        "weatherElement": field,
+                        "magnitude": round(magnitude + level * step, 2),
+                        "operator": operator,
+                        "units": units,
+                        "minDurationHours": duration,
+                        "source": source,
+                    }
+                )
+
+        return {
+            "id": self._uuid(),
+            "type": None,
+            "impactLevels": [
+                {"thresholdSet": threshold_set, "impactLevelValue": level, "impactStatements": []}
+                for level, threshold_set in enumerate(threshold_sets, start=1)
+            ],
+        }
+
+    def _uuid(self) -> str:
+        """Random UUID4, drawn from this generator's (seedable) random number generator"""
+        return str(UUID(int=self._rng.getrandbits(128), version=4))
+
+
+def write_profiles(  # pylint: disable=too-many-arguments
+    base_dir: str,
+    count: int,
+    seed: int | None = None,
+    *,
+    now: datetime | None = None,
+    bulk: bool = False,
+    chunk_size: int = 10_000,
+    workers: int = 1,
+) -> int:
+    """Stream `count` generated profiles to disk, never holding more than one chunk of JSON
+    in memory.
+
+    Args:
+        base_dir (str): NWS Connect proxy base directory to write profiles into
+        count (int): number of profiles to generate
+        seed (int | None): seed for reproducible profiles. The same seed, `now` and `chunk_size`
+            always produce the same profiles, regardless of `workers`.
+        now (datetime | None): reference time of active time windows, shared by all chunks.
+            Defaults to current time.
+        bulk (bool): if True, write profiles as JSON arrays of `chunk_size` profiles (like raw
+            NWS Connect API responses) in `base_dir`, which is much faster to write. Otherwise,
+            write one file per profile to `base_dir/profiles/`, the layout the proxy serves from.
+        chunk_size (int): number of profiles generated from each random seed, and number of
+            profiles per file if `bulk` is True
+        workers (int): number of processes generating chunks in parallel. Defaults to 1.
+
+    Returns:
+        int: number of files written
+    """
+    os.makedirs(os.path.join(base_dir, "profiles"), exist_ok=True)
+    # resolve now once, so chunks generated in different processes agree on it
+    now = now or datetime.now(UTC)
+    chunks = [
+        (chunk_index, min(chunk_size, count - chunk_start))
+        for chunk_index, chunk_start in enumerate(range(0, count, chunk_size))
+    ]
+    write_chunk = partial(_write_chunk, base_dir, seed=seed, now=now, bulk=bulk)
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(write_chunk, *zip(*chunks)))
+    return sum(write_chunk(*chunk) for chunk in chunks)
+
+
+def _write_chunk(  # pylint: disable=too-many-arguments
+    base_dir: str, chunk_index: int, count: int, *, seed: int | None, now: datetime, bulk: bool
+) -> int:
+    """Generate one chunk of profiles (seeded by overall seed and chunk index), and write them
+    to disk. Returns number of files written.
+    """
+    generator = ProfileGenerator(None if seed is None else f"{seed}:{chunk_index}", now)
+    profiles = generator.generate(count)
+
+    if not bulk:
+        profile_dir = os.path.join(base_dir, "profiles")
+        for profile in profiles:
+            filepath = os.path.join(profile_dir, f'{profile["id"]}.json')
+            with open(filepath, "w", encoding="utf-8") as file:
+                json.dump(profile, file)
+        return count
+
+    filepath = os.path.join(base_dir, f"synthetic_profiles_{chunk_index:05d}.json")
+    with open(filepath, "w", encoding="utf-8") as file:
+        file.write("[")
+        for index, profile in enumerate(profiles):
+            if index:
+                file.write(",")
+            file.write(json.dumps(profile))
+        file.write("]")
+    return 1
+
+
+def _to_iso(dt: datetime) -> str:
+    """Format datetime like NWS Connect does, e.g. `2026-01-01T12:00:00.000Z`"""
+    return f'{dt.strftime("%Y-%m-%dT%H:%M:%S")}.{dt.microsecond // 1000:03d}Z'
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = ArgumentParser(description="Generate synthetic Vulnerability profiles")
+    parser.add_argument("--base_dir", required=True, help="Directory to write profiles to")
+    parser.add_argument("--count", type=int, default=1000, help="Number of profiles")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible output")
+    parser.add_argument(
+        "--now",
+        type=datetime.fromisoformat,
+        default=None,
+        help="ISO 8601 reference time of active times (default: current time). Set with --seed "
+        "for identical output between runs",
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Write JSON arrays of many profiles, rather than one file per profile",
+    )
+    parser.add_argument(
+        "--chunk_size", type=int, default=10_000, help="Profiles per seed, and per file if --bulk"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count(), help="Processes generating profiles"
+    )
+    _args = parser.parse_args()
+
+    write_profiles(
+        _args.base_dir,
+        _args.count,
+        _args.seed,
+        now=_args.now,
+        bulk=_args.bulk,
+        chunk_size=_args.chunk_size,
+        workers=_args.workers,
+    )
@@ -13,13 +13,148 @@
 # --------------------------------------------------------------------------------
 
 import csv
+import hashlib
+import importlib.util
 import json
+import logging
+import os
 import pathlib
-
+import pickle
+import re
+import sys
+from collections import OrderedDict
 from collections.abc import Sequence
 from importlib import resources
 from os import path
-from typing import Any, TextIO, Callable
+from tempfile import gettempdir
+from threading import Lock
+from typing import Any, TextIO, Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    # numpy and xarray are slow to import, so only import them when an array or dataset is
+    # actually loaded. `get_filepath` and JSON resources never need them
+    import numpy as np
+    import xarray
+
+logger = logging.getLogger(__name__)
+
+# default max total size of all resources held by the resource cache, in bytes
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ResourceCache:
+    """Thread-safe, size-bounded LRU cache of loaded test resources, shared by the whole process.
+
+    Mutable values (e.g. dicts from JSON) are stored pickled, and every hit unpickles a fresh
+    copy, which is several times faster than re-reading and re-parsing the file, and means callers
+    can never modify the cached value. Immutable values (str, bytes) are stored and returned as-is,
+    and NumPy arrays are stored and returned as read-only views.
+
+    Args:
+        enabled (bool): if False, `get_resource_from_file` does not use cache unless asked to
+        max_bytes (int): max total size of all cached values. Least recently used values are
+            evicted to stay under this limit; values bigger than this are never cached.
+    """
+
+    def __init__(self, enabled: bool = False, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[Any, bool, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    def get(self, key: tuple) -> tuple[bool, Any]:
+        """Look up resource by key. Returns tuple of (True, value) if found, otherwise
+        (False, None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+        value, is_pickled, _ = entry
+        return True, pickle.loads(value) if is_pickled else value
+
+    def put(self, key: tuple, value: Any):
+        """Add resource to cache, evicting least recently used resources if needed. Values that
+        cannot be pickled (e.g. objects holding open files) are silently not cached.
+        """
+        # if numpy was never imported, value can't be an array (and no need to import it to check)
+        numpy = sys.modules.get("numpy")
+        if isinstance(value, (str, bytes)):
+            stored, is_pickled, size = value, False, len(value)
+        elif numpy is not None and isinstance(value, numpy.ndarray):
+            stored, is_pickled, size = value.view(), False, value.nbytes
+            stored.flags.writeable = False
+        else:
+            try:
+                stored = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError) as exc:
+                logger.debug("Not caching resource %s, cannot be pickled: %s", key, exc)
+                return
+            is_pickled, size = True, len(stored)
+
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._size_bytes -= self._entries.pop(key)[2]
+            self._entries[key] = (stored, is_pickled, size)
+            self._size_bytes += size
+            while self._size_bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+
+    def clear(self):
+        """Drop all cached resources and reset statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> dict:
+        """Cache statistics: hits, misses, number of entries, and total size in bytes"""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+                "size_bytes": self._size_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# cache used by get_resource_from_file. Disabled by default; enable for the whole process with
+# configure_resource_cache(), or by setting env var IDSSE_TESTING_RESOURCE_CACHE=true
+_RESOURCE_CACHE = ResourceCache(
+    enabled=os.getenv("IDSSE_TESTING_RESOURCE_CACHE", "").lower() in ("1", "true", "yes")
+)
+
+
+def configure_resource_cache(enabled: bool = True, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+    """Turn the process-wide resource cache on or off, and set its max size in bytes.
+    Shrinking the cache does not evict anything until the next resource is added.
+    """
+    _RESOURCE_CACHE.enabled = enabled
+    _RESOURCE_CACHE.max_bytes = max_bytes
+
+
+def clear_resource_cache():
+    """Drop everything in the process-wide resource cache"""
+    _RESOURCE_CACHE.clear()
+
+
+def resource_cache_info() -> dict:
+    """Statistics of the process-wide resource cache, e.g. `hits`, `misses` and `size_bytes`"""
+    return _RESOURCE_CACHE.info()
 
 
 # pylint: disable=protected-access
@@ -52,7 +187,10 @@ def get_filepath(package: str, filename: str) -> str:
 
 
 def get_resource_from_file(
-    package: str, filename: str, load_func: Callable[[str], Any] | None = None
+    package: str,
+    filename: str,
+    load_func: Callable[[str], Any] | None = None,
+    cache: bool | None = None,
 ) -> dict | Sequence[Sequence[Any]]:
     """Load test resource/data from file into python object
 
@@ -60,29 +198,322 @@ def get_resource_from_file(
         package (str): name of test package containing the file
         filename (str): name of test resource to load from the package directory
         load_func (optional, Callable | None): custom function to read content from the provided
-            filename and package. Required if file extension is not one of: `[.json, .csv. .html]`.
-            Defaults to None (use built-in file readers).
+            filename and package. Required if file extension is not one of:
+            `[.json, .csv. .html, .nc, .grib2, .zarr.zip]`. Defaults to None (use built-in file
+            readers).
+        cache (optional, bool | None): if True, reuse this resource from the process-wide resource
+            cache if it was loaded before (and the file hasn't changed since), and add it if not.
+            Callers always get their own copy. Defaults to None, which caches only if
+            enabled with `configure_resource_cache()`. Datasets are never cached.
 
     Raises:
         ValueError: if file extension is not supported
 
     Returns:
         dict | Sequence[Sequence[Any]]: Appropriate data type based on resource file type.
-        For example, .json returns a dict, .csv returns a list of lists
+        For example, .json returns a dict, .csv returns a list of lists, and .nc, .grib2 and
+        .zarr.zip return a lazily loaded xarray Dataset (see `open_dataset_resource`)
     """
+    if load_func is None and filename.endswith(DATASET_EXTENSIONS):
+        return open_dataset_resource(package, filename)
+
     traversable = resources.files(package).joinpath(filename)
+    if load_func is None:
+        _, file_extension = path.splitext(filename)
+        if file_extension not in _LOADERS:
+            raise ValueError(
+                f"Unable to load test data from unsupported extension {file_extension}"
+            )
+
+    use_cache = _RESOURCE_CACHE.enabled if cache is None else cache
+    if not use_cache:
+        return _load_resource(traversable, filename, load_func)
+
+    key = (package, filename, load_func or _LOADERS[file_extension], _get_mtime(traversable))
+    found, resource = _RESOURCE_CACHE.get(key)
+    if not found:
+        resource = _load_resource(traversable, filename, load_func)
+        _RESOURCE_CACHE.put(key, resource)
+    return resource
+
+
+def get_array_from_file(  # pylint: disable=too-many-arguments
+    package: str,
+    filename: str,
+    dtype: "np.dtype | str" = "float64",
+    *,
+    sidecar: bool = False,
+    cache: bool | None = None,
+    sidecar_in_package: bool = False,
+) -> "np.ndarray":
+    """Load CSV test resource (e.g. grid fixture) into 2D NumPy array, using NumPy's vectorized
+    parser. Much faster, and a fraction of the memory, of `get_resource_from_file` list of lists.
+
+    Args:
+        package (str): name of test package containing the file
+        filename (str): name of CSV test resource to load from the package directory
+        dtype (optional, np.dtype | str): data type of array. Defaults to float64.
+        sidecar (optional, bool): if True, save the parsed array as a `.npy` file in the user
+            cache directory (`$XDG_CACHE_HOME/idsse_testing`, or the system temp directory if
+            XDG_CACHE_HOME is not set), and on later loads memory-map that file instead of
+            parsing the CSV. The sidecar is rebuilt whenever the CSV is newer. Memory-mapped
+            arrays are read-only. Defaults to False.
+        cache (optional, bool | None): use the process-wide resource cache, as in
+            `get_resource_from_file`. Cached arrays are read-only.
+        sidecar_in_package (optional, bool): if True, save the sidecar alongside the CSV in the
+            package directory instead, falling back to the cache directory if that is not
+            writable. Defaults to False.
+
+    Raises:
+        ValueError: if file is not a CSV
+
+    Returns:
+        np.ndarray: 2D array of CSV values
+    """
+    if path.splitext(filename)[1] != ".csv":
+        raise ValueError(f"Unable to load array from non-CSV file {filename}")
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    def load_array(traversable) -> np.ndarray:
+        if sidecar:
+            return _load_csv_sidecar(package, traversable, np.dtype(dtype), sidecar_in_package)
+        with traversable.open("r") as file_stream:
+            return _load_csv_array(file_stream, np.dtype(dtype))
+
+    traversable = resources.files(package).joinpath(filename)
+    use_cache = _RESOURCE_CACHE.enabled if cache is None else cache
+    if not use_cache:
+        return load_array(traversable)
+
+    key = (package, filename, _load_csv_array, str(np.dtype(dtype)), _get_mtime(traversable))
+    found, array = _RESOURCE_CACHE.get(key)
+    if not found:
+        array = load_array(traversable)
+        _RESOURCE_CACHE.put(key, array)
+        # hand out read-only view, like every later cache hit
+        array = array.view()
+        array.flags.writeable = False
+    return array
+
+
+def open_dataset_resource(  # pylint: disable=too-many-arguments
+    package: str,
+    filename: str,
+    *,
+    chunks: dict[str, int] | int | str | None = "auto",
+    variables: Sequence[str] | None = None,
+    isel: dict[str, int | slice] | None = None,
+    sel: dict[str, Any] | None = None,
+    filter_by_keys: dict[str, Any] | None = None,
+    **open_kwargs,
+) -> "xarray.Dataset":
+    """Open a gridded test resource (NetCDF, GRIB2, or zipped Zarr store) as a lazy, dask-backed
+    xarray Dataset. Only metadata is read on open; data is read chunk by chunk as it is used, so
+    slicing before computing reads only the bytes needed.
+
+    Args:
+        package (str): name of test package containing the file
+        filename (str): name of `.nc`, `.grib2` or `.zarr.zip` resource in the package directory
+        chunks (optional, dict[str, int] | int | str | None): dask chunk sizes, e.g.
+            `{"x": 512, "y": 512}`. Defaults to "auto" (let dask choose). `{}` uses the file's
+            own chunking, and None opens without dask (still lazy, but not chunked).
+        variables (optional, Sequence[str] | None): only keep these data variables
+        isel (optional, dict[str, int | slice] | None): index-based slice to apply on open, e.g.
+            `{"y": slice(0, 100), "x": slice(200, 300)}`
+        sel (optional, dict[str, Any] | None): label-based slice to apply on open, e.g.
+            `{"latitude": slice(45, 40)}`
+        filter_by_keys (optional, dict[str, Any] | None): GRIB2 only. GRIB keys selecting which
+            messages to read, e.g. `{"typeOfLevel": "heightAboveGround", "level": 2}`. Needed
+            for files with fields on different levels, which cfgrib cannot combine otherwise.
+        **open_kwargs: any other arguments passed to `xarray.open_dataset` or `xarray.open_zarr`
+
+    Raises:
+        ValueError: if file extension is not supported
+        ImportError: if file is GRIB2 and cfgrib is not installed (`idsse-testing[grib]` extra)
+
+    Returns:
+        xarray.Dataset: the lazily loaded dataset. Close it (or use it in a `with` block) to
+            release the underlying file
+    """
+    import xarray as xr  # pylint: disable=import-outside-toplevel
+
+    file_path = get_filepath(package, filename)
+    zip_store = None
+    if filename.endswith(".zarr.zip"):
+        import zarr  # pylint: disable=import-outside-toplevel
+
+        zip_store = zarr.storage.ZipStore(file_path, mode="r")
+        try:
+            dataset = xr.open_zarr(zip_store, chunks=chunks, **open_kwargs)
+        except Exception:
+            zip_store.close()
+            raise
+    elif filename.endswith(".grib2"):
+        if importlib.util.find_spec("cfgrib") is None:
+            raise ImportError(
+                f"Opening GRIB2 resource {filename} requires cfgrib: "
+                "pip install idsse-testing[grib]"
+            )
+        backend_kwargs = {
+            # never write cfgrib .idx files into the (possibly read-only) package directory
+            "indexpath": "",
+            **({"filter_by_keys": filter_by_keys} if filter_by_keys else {}),
+            **open_kwargs.pop("backend_kwargs", {}),
+        }
+        dataset = xr.open_dataset(
+            file_path, engine="cfgrib", chunks=chunks, backend_kwargs=backend_kwargs, **open_kwargs
+        )
+    elif filename.endswith(".nc"):
+        dataset = xr.open_dataset(file_path, chunks=chunks, **open_kwargs)
+    else:
+        raise ValueError(f"Unable to open dataset from unsupported file {filename}")
+
+    # every selection is lazy, so only the chunks overlapping the slice are ever read
+    if variables is not None:
+        dataset = dataset[list(variables)]
+    if isel:
+        dataset = dataset.isel(isel)
+    if sel:
+        dataset = dataset.sel(sel)
+    if zip_store is not None:
+        # xarray doesn't close a store it was given, so close it with the (selected) dataset
+        dataset.set_close(zip_store.close)
+    return dataset
+
+
+def parse_slice(grid_slice: str) -> tuple[slice, slice]:
+    """Parse the `slice` of a data request or IDSSe gridstore file, e.g. `[1722:2122,802:1102]`.
+    As in those files, the first range is columns (x) and the second is rows (y). Either end of
+    a range may be left empty, as in Python.
+
+    Raises:
+        ValueError: if not in this format
+
+    Returns:
+        tuple[slice, slice]: slices of (rows, columns)
+    """
+    match = _SLICE_PATTERN.match(grid_slice)
+    if not match:
+        raise ValueError(f"Invalid slice {grid_slice}, expected format [x0:x1,y0:y1]")
+    col_start, col_stop, row_start, row_stop = (
+        int(bound) if bound else None for bound in match.groups()
+    )
+    return slice(row_start, row_stop), slice(col_start, col_stop)
+
+
+def read_slice(  # pylint: disable=too-many-arguments
+    package: str,
+    filenames: str | Sequence[str],
+    grid_slice: str,
+    *,
+    variables: Sequence[str] | None = None,
+    sel: dict[str, Any] | None = None,
+    filter_by_keys: dict[str, Any] | None = None,
+) -> "xarray.Dataset":
+    """Read only a window of one or more gridded test resources (see `open_dataset_resource`),
+    given the `slice` of a data request, e.g. `[910:1010,829:929]`. NetCDF and Zarr resources
+    read just the bytes (or chunks) overlapping the window; GRIB2 messages can only be decoded
+    whole, so only the requested messages are read.
+
+    Slices are in the coordinates of the full grid: if a resource is itself a slice of the full
+    grid (has a `slice` attribute, like the IDSSe gridstore files), the window is shifted to
+    match.
+
+    Args:
+        package (str): name of test package containing the files
+        filenames (str | Sequence[str]): resource, or resources (e.g. one per `validDt`) whose
+            windows are stacked along a new `source` dimension, with the file names as its
+            coordinate
+        grid_slice (str): window to read, `[x0:x1,y0:y1]`
+        variables (optional, Sequence[str] | None): only read these data variables
+        sel (optional, dict[str, Any] | None): label-based selection of other dimensions, e.g.
+            `{"member": ["DTRM", "p010"], "validDt": [...]}`, so many valid times and percentile
+            fields of a Zarr store are read in one call
+        filter_by_keys (optional, dict[str, Any] | None): GRIB2 only. Keys selecting messages
+
+    Raises:
+        ValueError: if slice is invalid, or not within the grid of every resource
+
+    Returns:
+        xarray.Dataset: the window, loaded into memory
+    """
+    import xarray as xr  # pylint: disable=import-outside-toplevel
+
+    rows, cols = parse_slice(grid_slice)
+    names = [filenames] if isinstance(filenames, str) else list(filenames)
+    # without dask, lazy indexing reads exactly the window rather than whole dask chunks
+    datasets = [
+        open_dataset_resource(
+            package,
+            name,
+            chunks=None,
+            variables=variables,
+            sel=sel,
+            filter_by_keys=filter_by_keys,
+        )
+        for name in names
+    ]
+    try:
+        windows = [
+            _window(dataset, rows, cols, f"{name} {grid_slice}")
+            for name, dataset in zip(names, datasets)
+        ]
+        if isinstance(filenames, str):
+            return windows[0].load()
+        return xr.concat(
+            [window.load() for window in windows],
+            dim="source",
+            coords="minimal",
+            compat="override",
+            join="override",
+            combine_attrs="drop_conflicts",
+        ).assign_coords(source=names)
+    finally:
+        for dataset in datasets:
+            dataset.close()
+
+
+def _window(  # pylint: disable=too-many-locals
+    dataset: "xarray.Dataset", rows: slice, cols: slice, label: str
+) -> "xarray.Dataset":
+    """Lazily index the (rows, columns) window of a dataset, given in full grid coordinates"""
+    data_var = next(iter(dataset.data_vars.values()))
+    row_dim, col_dim = data_var.dims[-2:]
+
+    row_offset, col_offset = 0, 0
+    if "slice" in dataset.attrs:
+        file_rows, file_cols = parse_slice(dataset.attrs["slice"])
+        row_offset, col_offset = file_rows.start or 0, file_cols.start or 0
+
+    window = {}
+    for dim, dim_slice, offset in ((row_dim, rows, row_offset), (col_dim, cols, col_offset)):
+        size = dataset.sizes[dim]
+        start = 0 if dim_slice.start is None else dim_slice.start - offset
+        stop = size if dim_slice.stop is None else dim_slice.stop - offset
+        if not 0 <= start < stop <= size:
+            raise ValueError(
+                f"Slice {label} is outside of grid, which covers {dim} "
+                f"{offset}:{offset + size}"
+            )
+        window[dim] = slice(start, stop)
+    return dataset.isel(window)
+
+
+def _load_resource(traversable, filename: str, load_func: Callable[[str], Any] | None) -> Any:
     if load_func:
         return load_func(traversable)
 
     _, file_extension = path.splitext(filename)
-    file_stream = traversable.open("r")
-    if file_extension == ".json":
-        return _load_json_resource(file_stream)
-    if file_extension == ".csv":
-        return _load_csv_resource(file_stream)
-    if file_extension == ".html":
-        return _load_html_resource(file_stream)
-    raise ValueError(f"Unable to load test data from unsupported extension {file_extension}")
+    with traversable.open("r") as file_stream:
+        return _LOADERS[file_extension](file_stream)
+
+
+def _get_mtime(traversable) -> int | None:
+    """Last modified time of resource file (in ns), or None if it isn't a file on disk"""
+    try:
+        return os.stat(str(traversable)).st_mtime_ns
+    except OSError:
+        return None
 
 
 def _load_json_resource(stream: TextIO) -> dict:
@@ -96,6 +527,78 @@ def _load_csv_resource(stream: TextIO) -> Sequence[Sequence[Any]]:
     return [list(map(float, row)) for row in file_reader]
 
 
+def _load_csv_array(stream: TextIO, dtype: "np.dtype") -> "np.ndarray":
+    """utility to load CSV file from package into 2D NumPy array"""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    return np.loadtxt(stream, delimiter=",", dtype=dtype, ndmin=2)
+
+
+def _load_csv_sidecar(
+    package: str, traversable, dtype: "np.dtype", in_package: bool = False
+) -> "np.ndarray":
+    """utility to load CSV file from memory-mapped `.npy` sidecar file, creating it if needed"""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    csv_mtime = _get_mtime(traversable)
+    candidates = _sidecar_paths(package, str(traversable), dtype, in_package)
+    for sidecar_path in candidates:
+        try:
+            if csv_mtime is not None and os.stat(sidecar_path).st_mtime_ns >= csv_mtime:
+                return np.load(sidecar_path, mmap_mode="r")
+        except (OSError, ValueError):
+            continue  # sidecar missing or unreadable; try the next location
+
+    with traversable.open("r") as file_stream:
+        array = _load_csv_array(file_stream, dtype)
+
+    for sidecar_path in candidates:
+        try:
+            os.makedirs(path.dirname(sidecar_path), exist_ok=True)
+            # write to temp file and rename, so concurrent test processes never read partial file
+            temp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as file:
+                np.save(file, array)
+            os.replace(temp_path, sidecar_path)
+            return np.load(sidecar_path, mmap_mode="r")
+        except OSError as exc:
+            logger.debug("Unable to write .npy sidecar to %s: %s", sidecar_path, exc)
+
+    return array  # nowhere writable, so just return the parsed array
+
+
+def _sidecar_paths(package: str, csv_path: str, dtype: "np.dtype", in_package: bool) -> list[str]:
+    """utility to list where `.npy` sidecar of a CSV file may be saved, in order of preference"""
+    sidecar_name = f"{path.basename(csv_path)}.{dtype.str.lstrip('<>|=')}.npy"
+    # key cached sidecars by CSV's directory too, so different installs of a package never mix
+    dir_hash = hashlib.sha1(path.dirname(csv_path).encode("utf-8")).hexdigest()[:12]
+    candidates = [path.join(_sidecar_dir(), package, f"{dir_hash}-{sidecar_name}")]
+    if in_package:
+        candidates.insert(0, path.join(path.dirname(csv_path), sidecar_name))
+    return candidates
+
+
+def _sidecar_dir() -> str:
+    """Directory where `.npy` sidecars of CSV resources are saved: `$XDG_CACHE_HOME/idsse_testing`
+    if XDG_CACHE_HOME is set, otherwise `idsse_testing` in the system temp directory
+    """
+    return path.join(os.getenv("XDG_CACHE_HOME") or gettempdir(), "idsse_testing")
+
+
 def _load_html_resource(filestream: TextIO) -> str:
     """utility to load NetCDF file from package"""
     return filestream.read()
+
+
+# `slice` of data requests and gridstore files, e.g. "[1722:2122,802:1102]" (columns, then rows)
+_SLICE_PATTERN = re.compile(r"^\s*\[\s*(\d*)\s*:\s*(\d*)\s*,\s*(\d*)\s*:\s*(\d*)\s*\]\s*$")
+
+# file extensions opened as xarray Datasets by `open_dataset_resource`
+DATASET_EXTENSIONS = (".nc", ".grib2", ".zarr.zip")
+
+# built-in loader for each supported file extension
+_LOADERS: dict[str, Callable[[TextIO], Any]] = {
+    ".json": _load_json_resource,
+    ".csv": _load_csv_resource,
+    ".html": _load_html_resource,
+}
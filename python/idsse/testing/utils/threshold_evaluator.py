@@ -0,0 +1,366 @@
+"""Reference evaluation of Vulnerability (a.k.a. Profile) hazards against gridded forecasts: every
+threshold set compiled to NumPy boolean masks over (time, y, x)"""
+
+# --------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved. (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# --------------------------------------------------------------------------------
+
+import math
+import time
+from argparse import ArgumentParser
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..idsse_common.lookups import (
+    FIELD_UNITS,
+    FIELDS_BY_LOWER_NAME,
+    resolve_relational,
+)
+from .resources import DEFAULT_CACHE_MAX_BYTES, ResourceCache
+from .units import convert, resolve
+
+RELATIONAL_UFUNCS: dict[str, Callable[[np.ndarray, float], np.ndarray]] = {
+    "GREATER THAN OR EQUAL": np.greater_equal,
+    "LESS THAN OR EQUAL": np.less_equal,
+    "GREATER THAN": np.greater,
+    "LESS THAN": np.less,
+}
+
+# abbreviated or legacy weather element spellings seen in real NWS Connect Profiles (lower case),
+# as in nwsc_proxy's profile validation
+WEATHER_ELEMENT_ALIASES = {"cold": "Temp", "windgst": "WindGust", "windspd": "WindSpeed"}
+
+
+@dataclass(frozen=True)
+class Threshold:
+    """One entry of an impact level's `thresholdSet`, normalized: weather element and units as
+    keyed in FORECAST_VAR_CONFIG, and operator as its `relational` key
+    """
+
+    element: str
+    relational: str
+    magnitude: float
+    units: str
+    min_duration_hours: float = 0
+
+
+@dataclass(frozen=True)
+class ImpactLevel:
+    """Impact level of a hazard, reached where every one of its thresholds is met"""
+
+    value: int
+    thresholds: tuple[Threshold, ...]
+
+
+@dataclass(frozen=True)
+class Hazard:
+    """Hazard of a Profile, with its impact levels from least to most severe"""
+
+    id: str
+    impact_levels: tuple[ImpactLevel, ...]
+
+
+def compile_threshold(threshold: dict) -> Threshold:
+    """Normalize a `thresholdSet` entry of Profile JSON, e.g. `{"weatherElement": "WindGust",
+    "magnitude": 20, "operator": "GREATER_THAN_OR_EQUAL_TO", "units": "MPH", ...}`
+
+    Raises:
+        ValueError: if weather element, operator or units are not recognized
+    """
+    spelling = str(threshold.get("weatherElement")).lower()
+    element = FIELDS_BY_LOWER_NAME.get(spelling, WEATHER_ELEMENT_ALIASES.get(spelling))
+    if element is None:
+        raise ValueError(f'Unrecognized weatherElement {threshold.get("weatherElement")}')
+    relational = resolve_relational(str(threshold.get("operator")))
+    if relational is None:
+        raise ValueError(f'Unrecognized operator {threshold.get("operator")}')
+    return Threshold(
+        element,
+        relational,
+        float(threshold["magnitude"]),
+        resolve(str(threshold.get("units"))),
+        float(threshold.get("minDurationHours") or 0),
+    )
+
+
+def compile_hazards(profile: dict) -> tuple[Hazard, ...]:
+    """Compile every hazard of Profile JSON, with impact levels sorted by `impactLevelValue`"""
+    return tuple(
+        Hazard(
+            hazard.get("id", ""),
+            tuple(
+                sorted(
+                    (
+                        ImpactLevel(
+                            int(level["impactLevelValue"]),
+                            tuple(compile_threshold(item) for item in level["thresholdSet"]),
+                        )
+                        for level in hazard.get("impactLevels", [])
+                    ),
+                    key=lambda level: level.value,
+                )
+            ),
+        )
+        for hazard in profile.get("hazards", [])
+    )
+
+
+class ThresholdEvaluator:
+    """Evaluates compiled hazards against gridded forecasts of their weather elements.
+
+    Masks are cached per distinct threshold (weather element, operator, magnitude in the grid's
+    units, and duration), so evaluating many Profiles as a batch computes each distinct
+    threshold once, however many hazards or Profiles use it (as long as the cache holds it).
+    Thresholds that differ only in duration share one comparison. This saves work only when
+    Profiles repeat thresholds; otherwise batch and separate evaluation do the same work.
+    Magnitudes are converted to the grid's units rather than grids to the threshold's. Returned
+    masks are read-only, since they are shared through the cache.
+
+    Args:
+        grids (Mapping[str, tuple[np.ndarray, str]]): forecast of each weather element (as
+            keyed in FORECAST_VAR_CONFIG, e.g. "WindGust"), as array shaped (time, y, x) and
+            its units
+        step_hours (float): hours between time steps of the grids. Default 1
+        max_cache_bytes (int): max total size of cached masks. Least recently used masks are
+            evicted to stay under this limit
+    """
+
+    def __init__(
+        self,
+        grids: Mapping[str, tuple[np.ndarray, str]],
+        step_hours: float = 1.0,
+        max_cache_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        self._grids = {
+            element: (values, resolve(units)) for element, (values, units) in grids.items()
+        }
+        self._step_hours = step_hours
+        self._masks = ResourceCache(enabled=True, max_bytes=max_cache_bytes)
+        self._masks_computed = 0
+        # while evaluating a batch, number of uses still to come of each mask (by cache key)
+        self._pending: Counter | None = None
+
+    @property
+    def masks_computed(self) -> int:
+        """Number of threshold masks computed, rather than found in the cache. Counts each
+        threshold once, even if its minimum duration needed both a comparison and a hold"""
+        return self._masks_computed
+
+    def clear(self):
+        """Drop every cached mask"""
+        self._masks.clear()
+
+    def mask(self, threshold: Threshold) -> np.ndarray:
+        """Boolean (time, y, x) mask where threshold is met for at least its minimum duration,
+        i.e. at every time step of the `min_duration_hours` up to and including this one
+
+        Raises:
+            KeyError: if there is no grid of the threshold's weather element
+        """
+        key = self._key(threshold)
+        self._use(key)
+        found, mask = self._masks.get(key)
+        if found:
+            return mask
+
+        self._masks_computed += 1
+        element, relational, magnitude, steps = key
+        instant_key = (element, relational, magnitude, 1)
+        if steps > 1:
+            self._use(instant_key)
+            found, mask = self._masks.get(instant_key)
+        if not found:
+            values, _ = self._grids[element]
+            mask = self._computed(instant_key, RELATIONAL_UFUNCS[relational](values, magnitude))
+        if steps > 1:
+            mask = self._computed(key, _held_for(mask, steps))
+        return mask
+
+    def _key(self, threshold: Threshold) -> tuple[str, str, float, int]:
+        """Cache key of threshold's mask: weather element, operator, magnitude in the grid's
+        units, and minimum duration in time steps"""
+        if threshold.element not in self._grids:
+            raise KeyError(f"No grid of weather element {threshold.element}")
+        _, units = self._grids[threshold.element]
+        # rounded, so the same threshold in other units (e.g. 32 F and 0 C) shares one mask,
+        # despite conversion rounding errors (32 F is 7e-15 C)
+        magnitude = round(convert(threshold.magnitude, threshold.units, units), 9)
+        steps = max(math.ceil(threshold.min_duration_hours / self._step_hours), 1)
+        return threshold.element, threshold.relational, magnitude, steps
+
+    def _use(self, key: tuple):
+        if self._pending is not None:
+            self._pending[key] -= 1
+
+    def _computed(self, key: tuple, mask: np.ndarray) -> np.ndarray:
+        """Make newly computed mask read-only, and cache it unless the batch being evaluated
+        will not use it again"""
+        mask.flags.writeable = False
+        if self._pending is None or self._pending[key] > 0:
+            self._masks.put(key, mask)
+        return mask
+
+    def evaluate_hazard(self, hazard: Hazard) -> np.ndarray:
+        """Highest impact level reached at each (time, y, x), 0 where none are"""
+        shape = next(iter(self._grids.values()))[0].shape if self._grids else (0, 0, 0)
+        levels = np.zeros(shape, dtype=np.int8)
+        scratch = np.empty(shape, dtype=np.int8)
+        for impact_level in hazard.impact_levels:
+            if not impact_level.thresholds:
+                continue
+            met = scratch.view(np.bool_)
+            np.copyto(met, self.mask(impact_level.thresholds[0]))
+            for threshold in impact_level.thresholds[1:]:
+                np.logical_and(met, self.mask(threshold), out=met)
+            # level where met, else 0. Arithmetic on whole arrays is much faster than `where=`
+            np.multiply(scratch, np.int8(impact_level.value), out=scratch)
+            np.maximum(levels, scratch, out=levels)
+        return levels
+
+    def evaluate_profile(self, profile: dict | Iterable[Hazard]) -> dict[str, np.ndarray]:
+        """Impact levels (see `evaluate_hazard`) of each hazard of a Profile, by hazard id"""
+        hazards = compile_hazards(profile) if isinstance(profile, dict) else profile
+        return {hazard.id: self.evaluate_hazard(hazard) for hazard in hazards}
+
+    def evaluate_profiles(self, profiles: Iterable[dict]) -> dict[str, dict[str, np.ndarray]]:
+        """Impact levels of every hazard of many Profiles, by Profile id and hazard id.
+
+        Compiles every Profile first and counts how often the batch uses each mask, so masks
+        used again later in the batch are computed once and cached, and masks used only once
+        are not cached at all (saving the memory and cache upkeep of masks never reused).
+        """
+        compiled = {profile.get("id", ""): compile_hazards(profile) for profile in profiles}
+        keys = [
+            self._key(threshold)
+            for hazards in compiled.values()
+            for hazard in hazards
+            for level in hazard.impact_levels
+            for threshold in level.thresholds
+        ]
+        pending = Counter(keys)
+        # each distinct minimum duration mask is held from its comparison, computed once
+        pending.update((*key[:3], 1) for key in set(keys) if key[3] > 1)
+
+        self._pending = pending
+        try:
+            return {
+                profile_id: self.evaluate_profile(hazards)
+                for profile_id, hazards in compiled.items()
+            }
+        finally:
+            self._pending = None
+
+
+def _held_for(mask: np.ndarray, steps: int) -> np.ndarray:
+    """Rolling AND over the time axis: True where mask is True at this and the previous
+    `steps - 1` time steps. Keeps a running count of True per cell, one time step at a time, so
+    cost doesn't depend on `steps` (and is far faster than `np.cumsum` over axis 0)
+    """
+    counts = np.zeros(mask.shape[1:], dtype=np.int16 if steps < 2**15 else np.int32)
+    held = np.zeros_like(mask)
+    as_int = mask.view(np.uint8)
+    for index in range(len(mask)):
+        counts += as_int[index]
+        if index >= steps:
+            counts -= as_int[index - steps]
+        if index >= steps - 1:
+            np.equal(counts, steps, out=held[index])
+    return held
+
+
+def benchmark(  # pylint: disable=too-many-locals
+    num_profiles: int = 200,
+    shape: tuple[int, int, int] = (24, 256, 256),
+    seed: int = 0,
+    repeat: int = 3,
+) -> dict[str, float]:
+    """Evaluate synthetic Profiles (see ProfileGenerator) against random grids of every weather
+    element, as one batch, and each Profile on its own with no shared masks. Each is timed
+    `repeat` times, alternating, after one untimed warm up, and the fastest time is reported.
+
+    Synthetic Profiles draw random magnitudes, so they rarely repeat a threshold and the batch
+    computes about as many masks as there are thresholds: compare "masks computed" to
+    "thresholds" to see how much work the batch shared.
+
+    Returns:
+        dict[str, float]: timings in milliseconds, and numbers of thresholds and masks computed
+    """
+    # pylint: disable=import-outside-toplevel
+    from .profile_generator import UNIT_MAGNITUDE_RANGES, ProfileGenerator
+
+    rng = np.random.default_rng(seed)
+    grids = {}
+    for element, units in FIELD_UNITS.items():
+        grid_units = sorted(units)[0]
+        if grid_units in UNIT_MAGNITUDE_RANGES:
+            low, high = UNIT_MAGNITUDE_RANGES[grid_units]
+            grids[element] = (rng.uniform(low, high, shape).astype(np.float32), grid_units)
+    profiles = list(ProfileGenerator(seed).generate(num_profiles))
+
+    start = time.perf_counter()
+    compiled = [compile_hazards(profile) for profile in profiles]
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    def evaluate_batch() -> ThresholdEvaluator:
+        evaluator = ThresholdEvaluator(grids)
+        evaluator.evaluate_profiles(profiles)
+        return evaluator
+
+    def evaluate_separately():
+        for profile in profiles:
+            ThresholdEvaluator(grids).evaluate_profile(profile)
+
+    evaluator = evaluate_batch()  # warm up, so neither timing pays for first use of NumPy
+    batch_ms = separate_ms = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        evaluate_batch()
+        batch_ms = min(batch_ms, (time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        evaluate_separately()
+        separate_ms = min(separate_ms, (time.perf_counter() - start) * 1000)
+
+    return {
+        "profiles": num_profiles,
+        "thresholds": sum(
+            len(level.thresholds)
+            for hazards in compiled
+            for hazard in hazards
+            for level in hazard.impact_levels
+        ),
+        "masks computed": evaluator.masks_computed,
+        "compile ms": compile_ms,
+        "batch ms": batch_ms,
+        "separately ms": separate_ms,
+    }
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = ArgumentParser(description="Benchmark Profile threshold evaluation on random grids")
+    parser.add_argument("--profiles", type=int, default=200, help="Number of Profiles")
+    parser.add_argument("--hours", type=int, default=24, help="Number of hourly time steps")
+    parser.add_argument("--height", type=int, default=256, help="Grid rows")
+    parser.add_argument("--width", type=int, default=256, help="Grid columns")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of Profiles and grids")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs of each; fastest wins")
+    _args = parser.parse_args()
+
+    _results = benchmark(
+        _args.profiles, (_args.hours, _args.height, _args.width), _args.seed, _args.repeat
+    )
+    for _name, _value in _results.items():
+        print(
+            f"{_name:16} {_value:10.1f}"
+            if isinstance(_value, float)
+            else f"{_name:16} {_value:10}"
+        )
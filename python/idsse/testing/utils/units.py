@@ -0,0 +1,182 @@
+"""Convert scalars and NumPy arrays between any of the units in FORECAST_VAR_CONFIG"""
+
+# --------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved. (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# --------------------------------------------------------------------------------
+
+import time
+from argparse import ArgumentParser
+from functools import lru_cache
+
+import numpy as np
+
+from ..idsse_common.lookups import resolve_units
+
+# each unit's quantity, and (scale, offset) converting it to that quantity's base (SI) unit:
+# base = value * scale + offset. Units of the same quantity convert to each other; the rest only
+# to themselves
+UNIT_CONVERSIONS: dict[str, tuple[str, float, float]] = {
+    "Meters": ("length", 1.0, 0.0),
+    "Millimeters": ("length", 0.001, 0.0),
+    "Centimeters": ("length", 0.01, 0.0),
+    "Kilometers": ("length", 1000.0, 0.0),
+    "Inches": ("length", 0.0254, 0.0),
+    "Feet": ("length", 0.3048, 0.0),
+    "Kilofeet": ("length", 304.8, 0.0),
+    "Miles": ("length", 1609.344, 0.0),
+    "NauticalMiles": ("length", 1852.0, 0.0),
+    "MetersPerSecond": ("speed", 1.0, 0.0),
+    "MmPerSec": ("speed", 0.001, 0.0),
+    "InchesPerSecond": ("speed", 0.0254, 0.0),
+    "MilesPerHour": ("speed", 1609.344 / 3600, 0.0),
+    "Knots": ("speed", 1852.0 / 3600, 0.0),
+    "Kelvin": ("temperature", 1.0, 0.0),
+    "Celsius": ("temperature", 1.0, 273.15),
+    "Fahrenheit": ("temperature", 5 / 9, 273.15 - 32 * 5 / 9),
+    "Radians": ("angle", 1.0, 0.0),
+    "Degrees": ("angle", np.pi / 180, 0.0),
+    "Hours": ("time", 3600.0, 0.0),
+}
+
+# spellings seen in profiles and requests that aren't a key, name or abbreviation in the
+# FORECAST_VAR_CONFIG units table (which are all recognized, case insensitive)
+UNITS_ALIASES = {
+    "f": "Fahrenheit",
+    "deg_f": "Fahrenheit",
+    "degf": "Fahrenheit",
+    "c": "Celsius",
+    "deg_c": "Celsius",
+    "degc": "Celsius",
+    "kts": "Knots",
+    "knot": "Knots",
+    "mps": "MetersPerSecond",
+    "in": "Inches",
+    "inch": "Inches",
+    "ft": "Feet",
+    "deg": "Degrees",
+    "pct": "Percent",
+}
+
+
+def resolve(units: str) -> str:
+    """Units key in FORECAST_VAR_CONFIG for any spelling of units, e.g. "F", "°F" or
+    "fahrenheit" are "Fahrenheit"
+
+    Raises:
+        ValueError: if units are not recognized
+    """
+    resolved = resolve_units(units) or UNITS_ALIASES.get(units.lower())
+    if resolved is None:
+        raise ValueError(f"Unrecognized units {units}")
+    return resolved
+
+
+@lru_cache(maxsize=None)
+def conversion(from_units: str, to_units: str) -> tuple[float, float]:
+    """Scale and offset converting `from_units` to `to_units`: converted = value * scale + offset.
+    Cached, so every unit pair is only resolved once
+
+    Raises:
+        ValueError: if either units are unrecognized, or they measure different quantities
+    """
+    from_key, to_key = resolve(from_units), resolve(to_units)
+    if from_key == to_key:
+        return 1.0, 0.0
+    if from_key not in UNIT_CONVERSIONS or to_key not in UNIT_CONVERSIONS:
+        raise ValueError(f"No conversion from {from_key} to {to_key}")
+
+    from_quantity, from_scale, from_offset = UNIT_CONVERSIONS[from_key]
+    to_quantity, to_scale, to_offset = UNIT_CONVERSIONS[to_key]
+    if from_quantity != to_quantity:
+        raise ValueError(
+            f"Cannot convert {from_key} ({from_quantity}) to {to_key} ({to_quantity})"
+        )
+    # fold both steps (to base unit and from it) into one multiply-add
+    return from_scale / to_scale, (from_offset - to_offset) / to_scale
+
+
+def convert(
+    values: float | np.ndarray,
+    from_units: str,
+    to_units: str,
+    *,
+    out: np.ndarray | None = None,
+) -> float | np.ndarray:
+    """Convert a scalar or array between units, e.g. `convert(grid, "Kelvin", "F")`. Arrays are
+    converted in one pass with no temporary arrays: the result is the only new array (or none,
+    if `out` is given), and arrays already in the requested units are returned as-is.
+
+    Args:
+        values (float | np.ndarray): value(s) to convert
+        from_units (str): units of values, any spelling `resolve` recognizes
+        to_units (str): units to convert to
+        out (optional, np.ndarray | None): array to write result into, e.g. `values` itself to
+            convert in place. Must be a float array the same shape as values
+
+    Raises:
+        ValueError: if units are unrecognized, or measure different quantities
+
+    Returns:
+        float | np.ndarray: converted value(s). `out`, if given
+    """
+    scale, offset = conversion(from_units, to_units)
+    if np.isscalar(values) and out is None:
+        return float(values) * scale + offset
+
+    if out is None:
+        if scale == 1.0 and offset == 0.0:
+            return values
+        out = np.multiply(values, scale)
+    else:
+        np.multiply(values, scale, out=out)
+    if offset:
+        np.add(out, offset, out=out)
+    return out
+
+
+def benchmark(shape: tuple[int, ...] = (1597, 2345), repeat: int = 20) -> dict[str, float]:
+    """Time temperature conversions of a float32 grid (default the full CONUS NBM grid), with
+    and without `out`, compared to the textbook two-step formula.
+
+    Returns:
+        dict[str, float]: median milliseconds per conversion, by description
+    """
+    rng = np.random.default_rng(0)
+    kelvin = rng.uniform(230, 320, shape).astype(np.float32)
+    scratch = np.empty_like(kelvin)
+
+    cases = {
+        "Kelvin->Fahrenheit": lambda: convert(kelvin, "Kelvin", "Fahrenheit"),
+        "Fahrenheit->Celsius": lambda: convert(kelvin, "F", "C"),
+        "Celsius->Kelvin": lambda: convert(kelvin, "Celsius", "Kelvin"),
+        "Kelvin->Fahrenheit (out=)": lambda: convert(kelvin, "K", "F", out=scratch),
+        "Kelvin->Fahrenheit (naive)": lambda: (kelvin - 273.15) * 9 / 5 + 32,
+    }
+    results = {}
+    for name, func in cases.items():
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        results[name] = float(np.median(timings) * 1000)
+    return results
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = ArgumentParser(description="Benchmark unit conversion of CONUS-sized grids")
+    parser.add_argument("--height", type=int, default=1597, help="Grid rows. Default NBM CONUS")
+    parser.add_argument("--width", type=int, default=2345, help="Grid columns. Default NBM CONUS")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs of each conversion")
+    _args = parser.parse_args()
+
+    _results = benchmark((_args.height, _args.width), _args.repeat)
+    _megabytes = _args.height * _args.width * 4 / 1e6
+    for _name, _millis in _results.items():
+        print(f"{_name:28} {_millis:8.2f} ms  {_megabytes / _millis:6.2f} GB/s")
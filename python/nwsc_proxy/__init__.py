@@ -0,0 +1 @@
+"""NWS Connect Proxy service, simulating the NWS Connect APIs for IDSSe testing"""
@@ -0,0 +1 @@
+"""Benchmarks of the NWS Connect Proxy service. Not installed with the `nwsc_proxy` package"""
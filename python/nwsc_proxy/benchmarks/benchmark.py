@@ -0,0 +1,612 @@
+"""Load generator and benchmark harness measuring performance of the NWS Connect Proxy service"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+import json
+import os
+import random
+import sys
+import time
+from argparse import ArgumentParser, Namespace
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass, field
+from datetime import datetime, UTC
+from glob import glob
+from tempfile import TemporaryDirectory
+from threading import Lock
+from uuid import uuid4
+
+from flask import Flask
+
+from ..ncp_web_service import AppWrapper, load_fault_configs
+from ..src.utils import deep_update
+from ..src.vulnerability_store import CachedProfile
+
+# constants
+BASE_URL = "/api/v1"
+PROXY_DIR = os.path.join(os.path.dirname(__file__), "..")
+TEMPLATE_PATH = os.path.join(PROXY_DIR, "src", "vulnerabilities", "nwsc_gsl_test_profiles.json")
+PORTFOLIO_DIR = os.path.join(PROXY_DIR, "..", "idsse", "testing", "event_portfolios")
+# real Vulnerabilities saved from NWS Connect, with the threshold counts seen in practice
+VULNERABILITY_FIXTURE_PATHS = [TEMPLATE_PATH] + sorted(
+    glob(
+        os.path.join(
+            PROXY_DIR,
+            "..",
+            "idsse",
+            "testing",
+            "nwsc_gateway",
+            "vulnerability_*.json",
+        )
+    )
+)
+OFFICES = ["BOU", "BOX", "GSL", "LWX", "OKX", "SEW", "SFO", "TWC"]
+
+# relative weight of each operation in the request mix, if none is provided
+DEFAULT_MIX = {
+    "get_list": 10,
+    "get_one": 40,
+    "post": 10,
+    "patch": 10,
+    "delete": 5,
+    "get_user": 15,
+    "update_user": 5,
+    "logout": 5,
+}
+
+
+@dataclass
+class OperationStats:
+    """Latencies and response status codes collected for one operation type"""
+
+    latencies: list[float] = field(default_factory=list)
+    statuses: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+
+    def record(self, latency: float, status: int):
+        """Add the outcome of one request"""
+        self.latencies.append(latency)
+        self.statuses[status] += 1
+
+    def merge(self, other: "OperationStats"):
+        """Combine another OperationStats into this one"""
+        self.latencies.extend(other.latencies)
+        for status, count in other.statuses.items():
+            self.statuses[status] += count
+
+    def summary(self, elapsed: float) -> dict:
+        """Summarize as JSON-serializable dict of request rate and latency percentiles (in ms)"""
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        return {
+            "count": count,
+            "requestsPerSec": count / elapsed if elapsed else 0.0,
+            "latencyMs": {
+                "mean": 1000 * sum(latencies) / count if count else 0.0,
+                "p50": 1000 * _percentile(latencies, 50),
+                "p90": 1000 * _percentile(latencies, 90),
+                "p99": 1000 * _percentile(latencies, 99),
+                "max": 1000 * latencies[-1] if count else 0.0,
+            },
+            "statuses": {str(status): num for status, num in sorted(self.statuses.items())},
+        }
+
+
+class ProfilePool:
+    """Thread-safe set of Vulnerability IDs known to exist in the proxy, so that the load
+    generator can target real profiles for GET/PATCH/DELETE requests.
+    """
+
+    def __init__(self, profile_ids: list[str]):
+        self._ids = list(profile_ids)
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, profile_id: str):
+        """Track newly created profile ID"""
+        with self._lock:
+            self._ids.append(profile_id)
+
+    def choice(self, rng: random.Random) -> str | None:
+        """Random existing profile ID, or None if pool is empty"""
+        with self._lock:
+            return rng.choice(self._ids) if self._ids else None
+
+    def pop(self, rng: random.Random) -> str | None:
+        """Remove and return random profile ID, or None if pool is empty"""
+        with self._lock:
+            if not self._ids:
+                return None
+            index = rng.randrange(len(self._ids))
+            # swap with last element so removal is O(1)
+            self._ids[index], self._ids[-1] = self._ids[-1], self._ids[index]
+            return self._ids.pop()
+
+
+def load_template_profile() -> dict:
+    """Read the example Vulnerability used as template for all synthetic profiles"""
+    with open(TEMPLATE_PATH, "r", encoding="utf-8") as file:
+        return json.load(file)[0]
+
+
+def build_profiles(num_profiles: int, seed: int | None = None) -> list[dict]:
+    """Create `num_profiles` synthetic Vulnerabilities, copied from the template profile"""
+    rng = random.Random(seed)
+    template = load_template_profile()
+
+    profiles = []
+    for index in range(num_profiles):
+        profile = deepcopy(template)
+        profile["id"] = str(uuid4())
+        profile["name"] = f"Benchmark Profile {index}"
+        profile["primaryOfficeId"] = rng.choice(OFFICES)
+        profiles.append(profile)
+    return profiles
+
+
+def build_base_dir(base_dir: str, num_profiles: int, seed: int | None = None) -> list[str]:
+    """Write `num_profiles` synthetic Vulnerabilities to `base_dir` as one raw NWS Connect
+    API response file, which the proxy will split into individual profiles on startup.
+
+    Returns:
+        list[str]: IDs of all profiles written
+    """
+    profiles = build_profiles(num_profiles, seed)
+    with open(os.path.join(base_dir, "benchmark_profiles.json"), "w", encoding="utf-8") as file:
+        json.dump(profiles, file)
+    return [profile["id"] for profile in profiles]
+
+
+def load_profiles(base_dir: str) -> list[dict]:
+    """Read every profile in a proxy base directory, both from raw NWS Connect API response
+    files and from the `profiles/` subdirectory of individual profiles
+    """
+    return load_profile_files(
+        os.path.join(base_dir, filename)
+        for pattern in ("*.json", os.path.join("profiles", "*.json"))
+        for filename in glob(pattern, root_dir=base_dir)
+    )
+
+
+def load_profile_files(paths: Iterable[str]) -> list[dict]:
+    """Read every profile in JSON files that are each a single profile, a list of profiles, or
+    an NWS Connect API response (object with `profiles` list)
+    """
+    profiles = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if isinstance(data, dict):
+            profiles.extend(data["profiles"] if "profiles" in data else [data])
+        else:
+            profiles.extend(data)
+    return profiles
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """Parse request mix formatted like `get_one=50,post=10` into dict of operation weights
+
+    Raises:
+        ValueError: if an operation is unknown or weight is not a non-negative number
+    """
+    weights = {}
+    for item in mix.split(","):
+        if not item.strip():
+            continue
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"Unknown operation {name}, expected one of {list(DEFAULT_MIX)}")
+        weights[name] = float(weight)
+        if weights[name] < 0:
+            raise ValueError(f"Weight of operation {name} cannot be negative")
+
+    if not any(weights.values()):
+        raise ValueError("Request mix must have at least one operation with positive weight")
+    return weights
+
+
+class LoadGenerator:  # pylint: disable=too-few-public-methods
+    """Drives a configurable mix of requests at a Flask app from many threads at once,
+    recording the latency of each request by operation type.
+
+    Args:
+        app (Flask): the app under test
+        pool (ProfilePool): IDs of profiles that exist in the app
+        mix (dict[str, float]): relative weight of each operation
+        seed (int | None): seed for reproducible request sequences
+    """
+
+    def __init__(
+        self, app: Flask, pool: ProfilePool, mix: dict[str, float], seed: int | None = None
+    ):
+        self._app = app
+        self._pool = pool
+        self._operations = [op for op, weight in mix.items() if weight > 0]
+        self._weights = [mix[op] for op in self._operations]
+        self._seed = seed
+        self._template = load_template_profile()
+
+    def run(self, num_requests: int, concurrency: int) -> tuple[dict[str, OperationStats], float]:
+        """Send `num_requests` requests split across `concurrency` worker threads.
+
+        Returns:
+            tuple[dict[str, OperationStats], float]: stats per operation, and elapsed seconds
+        """
+        # spread requests as evenly as possible across workers
+        counts = [num_requests // concurrency] * concurrency
+        for index in range(num_requests % concurrency):
+            counts[index] += 1
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            worker_results = list(executor.map(self._worker, range(concurrency), counts))
+        elapsed = time.perf_counter() - start
+
+        stats: dict[str, OperationStats] = defaultdict(OperationStats)
+        for result in worker_results:
+            for operation, op_stats in result.items():
+                stats[operation].merge(op_stats)
+        return stats, elapsed
+
+    def _worker(self, worker_id: int, num_requests: int) -> dict[str, OperationStats]:
+        # each worker gets its own client and random sequence, so workers share no state
+        # other than the app under test and the profile ID pool
+        rng = random.Random(None if self._seed is None else self._seed + worker_id)
+        client = self._app.test_client()
+        stats: dict[str, OperationStats] = defaultdict(OperationStats)
+
+        for operation in rng.choices(self._operations, self._weights, k=num_requests):
+            start = time.perf_counter()
+            status = getattr(self, f"_{operation}")(client, rng)
+            stats[operation].record(time.perf_counter() - start, status)
+        return stats
+
+    # operations. Each sends one request and returns its HTTP status code
+    def _get_list(self, client, rng: random.Random) -> int:
+        # half of list requests filter by office, like a gateway serving one office would
+        query = {"officeId": rng.choice(OFFICES)} if rng.random() < 0.5 else {}
+        return client.get(f"{BASE_URL}/vulnerabilities", query_string=query).status_code
+
+    def _get_one(self, client, rng: random.Random) -> int:
+        profile_id = self._pool.choice(rng) or str(uuid4())
+        return client.get(f"{BASE_URL}/vulnerabilities/{profile_id}").status_code
+
+    def _post(self, client, rng: random.Random) -> int:
+        body = {**self._template, "primaryOfficeId": rng.choice(OFFICES)}
+        response = client.post(f"{BASE_URL}/vulnerabilities", json=body)
+        if response.status_code == 201:
+            self._pool.add(response.json["id"])
+        return response.status_code
+
+    def _patch(self, client, rng: random.Random) -> int:
+        profile_id = self._pool.choice(rng) or str(uuid4())
+        body = {"name": f"Patched {rng.random()}"}
+        return client.patch(f"{BASE_URL}/vulnerabilities/{profile_id}", json=body).status_code
+
+    def _delete(self, client, rng: random.Random) -> int:
+        profile_id = self._pool.pop(rng) or str(uuid4())
+        return client.delete(f"{BASE_URL}/vulnerabilities/{profile_id}").status_code
+
+    def _get_user(self, client, rng: random.Random) -> int:
+        headers = {"Cookie": f"JSESSIONID=session{rng.randrange(100)}"}
+        return client.get(f"{BASE_URL}/users/nws-users/me", headers=headers).status_code
+
+    def _update_user(self, client, rng: random.Random) -> int:
+        headers = {"Cookie": f"JSESSIONID=session{rng.randrange(100)}"}
+        body = {"activeOfficeId": rng.choice(OFFICES), "settings": {"theme": "DARK"}}
+        return client.patch(
+            f"{BASE_URL}/users/nws-users/me", json=body, headers=headers
+        ).status_code
+
+    def _logout(self, client, rng: random.Random) -> int:
+        headers = {"Cookie": f"JSESSIONID=session{rng.randrange(100)}"}
+        return client.post(f"{BASE_URL}/session/logout", headers=headers).status_code
+
+
+def run_load_benchmark(args: Namespace) -> dict:
+    """Boot the proxy against a synthetic base directory and drive load at it.
+
+    Returns:
+        dict: JSON-serializable benchmark results
+    """
+    mix = parse_mix(args.mix) if args.mix else DEFAULT_MIX
+    with TemporaryDirectory(prefix="ncp_benchmark_") as temp_dir:
+        base_dir = args.base_dir or temp_dir
+        if not args.base_dir:
+            build_base_dir(base_dir, args.profiles, args.seed)
+
+        start = time.perf_counter()
+        wrapper = AppWrapper(base_dir, load_fault_configs(args.faults))
+        wrapper.wait_until_loaded()  # profiles load in the background; wait for all of them
+        startup_secs = time.perf_counter() - start
+
+        # by now, proxy has split any raw API response files into one file per profile
+        profile_ids = [
+            filename.removesuffix(".json")
+            for filename in os.listdir(os.path.join(base_dir, "profiles"))
+            if filename.endswith(".json")
+        ]
+        generator = LoadGenerator(wrapper.app, ProfilePool(profile_ids), mix, args.seed)
+        stats, elapsed = generator.run(args.requests, args.concurrency)
+
+    total = OperationStats()
+    for op_stats in stats.values():
+        total.merge(op_stats)
+
+    return {
+        "benchmark": "load",
+        "startedAt": datetime.now(UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "config": {
+            "baseDir": args.base_dir,
+            "profiles": len(profile_ids),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "mix": mix,
+            "faults": args.faults,
+            "seed": args.seed,
+        },
+        "startupSec": startup_secs,
+        "elapsedSec": elapsed,
+        "total": total.summary(elapsed),
+        "routes": {operation: stats[operation].summary(elapsed) for operation in sorted(stats)},
+    }
+
+
+def run_validation_benchmark(args: Namespace) -> dict:
+    """Measure cost of validating each profile, and of building a CachedProfile (which includes
+    validation), as the proxy does for every POST/PATCH and every profile loaded on startup.
+
+    Returns:
+        dict: JSON-serializable benchmark results
+    """
+    if args.base_dir:
+        profiles = load_profiles(args.base_dir)
+    else:
+        profiles = load_profile_files(args.paths or VULNERABILITY_FIXTURE_PATHS)
+    validator = CachedProfile.VALIDATOR
+
+    validate_secs: list[float] = []
+    construct_secs: list[float] = []
+    invalid_profiles = 0
+    for _ in range(args.repeat):
+        for profile in profiles:
+            start = time.perf_counter()
+            errors = validator.validate(profile)
+            validate_secs.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            try:
+                CachedProfile(profile)
+            except ValueError:
+                pass
+            construct_secs.append(time.perf_counter() - start)
+            invalid_profiles += bool(errors)
+
+    num_thresholds = sum(
+        len(impact_level.get("thresholdSet", []))
+        for profile in profiles
+        for hazard in profile.get("hazards", [])
+        for impact_level in hazard.get("impactLevels", [])
+    )
+    return {
+        "benchmark": "validate",
+        "startedAt": datetime.now(UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "config": {
+            "baseDir": args.base_dir,
+            "paths": None if args.base_dir else args.paths or VULNERABILITY_FIXTURE_PATHS,
+            "profiles": len(profiles),
+            "repeat": args.repeat,
+        },
+        "thresholdsPerProfile": num_thresholds / len(profiles) if profiles else 0.0,
+        "invalidProfiles": invalid_profiles // max(args.repeat, 1),
+        "validateUs": _micros_summary(validate_secs),
+        "cachedProfileUs": _micros_summary(construct_secs),
+    }
+
+
+def run_merge_benchmark(args: Namespace) -> dict:
+    """Compare the cost of applying small JSON merge patches with `deep_update` against the
+    previous implementation (which deep copied the whole document at every level), on large
+    JSON documents such as event portfolios.
+
+    Returns:
+        dict: JSON-serializable benchmark results
+    """
+    paths = args.paths or sorted(glob(os.path.join(PORTFOLIO_DIR, "*.json"))) + [TEMPLATE_PATH]
+
+    documents = {}
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        # event portfolios are objects, raw NWS Connect responses are lists of profiles
+        documents[os.path.basename(path)] = data[0] if isinstance(data, list) else data
+
+    results = {}
+    for name, document in documents.items():
+        patches = {
+            "top_level": {"name": "A different name"},
+            "nested_leaf": _nested_leaf_patch(document),
+        }
+        results[name] = {"sizeBytes": len(json.dumps(document))}
+        for patch_name, patch in patches.items():
+            previous_secs = _time_per_call(_deep_update_deepcopy, document, patch, args.repeat)
+            current_secs = _time_per_call(deep_update, document, patch, args.repeat)
+            results[name][patch_name] = {
+                "previousUs": 1e6 * previous_secs,
+                "currentUs": 1e6 * current_secs,
+                "speedup": previous_secs / current_secs if current_secs else 0.0,
+                "resultsMatch": deep_update(document, patch)
+                == _deep_update_deepcopy(document, patch),
+            }
+
+    return {
+        "benchmark": "merge",
+        "startedAt": datetime.now(UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "config": {"paths": paths, "repeat": args.repeat},
+        "documents": results,
+    }
+
+
+def _nested_leaf_patch(document: dict) -> dict:
+    """Build merge patch that changes a single leaf value, as deep in nested objects as possible"""
+    patch = {}
+    node, patch_node = document, patch
+    while True:
+        child_key = next((key for key, value in node.items() if isinstance(value, dict)), None)
+        if child_key is None:
+            break
+        node, patch_node[child_key] = node[child_key], {}
+        patch_node = patch_node[child_key]
+    patch_node["benchmarkValue"] = 1
+    return patch
+
+
+def _time_per_call(func, original: dict, patch: dict, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(original, patch)
+    return (time.perf_counter() - start) / repeat
+
+
+def _deep_update_deepcopy(original: dict, updates: dict) -> dict:
+    """Previous implementation of `deep_update`, kept for comparison"""
+    updated_dict = deepcopy(original)
+    for key, value in updates.items():
+        if isinstance(original.get(key), dict) and isinstance(value, dict):
+            updated_dict[key] = _deep_update_deepcopy(original.get(key), value)
+        else:
+            updated_dict[key] = value
+    return updated_dict
+
+
+def _micros_summary(durations: list[float]) -> dict:
+    """Summarize durations (in seconds) as mean and percentiles in microseconds"""
+    durations = sorted(durations)
+    count = len(durations)
+    return {
+        "mean": 1e6 * sum(durations) / count if count else 0.0,
+        "p50": 1e6 * _percentile(durations, 50),
+        "p99": 1e6 * _percentile(durations, 99),
+        "max": 1e6 * durations[-1] if count else 0.0,
+        "perSec": count / sum(durations) if count and sum(durations) else 0.0,
+    }
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list. 0 if list is empty"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def _write_results(results: dict, output: str | None):
+    if output:
+        with open(output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+def build_parser() -> ArgumentParser:
+    """Command line arguments for all benchmarks"""
+    parser = ArgumentParser(description="Benchmarks for the NWS Connect Proxy service")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    load_parser = subparsers.add_parser("load", help="Measure request throughput and latency")
+    load_parser.add_argument(
+        "--profiles", type=int, default=1000, help="Number of synthetic profiles in base_dir"
+    )
+    load_parser.add_argument(
+        "--base_dir",
+        default=None,
+        help="Serve profiles from an existing base directory (e.g. one written by "
+        "idsse.testing.utils.profile_generator) instead of a temporary one. Note that requests "
+        "which create, update or delete profiles modify this directory.",
+    )
+    load_parser.add_argument(
+        "--requests", type=int, default=5000, help="Total number of requests to send"
+    )
+    load_parser.add_argument(
+        "--concurrency", type=int, default=8, help="Number of concurrent client threads"
+    )
+    load_parser.add_argument(
+        "--mix",
+        default=None,
+        help="Relative weight of each operation, e.g. `get_one=50,post=10`. "
+        f"Operations: {', '.join(DEFAULT_MIX)}. Defaults to {DEFAULT_MIX}",
+    )
+    load_parser.add_argument(
+        "--fault",
+        dest="faults",
+        action="append",
+        default=[],
+        help="Inject faults into proxy routes, same format as ncp_web_service.py --fault",
+    )
+    load_parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible runs")
+    load_parser.add_argument(
+        "--output", default=None, help="File to write JSON results. Defaults to stdout"
+    )
+    load_parser.set_defaults(func=run_load_benchmark)
+
+    validate_parser = subparsers.add_parser("validate", help="Measure per-profile validation cost")
+    validate_parser.add_argument(
+        "--paths",
+        nargs="*",
+        default=None,
+        help="JSON files of profiles to validate. Defaults to the real Vulnerability fixtures in "
+        "src/vulnerabilities and idsse/testing/nwsc_gateway",
+    )
+    validate_parser.add_argument(
+        "--base_dir",
+        default=None,
+        help="Validate every profile in an existing base directory instead of --paths",
+    )
+    validate_parser.add_argument(
+        "--repeat", type=int, default=1000, help="Number of passes over all profiles"
+    )
+    validate_parser.add_argument(
+        "--output", default=None, help="File to write JSON results. Defaults to stdout"
+    )
+    validate_parser.set_defaults(func=run_validation_benchmark)
+
+    merge_parser = subparsers.add_parser(
+        "merge", help="Compare JSON merge patch (deep_update) cost against previous version"
+    )
+    merge_parser.add_argument(
+        "--paths",
+        nargs="*",
+        default=None,
+        help="JSON documents to patch. Defaults to the event portfolio fixtures in "
+        "idsse/testing/event_portfolios, plus the example Vulnerability",
+    )
+    merge_parser.add_argument(
+        "--repeat", type=int, default=200, help="Number of times each patch is applied"
+    )
+    merge_parser.add_argument(
+        "--output", default=None, help="File to write JSON results. Defaults to stdout"
+    )
+    merge_parser.set_defaults(func=run_merge_benchmark)
+
+    return parser
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _args = build_parser().parse_args()
+    _write_results(_args.func(_args), _args.output)
@@ -10,15 +10,20 @@
 #     Mackenzie Grimes (1)
 #
 # ----------------------------------------------------------------------------------
+import math
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, UTC
 from argparse import ArgumentParser, Namespace
 
 from flask import Flask, Response, request, jsonify
 
-from src.vulnerability_store import VulnerabilityStore
-from src.user_store import UserStore
-from src.utils import to_iso
+from .src.active_schedule import parse_datetime
+from .src.fault_injection import FaultConfig, FaultInjector, load_fault_configs
+from .src.profile_validation import ProfileValidationError
+from .src.vulnerability_store import VulnerabilityStore
+from .src.user_store import UserStore
+from .src.utils import to_iso
 
 # constants
 # GSL_KEY = "8209c979-e3de-402e-a1f5-556d650ab889"
@@ -106,10 +111,39 @@ class AuthenticationRoute:
 
 
 class VulnerabilitiesRoute:
-    """Handle requests to /vulnerabilities endpoint"""
+    """Handle requests to /vulnerabilities endpoint.
+
+    Profiles are loaded from `base_dir` in a background thread, so the server can start listening
+    (and answer /health) right away, however many Profiles there are. Requests that need the
+    Profiles wait until they are loaded.
+
+    Args:
+        base_dir (str): directory of Profile JSON files
+        max_cache_bytes (optional, int): memory limit of full Profiles held in memory, see
+            `VulnerabilityStore`. Defaults to None (no limit)
+    """
+
+    def __init__(self, base_dir: str, max_cache_bytes: int | None = None):
+        loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="VulnerabilityStoreLoader")
+        self._store_future: Future[VulnerabilityStore] = loader.submit(
+            VulnerabilityStore, base_dir, max_cache_bytes
+        )
+        loader.shutdown(wait=False)  # thread exits once store is loaded
+
+    def wait_until_loaded(self, timeout: float | None = None):
+        """Block until Profiles are loaded (or `timeout` seconds pass). Raises any error loading
+        them, or TimeoutError
+        """
+        self._store_future.result(timeout)
 
-    def __init__(self, base_dir: str):
-        self._profile_store = VulnerabilityStore(base_dir)
+    @property
+    def _profile_store(self) -> VulnerabilityStore:
+        """The VulnerabilityStore, once loaded. Raises any error loading it"""
+        return self._store_future.result()
+
+    def store_info(self):
+        """Logic for requests to /admin/store: memory use and cache hit/miss counts of the store"""
+        return jsonify(self._profile_store.cache_info()), 200
 
     def documents(self):
         """Logic for any HTTP request to /vulnerabilities."""
@@ -126,7 +160,25 @@ class VulnerabilitiesRoute:
         # Default to False if param not present (only return profiles where isDeleted: false)
         include_is_deleted = request.args.get("isDeleted", default=False, type=bool)
 
-        profiles = self._profile_store.get_all(include_inactive=include_is_deleted, office=office)
+        # optional spatial filters, answered by the store's spatial index
+        try:
+            bbox = self._read_coordinates("bbox", 4)
+            point = self._read_coordinates("point", 2)
+            active_at = self._read_timestamps("activeAt", 1)
+            active_between = self._read_timestamps("activeBetween", 2)
+        except ValueError as exc:
+            return jsonify({"message": str(exc)}), 400
+
+        filters = {"include_inactive": include_is_deleted, "office": office}
+        if bbox is not None:
+            filters["bbox"] = bbox
+        if point is not None:
+            filters["point"] = point
+        if active_at is not None:
+            filters["active_at"] = active_at[0]
+        if active_between is not None:
+            filters["active_between"] = active_between
+        profiles = self._profile_store.get_all(**filters)
         return jsonify(profiles), 200
 
     def document(self, profile_id: str):
@@ -146,12 +198,69 @@ class VulnerabilitiesRoute:
 
         return jsonify({"message": f"Profile {profile_id} not found"}), 404
 
+    @staticmethod
+    def _read_coordinates(param: str, count: int) -> tuple[float, ...] | None:
+        """Parse comma-separated numbers of a request param, e.g. `bbox=-106,39,-104,41`.
+
+        Returns:
+            tuple[float, ...] | None: the numbers, or None if param is not in request
+
+        Raises:
+            ValueError: if param is not exactly `count` finite numbers, or is a bounding box
+                with min greater than max
+        """
+        value: str | None = request.args.get(param)
+        if value is None:
+            return None
+        try:
+            coords = tuple(float(item) for item in value.split(","))
+        except ValueError:
+            coords = ()
+        if len(coords) != count or not all(math.isfinite(coord) for coord in coords):
+            raise ValueError(
+                f"Invalid {param} '{value}', expected {count} comma-separated numbers"
+            )
+        if count == 4 and (coords[0] > coords[2] or coords[1] > coords[3]):
+            raise ValueError(f"Invalid {param} '{value}', expected minx,miny,maxx,maxy")
+        return coords
+
+    @staticmethod
+    def _read_timestamps(param: str, count: int) -> tuple[float, ...] | None:
+        """Parse comma-separated ISO 8601 datetimes of a request param to Unix timestamps, e.g.
+        `activeBetween=2026-10-19T00:00:00Z,2026-10-20T00:00:00Z`. Datetimes with no timezone
+        are UTC.
+
+        Returns:
+            tuple[float, ...] | None: the timestamps, or None if param is not in request
+
+        Raises:
+            ValueError: if param is not exactly `count` datetimes, or they are out of order
+        """
+        value: str | None = request.args.get(param)
+        if value is None:
+            return None
+        try:
+            timestamps = tuple(
+                parse_datetime(item.strip()).timestamp() for item in value.split(",")
+            )
+        except (ValueError, OverflowError):
+            timestamps = ()
+        if len(timestamps) != count:
+            raise ValueError(f"Invalid {param} '{value}', expected {count} ISO 8601 datetime(s)")
+        if timestamps != tuple(sorted(timestamps)):
+            raise ValueError(f"Invalid {param} '{value}', start is after end")
+        return timestamps
+
     def _handle_create(self) -> Response:
         """Logic for POST requests to /vulnerabilities. Returns Response with status_code: 201 on
         success, 400 otherwise."""
         profile_data: dict = request.json
 
-        saved_profile = self._profile_store.save(profile_data)
+        try:
+            saved_profile = self._profile_store.save(profile_data)
+        except ProfileValidationError as exc:
+            return jsonify({"message": str(exc), "errors": exc.errors}), 400
+
         if not saved_profile:
             return jsonify({"message": "Error creating profile, may be malformed"}), 400
 
@@ -176,6 +285,8 @@ class VulnerabilitiesRoute:
             updated_profile = self._profile_store.update(profile_id, request_body)
         except FileNotFoundError:
             return jsonify({"message": f"Profile {profile_id} not found"}), 404
+        except ProfileValidationError as exc:
+            return jsonify({"message": str(exc), "errors": exc.errors}), 400
 
         if not updated_profile:
             return jsonify({"message": "Internal Server Error"}), 500
@@ -183,19 +294,66 @@ class VulnerabilitiesRoute:
         return jsonify(updated_profile), 200
 
 
+class FaultsRoute:
+    """Handle requests to /admin/faults endpoint to inspect or change injected faults at runtime"""
+
+    def __init__(self, injector: FaultInjector):
+        self._injector = injector
+
+    def handler(self):
+        """Logic for requests to /admin/faults"""
+        if request.method == "PUT":
+            # body is object of route name -> FaultConfig properties, e.g. {"*": {"latency_ms": 5}}
+            body: dict = request.json
+            try:
+                new_configs = {route: FaultConfig.from_dict(data) for route, data in body.items()}
+            except (AttributeError, TypeError, ValueError) as exc:
+                return jsonify({"message": f"Invalid fault config: {exc}"}), 400
+            for route, config in new_configs.items():
+                self._injector.set_config(route, config)
+
+        elif request.method == "DELETE":
+            # clear faults for a single route if requested, otherwise clear all of them
+            self._injector.clear(request.args.get("route"))
+
+        configs = {route: config.to_dict() for route, config in self._injector.configs.items()}
+        return jsonify(configs), 200
+
+
 class AppWrapper:
     """Web server class wrapping Flask operations"""
 
-    def __init__(self, base_dir: str):
+    def __init__(
+        self,
+        base_dir: str,
+        faults: dict[str, FaultConfig] | None = None,
+        max_cache_bytes: int | None = None,
+    ):
         """Build Flask app instance, mapping handler to each endpoint"""
         self.app = Flask(__name__, static_folder=None)  # no need for a static folder
         # self.app.config["GSL_KEY"] = GSL_KEY
 
+        # simulate latency, errors and rate limiting of NWS Connect, if any are configured
+        self.fault_injector = FaultInjector(faults)
+        self.fault_injector.init_app(self.app)
+
         health_route = HealthRoute()
         auth_route = AuthenticationRoute()
-        vulnerabilities_route = VulnerabilitiesRoute(base_dir)
+        self._vulnerabilities_route = vulnerabilities_route = VulnerabilitiesRoute(
+            base_dir, max_cache_bytes
+        )
+        faults_route = FaultsRoute(self.fault_injector)
 
         self.app.add_url_rule("/health", "health", view_func=health_route.handler, methods=["GET"])
+        self.app.add_url_rule(
+            "/admin/faults",
+            "faults",
+            view_func=faults_route.handler,
+            methods=["GET", "PUT", "DELETE"],
+        )
+        self.app.add_url_rule(
+            "/admin/store", "store", view_func=vulnerabilities_route.store_info, methods=["GET"]
+        )
         # hard-code /token path of whatever openid framework NWS Connect uses
         self.app.add_url_rule(AUTH_PATH, "token", view_func=auth_route.token, methods=["POST"])
         # the paths to Vulnerabilities and Users APIs are nested under `/api/v1/...`
@@ -225,6 +383,10 @@ class AppWrapper:
         # catch all uncaught errors, return generic JSON (instead of Flask text/html default)
         self.app.register_error_handler(500, self._generic_error)
 
+    def wait_until_loaded(self, timeout: float | None = None):
+        """Block until Profiles are loaded (see `VulnerabilitiesRoute`)"""
+        self._vulnerabilities_route.wait_until_loaded(timeout)
+
     def run(self, **kwargs):
         """Start up web server"""
         self.app.run(**kwargs)
@@ -237,11 +399,14 @@ class AppWrapper:
 def create_app(args: Namespace = None) -> Flask:
     """Create a Flask instance"""
     base_dir = args.base_dir
-    return AppWrapper(base_dir).app
+    # faults from FAULTS env var, overridden by any --fault command line args
+    faults = load_fault_configs(getattr(args, "faults", None))
+    return AppWrapper(base_dir, faults, getattr(args, "max_cache_bytes", None)).app
 
 
-if __name__ == "__main__":  # pragma: no cover
-    parser = ArgumentParser()
+def main(argv: list[str] | None = None):  # pragma: no cover
+    """Parse command line args and run the web server. Entry point of the `nwsc-proxy` command"""
+    parser = ArgumentParser(description="NWS Connect Proxy service")
     parser.add_argument(
         "--port",
         dest="port",
@@ -255,14 +420,42 @@ if __name__ == "__main__":  # pragma: no cover
         required=True,
         help="The base directory where Support Profile JSONs will be read/written",
     )
+    parser.add_argument(
+        "--fault",
+        dest="faults",
+        action="append",
+        default=[],
+        help="Inject faults into a route, formatted like `route:key=value,key=value`. "
+        "E.g. `vulnerabilities:latency_p50_ms=100,latency_p99_ms=900,error_rate=0.05`. "
+        "Omit `route:` to apply to all routes. Can be provided multiple times.",
+    )
+    parser.add_argument(
+        "--max_cache_bytes",
+        dest="max_cache_bytes",
+        default=os.getenv("MAX_CACHE_BYTES"),
+        type=int,
+        help="Approximate memory limit (bytes) of full Profiles held in memory. Profiles over "
+        "the limit are re-read from base_dir when requested. Default: MAX_CACHE_BYTES env var, "
+        "or no limit.",
+    )
+
+    args = parser.parse_args(argv)
 
-    _args = parser.parse_args()
+    flask_app = create_app(args)
+    # host=0.0.0.0 is required for flask to work properly in docker and k8s env.
+    # threaded so that any injected latency delays only the request it was applied to
+    flask_app.run(host="0.0.0.0", port=args.port, threaded=True)
 
-    app = create_app(_args)
-    # host=0.0.0.0 is required for flask to work properly in docker and k8s env
-    app.run(host="0.0.0.0", port=_args.port)
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
 
 elif "gunicorn" in os.getenv("SERVER_SOFTWARE", default=""):  # pragma: no cover
     # default to current directory
     _base_dir = os.getenv("BASE_DIR", os.getcwd())
-    app = AppWrapper(_base_dir).app
+    _max_cache_bytes = os.getenv("MAX_CACHE_BYTES")
+    app = AppWrapper(
+        _base_dir,
+        load_fault_configs(),
+        int(_max_cache_bytes) if _max_cache_bytes else None,
+    ).app
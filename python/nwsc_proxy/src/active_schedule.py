@@ -0,0 +1,262 @@
+"""When a Profile is active, from its `activeTime`: expanded once into sorted intervals, so asking
+whether it is active at a time (or during a window) is a binary search"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+
+import sys
+from bisect import bisect_right
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, UTC
+from math import inf
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    # dateutil is only imported when needed: for datetimes the stdlib can't parse, or profiles
+    # with a recurrenceRule
+    from dateutil.rrule import rrule
+
+# how far past now occurrences of a recurrence are expanded into intervals. Expansion moves
+# forward as time passes, but never past this; queries past it ask the rule itself
+EXPANSION_HORIZON = timedelta(days=366)
+# most occurrences of a recurrence expanded into intervals, however close together they are
+MAX_OCCURRENCES = 10_000
+
+# dateutil's rrule frequencies, from YEARLY (0) to SECONDLY (6). Rules repeating more often than
+# HOURLY are rejected: a year of MINUTELY occurrences is over half a million intervals
+_HOURLY = 4
+_DAILY = 3
+_WEEKLY = 2
+# length in seconds of each period of the frequencies whose periods are all the same length
+_FIXED_PERIOD_SECONDS = {_HOURLY: 3600, _DAILY: 86400, _WEEKLY: 604800}
+# memory held by each expanded interval: a start and end float, each in a list
+_INTERVAL_BYTES = 2 * (sys.getsizeof(0.0) + 8)
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parse ISO 8601 string to timezone-aware datetime, trying the (much faster) stdlib parser
+    first. Datetimes with no timezone are assumed to be UTC
+
+    Raises:
+        ValueError: if value is not a valid datetime
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        from dateutil.parser import parse as dt_parse  # pylint: disable=import-outside-toplevel
+
+        parsed = dt_parse(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def parse_rule(rule: str, start: datetime) -> "rrule":
+    """Parse iCalendar RRULE (with or without "RRULE:" prefix), e.g. "FREQ=WEEKLY;BYDAY=SA,SU",
+    with occurrences starting at `start`
+
+    Raises:
+        ValueError: if rule is not a valid RRULE, or repeats more often than HOURLY (e.g.
+            FREQ=MINUTELY)
+    """
+    # pylint: disable=import-outside-toplevel,redefined-outer-name
+    from dateutil.rrule import rrule, rrulestr
+
+    parsed = rrulestr(rule, dtstart=start)
+    if not isinstance(parsed, rrule):
+        raise ValueError(f"Expected a single RRULE: {rule}")
+    if parsed._freq > _HOURLY:  # pylint: disable=protected-access
+        raise ValueError(f"FREQ more frequent than HOURLY is not supported: {rule}")
+    return parsed
+
+
+class ActiveSchedule:  # pylint: disable=too-many-instance-attributes
+    """Intervals (Unix timestamps, inclusive) when a Profile is active, from its `activeTime`:
+    - no `startTime`: always active
+    - `startTime` but no `endTime`: active from start onwards
+    - `startTime` and `endTime`: active between them, or if `recurrenceRule` is set, during
+      every occurrence of the rule, each lasting `endTime - startTime`
+
+    Overlapping occurrences are merged, so intervals are disjoint and sorted by both start and
+    end, which lets every query bisect them. Occurrences are expanded up to `EXPANSION_HORIZON`
+    from now (and at most `MAX_OCCURRENCES` of them), so the work done for any one Profile is
+    bounded. Queries past the expanded intervals ask the rule for the next occurrence instead:
+    for HOURLY, DAILY and WEEKLY rules with no COUNT, from a whole number of periods after its
+    start, so quickly however far off. Other rules are scanned from their start, up to
+    `MAX_OCCURRENCES` occurrences, and are not active past that.
+
+    Args:
+        active_time (dict): the Profile's `activeTime` JSON
+
+    Raises:
+        ValueError: if startTime, endTime or recurrenceRule can't be parsed
+    """
+
+    def __init__(self, active_time: dict):
+        start_time: str | None = active_time.get("startTime")
+        end_time: str | None = active_time.get("endTime")
+        rule: str | None = active_time.get("recurrenceRule")
+
+        self._starts: list[float] = []
+        self._ends: list[float] = []
+        self._rule: "rrule | None" = None
+        self._occurrences: Iterator[datetime] | None = None
+        self._expanded = 0
+        self._duration = 0.0
+        self._expanded_until = inf
+        self._lock = Lock()
+
+        if not start_time:
+            self._starts.append(-inf)
+            self._ends.append(inf)
+            return
+
+        start = parse_datetime(start_time)
+        end = parse_datetime(end_time).timestamp() if end_time else inf
+        if not rule or end == inf:
+            # one interval; a rule repeating a never-ending interval changes nothing
+            self._starts.append(start.timestamp())
+            self._ends.append(end)
+            return
+
+        self._rule = parse_rule(rule, start)
+        self._occurrences = iter(self._rule)
+        self._duration = end - start.timestamp()
+        self._expanded_until = -inf
+        self._expand(inf)
+
+    @property
+    def start(self) -> float:
+        """Start of the first interval. -math.inf if always active"""
+        return self._starts[0] if self._starts else inf
+
+    @property
+    def end(self) -> float:
+        """End of the last interval. math.inf if never-ending, or the rule has occurrences past
+        those expanded so far
+        """
+        if self._rule is not None:
+            return inf
+        return self._ends[-1] if self._ends else -inf
+
+    @property
+    def is_recurring(self) -> bool:
+        """True if made of more than one interval, or may be once more are expanded"""
+        return self._rule is not None or len(self._starts) > 1
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the intervals expanded so far, in bytes"""
+        return len(self._starts) * _INTERVAL_BYTES
+
+    def __len__(self) -> int:
+        """Number of intervals expanded so far"""
+        return len(self._starts)
+
+    def is_active_at(self, timestamp: float) -> bool:
+        """True if active at this Unix timestamp"""
+        return self.is_active_between(timestamp, timestamp)
+
+    def is_active_between(self, start: float, end: float) -> bool:
+        """True if active at any time from `start` to `end` (Unix timestamps, inclusive)"""
+        if end > self._expanded_until:
+            self._expand(end)
+        # intervals are read under the lock, as another thread may be expanding them
+        with self._lock:
+            # latest interval starting by `end`. Intervals are disjoint, so it also ends the latest
+            index = bisect_right(self._starts, end) - 1
+            if index >= 0 and self._ends[index] >= start:
+                return True
+            expanded_until = self._expanded_until
+            rule = self._rule
+        # every occurrence starting by `expanded_until` is in the intervals
+        return end > expanded_until and self._is_active_beyond(rule, expanded_until, start, end)
+
+    def _expand(self, until: float):
+        """Expand occurrences of the recurrence rule starting up to `until` (Unix timestamp),
+        `EXPANSION_HORIZON` from now, or `MAX_OCCURRENCES` occurrences, whichever comes first
+        """
+        until = min(until, (datetime.now(UTC) + EXPANSION_HORIZON).timestamp())
+        with self._lock:
+            if self._occurrences is None or until <= self._expanded_until:
+                return  # no rule, or another thread already expanded this far
+            for occurrence in self._occurrences:
+                occurrence_start = occurrence.timestamp()
+                occurrence_end = occurrence_start + self._duration
+                if self._starts and occurrence_start <= self._ends[-1]:
+                    self._ends[-1] = max(self._ends[-1], occurrence_end)  # overlaps previous
+                else:
+                    self._starts.append(occurrence_start)
+                    self._ends.append(occurrence_end)
+                self._expanded += 1
+                if occurrence_start > until or self._expanded >= MAX_OCCURRENCES:
+                    self._expanded_until = occurrence_start
+                    if self._expanded >= MAX_OCCURRENCES:
+                        self._occurrences = None  # expand no further; rule answers the rest
+                    return
+            # rule has no more occurrences
+            self._occurrences = None
+            self._rule = None
+            self._expanded_until = inf
+
+    def _is_active_beyond(
+        self, rule: "rrule | None", expanded_until: float, start: float, end: float
+    ) -> bool:
+        """True if an occurrence of `rule` not yet expanded overlaps `start` to `end`, i.e.
+        starts between `start - duration` (or `expanded_until`, if later) and `end`
+        """
+        if rule is None:
+            return False
+        earliest = max(start - self._duration, expanded_until)
+        # pylint: disable=protected-access
+        period = _FIXED_PERIOD_SECONDS.get(rule._freq, 0) * rule._interval
+        if period and rule._count is None:
+            # occurrences repeat every period, so start the rule a whole number of periods later
+            periods = max((earliest - rule._dtstart.timestamp()) // period, 0)
+            rule = rule.replace(dtstart=rule._dtstart + timedelta(seconds=periods * period))
+            occurrence = rule.after(datetime.fromtimestamp(earliest, UTC), inc=True)
+            return occurrence is not None and occurrence.timestamp() <= end
+
+        for index, occurrence in enumerate(rule):
+            occurrence_start = occurrence.timestamp()
+            if occurrence_start >= earliest:
+                return occurrence_start <= end
+            if index >= MAX_OCCURRENCES:
+                return False  # too many occurrences to find out
+        return False
+
+
+class LazySchedule:
+    """Stand-in for an ActiveSchedule that keeps only its first start and last end in memory, and
+    loads the full schedule (with its expanded intervals) only when a query falls between them.
+
+    Args:
+        start (float): start of the schedule's first interval
+        end (float): end of the schedule's last interval. math.inf if it recurs indefinitely
+        load (Callable[[], ActiveSchedule | None]): returns the full schedule, or None if it can
+            no longer be loaded
+    """
+
+    def __init__(self, start: float, end: float, load: Callable[[], ActiveSchedule | None]):
+        self.start = start
+        self.end = end
+        self._load = load
+
+    def is_active_at(self, timestamp: float) -> bool:
+        """True if active at this Unix timestamp"""
+        return self.is_active_between(timestamp, timestamp)
+
+    def is_active_between(self, start: float, end: float) -> bool:
+        """True if active at any time from `start` to `end` (Unix timestamps, inclusive). Loads
+        the full schedule only if the window overlaps its first start to last end
+        """
+        if end < self.start or start > self.end:
+            return False
+        schedule = self._load()
+        return schedule is not None and schedule.is_active_between(start, end)
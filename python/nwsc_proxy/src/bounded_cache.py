@@ -0,0 +1,102 @@
+"""Thread-safe LRU cache bounded by the total size of its values, with hit/miss metrics"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+
+import sys
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+
+
+class BoundedCache:
+    """LRU cache of values by key, each with a size (in bytes) given when it is added. Least
+    recently used values are evicted to keep the total size under `max_bytes`; values bigger than
+    `max_bytes` are never cached.
+
+    Args:
+        max_bytes (int): max total size of all cached values
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Look up value by key, marking it most recently used.
+
+        Returns:
+            tuple[bool, Any]: (True, value) if cached, otherwise (False, None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return True, entry[0]
+
+    def put(self, key: str, value: Any, size_bytes: int):
+        """Add or replace value, evicting least recently used values if needed"""
+        with self._lock:
+            self._discard(key)
+            if size_bytes > self.max_bytes:
+                return
+            self._entries[key] = (value, size_bytes)
+            self._size_bytes += size_bytes
+            while self._size_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+                self._evictions += 1
+
+    def discard(self, key: str):
+        """Drop value from cache, if it is cached"""
+        with self._lock:
+            self._discard(key)
+
+    def info(self) -> dict:
+        """Size, limit and hit/miss/eviction counts of the cache"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size_bytes,
+                "maxBytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hitRate": self._hits / lookups if lookups else None,
+                "evictions": self._evictions,
+            }
+
+    def _discard(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry[1]
+
+
+def deep_sizeof(value: Any) -> int:
+    """Approximate memory used by a JSON-like value (dicts, lists, strings and numbers), in bytes,
+    including everything it contains
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_sizeof(key) + deep_sizeof(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(deep_sizeof(item) for item in value)
+    return size
@@ -0,0 +1,279 @@
+"""Fault injection layer that simulates a slow, flaky or rate-limited NWS Connect API"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+
+import logging
+import json
+import os
+import random
+import time
+from dataclasses import asdict, dataclass, fields
+from math import ceil, log
+from threading import Lock
+
+from flask import Flask, Response, request, jsonify
+
+logger = logging.getLogger(__name__)
+
+# z-score of the 99th percentile of a standard normal distribution. Used to derive the lognormal
+# sigma parameter from the requested p50/p99 latencies
+Z_P99 = 2.3263478740408408
+
+
+@dataclass
+class FaultConfig:  # pylint: disable=too-many-instance-attributes
+    """Faults to inject into requests to a single route (Flask endpoint).
+
+    Args:
+        latency_ms (float): fixed delay added to every request, in milliseconds
+        latency_p50_ms (float | None): median of lognormally distributed delay, in milliseconds.
+            Requires `latency_p99_ms` as well. Added on top of any `latency_ms`.
+        latency_p99_ms (float | None): 99th percentile of lognormally distributed delay
+        error_rate (float): probability [0, 1] that a request fails with `error_status`
+        error_status (int): HTTP status code returned for injected errors. Defaults to 503.
+        throttle_rate (float): probability [0, 1] that a request is rejected with 429
+        retry_after (int): value (seconds) of `Retry-After` header on injected 429/503 responses
+        rate_limit (float | None): sustained requests per second allowed by a token bucket.
+            Requests beyond this rate are rejected with 429. None (default) is unlimited.
+        burst (int | None): capacity of token bucket; defaults to `ceil(rate_limit)`
+    """
+
+    latency_ms: float = 0.0
+    latency_p50_ms: float | None = None
+    latency_p99_ms: float | None = None
+    error_rate: float = 0.0
+    error_status: int = 503
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    rate_limit: float | None = None
+    burst: int | None = None
+
+    def __post_init__(self):
+        if self.latency_ms is None or self.latency_ms < 0:
+            raise ValueError(f"latency_ms must be zero or positive, got {self.latency_ms}")
+        if self.retry_after is None or self.retry_after < 0:
+            raise ValueError(f"retry_after must be zero or positive, got {self.retry_after}")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError(f"burst must be a positive number of requests, got {self.burst}")
+        if not 0 <= self.error_rate <= 1 or not 0 <= self.throttle_rate <= 1:
+            raise ValueError("error_rate and throttle_rate must be between 0 and 1")
+        if not 500 <= self.error_status <= 599:
+            raise ValueError(f"error_status must be a 5xx code, got {self.error_status}")
+        if (self.latency_p50_ms is None) != (self.latency_p99_ms is None):
+            raise ValueError("latency_p50_ms and latency_p99_ms must be provided together")
+        if self.latency_p50_ms is not None and not 0 < self.latency_p50_ms <= self.latency_p99_ms:
+            raise ValueError("latency_p50_ms must be positive and no greater than latency_p99_ms")
+        if self.rate_limit is not None and self.rate_limit <= 0:
+            raise ValueError("rate_limit must be positive (requests per second)")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FaultConfig":
+        """Build FaultConfig from a JSON-like dict, casting values to the expected types.
+
+        Raises:
+            ValueError: if `data` contains unknown keys or invalid values
+        """
+        types = {field.name: field.type for field in fields(cls)}
+        unknown_keys = set(data) - set(types)
+        if unknown_keys:
+            raise ValueError(f"Unknown fault config properties: {sorted(unknown_keys)}")
+
+        kwargs = {}
+        for key, value in data.items():
+            if value is None:
+                kwargs[key] = None
+            else:
+                # int fields stay ints, everything else is a float
+                kwargs[key] = (
+                    int(value) if key in ("error_status", "retry_after", "burst") else float(value)
+                )
+        return cls(**kwargs)
+
+    def to_dict(self) -> dict:
+        """Serialize to JSON-like dict"""
+        return asdict(self)
+
+    def sample_delay(self, rng: random.Random) -> float:
+        """Draw the delay (in seconds) to apply to a single request"""
+        delay_ms = self.latency_ms
+        if self.latency_p50_ms is not None:
+            # lognormal where median = e^mu, and p99 = e^(mu + Z_P99 * sigma)
+            mu = log(self.latency_p50_ms)
+            sigma = (log(self.latency_p99_ms) - mu) / Z_P99
+            delay_ms += rng.lognormvariate(mu, sigma)
+        return delay_ms / 1000
+
+
+class TokenBucket:  # pylint: disable=too-few-public-methods
+    """Thread-safe token bucket rate limiter.
+
+    Args:
+        rate (float): tokens added to bucket per second
+        capacity (int): max tokens the bucket can hold (allowed burst size)
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> float:
+        """Attempt to consume one token from the bucket.
+
+        Returns:
+            float: 0 if token was consumed (request allowed), otherwise the number of seconds
+                until the next token will be available
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+
+class FaultInjector:
+    """Apply configured faults (latency, errors, throttling) to requests of a Flask app, per route.
+
+    Configs are keyed by Flask endpoint name (e.g. "vulnerabilities"), or `*` to apply to any
+    route without a specific config. Delays are applied in the worker thread handling the request,
+    and no lock is held while sleeping, so slow requests never block other requests.
+
+    Args:
+        configs (dict[str, FaultConfig] | None): initial fault configs by endpoint name
+        seed (int | None): optional seed for the random number generator, for reproducible faults
+    """
+
+    WILDCARD = "*"
+    # routes that never have faults injected, so service stays observable and controllable
+    EXEMPT_ENDPOINTS = {"health", "faults", "store"}
+
+    def __init__(self, configs: dict[str, FaultConfig] | None = None, seed: int | None = None):
+        self._rng = random.Random(seed)
+        self._rng_lock = Lock()
+        self._configs: dict[str, FaultConfig] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        for route, config in (configs or {}).items():
+            self.set_config(route, config)
+
+    @property
+    def configs(self) -> dict[str, FaultConfig]:
+        """Copy of all fault configs currently applied, by endpoint name"""
+        return dict(self._configs)
+
+    def set_config(self, route: str, config: FaultConfig):
+        """Set (or replace) the faults injected for a route"""
+        logger.info("Injecting faults into route %s: %s", route, config)
+        self._configs[route] = config
+        if config.rate_limit is None:
+            self._buckets.pop(route, None)
+        else:
+            capacity = config.burst if config.burst is not None else ceil(config.rate_limit)
+            self._buckets[route] = TokenBucket(config.rate_limit, capacity)
+
+    def clear(self, route: str | None = None):
+        """Remove faults for one route, or for all routes if `route` is None"""
+        if route is None:
+            self._configs.clear()
+            self._buckets.clear()
+        else:
+            self._configs.pop(route, None)
+            self._buckets.pop(route, None)
+
+    def init_app(self, app: Flask):
+        """Register this injector to run before every request to the Flask app"""
+        app.before_request(self.before_request)
+
+    def before_request(self) -> tuple[Response, int] | None:
+        """Flask `before_request` hook. Returns an error response to short-circuit the request
+        if a fault was injected, or None to let the request through (possibly after a delay).
+        """
+        endpoint = request.endpoint
+        if endpoint is None or endpoint in self.EXEMPT_ENDPOINTS:
+            return None
+
+        route = endpoint if endpoint in self._configs else self.WILDCARD
+        config = self._configs.get(route)
+        if not config:
+            return None
+
+        if bucket := self._buckets.get(route):
+            wait_secs = bucket.acquire()
+            if wait_secs > 0:
+                return self._error_response(429, ceil(wait_secs), "Rate limit exceeded")
+
+        with self._rng_lock:
+            delay = config.sample_delay(self._rng)
+            roll = self._rng.random()
+
+        if delay > 0:
+            time.sleep(delay)
+
+        if roll < config.throttle_rate:
+            return self._error_response(429, config.retry_after, "Too many requests")
+        if roll < config.throttle_rate + config.error_rate:
+            return self._error_response(config.error_status, config.retry_after, "Injected fault")
+        return None
+
+    @staticmethod
+    def _error_response(status: int, retry_after: int, message: str) -> tuple[Response, int]:
+        response = jsonify({"message": message})
+        response.headers["Retry-After"] = str(retry_after)
+        return response, status
+
+
+def parse_fault_spec(spec: str) -> tuple[str, FaultConfig]:
+    """Parse a fault spec string from the command line or environment, formatted like
+    `route:key=value,key=value`, e.g. `vulnerabilities:latency_p50_ms=100,latency_p99_ms=900`.
+    If route is omitted (no `:`), the faults apply to all routes (`*`).
+
+    Raises:
+        ValueError: if spec is malformed
+    """
+    route, _, params = spec.rpartition(":")
+    route = route.strip() or FaultInjector.WILDCARD
+
+    data = {}
+    for param in params.split(","):
+        if not param.strip():
+            continue
+        key, sep, value = param.partition("=")
+        if not sep:
+            raise ValueError(f"Fault spec parameter must be key=value, got: {param}")
+        data[key.strip()] = None if value.strip().lower() == "none" else value.strip()
+
+    return route, FaultConfig.from_dict(data)
+
+
+def load_fault_configs(
+    specs: list[str] | None = None, env_var: str = "FAULTS"
+) -> dict[str, FaultConfig]:
+    """Collect fault configs from the environment variable `env_var` (semicolon-separated specs,
+    or a JSON object of `{route: {key: value}}`), then from `specs` (e.g. CLI args). Later specs
+    for the same route override earlier ones.
+    """
+    configs: dict[str, FaultConfig] = {}
+
+    env_value = os.getenv(env_var, "").strip()
+    if env_value.startswith("{"):
+        for route, data in json.loads(env_value).items():
+            configs[route] = FaultConfig.from_dict(data)
+    elif env_value:
+        configs.update(parse_fault_spec(spec) for spec in env_value.split(";") if spec.strip())
+
+    configs.update(parse_fault_spec(spec) for spec in specs or [])
+    return configs
@@ -0,0 +1,304 @@
+"""Validation of Vulnerability (a.k.a. Profile) JSON against the expected NWS Connect schema"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+
+import re
+from datetime import datetime, UTC
+from functools import lru_cache
+
+from .active_schedule import parse_datetime, parse_rule
+from .spatial_index import ProfileGeometry
+
+# units allowed for each weather element. Copied from `FORECAST_VAR_CONFIG` in
+# idsse.testing.idsse_common.constants, since this service is deployed without the rest of the repo
+FIELD_UNITS: dict[str, tuple[str, ...]] = {
+    "AppTemp": ("Fahrenheit", "Celsius"),
+    "Ceiling": ("KiloFeet",),
+    "CloudCover": ("Percent",),
+    "DewPoint": ("Fahrenheit", "Celsius"),
+    "EchoTop": ("KiloFeet",),
+    "HeatIdx": ("Fahrenheit", "Celsius"),
+    "Ice:1HR": ("Inches",),
+    "Ice:3HR": ("Inches",),
+    "Ice:6HR": ("Inches",),
+    "Ice:24HR": ("Inches",),
+    "Lightning": ("Lightning",),
+    "MaxTemp": ("Fahrenheit", "Celsius"),
+    "MinTemp": ("Fahrenheit", "Celsius"),
+    "MaxRef": ("DBZ",),
+    "MaxRh": ("Percent",),
+    "MinRh": ("Percent",),
+    "ProbPrecip": ("Percent",),
+    "ProbThdr:1HR": ("Percent",),
+    "ProbThdr:3HR": ("Percent",),
+    "ProbThdr:6HR": ("Percent",),
+    "ProbThdr:12HR": ("Percent",),
+    "Precip:1HR": ("Inches", "Millimeters"),
+    "Precip:3HR": ("Inches", "Millimeters"),
+    "Precip:6HR": ("Inches", "Millimeters"),
+    "Precip:24HR": ("Inches", "Millimeters"),
+    "RH": ("Percent",),
+    "Snow:1HR": ("Inches", "Feet"),
+    "Snow:3HR": ("Inches", "Feet"),
+    "Snow:6HR": ("Inches", "Feet"),
+    "Snow:12HR": ("Inches", "Feet"),
+    "Snow:24HR": ("Inches", "Feet"),
+    "Snow:48HR": ("Inches", "Feet"),
+    "Temp": ("Fahrenheit", "Celsius"),
+    "VIL": ("KgPerMeter2",),
+    "Visibility": ("Miles", "Kilometers"),
+    "WaveHeight": ("Feet", "Meters"),
+    "WBGT": ("Fahrenheit", "Celsius"),
+    "WindChill": ("Fahrenheit", "Celsius"),
+    "WindDir": ("Degrees",),
+    "WindGust": ("MilesPerHour", "Knots"),
+    "WindSpeed": ("MilesPerHour", "Knots"),
+}
+
+# threshold operators, from keys of `FORECAST_VAR_CONFIG["relational"]`. NWS Connect sends
+# these with underscores, sometimes with a trailing "_TO" (e.g. "GREATER_THAN_OR_EQUAL_TO")
+OPERATORS = frozenset(["GREATER_THAN_OR_EQUAL", "LESS_THAN_OR_EQUAL", "GREATER_THAN", "LESS_THAN"])
+
+# abbreviated or legacy spellings seen in real NWS Connect responses, mapped to the names above.
+# Matching is case insensitive and ignores punctuation, so e.g. "DEWPOINT" and "PERCENT" need
+# no alias
+WEATHER_ELEMENT_ALIASES = {
+    "COLD": "Temp",
+    "WINDGST": "WindGust",
+    "WINDSPD": "WindSpeed",
+}
+UNITS_ALIASES = {
+    "F": "Fahrenheit",
+    "DEG_F": "Fahrenheit",
+    "C": "Celsius",
+    "DEG_C": "Celsius",
+    "MPH": "MilesPerHour",
+    "KT": "Knots",
+    "KTS": "Knots",
+    "IN": "Inches",
+    "INCH": "Inches",
+    "MM": "Millimeters",
+    "FT": "Feet",
+    "M": "Meters",
+    "MI": "Miles",
+    "KM": "Kilometers",
+    "KFT": "KiloFeet",
+    "PCT": "Percent",
+}
+
+# top level properties every Profile must have (non-empty), and the JSON type each must be
+REQUIRED_PROPERTIES = {
+    "id": str,
+    "name": str,
+    "primaryOfficeId": str,
+    "hazards": list,
+    "activeTime": dict,
+}
+
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9:]")
+
+# distinct raw spellings remembered by `_normalize` and `_normalize_operator`. Real data uses a
+# few dozen; the limit keeps clients sending arbitrary strings from growing memory without bound
+NORMALIZE_CACHE_SIZE = 1024
+
+
+class ProfileValidationError(ValueError):
+    """Profile JSON did not match the expected schema.
+
+    Args:
+        errors (list[dict]): every problem found, each with the `path` to the invalid
+            property (e.g. `hazards[0].impactLevels[1].thresholdSet[0].units`) and a `message`
+    """
+
+    def __init__(self, errors: list[dict]):
+        self.errors = errors
+        first_error = f'{errors[0]["path"]}: {errors[0]["message"]}' if errors else ""
+        more = f" (and {len(errors) - 1} more errors)" if len(errors) > 1 else ""
+        super().__init__(f"JSON not valid Profile format; {first_error}{more}")
+
+
+class ProfileValidator:  # pylint: disable=too-few-public-methods
+    """Checks Profile JSON, including every threshold nested in its hazards, against the schema
+    NWS Connect uses. Weather elements, units and operators are compiled once into lookup tables
+    keyed by normalized spelling, and recently seen raw spellings are not normalized again (see
+    `NORMALIZE_CACHE_SIZE`), so validating a Profile is a handful of dict lookups per threshold.
+
+    Args:
+        field_units (dict[str, tuple[str, ...]]): units allowed for each weather element
+    """
+
+    def __init__(self, field_units: dict[str, tuple[str, ...]] | None = None):
+        field_units = field_units or FIELD_UNITS
+        self._element_units = {element: frozenset(units) for element, units in field_units.items()}
+
+        all_units = {unit for units in field_units.values() for unit in units}
+        self._elements = self._compile(field_units, WEATHER_ELEMENT_ALIASES)
+        self._units = self._compile(all_units, UNITS_ALIASES)
+
+    def validate(self, data: dict) -> list[dict]:
+        """Validate Profile JSON.
+
+        Returns:
+            list[dict]: problems found, each with the `path` and a `message`. Empty if valid.
+        """
+        if not isinstance(data, dict):
+            return [_error("", "Profile must be a JSON object")]
+
+        errors = []
+        for prop, prop_type in REQUIRED_PROPERTIES.items():
+            value = data.get(prop)
+            if not value:
+                errors.append(_error(prop, f"missing property {prop}"))
+            elif not isinstance(value, prop_type):
+                errors.append(_error(prop, f"expected {prop_type.__name__}"))
+
+        if isinstance(data.get("activeTime"), dict):
+            self._validate_active_time(data["activeTime"], errors)
+
+        if data.get("geometry"):
+            self._validate_geometry(data["geometry"], errors)
+
+        if isinstance(data.get("hazards"), list):
+            for hazard_index, hazard in enumerate(data["hazards"]):
+                self._validate_hazard(hazard, f"hazards[{hazard_index}]", errors)
+
+        return errors
+
+    def _validate_active_time(self, active_time: dict, errors: list[dict]):
+        timestamps = []
+        for prop in ("startTime", "endTime"):
+            path = f"activeTime.{prop}"
+            value = active_time.get(prop)
+            if not value:
+                # null, empty or missing means never-ending. A JSON merge patch (PATCH) of null
+                # removes the property, so missing must mean the same as null
+                continue
+            try:
+                timestamps.append(_parse_timestamp(value))
+            except (TypeError, ValueError, OverflowError):
+                errors.append(_error(path, f"not a valid ISO 8601 datetime: {value}"))
+
+        if len(timestamps) == 2 and timestamps[1] < timestamps[0]:
+            errors.append(_error("activeTime.endTime", "endTime is before startTime"))
+
+        rule = active_time.get("recurrenceRule")
+        if rule:
+            try:
+                parse_rule(rule, datetime.fromtimestamp(timestamps[0] if timestamps else 0, UTC))
+            except (TypeError, ValueError) as exc:
+                errors.append(_error("activeTime.recurrenceRule", f"not a valid RRULE: {exc}"))
+
+    @staticmethod
+    def _validate_geometry(geometry: str, errors: list[dict]):
+        if not isinstance(geometry, str):
+            errors.append(_error("geometry", "expected WKT string"))
+            return
+        try:
+            ProfileGeometry.from_wkt(geometry)
+        except ValueError as exc:
+            errors.append(_error("geometry", str(exc)))
+
+    def _validate_hazard(self, hazard: dict, path: str, errors: list[dict]):
+        if not isinstance(hazard, dict):
+            errors.append(_error(path, "expected object"))
+            return
+
+        impact_levels = hazard.get("impactLevels")
+        if not impact_levels or not isinstance(impact_levels, list):
+            errors.append(_error(f"{path}.impactLevels", "expected non-empty list"))
+            return
+
+        for level_index, impact_level in enumerate(impact_levels):
+            level_path = f"{path}.impactLevels[{level_index}]"
+            threshold_set = (
+                impact_level.get("thresholdSet") if isinstance(impact_level, dict) else None
+            )
+            if not threshold_set or not isinstance(threshold_set, list):
+                errors.append(_error(f"{level_path}.thresholdSet", "expected non-empty list"))
+                continue
+
+            for threshold_index, threshold in enumerate(threshold_set):
+                self._validate_threshold(
+                    threshold, f"{level_path}.thresholdSet[{threshold_index}]", errors
+                )
+
+    def _validate_threshold(self, threshold: dict, path: str, errors: list[dict]):
+        if not isinstance(threshold, dict):
+            errors.append(_error(path, "expected object"))
+            return
+
+        raw_element = threshold.get("weatherElement")
+        element = self._resolve(raw_element, self._elements)
+        if element is None:
+            errors.append(
+                _error(f"{path}.weatherElement", f"unknown weather element {raw_element}")
+            )
+
+        raw_units = threshold.get("units")
+        units = self._resolve(raw_units, self._units)
+        if units is None:
+            errors.append(_error(f"{path}.units", f"unknown units {raw_units}"))
+        elif element is not None and units not in self._element_units[element]:
+            errors.append(
+                _error(
+                    f"{path}.units",
+                    f"units {raw_units} not valid for {element}, "
+                    f"expected one of {sorted(self._element_units[element])}",
+                )
+            )
+
+        raw_operator = threshold.get("operator")
+        if not isinstance(raw_operator, str) or _normalize_operator(raw_operator) not in OPERATORS:
+            errors.append(_error(f"{path}.operator", f"unknown operator {raw_operator}"))
+
+        magnitude = threshold.get("magnitude")
+        if not isinstance(magnitude, (int, float)) or isinstance(magnitude, bool):
+            errors.append(_error(f"{path}.magnitude", "expected number"))
+
+        if not isinstance(threshold.get("source"), str):
+            errors.append(_error(f"{path}.source", "expected string (may be empty)"))
+
+        duration = threshold.get("minDurationHours", 0)
+        if not isinstance(duration, (int, float)) or isinstance(duration, bool) or duration < 0:
+            errors.append(_error(f"{path}.minDurationHours", "expected non-negative number"))
+
+    @staticmethod
+    def _compile(names, aliases: dict[str, str]) -> dict[str, str]:
+        """Build lookup table of normalized spelling -> canonical name"""
+        table = {_normalize(name): name for name in names}
+        table.update({_normalize(alias): name for alias, name in aliases.items()})
+        return table
+
+    @staticmethod
+    def _resolve(raw, table: dict[str, str]) -> str | None:
+        """Look up canonical name of a raw weather element or units string, or None if unknown"""
+        if not isinstance(raw, str):
+            return None
+        return table.get(_normalize(raw))
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize(name: str) -> str:
+    return _NON_ALPHANUMERIC.sub("", name.lower())
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_operator(raw: str) -> str:
+    return raw.strip().upper().replace(" ", "_").removesuffix("_TO")
+
+
+def _parse_timestamp(value: str) -> float:
+    """Parse ISO 8601 string to Unix timestamp, trying the (much faster) stdlib parser first"""
+    return parse_datetime(value).timestamp()
+
+
+def _error(path: str, message: str) -> dict:
+    return {"path": path, "message": message}
@@ -0,0 +1,293 @@
+"""Spatial index of Profile geometries, to answer bounding box and point queries without scanning
+every Profile"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+
+import math
+import re
+from collections.abc import Callable
+from threading import Lock
+
+Ring = list[tuple[float, float]]
+Bounds = tuple[float, float, float, float]
+
+# WKT grammar and point-in-polygon rule are the same as `idsse.testing.utils.geometry`, since this
+# service is deployed without the rest of the repo. Both are tested against the same cases, in
+# idsse/testing/nwsc_gateway/geometry_cases.json
+_WKT_PATTERN = re.compile(r"^\s*(MULTIPOLYGON|POLYGON)\s*(?:Z|M|ZM)?\s*(\(.*\))\s*$", re.I | re.S)
+# quantifiers are possessive (e.g. `++`), so matching never backtracks and stays fast even if WKT
+# is malformed
+_WKT_NUMBER = r"[-+]?+(?:\d++\.?+\d*+|\.\d++)(?:[eE][-+]?+\d++)?+"
+# one WKT coordinate: x y, with optional z and m, which are dropped
+_WKT_COORDINATE = re.compile(rf"({_WKT_NUMBER})\s++({_WKT_NUMBER})(?:\s++{_WKT_NUMBER}){{0,2}}+")
+_WKT_RING = re.compile(
+    rf"\(\s*+{_WKT_COORDINATE.pattern}(?:\s*+,\s*+{_WKT_COORDINATE.pattern})*+\s*+\)"
+)
+_WKT_POLYGON = re.compile(rf"\(\s*+{_WKT_RING.pattern}(?:\s*+,\s*+{_WKT_RING.pattern})*+\s*+\)")
+_WKT_MULTIPOLYGON = re.compile(
+    rf"\(\s*+{_WKT_POLYGON.pattern}(?:\s*+,\s*+{_WKT_POLYGON.pattern})*+\s*+\)"
+)
+
+# geometries whose bounding box touches more grid cells than this are listed in one overflow
+# bucket, which every query checks, rather than in every cell. Bounds the memory and time of
+# indexing any one geometry, however large its area
+MAX_CELLS_PER_GEOMETRY = 256
+
+
+class ProfileGeometry:
+    """Polygon(s) of a Profile's `geometry`, with their bounding box.
+
+    Args:
+        polygons (list[list[Ring]]): rings of each polygon, as lists of (longitude, latitude).
+            The first ring is the exterior, and any others are holes
+
+    Raises:
+        ValueError: if there are no polygons, any ring has fewer than 3 points, or any
+            longitude is outside [-180, 180] or latitude outside [-90, 90]
+    """
+
+    def __init__(self, polygons: list[list[Ring]]):
+        rings = [ring for polygon in polygons for ring in polygon]
+        if not rings or any(len(ring) < 3 for ring in rings):
+            raise ValueError("Geometry must have at least one ring of at least 3 points")
+        self.polygons = polygons
+        self.bounds: Bounds = (
+            min(lon for ring in rings for lon, _ in ring),
+            min(lat for ring in rings for _, lat in ring),
+            max(lon for ring in rings for lon, _ in ring),
+            max(lat for ring in rings for _, lat in ring),
+        )
+        min_lon, min_lat, max_lon, max_lat = self.bounds
+        if not (-180 <= min_lon and max_lon <= 180 and -90 <= min_lat and max_lat <= 90):
+            raise ValueError(
+                f"Geometry coordinates out of range (bounds {self.bounds}), expected longitude "
+                "in [-180, 180] and latitude in [-90, 90]"
+            )
+
+    @classmethod
+    def from_wkt(cls, wkt: str) -> "ProfileGeometry":
+        """Parse WKT POLYGON or MULTIPOLYGON, e.g. `"POLYGON ((-105 40, -104 40, -104 41))"`.
+        Z and M values are dropped, and rings need not be closed.
+
+        Raises:
+            ValueError: if `wkt` is not a (multi)polygon with valid rings and coordinates
+        """
+        return cls(
+            [
+                [[(float(lon), float(lat)) for lon, lat in ring] for ring in polygon]
+                for polygon in _wkt_polygons(wkt)
+            ]
+        )
+
+    def intersects_bbox(self, bounds: Bounds) -> bool:
+        """True if the bounding box of this geometry overlaps `bounds` (inclusive)"""
+        return _overlaps(self.bounds, bounds)
+
+    def contains(self, lon: float, lat: float) -> bool:
+        """True if point is inside any of the polygons (even-odd rule, so holes are excluded).
+        Points exactly on an edge may be either in or out
+        """
+        if not _overlaps(self.bounds, (lon, lat, lon, lat)):
+            return False
+        return any(_crosses_odd(polygon, lon, lat) for polygon in self.polygons)
+
+
+class LazyGeometry:
+    """Stand-in for a ProfileGeometry that keeps only its bounding box in memory, and loads the
+    full geometry only when a point query needs its polygons.
+
+    Args:
+        bounds (Bounds): bounding box of the geometry
+        load (Callable[[], ProfileGeometry | None]): returns the full geometry, or None if it
+            can no longer be loaded
+    """
+
+    def __init__(self, bounds: Bounds, load: Callable[[], ProfileGeometry | None]):
+        self.bounds = bounds
+        self._load = load
+
+    def intersects_bbox(self, bounds: Bounds) -> bool:
+        """True if the bounding box of this geometry overlaps `bounds` (inclusive)"""
+        return _overlaps(self.bounds, bounds)
+
+    def contains(self, lon: float, lat: float) -> bool:
+        """True if point is inside the polygon(s). Loads them only if point is in bounding box"""
+        if not _overlaps(self.bounds, (lon, lat, lon, lat)):
+            return False
+        geometry = self._load()
+        return geometry is not None and geometry.contains(lon, lat)
+
+
+class SpatialIndex:
+    """Grid-bucket index of geometries by ID: each geometry is listed in every cell (of
+    `cell_degrees` square) its bounding box touches, so a query only checks geometries listed in
+    the cells it touches. Geometries touching more than `max_cells` cells are instead listed in
+    an overflow bucket that every query checks. Safe to modify from multiple threads.
+
+    Args:
+        cell_degrees (optional, float): width and height of each grid cell. Default 1 degree,
+            roughly the size of a county, so most Profiles are listed in only a few cells
+        max_cells (optional, int): most cells any one geometry is listed in. Default
+            MAX_CELLS_PER_GEOMETRY
+    """
+
+    def __init__(self, cell_degrees: float = 1.0, max_cells: int = MAX_CELLS_PER_GEOMETRY):
+        self._cell_degrees = cell_degrees
+        self._max_cells = max_cells
+        self._cells: dict[tuple[int, int], set[str]] = {}
+        self._overflow: set[str] = set()
+        self._geometries: dict[str, ProfileGeometry | LazyGeometry] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._geometries)
+
+    def __contains__(self, geometry_id: str) -> bool:
+        return geometry_id in self._geometries
+
+    def add(self, geometry_id: str, geometry: ProfileGeometry | LazyGeometry):
+        """Index geometry by ID, replacing any geometry already indexed with this ID"""
+        with self._lock:
+            self._remove(geometry_id)
+            self._geometries[geometry_id] = geometry
+            cells = self._cells_of(geometry.bounds)
+            if cells is None:
+                self._overflow.add(geometry_id)
+                return
+            for cell in cells:
+                self._cells.setdefault(cell, set()).add(geometry_id)
+
+    def remove(self, geometry_id: str):
+        """Drop geometry with this ID from the index, if it is indexed"""
+        with self._lock:
+            self._remove(geometry_id)
+
+    def query_bbox(self, bounds: Bounds) -> set[str]:
+        """IDs of geometries whose bounding box overlaps `bounds` (minx, miny, maxx, maxy)"""
+        with self._lock:
+            candidates = self._candidates(bounds)
+            return {
+                geometry_id
+                for geometry_id in candidates
+                if self._geometries[geometry_id].intersects_bbox(bounds)
+            }
+
+    def query_point(self, lon: float, lat: float) -> set[str]:
+        """IDs of geometries containing the point (lon, lat)"""
+        with self._lock:
+            candidates = [
+                (geometry_id, self._geometries[geometry_id])
+                for geometry_id in self._candidates((lon, lat, lon, lat))
+            ]
+        # test polygons outside the lock, since a LazyGeometry may have to load them
+        return {geometry_id for geometry_id, geometry in candidates if geometry.contains(lon, lat)}
+
+    def _remove(self, geometry_id: str):
+        geometry = self._geometries.pop(geometry_id, None)
+        if geometry is None:
+            return
+        cells = self._cells_of(geometry.bounds)
+        if cells is None:
+            self._overflow.discard(geometry_id)
+            return
+        for cell in cells:
+            ids = self._cells.get(cell)
+            if ids is not None:
+                ids.discard(geometry_id)
+                if not ids:
+                    del self._cells[cell]
+
+    def _candidates(self, bounds: Bounds) -> set[str]:
+        min_col, min_row, max_col, max_row = self._cell_range(bounds)
+        if (max_col - min_col + 1) * (max_row - min_row + 1) > len(self._cells):
+            # query covers more cells than are occupied; cheaper to walk the occupied ones
+            candidates = {
+                geometry_id
+                for (col, row), ids in self._cells.items()
+                if min_col <= col <= max_col and min_row <= row <= max_row
+                for geometry_id in ids
+            }
+        else:
+            candidates = {
+                geometry_id
+                for col in range(min_col, max_col + 1)
+                for row in range(min_row, max_row + 1)
+                for geometry_id in self._cells.get((col, row), ())
+            }
+        return candidates | self._overflow
+
+    def _cell_range(self, bounds: Bounds) -> tuple[int, int, int, int]:
+        min_x, min_y, max_x, max_y = bounds
+        size = self._cell_degrees
+        return (
+            math.floor(min_x / size),
+            math.floor(min_y / size),
+            math.floor(max_x / size),
+            math.floor(max_y / size),
+        )
+
+    def _cells_of(self, bounds: Bounds) -> list[tuple[int, int]] | None:
+        """Every cell bounding box touches, or None if that is more than `max_cells`"""
+        min_col, min_row, max_col, max_row = self._cell_range(bounds)
+        if (max_col - min_col + 1) * (max_row - min_row + 1) > self._max_cells:
+            return None
+        return [
+            (col, row)
+            for col in range(min_col, max_col + 1)
+            for row in range(min_row, max_row + 1)
+        ]
+
+
+def _overlaps(first: Bounds, second: Bounds) -> bool:
+    return (
+        first[0] <= second[2]
+        and second[0] <= first[2]
+        and first[1] <= second[3]
+        and second[1] <= first[3]
+    )
+
+
+def _crosses_odd(rings: list[Ring], lon: float, lat: float) -> bool:
+    """True if a ray from the point toward +longitude crosses the rings an odd number of times"""
+    inside = False
+    for ring in rings:
+        prev_lon, prev_lat = ring[-1]
+        for ring_lon, ring_lat in ring:
+            if (ring_lat > lat) != (prev_lat > lat) and lon < (prev_lon - ring_lon) * (
+                lat - ring_lat
+            ) / (prev_lat - ring_lat) + ring_lon:
+                inside = not inside
+            prev_lon, prev_lat = ring_lon, ring_lat
+    return inside
+
+
+def _wkt_polygons(wkt: str) -> list[list[list[tuple[str, str]]]]:
+    """Rings of each polygon of WKT POLYGON or MULTIPOLYGON, as lists of (x, y) strings
+
+    Raises:
+        ValueError: if `wkt` is not a (multi)polygon, or is malformed
+    """
+    match = _WKT_PATTERN.match(wkt)
+    if not match:
+        raise ValueError(f"Unsupported WKT geometry: {wkt[:40]}")
+    geometry_type, body = match.group(1).upper(), match.group(2)
+    if not (_WKT_POLYGON if geometry_type == "POLYGON" else _WKT_MULTIPOLYGON).fullmatch(body):
+        raise ValueError(f"Malformed WKT geometry: {wkt[:40]}")
+    # body is well formed, so each polygon (and each ring in it) is simply the next match
+    polygons = [body] if geometry_type == "POLYGON" else _matches(_WKT_POLYGON, body)
+    return [
+        [_WKT_COORDINATE.findall(ring) for ring in _matches(_WKT_RING, polygon)]
+        for polygon in polygons
+    ]
+
+
+def _matches(pattern: re.Pattern, text: str) -> list[str]:
+    return [match.group(0) for match in pattern.finditer(text)]
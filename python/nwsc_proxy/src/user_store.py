@@ -15,7 +15,7 @@ from uuid import uuid4
 from datetime import datetime, timedelta, UTC
 from dataclasses import dataclass
 
-from src.utils import to_iso
+from .utils import to_iso
 
 logger = logging.getLogger(__name__)
 
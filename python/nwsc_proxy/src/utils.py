@@ -10,14 +10,14 @@
 #
 # ----------------------------------------------------------------------------------
 
-from copy import deepcopy
 from datetime import datetime, UTC
 
 
-def deep_update(original: dict, updates: dict) -> dict:
+def deep_update(original: dict, updates: dict, delete_nulls: bool = True) -> dict:
     """Recursively combine two dictionaries such that attributes in `changes` only
-    overwrite the original dict's values at the deepest level (a.k.a. leaf node). Returns
-    the original dictionary with changes updated (dictionaries not changed in place).
+    overwrite the original dict's values at the deepest level (a.k.a. leaf node), following
+    the JSON merge patch standard (RFC 7386). Returns the original dictionary with changes updated
+    (dictionaries not changed in place).
 
     E.g.
     ```
@@ -27,11 +27,28 @@ def deep_update(original: dict, updates: dict) -> dict:
     ```
     {'foo': {'bar': 'y', 'baz': 'x'}}
     ```
+
+    Only the dicts along the path of each change are copied; every untouched value in the result
+    is the same object as in `original` (structural sharing). So the result is cheap to build
+    even for large documents, but must be treated as read-only, since modifying a nested value in
+    place would modify `original` too.
+
+    Args:
+        original (dict): the dictionary to update. Not modified.
+        updates (dict): the changes to apply
+        delete_nulls (optional, bool): if True (default), a `None` value in `updates` removes
+            that key from the result, per RFC 7386. If False, the key is set to `None`.
     """
-    updated_dict = deepcopy(original)
+    updated_dict = dict(original)  # shallow copy, sharing all values with original
     for key, value in updates.items():
-        if isinstance(original.get(key), dict) and isinstance(value, dict):
-            updated_dict[key] = deep_update(original.get(key), value)  # recurse down one level
+        if value is None and delete_nulls:
+            updated_dict.pop(key, None)
+        elif isinstance(value, dict):
+            original_value = original.get(key)
+            # recurse down one level, copying only this branch of the original
+            updated_dict[key] = deep_update(
+                original_value if isinstance(original_value, dict) else {}, value, delete_nulls
+            )
         else:
             updated_dict[key] = value
     return updated_dict
@@ -13,102 +13,126 @@
 import os
 import json
 import logging
+import sys
+from collections.abc import Callable, Iterator
+from copy import copy
+from functools import partial
 from uuid import uuid4
 
 from datetime import datetime, UTC
 from glob import glob
 from math import inf
 
-from dateutil.parser import parse as dt_parse
-
-from src.utils import deep_update
+from .active_schedule import ActiveSchedule, LazySchedule, parse_datetime
+from .bounded_cache import BoundedCache, deep_sizeof
+from .profile_validation import ProfileValidationError, ProfileValidator
+from .spatial_index import Bounds, LazyGeometry, ProfileGeometry, SpatialIndex
+from .utils import deep_update
 
 logger = logging.getLogger(__name__)
 
 
-class CachedProfile:
+class CachedProfile:  # pylint: disable=too-many-instance-attributes
     """Data class to hold Profile's data, plus some derived properties extracted from the `data`
     JSON (e.g. `CachedProfile.is_deleted` or `CachedProfile.start_timestamp`) that make it
     easier to query and filter multiple Profiles.
 
     Args:
         data (dict): full JSON data of this Profile
+        validate (optional, bool): if False, trust that `data` was already validated, e.g. when
+            re-reading a Profile this service saved itself. Defaults to True.
     """
 
-    # properties at root of Profile object that are minimum required to assume acceptably formatted
-    REQUIRED_PROPERTIES = ["id", "name", "primaryOfficeId", "hazards", "activeTime"]
-
     DEFAULT_DATA_SOURCE = "NBM"
 
-    def __init__(self, data: dict):
+    # schema is compiled once, and shared by all CachedProfiles
+    VALIDATOR = ProfileValidator()
+
+    def __init__(self, data: dict, validate: bool = True):
         """
         Raises:
-            ValueError:  if data is not dictionary with minimum expected properties to be Profile
+            ProfileValidationError: if data does not match expected Profile schema, including
+                its hazards' thresholds. Subclass of ValueError.
         """
-        for prop in self.REQUIRED_PROPERTIES:
-            if not data.get(prop):
-                raise ValueError(f"JSON not valid Profile format; missing property {prop}")
-
-        if not "startTime" in data["activeTime"] or not "endTime" in data["activeTime"]:
-            raise ValueError(
-                "JSON not valid Profile format; missing property "
-                "`activeTime.startTime` or `activeTime.endTime`"
-            )
-
-        self.data = data
-
-    @property
-    def id(self) -> str:
-        """The Profile UUID"""
-        # pylint: disable=invalid-name
-        return self.data["id"]
-
-    @property
-    def name(self) -> str:
-        """The Profile name"""
-        return self.data["name"]
-
-    @property
-    def office(self) -> str:
-        """The Profile's NWS 'office" tag"""
-        return self.data["primaryOfficeId"]
-
-    @property
-    def is_deleted(self) -> bool:
-        """The Profile's active state (can be marked as deleted to halt processing)"""
-        return self.data.get("isDeleted", False)
-
-    @property
-    def start_timestamp(self) -> float:
-        """The Profile event's start in Unix time (milliseconds since the epoch).
-        math.inf if Profile is never-ending
+        if validate:
+            errors = self.VALIDATOR.validate(data)
+            if errors:
+                raise ProfileValidationError(errors)
+
+        # full JSON data; None if this is a compact summary (see `CachedProfile.summary()`)
+        self.data: dict | None = data
+        self.geometry: ProfileGeometry | LazyGeometry | None = self._parse_geometry(
+            data.get("geometry")
+        )
+        # recurrence rule is expanded once here, never per request
+        self.schedule: ActiveSchedule | LazySchedule = ActiveSchedule(data["activeTime"])
+
+        # derived properties are extracted up front, so they stay available without `data`
+        self.id: str = data["id"]  # pylint: disable=invalid-name
+        self.name: str = data["name"]
+        self.office: str = data["primaryOfficeId"]
+        self.is_deleted: bool = data.get("isDeleted", False)
+        self.start_timestamp, self.end_timestamp = self._parse_timestamps(data["activeTime"])
+        self.data_sources = self._parse_data_sources(data)
+
+    def summary(
+        self,
+        load_geometry: Callable[[], ProfileGeometry | None],
+        load_schedule: Callable[[], ActiveSchedule | None],
+    ) -> "CachedProfile":
+        """Compact copy of this CachedProfile, with all derived properties but no `data`. Its
+        geometry keeps only the bounding box, and calls `load_geometry` if it needs the polygons.
+        A recurring schedule keeps only its first start and last end, and calls `load_schedule`
+        if it needs the intervals, which are only held (and counted) with the full Profile.
         """
-        profile_start: str | None = self.data["activeTime"]["startTime"]
-        return dt_parse(profile_start).timestamp() if profile_start else inf
+        compact = copy(self)
+        compact.data = None
+        if self.geometry:
+            compact.geometry = LazyGeometry(self.geometry.bounds, load_geometry)
+        if self.schedule.is_recurring:
+            compact.schedule = LazySchedule(self.schedule.start, self.schedule.end, load_schedule)
+        return compact
 
-    @property
-    def end_timestamp(self) -> float:
-        """The Profile event's end in Unix time (milliseconds since the epoch).
+    @staticmethod
+    def _parse_timestamps(active_time: dict) -> tuple[float, float]:
+        """The Profile event's start and end in Unix time (seconds since the epoch).
         math.inf if Profile is never-ending
         """
-        if self.start_timestamp == inf:
-            return inf  # infinite start time, so infinite end time as well
-        profile_end: str | None = self.data["activeTime"]["endTime"]
-        return dt_parse(profile_end).timestamp() if profile_end else inf
+        profile_start: str | None = active_time.get("startTime")
+        if not profile_start:
+            return inf, inf  # infinite start time, so infinite end time as well
+        profile_end: str | None = active_time.get("endTime")
+        return (
+            parse_datetime(profile_start).timestamp(),
+            parse_datetime(profile_end).timestamp() if profile_end else inf,
+        )
 
-    @property
-    def data_sources(self) -> set[str]:
+    @classmethod
+    def _parse_data_sources(cls, data: dict) -> frozenset[str]:
         """The weather products used by any parts of this Profile (e.g. NBM, HRRR, MRMS)"""
         try:
-            return set(
+            return frozenset(
                 # treat any profiles with empty string dataSource as default 'NBM'
-                threshold["source"] if threshold["source"] != "" else self.DEFAULT_DATA_SOURCE
-                for hazard in self.data["hazards"]
+                threshold["source"] if threshold["source"] != "" else cls.DEFAULT_DATA_SOURCE
+                for hazard in data["hazards"]
                 for impact_level in hazard["impactLevels"]
                 for threshold in impact_level["thresholdSet"]
             )
         except KeyError:
-            return set([self.DEFAULT_DATA_SOURCE])  # couldn't lookup dataSources; default to NBM
+            return frozenset([cls.DEFAULT_DATA_SOURCE])  # couldn't lookup dataSources; use NBM
+
+    @staticmethod
+    def _parse_geometry(wkt: str | None) -> ProfileGeometry | None:
+        """Parse Profile's WKT geometry once, so spatial queries never re-parse it. None if
+        Profile has no geometry, or it can't be parsed (Profile will not match spatial queries)
+        """
+        if not isinstance(wkt, str) or not wkt:
+            return None
+        try:
+            return ProfileGeometry.from_wkt(wkt)
+        except ValueError as exc:
+            logger.warning("Unable to parse Profile geometry %s: %s", wkt[:40], exc)
+            return None
 
     def __str__(self):
         return (
@@ -120,13 +144,25 @@ class CachedProfile:
 
 class VulnerabilityStore:
     """Data storage using JSON files on filesystem that simulates CRUD operations of
-    NWS Connect Vulnerabilities API
+    NWS Connect Vulnerabilities API.
+
+    By default every Profile's full JSON is held in memory. If `max_cache_bytes` is set, only a
+    compact summary of each Profile (ID, office, first and last active times, data sources,
+    geometry bounding box) is always held in memory; full Profiles (including any expanded
+    recurrence) are kept in an LRU cache of at most `max_cache_bytes`, and read back from the
+    filesystem when they are not cached.
+
+    Args:
+        base_dir (str): directory of NWS Connect API response files. Profiles are saved to its
+            `profiles` subdirectory.
+        max_cache_bytes (optional, int): approximate memory limit of full Profiles held in
+            memory. Defaults to None (no limit, all Profiles held in memory).
     """
 
     # constants controlling the subdirectory where existing Profiles are saved
     PROFILE_DIR = "profiles"
 
-    def __init__(self, base_dir: str):
+    def __init__(self, base_dir: str, max_cache_bytes: int | None = None):
         # ensure that base directory and all expected subdirectories exist
         self._profile_dir = os.path.join(base_dir, self.PROFILE_DIR)
         os.makedirs(self._profile_dir, exist_ok=True)
@@ -152,13 +188,15 @@ class VulnerabilityStore:
                 # loop through all profiles in this file,
                 # save them to subdirectory as individual profiles
                 for profile_data in profiles:
-                    try:
-                        _ = CachedProfile(profile_data)
-                    except ValueError:
+                    # only validate here; each Profile is parsed when loaded from its own file
+                    errors = CachedProfile.VALIDATOR.validate(profile_data)
+                    if errors:
                         logger.warning(
-                            "Rejecting profile in file %s: not expected Profile format. ID: %s",
+                            "Rejecting profile in file %s: not expected Profile format. "
+                            "ID: %s (%s)",
                             abs_path,
-                            profile_data.get("id"),
+                            profile_data.get("id") if isinstance(profile_data, dict) else None,
+                            ProfileValidationError(errors),
                         )
                         continue
 
@@ -169,14 +207,35 @@ class VulnerabilityStore:
                     with open(profile_filepath, "w", encoding="utf-8") as outfile:
                         json.dump(profile_data, outfile)
 
-        # populate cache of JSON data of all Profiles
-        self._cache: dict[str, CachedProfile] = {
-            profile["id"]: CachedProfile(profile)
-            for profile in self._load_profiles_from_filesystem(self._profile_dir)
-        }
-
-    def get_all(
-        self, data_source="ANY", include_inactive=False, office: str | None = None
+        # cache of all Profiles (or only their summaries, if memory-bounded) by ID, and index of
+        # their geometries
+        self._cache: dict[str, CachedProfile] = {}
+        self._spatial_index = SpatialIndex()
+        # the full Profiles, if memory-bounded. Otherwise they are all in `_cache`
+        self._documents = BoundedCache(max_cache_bytes) if max_cache_bytes is not None else None
+        for filename, profile in self._load_profiles_from_filesystem(self._profile_dir):
+            try:
+                cached_profile = CachedProfile(profile)
+            except ValueError as exc:
+                # likely saved before validation was stricter; skip rather than fail to start
+                logger.warning("Skipping invalid profile in %s: %s", self._profile_dir, exc)
+                continue
+
+            if self._documents is not None and filename != f"{cached_profile.id}.json":
+                # Profiles not in cache are re-read from their own file, so make sure it exists
+                self._save_profile_to_filesystem(cached_profile)
+            self._set_cached(cached_profile)
+
+    def get_all(  # pylint: disable=too-many-arguments
+        self,
+        data_source="ANY",
+        include_inactive=False,
+        office: str | None = None,
+        *,
+        bbox: Bounds | None = None,
+        point: tuple[float, float] | None = None,
+        active_at: float | None = None,
+        active_between: tuple[float, float] | None = None,
     ) -> list[dict]:
         """Get all Profile JSONs persisted in this API.
 
@@ -187,26 +246,59 @@ class VulnerabilityStore:
                 `isDeleted: False`. Defaults to False (hide deleted profiles).
             office (optional, str): the NWS office ID to filter Profiles, e.g. "BOU" or "SFO".
                 Not case sensitive. Defaults to None (return Profiles associated with any office).
+            bbox (optional, tuple[float, float, float, float]): (minx, miny, maxx, maxy) in
+                degrees longitude and latitude. If set, only return Profiles whose geometry's
+                bounding box overlaps it. Defaults to None (any location).
+            point (optional, tuple[float, float]): (lon, lat). If set, only return Profiles whose
+                geometry contains this point. Defaults to None (any location).
+            active_at (optional, float): Unix timestamp. If set, only return Profiles active at
+                this time, per their `activeTime` (including `recurrenceRule`). Defaults to None.
+            active_between (optional, tuple[float, float]): (start, end) Unix timestamps. If set,
+                only return Profiles active at any time in this window. Defaults to None.
         """
+        # snapshot cache values; other request threads may add/remove profiles meanwhile
+        if bbox is None and point is None:
+            candidates = list(self._cache.values())
+        else:
+            # only consider Profiles found by spatial index, rather than scanning all of them
+            matching_ids = self._query_spatial_index(bbox, point)
+            candidates = [
+                cached_profile
+                for profile_id in matching_ids
+                if (cached_profile := self._cache.get(profile_id)) is not None
+            ]
+
         # compare all Profiles to the same now() value
         current_timestamp = datetime.now(UTC).timestamp()
         profiles_by_status = [
             cached_profile
-            for cached_profile in self._cache.values()
+            for cached_profile in candidates
             # is "active", meaning no one has intentional disabled/deactivated it
             if (include_inactive or not cached_profile.is_deleted)
-            # the end_dt has not yet passed (or profile is never-ending)
-            and current_timestamp <= cached_profile.end_timestamp
+            # the last occurrence has not yet ended (or profile is never-ending)
+            and current_timestamp <= cached_profile.schedule.end
+            and (active_at is None or cached_profile.schedule.is_active_at(active_at))
+            and (
+                active_between is None
+                or cached_profile.schedule.is_active_between(*active_between)
+            )
             # is associated with requested office (or no office specified)
             and (not office or office.upper().strip() == cached_profile.office.upper())
         ]
 
-        if data_source == "ANY":
-            # all data sources requested, so do not filter by products used
-            return [profile.data for profile in profiles_by_status]
+        if data_source != "ANY":
+            # only keep Profiles that use the requested data source
+            profiles_by_status = [
+                profile for profile in profiles_by_status if data_source in profile.data_sources
+            ]
 
+        if self._documents is None:
+            return [profile.data for profile in profiles_by_status]
+        # only now load full Profiles that matched, skipping any that were deleted meanwhile
         return [
-            profile.data for profile in profiles_by_status if data_source in profile.data_sources
+            full_profile.data
+            for profile in profiles_by_status
+            if (full_profile := self._get_full(profile.id)) is not None
         ]
 
     def get(self, profile_id: str) -> dict | None:
@@ -218,7 +310,7 @@ class VulnerabilityStore:
         Returns:
             dict | None: The Profile JSON data, or None if `profile_id` does not exist.
         """
-        cached_profile = self._cache.get(profile_id, None)
+        cached_profile = self._get_full(profile_id)
         return cached_profile.data if cached_profile else None
 
     def save(self, profile_data: dict) -> dict | None:
@@ -229,6 +321,9 @@ class VulnerabilityStore:
 
         Returns:
             dict | None: content of saved Profile on success, otherwise None
+
+        Raises:
+            ProfileValidationError: if `profile_data` does not match expected Profile schema
         """
         logger.debug("Now saving new profile: %s", profile_data)
         # generate a UUID, ignoring whaterver client provided
@@ -237,15 +332,15 @@ class VulnerabilityStore:
         # overwrite any `isDeleted` attribute from client (shouldn't set this on creation)
         profile_data = {**profile_data, "id": profile_id, "isDeleted": False}
 
+        cached_profile = CachedProfile(profile_data)
         try:
-            cached_profile = CachedProfile(profile_data)
             filepath = self._save_profile_to_filesystem(cached_profile)
         except Exception as exc:  # pylint: disable=broad-exception-caught
             logger.error("Unable to save Vulnerability due to error: (%s) %s", type(exc), exc)
             return None
 
         # add profile to in-memory cache
-        self._cache[cached_profile.id] = cached_profile
+        self._set_cached(cached_profile)
         logger.info("Saved profile to cache, file location: %s", filepath)
         return cached_profile.data
 
@@ -262,11 +357,12 @@ class VulnerabilityStore:
 
         Raises:
             FileNotFoundError: if no Profile exists with the provided ID
+            ProfileValidationError: if the updated Profile would not match expected Profile schema
         """
         logger.info("Updating profile_id %s with new data: %s", profile_id, data)
 
         # find the profile data from the new_profiles cache, then save over it
-        cached_profile = self._cache.get(profile_id)
+        cached_profile = self._get_full(profile_id)
         if not cached_profile:
             raise FileNotFoundError  # Profile with this ID does not exist in cache
 
@@ -279,7 +375,7 @@ class VulnerabilityStore:
             return None
 
         # update in-memory cache to overwrite previous profile by ID
-        self._cache[profile_id] = updated_profile
+        self._set_cached(updated_profile)
         return updated_profile.data
 
     def delete(self, profile_id: str) -> bool:
@@ -301,9 +397,94 @@ class VulnerabilityStore:
         logger.debug("Attempting to delete profile at path: %s", filepath)
         os.remove(filepath)
         # drop profile from cache
-        del self._cache[profile_id]
+        self._cache.pop(profile_id, None)
+        if self._documents is not None:
+            self._documents.discard(profile_id)
+        self._spatial_index.remove(profile_id)
         return True
 
+    def cache_info(self) -> dict:
+        """Memory use of this store: number of Profiles, plus size, limit and hit/miss counts of
+        the cache of full Profiles (if memory-bounded)
+        """
+        if self._documents is not None:
+            return {"profiles": len(self._cache), "bounded": True, **self._documents.info()}
+
+        # every full Profile is always in memory, so every lookup is a hit. Sizes are only
+        # measured when bounded, since walking every Profile is slow
+        profile_count = len(self._cache)
+        return {
+            "profiles": profile_count,
+            "bounded": False,
+            "entries": profile_count,
+            "bytes": None,
+            "maxBytes": None,
+        }
+
+    def _set_cached(self, profile: CachedProfile):
+        """Add or replace Profile in the in-memory cache, keeping the spatial index in sync"""
+        if self._documents is not None:
+            self._documents.put(profile.id, profile, _size_of(profile))
+            profile = profile.summary(
+                partial(self._load_geometry, profile.id), partial(self._load_schedule, profile.id)
+            )
+
+        self._cache[profile.id] = profile
+        if profile.geometry:
+            self._spatial_index.add(profile.id, profile.geometry)
+        else:
+            self._spatial_index.remove(profile.id)
+
+    def _get_full(self, profile_id: str) -> CachedProfile | None:
+        """Get CachedProfile with full JSON data, reading it from the filesystem if it is not in
+        memory. None if Profile does not exist (or could not be read)
+        """
+        cached_profile = self._cache.get(profile_id)
+        if cached_profile is None or self._documents is None:
+            return cached_profile
+
+        found, full_profile = self._documents.get(profile_id)
+        if found:
+            return full_profile
+
+        filepath = os.path.join(self._profile_dir, f"{profile_id}.json")
+        logger.debug("Profile %s not in cache, reading from file: %s", profile_id, filepath)
+        try:
+            with open(filepath, "r", encoding="utf-8") as file:
+                # this service saved the file, so it was already validated
+                full_profile = CachedProfile(json.load(file), validate=False)
+        except (OSError, ValueError, KeyError) as exc:
+            logger.error(
+                "Unable to read Profile %s from file: (%s) %s", profile_id, type(exc), exc
+            )
+            return None
+
+        if profile_id in self._cache:  # skip caching if deleted while reading
+            self._documents.put(profile_id, full_profile, _size_of(full_profile))
+        return full_profile
+
+    def _load_geometry(self, profile_id: str) -> ProfileGeometry | None:
+        """Full (parsed) geometry of a Profile, for the LazyGeometry of its summary"""
+        full_profile = self._get_full(profile_id)
+        return full_profile.geometry if full_profile else None
+
+    def _load_schedule(self, profile_id: str) -> ActiveSchedule | None:
+        """Full (expanded) schedule of a Profile, for the LazySchedule of its summary"""
+        full_profile = self._get_full(profile_id)
+        return full_profile.schedule if full_profile else None
+
+    def _query_spatial_index(
+        self, bbox: Bounds | None, point: tuple[float, float] | None
+    ) -> set[str]:
+        """IDs of Profiles matching both `bbox` and `point` (whichever are not None)"""
+        matching_ids: set[str] | None = None
+        if bbox is not None:
+            matching_ids = self._spatial_index.query_bbox(bbox)
+        if point is not None:
+            point_ids = self._spatial_index.query_point(*point)
+            matching_ids = point_ids if matching_ids is None else matching_ids & point_ids
+        return matching_ids or set()
+
     def _save_profile_to_filesystem(self, profile: CachedProfile) -> str | None:
         """Save CachedProfile data (dict) to filesystem so it persists through service restarts"""
         profile_id = profile.data.get("id")
@@ -314,7 +495,7 @@ class VulnerabilityStore:
         logger.debug("Now saving profile to path: %s", filepath)
         try:
             with open(filepath, "w", encoding="utf-8") as file:
-                json.dump(profile.data, file)
+                file.write(json.dumps(profile.data))
         except (PermissionError, json.JSONDecodeError, TypeError) as exc:
             logger.error(
                 "Failed to save Profile %s to file %s: (%s) %s",
@@ -328,25 +509,41 @@ class VulnerabilityStore:
         return filepath
 
     @staticmethod
-    def _load_profiles_from_filesystem(dir_: str) -> list[dict]:
-        """Read all JSON files from one of this ProfileStore's subdirectories, and return list of
-        the discovered files' json data.
+    def _load_profiles_from_filesystem(dir_: str) -> Iterator[tuple[str, dict]]:
+        """Read all JSON files from one of this ProfileStore's subdirectories, and yield the json
+        data of each discovered Profile with the name of its file. Files are read one at a time,
+        so only one file's data needs to be in memory at once.
 
         Args:
             dir_ (str): path to scan for Profile or NWS Connect API response JSON files
         """
         logger.info("Loading Profiles JSON files from path: %s", dir_)
 
-        profile_list: list[dict] = []
         for filename in glob("*.json", root_dir=dir_):
             with open(os.path.join(dir_, filename), "r", encoding="utf-8") as file:
                 json_data: dict = json.load(file)
 
-                # this is a pure NWS Connect profiles[] response
-                if isinstance(json_data, list):
-                    profile_list.extend(json_data)
-                else:
-                    # this file is assumed to be just a single Profile
-                    profile_list.append(json_data)
+            # this is a pure NWS Connect profiles[] response
+            if isinstance(json_data, list):
+                for profile in json_data:
+                    yield filename, profile
+            else:
+                # this file is assumed to be just a single Profile
+                yield filename, json_data
+
+
+# memory held by each point of a parsed geometry: a (lon, lat) tuple of floats, in a list
+_POINT_BYTES = sys.getsizeof((0.0, 0.0)) + 2 * sys.getsizeof(0.0) + 8
 
-        return profile_list
+
+def _size_of(profile: CachedProfile) -> int:
+    """Approximate memory held by a full CachedProfile's data (plus parsed geometry and expanded
+    schedule), in bytes. Geometry points all take the same memory, so are counted rather than
+    measured one by one
+    """
+    size = deep_sizeof(profile.data) + profile.schedule.nbytes
+    if isinstance(profile.geometry, ProfileGeometry):
+        size += _POINT_BYTES * sum(
+            len(ring) for polygon in profile.geometry.polygons for ring in polygon
+        )
+    return size
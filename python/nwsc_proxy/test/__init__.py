@@ -1,6 +1 @@
-"""Add nwsc_proxy top-level module to sys.path"""
-
-import os
-import sys
-
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+"""Tests for the NWS Connect Proxy service"""
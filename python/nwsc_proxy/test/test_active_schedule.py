@@ -0,0 +1,311 @@
+"""Tests for src/active_schedule.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, UTC
+from math import inf
+from unittest.mock import Mock
+
+from pytest import raises, MonkeyPatch
+
+from python.nwsc_proxy.src import active_schedule
+from python.nwsc_proxy.src.active_schedule import (
+    MAX_OCCURRENCES,
+    ActiveSchedule,
+    LazySchedule,
+    parse_datetime,
+)
+
+# constants
+NWSC_GATEWAY_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "idsse", "testing", "nwsc_gateway"
+)
+
+
+def _active_time(filename: str) -> dict:
+    """`activeTime` of a Vulnerability shipped in idsse/testing/nwsc_gateway"""
+    with open(os.path.join(NWSC_GATEWAY_PATH, filename), "r", encoding="utf-8") as file:
+        return json.load(file)["activeTime"]
+
+
+def _ts(value: str) -> float:
+    return parse_datetime(value).timestamp()
+
+
+class _SlowList(list):
+    """List that lets other threads run between each append and the value being added"""
+
+    def append(self, value):
+        time.sleep(0.0001)
+        super().append(value)
+
+
+def test_parse_datetime():
+    assert parse_datetime("2026-10-17T10:00:00Z") == datetime(2026, 10, 17, 10, tzinfo=UTC)
+    # no timezone is assumed UTC
+    assert parse_datetime("2026-10-17 10:00") == datetime(2026, 10, 17, 10, tzinfo=UTC)
+    with raises(ValueError):
+        parse_datetime("not a date")
+
+
+def test_always_active():
+    schedule = ActiveSchedule({"startTime": None, "endTime": None, "recurrenceRule": ""})
+
+    assert schedule.start == -inf
+    assert schedule.end == inf
+    assert schedule.is_active_at(0)
+    assert schedule.is_active_at(_ts("2099-01-01T00:00:00Z"))
+
+
+def test_single_interval():
+    schedule = ActiveSchedule(
+        {"startTime": "2026-10-17T10:00:00Z", "endTime": "2026-10-17T12:00:00Z"}
+    )
+
+    assert schedule.end == _ts("2026-10-17T12:00:00Z")
+    assert schedule.is_active_at(_ts("2026-10-17T10:00:00Z"))
+    assert schedule.is_active_at(_ts("2026-10-17T12:00:00Z"))
+    assert not schedule.is_active_at(_ts("2026-10-17T12:00:01Z"))
+    assert schedule.is_active_between(_ts("2026-10-17T00:00:00Z"), _ts("2026-10-17T10:00:00Z"))
+    assert not schedule.is_active_between(_ts("2026-10-17T00:00:00Z"), _ts("2026-10-17T09:59:59Z"))
+
+
+def test_boston_airport_overnight():
+    # 22:00 to 03:00 UTC, across midnight
+    schedule = ActiveSchedule(_active_time("vulnerability_boston_airport.json"))
+    start, end = _ts("2025-11-24T22:00:00Z"), _ts("2025-11-25T03:00:00Z")
+
+    assert (schedule.start, schedule.end) == (start, end)
+    assert not schedule.is_active_at(start - 1)
+    for timestamp in (start, _ts("2025-11-24T23:59:59Z"), _ts("2025-11-25T00:00:00Z"), end):
+        assert schedule.is_active_at(timestamp)
+    assert not schedule.is_active_at(end + 1)
+    assert not schedule.is_active_at(start + 86400)  # no recurrence the next night
+    # windows that only touch the start or end still overlap
+    assert schedule.is_active_between(start - 3600, start)
+    assert schedule.is_active_between(end, end + 3600)
+    assert schedule.is_active_between(start - 86400, end + 86400)
+    assert not schedule.is_active_between(start - 3600, start - 1)
+    assert not schedule.is_active_between(end + 1, end + 3600)
+
+
+def test_multi_hazard_month():
+    schedule = ActiveSchedule(_active_time("vulnerability_multi_hazard.json"))
+    # one with and one without fractional seconds
+    start, end = _ts("2026-07-01T22:00:00Z"), _ts("2026-08-01T03:00:00Z")
+
+    assert len(schedule) == 1
+    assert (schedule.start, schedule.end) == (start, end)
+    assert schedule.is_active_at(start) and schedule.is_active_at(end)
+    assert schedule.is_active_at(_ts("2026-07-15T12:00:00Z"))
+    assert not schedule.is_active_at(start - 1) and not schedule.is_active_at(end + 1)
+    assert schedule.is_active_between(_ts("2026-07-10T00:00:00Z"), _ts("2026-07-11T00:00:00Z"))
+    assert not schedule.is_active_between(end + 1, _ts("2026-12-31T00:00:00Z"))
+
+
+def test_always_active_fixtures():
+    for filename in ("vulnerability_anchorage.json", "vulnerability_single_point.json"):
+        schedule = ActiveSchedule(_active_time(filename))
+
+        assert (schedule.start, schedule.end) == (-inf, inf)
+        assert schedule.is_active_at(_ts("2025-11-25T00:00:00Z"))
+        assert schedule.is_active_between(0, 1)
+
+
+def test_open_ended_interval_ignores_rule():
+    schedule = ActiveSchedule(
+        {"startTime": "2026-10-17T10:00:00Z", "endTime": None, "recurrenceRule": "FREQ=DAILY"}
+    )
+
+    assert len(schedule) == 1
+    assert not schedule.is_active_at(_ts("2026-10-17T09:00:00Z"))
+    assert schedule.is_active_at(_ts("2099-01-01T00:00:00Z"))
+
+
+def test_recurrence_with_count():
+    # 2 hours every Saturday and Sunday, 4 times. 2026-10-17 is a Saturday
+    schedule = ActiveSchedule(
+        {
+            "startTime": "2026-10-17T10:00:00Z",
+            "endTime": "2026-10-17T12:00:00Z",
+            "recurrenceRule": "FREQ=WEEKLY;BYDAY=SA,SU;COUNT=4",
+        }
+    )
+
+    assert len(schedule) == 4
+    assert schedule.end == _ts("2026-10-25T12:00:00Z")
+    assert schedule.is_active_at(_ts("2026-10-18T11:00:00Z"))  # Sunday
+    assert not schedule.is_active_at(_ts("2026-10-19T11:00:00Z"))  # Monday
+    assert schedule.is_active_at(_ts("2026-10-24T10:30:00Z"))
+    assert not schedule.is_active_at(_ts("2026-10-31T11:00:00Z"))  # after COUNT reached
+    assert schedule.is_active_between(_ts("2026-10-19T00:00:00Z"), _ts("2026-10-24T10:00:00Z"))
+    assert not schedule.is_active_between(_ts("2026-10-19T00:00:00Z"), _ts("2026-10-24T09:00:00Z"))
+
+
+def test_overlapping_occurrences_merge():
+    # 3 day long occurrence, every day: one continuous interval
+    schedule = ActiveSchedule(
+        {
+            "startTime": "2026-10-17T00:00:00Z",
+            "endTime": "2026-10-20T00:00:00Z",
+            "recurrenceRule": "RRULE:FREQ=DAILY;COUNT=5",
+        }
+    )
+
+    assert len(schedule) == 1
+    assert schedule.end == _ts("2026-10-24T00:00:00Z")
+    assert schedule.is_active_at(_ts("2026-10-23T12:00:00Z"))
+
+
+def test_never_ending_recurrence_answered_past_expansion():
+    start = datetime.now(UTC).replace(microsecond=0)
+    schedule = ActiveSchedule(
+        {
+            "startTime": start.isoformat(),
+            "endTime": (start + timedelta(hours=1)).isoformat(),
+            "recurrenceRule": "FREQ=DAILY",
+        }
+    )
+    expanded = len(schedule)
+
+    assert schedule.end == inf
+    assert 366 <= expanded <= 368  # roughly a year of daily occurrences
+    # 10 years and 75 years out: past the expansion, so answered by the rule, expanding nothing
+    for days in (3650, 365 * 75):
+        later = start + timedelta(days=days, minutes=30)
+        assert schedule.is_active_at(later.timestamp())
+        assert not schedule.is_active_at((later + timedelta(hours=2)).timestamp())
+        assert schedule.is_active_between(
+            (later + timedelta(hours=2)).timestamp(), (later + timedelta(days=1)).timestamp()
+        )
+    assert len(schedule) == expanded
+
+
+def test_recurrence_with_count_past_expansion():
+    start = datetime.now(UTC).replace(microsecond=0)
+    schedule = ActiveSchedule(
+        {
+            "startTime": start.isoformat(),
+            "endTime": (start + timedelta(hours=1)).isoformat(),
+            "recurrenceRule": "FREQ=WEEKLY;COUNT=100",
+        }
+    )
+
+    assert schedule.end == inf  # not all 100 weeks expanded yet
+    assert schedule.is_active_at((start + timedelta(weeks=99, minutes=30)).timestamp())
+    assert not schedule.is_active_at((start + timedelta(weeks=100, minutes=30)).timestamp())
+
+
+def test_monthly_recurrence_past_expansion():
+    schedule = ActiveSchedule(
+        {
+            "startTime": "2026-01-15T00:00:00Z",
+            "endTime": "2026-01-15T06:00:00Z",
+            "recurrenceRule": "FREQ=MONTHLY",
+        }
+    )
+
+    assert schedule.is_active_at(_ts("2100-07-15T03:00:00Z"))
+    assert not schedule.is_active_at(_ts("2100-07-16T03:00:00Z"))
+
+
+def test_expansion_capped():
+    # 60 occurrences an hour: a year would be over half a million
+    schedule = ActiveSchedule(
+        {
+            "startTime": "2026-01-01T00:00:00Z",
+            "endTime": "2026-01-01T00:00:10Z",
+            "recurrenceRule": f'FREQ=HOURLY;BYMINUTE={",".join(str(m) for m in range(60))}',
+        }
+    )
+
+    assert len(schedule) == MAX_OCCURRENCES
+    assert schedule.end == inf
+    assert schedule.is_active_at(_ts("2100-01-01T12:34:05Z"))
+    assert not schedule.is_active_at(_ts("2100-01-01T12:34:15Z"))
+
+
+def test_concurrent_queries_while_expanding(monkeypatch: MonkeyPatch):
+    start = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+    active_time = {
+        "startTime": start.isoformat(),
+        "endTime": (start + timedelta(minutes=10)).isoformat(),
+        "recurrenceRule": "FREQ=HOURLY",
+    }
+    expected = ActiveSchedule(active_time)
+    # expand nothing up front, so every query below expands the intervals a little further
+    monkeypatch.setattr(active_schedule, "EXPANSION_HORIZON", timedelta(0))
+    schedule = ActiveSchedule(active_time)
+    monkeypatch.undo()
+    # an interval's end is appended after its start, so widen the gap between them
+    schedule._ends = _SlowList(schedule._ends)  # pylint: disable=protected-access
+    timestamps = [(start + timedelta(minutes=7 * i)).timestamp() for i in range(4000)]
+
+    def query(offset: int) -> list[bool]:
+        return [schedule.is_active_at(timestamp) for timestamp in timestamps[offset::8]]
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(query, range(8)))
+
+    for offset, result in enumerate(results):
+        assert result == [expected.is_active_at(timestamp) for timestamp in timestamps[offset::8]]
+
+
+def test_lazy_schedule_loads_only_when_needed():
+    schedule = ActiveSchedule(
+        {
+            "startTime": "2026-01-01T10:00:00Z",
+            "endTime": "2026-01-01T12:00:00Z",
+            "recurrenceRule": "FREQ=DAILY;COUNT=30",
+        }
+    )
+    load = Mock(return_value=schedule)
+    lazy = LazySchedule(schedule.start, schedule.end, load)
+
+    assert schedule.is_recurring and schedule.nbytes > 0
+    assert not lazy.is_active_at(_ts("2025-12-31T11:00:00Z"))
+    assert not lazy.is_active_between(_ts("2026-02-01T00:00:00Z"), _ts("2026-03-01T00:00:00Z"))
+    load.assert_not_called()  # outside first start and last end
+    assert lazy.is_active_at(_ts("2026-01-15T11:00:00Z"))
+    assert not lazy.is_active_at(_ts("2026-01-15T13:00:00Z"))
+    assert load.call_count == 2
+    # full schedule can no longer be loaded, e.g. Profile was deleted
+    assert not LazySchedule(schedule.start, schedule.end, Mock(return_value=None)).is_active_at(
+        _ts("2026-01-15T11:00:00Z")
+    )
+
+
+def test_rule_more_frequent_than_hourly():
+    for rule in ("FREQ=MINUTELY", "FREQ=SECONDLY;INTERVAL=30"):
+        with raises(ValueError, match="HOURLY"):
+            ActiveSchedule(
+                {
+                    "startTime": "2026-10-17T10:00:00Z",
+                    "endTime": "2026-10-17T10:00:30Z",
+                    "recurrenceRule": rule,
+                }
+            )
+
+
+def test_invalid_rule():
+    with raises(ValueError):
+        ActiveSchedule(
+            {
+                "startTime": "2026-10-17T10:00:00Z",
+                "endTime": "2026-10-17T12:00:00Z",
+                "recurrenceRule": "FREQ=SOMETIMES",
+            }
+        )
@@ -0,0 +1,135 @@
+"""Tests for benchmarks/benchmark.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring,redefined-outer-name,unused-argument
+
+import json
+import os
+import random
+
+from pytest import raises
+
+from python.nwsc_proxy.benchmarks.benchmark import (
+    DEFAULT_MIX,
+    OperationStats,
+    ProfilePool,
+    build_base_dir,
+    build_parser,
+    parse_mix,
+    _percentile,
+)
+
+
+def test_parse_mix():
+    mix = parse_mix("get_one=5, post=1,delete=0")
+
+    assert mix == {"get_one": 5, "post": 1, "delete": 0}
+
+
+def test_parse_mix_invalid():
+    with raises(ValueError):
+        parse_mix("get_everything=5")
+    with raises(ValueError):
+        parse_mix("get_one=0")
+
+
+def test_percentile():
+    values = [float(i) for i in range(1, 101)]
+
+    assert _percentile(values, 50) == 50
+    assert _percentile(values, 99) == 99
+    assert _percentile([], 99) == 0
+
+
+def test_operation_stats_summary():
+    stats = OperationStats()
+    for latency in [0.001, 0.002, 0.003, 0.004]:
+        stats.record(latency, 200)
+    stats.record(0.1, 500)
+
+    summary = stats.summary(elapsed=0.5)
+
+    assert summary["count"] == 5
+    assert summary["requestsPerSec"] == 10
+    assert summary["latencyMs"]["max"] == 100
+    assert summary["statuses"] == {"200": 4, "500": 1}
+
+
+def test_profile_pool_pop_removes():
+    pool = ProfilePool(["a", "b"])
+    rng = random.Random(0)
+
+    popped = {pool.pop(rng), pool.pop(rng)}
+
+    assert popped == {"a", "b"}
+    assert pool.pop(rng) is None
+    assert pool.choice(rng) is None
+
+
+def test_build_base_dir(tmp_path):
+    profile_ids = build_base_dir(str(tmp_path), 25, seed=3)
+
+    with open(os.path.join(tmp_path, "benchmark_profiles.json"), "r", encoding="utf-8") as file:
+        profiles = json.load(file)
+    assert len(profiles) == 25
+    assert [p["id"] for p in profiles] == profile_ids
+    assert len(set(profile_ids)) == 25
+
+
+def test_run_load_benchmark():
+    args = build_parser().parse_args(
+        ["load", "--profiles", "20", "--requests", "200", "--concurrency", "4", "--seed", "1"]
+    )
+
+    results = args.func(args)
+
+    # results are JSON serializable, include every operation in mix, and had no server errors
+    json.dumps(results)
+    assert results["total"]["count"] == 200
+    assert set(results["routes"]) == set(DEFAULT_MIX)
+    assert all(not status.startswith("5") for status in results["total"]["statuses"])
+    for route_summary in results["routes"].values():
+        assert set(route_summary["latencyMs"]) == {"mean", "p50", "p90", "p99", "max"}
+
+
+def test_run_validation_benchmark(tmp_path):
+    build_base_dir(str(tmp_path), 10, seed=1)
+    args = build_parser().parse_args(["validate", "--base_dir", str(tmp_path), "--repeat", "2"])
+
+    results = args.func(args)
+
+    json.dumps(results)
+    assert results["config"]["profiles"] == 10
+    assert results["invalidProfiles"] == 0
+    assert results["validateUs"]["mean"] > 0
+
+
+def test_run_validation_benchmark_on_fixtures():
+    args = build_parser().parse_args(["validate", "--repeat", "2"])
+
+    results = args.func(args)
+
+    # example Vulnerabilities, plus the ones saved in idsse/testing/nwsc_gateway
+    assert results["config"]["profiles"] > 3
+    assert results["invalidProfiles"] == 0
+    assert results["thresholdsPerProfile"] > 1
+
+
+def test_run_merge_benchmark():
+    args = build_parser().parse_args(["merge", "--repeat", "2"])
+
+    results = args.func(args)
+
+    json.dumps(results)
+    assert len(results["documents"]) > 1  # event portfolio fixtures were found
+    for document_results in results["documents"].values():
+        assert document_results["top_level"]["resultsMatch"]
+        assert document_results["nested_leaf"]["resultsMatch"]
@@ -0,0 +1,80 @@
+"""Tests for src/bounded_cache.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring
+
+import sys
+
+from python.nwsc_proxy.src.bounded_cache import BoundedCache, deep_sizeof
+
+
+def test_get_counts_hits_and_misses():
+    cache = BoundedCache(100)
+    cache.put("a", {"foo": "bar"}, 10)
+
+    assert cache.get("a") == (True, {"foo": "bar"})
+    assert cache.get("b") == (False, None)
+
+    info = cache.info()
+    assert info["hits"] == 1
+    assert info["misses"] == 1
+    assert info["hitRate"] == 0.5
+    assert info["bytes"] == 10
+
+
+def test_evicts_least_recently_used():
+    cache = BoundedCache(100)
+    cache.put("a", "A", 40)
+    cache.put("b", "B", 40)
+    cache.get("a")  # now "b" is least recently used
+    cache.put("c", "C", 40)
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, "A")
+    assert cache.get("c") == (True, "C")
+    assert len(cache) == 2
+    assert cache.info()["evictions"] == 1
+    assert cache.info()["bytes"] == 80
+
+
+def test_replace_and_discard():
+    cache = BoundedCache(100)
+    cache.put("a", "A", 40)
+    cache.put("a", "A2", 60)
+
+    assert cache.get("a") == (True, "A2")
+    assert cache.info()["bytes"] == 60
+
+    cache.discard("a")
+    cache.discard("missing")
+    assert len(cache) == 0
+    assert cache.info()["bytes"] == 0
+
+
+def test_value_bigger_than_limit_is_not_cached():
+    cache = BoundedCache(100)
+    cache.put("a", "A", 40)
+    cache.put("big", "BIG", 101)
+
+    assert cache.get("big") == (False, None)
+    assert cache.get("a") == (True, "A")
+    assert cache.info()["evictions"] == 0
+
+
+def test_no_lookups_has_no_hit_rate():
+    assert BoundedCache(100).info()["hitRate"] is None
+
+
+def test_deep_sizeof():
+    value = {"name": "x" * 1000, "items": [1.5, 2.5]}
+
+    assert deep_sizeof(value) > sys.getsizeof("x" * 1000) + sys.getsizeof(value)
+    assert deep_sizeof([value, value]) > 2 * deep_sizeof(value)
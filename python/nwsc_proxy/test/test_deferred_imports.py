@@ -0,0 +1,57 @@
+"""Tests that importing the proxy doesn't import heavy modules, checked in a fresh interpreter"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring
+
+import json
+import os
+import subprocess
+import sys
+
+# constants
+PYTHON_DIR = os.path.join(os.path.dirname(__file__), "..", "..")
+
+# modules that must not be imported just to import the proxy. dateutil is only needed for
+# recurrence rules, or datetimes the standard library can't parse
+DEFERRED_MODULES = {"dateutil", "numpy", "xarray", "dask", "zarr", "pandas", "netCDF4", "pika"}
+
+
+def _imported_modules(statement: str) -> set[str]:
+    """Top-level packages of every module in sys.modules after running `statement`"""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}\nimport json, sys\nprint(json.dumps(list(sys.modules)))",
+        ],
+        cwd=PYTHON_DIR,
+        env={**os.environ, "PYTHONPATH": PYTHON_DIR},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {module.split(".")[0] for module in json.loads(result.stdout)}
+
+
+def test_proxy_defers_heavy_imports():
+    modules = _imported_modules("import nwsc_proxy.ncp_web_service")
+
+    assert "nwsc_proxy" in modules
+    assert not modules & DEFERRED_MODULES
+
+
+def test_profile_store_defers_heavy_imports():
+    statement = (
+        "from nwsc_proxy.src.vulnerability_store import CachedProfile\n"
+        "CachedProfile.VALIDATOR.validate({})"
+    )
+
+    assert not _imported_modules(statement) & DEFERRED_MODULES
@@ -0,0 +1,195 @@
+"""Tests for src/fault_injection.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring,redefined-outer-name,unused-argument
+
+import random
+from statistics import median
+from unittest.mock import Mock
+
+from flask import Flask
+from pytest import fixture, mark, raises, MonkeyPatch
+
+from python.nwsc_proxy.ncp_web_service import FaultsRoute
+from python.nwsc_proxy.src.fault_injection import (
+    FaultConfig,
+    FaultInjector,
+    TokenBucket,
+    load_fault_configs,
+    parse_fault_spec,
+)
+
+
+# fixtures
+@fixture
+def mock_sleep(monkeypatch: MonkeyPatch) -> Mock:
+    mock_func = Mock(name="MockSleep")
+    monkeypatch.setattr("python.nwsc_proxy.src.fault_injection.time.sleep", mock_func)
+    return mock_func
+
+
+@fixture
+def injector() -> FaultInjector:
+    return FaultInjector(seed=42)
+
+
+@fixture
+def client(injector: FaultInjector):
+    app = Flask(__name__)
+    app.add_url_rule("/health", "health", view_func=lambda: ("ok", 200))
+    app.add_url_rule("/things", "things", view_func=lambda: ("things", 200))
+    app.add_url_rule("/other", "other", view_func=lambda: ("other", 200))
+    app.add_url_rule(
+        "/admin/faults", "faults", view_func=FaultsRoute(injector).handler, methods=["GET", "PUT"]
+    )
+    injector.init_app(app)
+    return app.test_client()
+
+
+# tests
+def test_config_rejects_invalid_values():
+    with raises(ValueError):
+        FaultConfig(error_rate=1.5)
+    with raises(ValueError):
+        FaultConfig(error_status=404)
+    with raises(ValueError):
+        FaultConfig(latency_p50_ms=100)  # p99 missing
+    with raises(ValueError):
+        FaultConfig.from_dict({"latency": 100})  # unknown key
+    with raises(ValueError):
+        FaultConfig(burst=0)  # would silently fall back to ceil(rate_limit)
+    with raises(ValueError):
+        parse_fault_spec("latency_ms=none")
+
+
+def test_lognormal_delay_matches_percentiles():
+    config = FaultConfig(latency_p50_ms=100, latency_p99_ms=1000)
+    rng = random.Random(1)
+
+    samples = sorted(config.sample_delay(rng) for _ in range(20_000))
+
+    assert abs(median(samples) - 0.1) < 0.01
+    assert abs(samples[int(len(samples) * 0.99)] - 1.0) < 0.15
+
+
+def test_token_bucket_allows_burst_then_limits():
+    bucket = TokenBucket(rate=1, capacity=3)
+
+    results = [bucket.acquire() for _ in range(4)]
+
+    assert results[:3] == [0, 0, 0]
+    assert 0 < results[3] <= 1
+
+
+def test_parse_fault_spec():
+    route, config = parse_fault_spec("vulnerabilities:latency_ms=25,error_rate=0.1,burst=none")
+
+    assert route == "vulnerabilities"
+    assert config.latency_ms == 25
+    assert config.error_rate == 0.1
+    assert config.burst is None
+
+
+def test_parse_fault_spec_no_route():
+    route, config = parse_fault_spec("rate_limit=5")
+
+    assert route == "*"
+    assert config.rate_limit == 5
+
+
+def test_load_fault_configs_from_json_env(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv("FAULTS", '{"user": {"throttle_rate": 0.5, "retry_after": 3}}')
+
+    configs = load_fault_configs(["things:latency_ms=1"])
+
+    assert configs["user"].throttle_rate == 0.5
+    assert configs["user"].retry_after == 3
+    assert configs["things"].latency_ms == 1
+
+
+@mark.parametrize(
+    "body",
+    [
+        {"latency_ms": None},
+        {"latency_ms": -5},
+        {"retry_after": None},
+        {"retry_after": -1},
+        {"burst": 0},
+        {"burst": -2, "rate_limit": 5},
+    ],
+)
+def test_put_invalid_faults(client, injector: FaultInjector, mock_sleep: Mock, body: dict):
+    response = client.put("/admin/faults", json={"things": body})
+
+    assert response.status_code == 400
+    assert injector.configs == {}
+    assert client.get("/things").status_code == 200  # requests still served
+
+
+def test_no_faults_passes_through(client, mock_sleep: Mock):
+    response = client.get("/things")
+
+    assert response.status_code == 200
+    mock_sleep.assert_not_called()
+
+
+def test_latency_injected(client, injector: FaultInjector, mock_sleep: Mock):
+    injector.set_config("things", FaultConfig(latency_ms=250))
+
+    response = client.get("/things")
+
+    assert response.status_code == 200
+    mock_sleep.assert_called_once_with(0.25)
+
+
+def test_wildcard_skips_exempt_routes(client, injector: FaultInjector, mock_sleep: Mock):
+    injector.set_config("*", FaultConfig(error_rate=1))
+
+    assert client.get("/other").status_code == 503
+    assert client.get("/health").status_code == 200
+
+
+def test_error_injected_with_retry_after(client, injector: FaultInjector, mock_sleep: Mock):
+    injector.set_config("things", FaultConfig(error_rate=1, error_status=502, retry_after=7))
+
+    response = client.get("/things")
+
+    assert response.status_code == 502
+    assert response.headers["Retry-After"] == "7"
+    # other routes unaffected
+    assert client.get("/other").status_code == 200
+
+
+def test_throttle_injected(client, injector: FaultInjector, mock_sleep: Mock):
+    injector.set_config("things", FaultConfig(throttle_rate=1))
+
+    response = client.get("/things")
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_rate_limit(client, injector: FaultInjector, mock_sleep: Mock):
+    injector.set_config("things", FaultConfig(rate_limit=0.5, burst=2))
+
+    statuses = [client.get("/things").status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 429]
+
+
+def test_clear_faults(client, injector: FaultInjector, mock_sleep: Mock):
+    injector.set_config("things", FaultConfig(rate_limit=0.001, burst=1))
+    client.get("/things")
+
+    injector.clear("things")
+
+    assert client.get("/things").status_code == 200
+    assert injector.configs == {}
@@ -12,17 +12,19 @@
 # pylint: disable=missing-function-docstring,redefined-outer-name,unused-argument
 
 import json
-from datetime import timedelta
+from datetime import timedelta, UTC
 from unittest.mock import Mock
 
 from flask import Request, Response
-from pytest import fixture, MonkeyPatch
+from pytest import fixture, raises, MonkeyPatch
 from werkzeug.datastructures import MultiDict
 
 from python.nwsc_proxy.ncp_web_service import (
     AppWrapper,
+    FaultConfig,
     Flask,
     Namespace,
+    ProfileValidationError,
     UserStore,
     VulnerabilityStore,
     create_app,
@@ -87,6 +89,7 @@ def mock_request(monkeypatch: MonkeyPatch, mock_jsonify) -> Mock:
     mock_obj = Mock(name="MockFlaskRequest", spec=Request)
     mock_obj.origin = "http://example.com:5000"
     mock_obj.method = "GET"
+    mock_obj.args = MultiDict()
     # mock_obj.headers = MultiDict({"X-Api-Key": GSL_KEY})
     monkeypatch.setattr("python.nwsc_proxy.ncp_web_service.request", mock_obj)
     return mock_obj
@@ -100,7 +103,16 @@ def wrapper(mock_store, mock_user_store, mock_datetime, mock_request) -> AppWrap
 def test_create_app(mock_store):
     args = Namespace()
     args.base_dir = "/fake/base/dir"
-    expected_endpoints = ["health", "logout", "token", "user", "vulnerabilities", "vulnerability"]
+    expected_endpoints = [
+        "faults",
+        "health",
+        "logout",
+        "store",
+        "token",
+        "user",
+        "vulnerabilities",
+        "vulnerability",
+    ]
 
     _app = create_app(args)
 
@@ -109,6 +121,21 @@ def test_create_app(mock_store):
     assert sorted(list(endpoint_dict.keys())) == expected_endpoints
 
 
+def test_create_app_with_faults(mock_store, monkeypatch: MonkeyPatch):
+    monkeypatch.setenv("FAULTS", "*:latency_ms=10;vulnerabilities:error_rate=0.5")
+    args = Namespace()
+    args.base_dir = "/fake/base/dir"
+    args.faults = ["vulnerabilities:error_rate=0.1"]
+
+    _app = create_app(args)
+
+    # ran one before_request hook, CLI arg overrode env var for same route
+    assert len(_app.before_request_funcs[None]) == 1
+    injector = _app.before_request_funcs[None][0].__self__
+    assert injector.configs["*"].latency_ms == 10
+    assert injector.configs["vulnerabilities"].error_rate == 0.1
+
+
 def test_health_route(wrapper: AppWrapper, mock_datetime: Mock):
     # simulate that server has been running for 5 minutes
     mock_datetime.now.return_value = EXAMPLE_DATETIME + timedelta(minutes=5)
@@ -120,6 +147,50 @@ def test_health_route(wrapper: AppWrapper, mock_datetime: Mock):
     assert response.json == {"startedAt": "2024-01-01T12:34:00.000Z", "uptime": 5 * 60}
 
 
+def test_get_faults(mock_store, mock_user_store, mock_datetime, mock_request):
+    wrapper = AppWrapper("/fake/base/dir", {"vulnerabilities": FaultConfig(latency_ms=50)})
+
+    result: tuple[Response, int] = wrapper.app.view_functions["faults"]()
+
+    response, status = result
+    assert status == 200
+    assert response.json["vulnerabilities"]["latency_ms"] == 50
+
+
+def test_put_faults(wrapper: AppWrapper, mock_request: Mock):
+    mock_request.method = "PUT"
+    mock_request.json = {"*": {"error_rate": 0.25, "error_status": 502}}
+
+    result: tuple[Response, int] = wrapper.app.view_functions["faults"]()
+
+    response, status = result
+    assert status == 200
+    assert response.json["*"]["error_status"] == 502
+    assert wrapper.fault_injector.configs["*"].error_rate == 0.25
+
+
+def test_put_faults_invalid(wrapper: AppWrapper, mock_request: Mock):
+    mock_request.method = "PUT"
+    mock_request.json = {"*": {"error_rate": 2}}  # probability can't be > 1
+
+    result: tuple[Response, int] = wrapper.app.view_functions["faults"]()
+
+    assert result[1] == 400
+    assert wrapper.fault_injector.configs == {}
+
+
+def test_delete_faults(wrapper: AppWrapper, mock_request: Mock):
+    wrapper.fault_injector.set_config("user", FaultConfig(throttle_rate=1))
+    wrapper.fault_injector.set_config("vulnerability", FaultConfig(throttle_rate=1))
+    mock_request.method = "DELETE"
+    mock_request.args = MultiDict({"route": "user"})
+
+    result: tuple[Response, int] = wrapper.app.view_functions["faults"]()
+
+    assert result[1] == 200
+    assert list(result[0].json.keys()) == ["vulnerability"]
+
+
 # def test_events_bad_key(wrapper: AppWrapper, mock_request: Mock):
 #     mock_request.headers = MultiDict({"X-Api-Key": "A_BAD_KEY"})
 #     result: tuple[Response, int] = wrapper.app.view_functions["vulnerabilities"]()
@@ -155,6 +226,111 @@ def test_get_vulnerabilities_office(wrapper: AppWrapper, mock_store: Mock, mock_
     )
 
 
+def test_get_vulnerabilities_bbox_and_point(
+    wrapper: AppWrapper, mock_store: Mock, mock_request: Mock
+):
+    mock_store.return_value.get_all.return_value = []
+    mock_request.args = MultiDict({"bbox": "-106,39,-104.5,41", "point": "-105,40"})
+
+    result: tuple[Response, int] = wrapper.app.view_functions["vulnerabilities"]()
+
+    assert result[1] == 200
+    mock_store.return_value.get_all.assert_called_once_with(
+        include_inactive=False, office=None, bbox=(-106, 39, -104.5, 41), point=(-105, 40)
+    )
+
+
+def test_get_vulnerabilities_invalid_bbox(
+    wrapper: AppWrapper, mock_store: Mock, mock_request: Mock
+):
+    for bbox in ["-106,39,-104", "-106,39,-104,abc", "-104,39,-106,41", "nan,39,-104,41"]:
+        mock_request.args = MultiDict({"bbox": bbox})
+
+        result: tuple[Response, int] = wrapper.app.view_functions["vulnerabilities"]()
+
+        assert result[1] == 400
+        assert "bbox" in result[0].json["message"]
+    mock_store.return_value.get_all.assert_not_called()
+
+
+def test_get_vulnerabilities_invalid_point(
+    wrapper: AppWrapper, mock_store: Mock, mock_request: Mock
+):
+    mock_request.args = MultiDict({"point": "-105"})
+
+    result: tuple[Response, int] = wrapper.app.view_functions["vulnerabilities"]()
+
+    assert result[1] == 400
+    mock_store.return_value.get_all.assert_not_called()
+
+
+def test_get_vulnerabilities_active_at_and_between(
+    wrapper: AppWrapper, mock_store: Mock, mock_request: Mock
+):
+    mock_store.return_value.get_all.return_value = []
+    mock_request.args = MultiDict(
+        {
+            "activeAt": "2026-10-17T10:00:00Z",
+            "activeBetween": "2026-10-17T00:00:00Z,2026-10-18T00:00:00Z",
+        }
+    )
+
+    result: tuple[Response, int] = wrapper.app.view_functions["vulnerabilities"]()
+
+    assert result[1] == 200
+    mock_store.return_value.get_all.assert_called_once_with(
+        include_inactive=False,
+        office=None,
+        active_at=datetime(2026, 10, 17, 10, tzinfo=UTC).timestamp(),
+        active_between=(
+            datetime(2026, 10, 17, tzinfo=UTC).timestamp(),
+            datetime(2026, 10, 18, tzinfo=UTC).timestamp(),
+        ),
+    )
+
+
+def test_get_vulnerabilities_invalid_active_between(
+    wrapper: AppWrapper, mock_store: Mock, mock_request: Mock
+):
+    for active_between in ["2026-10-17T00:00:00Z", "2026-10-18T00:00Z,2026-10-17T00:00Z", "x,y"]:
+        mock_request.args = MultiDict({"activeBetween": active_between})
+
+        result: tuple[Response, int] = wrapper.app.view_functions["vulnerabilities"]()
+
+        assert result[1] == 400
+        assert "activeBetween" in result[0].json["message"]
+    mock_store.return_value.get_all.assert_not_called()
+
+
+def test_vulnerability_store_loads_in_background(
+    mock_store: Mock, mock_user_store, mock_datetime, mock_request: Mock
+):
+    mock_store.side_effect = RuntimeError("Unable to read profiles")
+
+    # app starts up despite store failing to load; the error is raised to requests that need it
+    wrapper = AppWrapper("/fake/path")
+    assert wrapper.app.view_functions["health"]()[1] == 200
+    with raises(RuntimeError):
+        wrapper.app.view_functions["vulnerabilities"]()
+
+
+def test_get_store_info(wrapper: AppWrapper, mock_store: Mock):
+    mock_store.return_value.cache_info.return_value = {"profiles": 3, "bounded": True, "hits": 1}
+
+    result: tuple[Response, int] = wrapper.app.view_functions["store"]()
+
+    response, status = result
+    assert status == 200
+    assert response.json == {"profiles": 3, "bounded": True, "hits": 1}
+
+
+def test_max_cache_bytes_passed_to_store(mock_store: Mock, mock_user_store, mock_datetime):
+    wrapper = AppWrapper("/fake/base/dir", max_cache_bytes=1024)
+    wrapper.wait_until_loaded()
+
+    mock_store.assert_called_once_with("/fake/base/dir", 1024)
+
+
 def test_post_vulnerabilities(wrapper: AppWrapper, mock_store: Mock, mock_request: Mock):
     example_profile = {"id": EXAMPLE_UUID, "name": "My Profile", "hazards": []}
     mock_request.json = example_profile
@@ -169,6 +345,18 @@ def test_post_vulnerabilities(wrapper: AppWrapper, mock_store: Mock, mock_reques
     mock_store.return_value.save.assert_called_with(example_profile)
 
 
+def test_post_vulnerabilities_invalid(wrapper: AppWrapper, mock_store: Mock, mock_request: Mock):
+    mock_request.json = {"id": EXAMPLE_UUID, "name": "My Profile", "hazards": []}
+    mock_request.method = "POST"
+    errors = [{"path": "hazards", "message": "missing property hazards"}]
+    mock_store.return_value.save.side_effect = ProfileValidationError(errors)
+
+    result: tuple[Response, int] = wrapper.app.view_functions["vulnerabilities"]()
+
+    assert result[1] == 400
+    assert result[0].json["errors"] == errors
+
+
 def test_get_vulnerability(wrapper: AppWrapper, mock_store: Mock, mock_request: Mock):
     expected_id = EXAMPLE_UUID
     mock_store.return_value.get.return_value = {"id": expected_id, "name": "My Vulnerability"}
@@ -238,6 +426,18 @@ def test_patch_vulnerability_fails(wrapper: AppWrapper, mock_store: Mock, mock_r
     assert result[1] == 500
 
 
+def test_patch_vulnerability_invalid(wrapper: AppWrapper, mock_store: Mock, mock_request: Mock):
+    mock_request.method = "PATCH"
+    mock_request.json = {"activeTime": {"startTime": "not a date"}}
+    errors = [{"path": "activeTime.startTime", "message": "not a valid ISO 8601 datetime"}]
+    mock_store.return_value.update.side_effect = ProfileValidationError(errors)
+
+    result: tuple[Response, int] = wrapper.app.view_functions["vulnerability"](EXAMPLE_UUID)
+
+    assert result[1] == 400
+    assert result[0].json["errors"] == errors
+
+
 def test_token_path(wrapper: AppWrapper, mock_request):
     mock_request.method = "POST"
     mock_request.json = {"grant_type": "client_credentials", "client_secret": "foobar"}
@@ -0,0 +1,166 @@
+"""Tests for src/profile_validation.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring,redefined-outer-name,unused-argument
+
+import json
+import os
+from copy import deepcopy
+
+from pytest import fixture
+
+from python.nwsc_proxy.src.profile_validation import ProfileValidationError, ProfileValidator
+
+# constants
+RAW_JSON_PATH = os.path.join(os.path.dirname(__file__), "..", "src", "vulnerabilities")
+
+with open(f"{RAW_JSON_PATH}/nwsc_gsl_test_profiles.json", "r", encoding="utf-8") as file:
+    EXAMPLE_PROFILES: list[dict] = json.load(file)
+
+THRESHOLD_PATH = "hazards[0].impactLevels[0].thresholdSet[0]"
+
+
+# fixtures
+@fixture
+def validator() -> ProfileValidator:
+    return ProfileValidator()
+
+
+@fixture
+def profile() -> dict:
+    return deepcopy(EXAMPLE_PROFILES[0])
+
+
+@fixture
+def threshold(profile: dict) -> dict:
+    return profile["hazards"][0]["impactLevels"][0]["thresholdSet"][0]
+
+
+# tests
+def test_example_profiles_valid(validator: ProfileValidator):
+    for example_profile in EXAMPLE_PROFILES:
+        assert validator.validate(example_profile) == []
+
+
+def test_aliases_and_spellings_accepted(validator: ProfileValidator, profile: dict, threshold):
+    for element, units, operator in [
+        ("Temp", "Fahrenheit", "LESS_THAN"),
+        ("DEWPOINT", "F", "LESS_THAN_OR_EQUAL"),
+        ("WINDGST", "MPH", "GREATER_THAN_OR_EQUAL_TO"),
+        ("Precip:1HR", "INCH", "greater than"),
+    ]:
+        threshold.update(weatherElement=element, units=units, operator=operator)
+        assert validator.validate(profile) == [], f"{element}, {units}, {operator}"
+
+
+def test_missing_properties(validator: ProfileValidator, profile: dict):
+    profile["name"] = ""
+    del profile["primaryOfficeId"]
+
+    errors = validator.validate(profile)
+
+    assert [error["path"] for error in errors] == ["name", "primaryOfficeId"]
+
+
+def test_missing_end_time_is_never_ending(validator: ProfileValidator, profile: dict):
+    # same as null, which a JSON merge patch removes
+    del profile["activeTime"]["endTime"]
+
+    assert validator.validate(profile) == []
+
+
+def test_not_an_object(validator: ProfileValidator):
+    assert validator.validate(["not", "a", "profile"])[0]["path"] == ""
+
+
+def test_invalid_active_time(validator: ProfileValidator, profile: dict):
+    profile["activeTime"] = {"startTime": "2026-02-01T00:00:00Z", "endTime": "2026-01-01T00:00Z"}
+
+    errors = validator.validate(profile)
+
+    assert errors == [{"path": "activeTime.endTime", "message": "endTime is before startTime"}]
+
+
+def test_invalid_geometry(validator: ProfileValidator, profile: dict):
+    profile["geometry"] = "POLYGON ((0 0, 100000 0, 0 100000, 0 0))"
+
+    errors = validator.validate(profile)
+
+    assert len(errors) == 1
+    assert errors[0]["path"] == "geometry"
+    assert "out of range" in errors[0]["message"]
+
+    profile["geometry"] = {"type": "Polygon"}
+    assert validator.validate(profile) == [{"path": "geometry", "message": "expected WKT string"}]
+
+
+def test_invalid_recurrence_rule(validator: ProfileValidator, profile: dict):
+    profile["activeTime"] = {
+        "startTime": "2026-01-01T00:00:00Z",
+        "endTime": "2026-01-01T02:00:00Z",
+        "recurrenceRule": "FREQ=SOMETIMES",
+    }
+
+    errors = validator.validate(profile)
+
+    assert len(errors) == 1
+    assert errors[0]["path"] == "activeTime.recurrenceRule"
+
+    profile["activeTime"]["recurrenceRule"] = "FREQ=MINUTELY"
+    errors = validator.validate(profile)
+    assert [error["path"] for error in errors] == ["activeTime.recurrenceRule"]
+    assert "HOURLY" in errors[0]["message"]
+
+    profile["activeTime"]["recurrenceRule"] = "FREQ=WEEKLY;BYDAY=SA,SU;COUNT=4"
+    assert validator.validate(profile) == []
+
+
+def test_units_must_match_weather_element(validator: ProfileValidator, profile: dict, threshold):
+    threshold.update(weatherElement="WindSpeed", units="Fahrenheit")
+
+    errors = validator.validate(profile)
+
+    assert len(errors) == 1
+    assert errors[0]["path"] == f"{THRESHOLD_PATH}.units"
+    assert "not valid for WindSpeed" in errors[0]["message"]
+
+
+def test_invalid_threshold_collects_all_errors(validator: ProfileValidator, profile, threshold):
+    threshold.update(weatherElement="Vibes", magnitude="32", minDurationHours=-1)
+    del threshold["source"]
+
+    errors = validator.validate(profile)
+
+    assert [error["path"] for error in errors] == [
+        f"{THRESHOLD_PATH}.weatherElement",
+        f"{THRESHOLD_PATH}.magnitude",
+        f"{THRESHOLD_PATH}.source",
+        f"{THRESHOLD_PATH}.minDurationHours",
+    ]
+
+
+def test_empty_impact_levels(validator: ProfileValidator, profile: dict):
+    profile["hazards"][0]["impactLevels"] = []
+
+    errors = validator.validate(profile)
+
+    assert errors[0]["path"] == "hazards[0].impactLevels"
+
+
+def test_validation_error_message():
+    error = ProfileValidationError(
+        [{"path": "name", "message": "missing property name"}, {"path": "id", "message": "oops"}]
+    )
+
+    assert str(error) == (
+        "JSON not valid Profile format; name: missing property name (and 1 more errors)"
+    )
+    assert isinstance(error, ValueError)
@@ -0,0 +1,161 @@
+"""Tests for src/spatial_index.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring
+
+import json
+import os
+
+from pytest import raises
+
+from python.nwsc_proxy.src.spatial_index import ProfileGeometry, SpatialIndex
+
+# constants
+GEOMETRY_CASES_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "idsse",
+    "testing",
+    "nwsc_gateway",
+    "geometry_cases.json",
+)
+with open(GEOMETRY_CASES_PATH, "r", encoding="utf-8") as file:
+    GEOMETRY_CASES: dict[str, list[dict]] = json.load(file)
+
+SQUARE = "POLYGON ((-106 39, -104 39, -104 41, -106 41, -106 39))"
+# square with a square hole in the middle
+DONUT = (
+    "POLYGON ((-106 39, -104 39, -104 41, -106 41, -106 39), "
+    "(-105.5 39.5, -104.5 39.5, -104.5 40.5, -105.5 40.5, -105.5 39.5))"
+)
+TWO_SQUARES = (
+    "MULTIPOLYGON (((-106 39, -104 39, -104 41, -106 41, -106 39)), "
+    "((10 50, 11 50, 11 51, 10 51, 10 50)))"
+)
+
+
+def test_parse_polygon():
+    geometry = ProfileGeometry.from_wkt(SQUARE)
+
+    assert geometry.bounds == (-106, 39, -104, 41)
+    assert len(geometry.polygons) == 1
+    assert geometry.polygons[0][0][0] == (-106, 39)
+
+
+def test_parse_multipolygon():
+    geometry = ProfileGeometry.from_wkt(TWO_SQUARES)
+
+    assert geometry.bounds == (-106, 39, 11, 51)
+    assert len(geometry.polygons) == 2
+
+
+def test_parse_rejects_other_geometries():
+    with raises(ValueError):
+        ProfileGeometry.from_wkt("POINT (-105 40)")
+    with raises(ValueError):
+        ProfileGeometry.from_wkt("POLYGON ((-105 40, -104 40))")
+
+
+def test_parse_rejects_coordinates_out_of_range():
+    for wkt in [
+        "POLYGON ((0 0, 100000 0, 0 100000, 0 0))",
+        "POLYGON ((-181 0, -179 0, -179 1, -181 0))",
+        "POLYGON ((0 89, 1 89, 1 91, 0 89))",
+    ]:
+        with raises(ValueError, match="out of range"):
+            ProfileGeometry.from_wkt(wkt)
+
+
+def test_contains():
+    geometry = ProfileGeometry.from_wkt(DONUT)
+
+    assert geometry.contains(-105.8, 40)
+    assert not geometry.contains(-105, 40)  # in the hole
+    assert not geometry.contains(-103, 40)
+
+
+def test_query_bbox_and_point():
+    index = SpatialIndex()
+    index.add("square", ProfileGeometry.from_wkt(SQUARE))
+    index.add("two", ProfileGeometry.from_wkt(TWO_SQUARES))
+
+    assert index.query_bbox((-105.2, 39.8, -104.8, 40.2)) == {"square", "two"}
+    assert index.query_bbox((10.5, 50.5, 12, 52)) == {"two"}
+    assert index.query_bbox((0, 0, 1, 1)) == set()
+    # inside bounding box of "two" but in neither of its polygons
+    assert index.query_point(0, 45) == set()
+    assert index.query_point(10.5, 50.5) == {"two"}
+
+
+def test_query_bbox_larger_than_occupied_cells():
+    index = SpatialIndex()
+    index.add("square", ProfileGeometry.from_wkt(SQUARE))
+
+    assert index.query_bbox((-180, -90, 180, 90)) == {"square"}
+
+
+def test_add_replaces_and_remove():
+    index = SpatialIndex()
+    index.add("profile", ProfileGeometry.from_wkt(SQUARE))
+    index.add("profile", ProfileGeometry.from_wkt("POLYGON ((10 50, 11 50, 11 51, 10 50))"))
+
+    assert len(index) == 1
+    assert index.query_point(-105, 40) == set()
+    assert index.query_bbox((10, 50, 11, 51)) == {"profile"}
+
+    index.remove("profile")
+    index.remove("profile")  # already removed; should do nothing
+
+    assert "profile" not in index
+    assert index.query_bbox((-180, -90, 180, 90)) == set()
+
+
+def test_large_geometry_in_overflow_bucket():
+    index = SpatialIndex(max_cells=4)
+    # touches 3x3 cells, more than max_cells, so is not listed in any cell
+    index.add("large", ProfileGeometry.from_wkt("POLYGON ((0 0, 2.5 0, 2.5 2.5, 0 2.5, 0 0))"))
+    index.add("square", ProfileGeometry.from_wkt(SQUARE))
+
+    assert not index._cells.keys() & {(0, 0), (2, 2)}  # pylint: disable=protected-access
+    assert index.query_bbox((2, 2, 3, 3)) == {"large"}
+    assert index.query_bbox((-105.5, 39.5, -105, 40)) == {"square"}
+    assert index.query_point(1, 1) == {"large"}
+    assert index.query_point(3, 3) == set()
+
+    index.remove("large")
+
+    assert "large" not in index
+    assert index.query_bbox((-180, -90, 180, 90)) == {"square"}
+
+
+def test_whole_world_geometry_indexed_quickly():
+    index = SpatialIndex()
+    index.add("world", ProfileGeometry.from_wkt("POLYGON ((-180 -90, 180 -90, 180 90, -180 -90))"))
+
+    assert len(index._cells) == 0  # pylint: disable=protected-access
+    assert index.query_point(179, -89) == {"world"}
+
+
+def test_geometry_cases():
+    # same cases as idsse.testing.utils.geometry is tested against, so both parse WKT alike
+    for case in GEOMETRY_CASES["valid"]:
+        geometry = ProfileGeometry.from_wkt(case["wkt"])
+
+        assert geometry.bounds == tuple(case["bounds"]), case["name"]
+        for lon, lat in case["inside"]:
+            assert geometry.contains(lon, lat), f'{case["name"]}: {lon}, {lat}'
+        for lon, lat in case["outside"]:
+            assert not geometry.contains(lon, lat), f'{case["name"]}: {lon}, {lat}'
+
+    for case in GEOMETRY_CASES["invalid"]:
+        with raises(ValueError):
+            ProfileGeometry.from_wkt(case["wkt"])
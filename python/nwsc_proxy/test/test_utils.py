@@ -0,0 +1,71 @@
+"""Tests for src/utils.py"""
+
+# ----------------------------------------------------------------------------------
+# Created on Mon Oct 19 2026
+#
+# Copyright (c) 2026 Colorado State University. All rights reserved.             (1)
+#
+# Contributors:
+#     Mackenzie Grimes (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring
+
+from copy import deepcopy
+
+from python.nwsc_proxy.src.utils import deep_update
+
+# constants
+ORIGINAL = {
+    "name": "My Profile",
+    "geometry": "POLYGON ((0 0, 0 1, 1 1, 0 0))",
+    "activeTime": {"startTime": "2026-01-01T00:00:00Z", "endTime": None},
+    "hazards": [{"id": "abc", "impactLevels": []}],
+    "settings": {"display": {"theme": "DARK", "units": "imperial"}, "alerts": True},
+}
+
+
+def test_deep_update_leaf():
+    original = deepcopy(ORIGINAL)
+
+    result = deep_update(original, {"settings": {"display": {"theme": "LIGHT"}}})
+
+    assert result["settings"] == {
+        "display": {"theme": "LIGHT", "units": "imperial"},
+        "alerts": True,
+    }
+    assert original == ORIGINAL  # original not changed
+
+
+def test_deep_update_shares_untouched_values():
+    original = deepcopy(ORIGINAL)
+
+    result = deep_update(original, {"settings": {"display": {"theme": "LIGHT"}}})
+
+    # untouched subtrees are reused, only the path to the change is copied
+    assert result["hazards"] is original["hazards"]
+    assert result["activeTime"] is original["activeTime"]
+    assert result["settings"] is not original["settings"]
+    assert result["settings"]["display"] is not original["settings"]["display"]
+
+
+def test_deep_update_null_deletes():
+    result = deep_update(ORIGINAL, {"geometry": None, "settings": {"alerts": None}, "other": None})
+
+    assert "geometry" not in result
+    assert "other" not in result
+    assert result["settings"] == {"display": {"theme": "DARK", "units": "imperial"}}
+
+
+def test_deep_update_keep_nulls():
+    result = deep_update(ORIGINAL, {"activeTime": {"startTime": None}}, delete_nulls=False)
+
+    assert result["activeTime"] == {"startTime": None, "endTime": None}
+
+
+def test_deep_update_replaces_non_dicts():
+    # RFC 7386: arrays are replaced wholesale, and an object replacing a non-object drops nulls
+    result = deep_update(ORIGINAL, {"hazards": [], "name": {"first": "A", "last": None}})
+
+    assert not result["hazards"]
+    assert result["name"] == {"first": "A"}
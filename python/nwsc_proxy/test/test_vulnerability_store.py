@@ -14,16 +14,22 @@
 import json
 import os
 import shutil
+import tracemalloc
 from copy import deepcopy
 from datetime import datetime, timedelta, UTC
 from glob import glob
+from math import inf
 from unittest.mock import Mock
 from uuid import uuid4, UUID
 
-from pytest import fixture, raises, MonkeyPatch
+from pytest import fixture, mark, raises, MonkeyPatch
 
 from python.nwsc_proxy.ncp_web_service import to_iso
-from python.nwsc_proxy.src.vulnerability_store import VulnerabilityStore, dt_parse
+from python.nwsc_proxy.src.vulnerability_store import (
+    ProfileValidationError,
+    VulnerabilityStore,
+    parse_datetime,
+)
 
 # constants
 RAW_JSON_PATH = os.path.join(os.path.dirname(__file__), "..", "src", "vulnerabilities")
@@ -31,6 +37,14 @@ RAW_JSON_PATH = os.path.join(os.path.dirname(__file__), "..", "src", "vulnerabil
 with open(f"{RAW_JSON_PATH}/nwsc_gsl_test_profiles.json", "r", encoding="utf-8") as file:
     EXAMPLE_PROFILE: dict = json.load(file)[0]
 
+# Vulnerabilities shipped in idsse/testing/nwsc_gateway, by ID
+NWSC_GATEWAY_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "idsse", "testing", "nwsc_gateway"
+)
+BOSTON_AIRPORT_ID = "f177061e-4980-4299-9553-f2fe8cdd977f"  # 22:00 to 03:00 UTC, Nov 24-25 2025
+MULTI_HAZARD_ID = "e1033860-f198-4c6a-a91b-beaec905132f"  # July 2026
+ANCHORAGE_ID = "fd35adec-d2a0-49a9-a320-df20a7b6d681"  # always active
+
 
 # fixtures
 @fixture
@@ -60,6 +74,26 @@ def store(base_dir: str, mock_uuid) -> VulnerabilityStore:
     return VulnerabilityStore(base_dir)
 
 
+@fixture
+def gateway_dir(tmp_path) -> str:
+    """Base dir holding only the (uniquely identified) Vulnerabilities in nwsc_gateway"""
+    # each file is a single Profile, like the ones the store saves itself
+    profile_dir = tmp_path / VulnerabilityStore.PROFILE_DIR
+    profile_dir.mkdir()
+    for name in ("boston_airport", "multi_hazard", "anchorage"):
+        shutil.copy(os.path.join(NWSC_GATEWAY_PATH, f"vulnerability_{name}.json"), profile_dir)
+    return str(tmp_path)
+
+
+@fixture
+def mock_datetime(monkeypatch: MonkeyPatch) -> Mock:
+    # before any of the nwsc_gateway Vulnerabilities have ended
+    mock_obj = Mock(name="MockDatetime")
+    mock_obj.now.return_value = datetime(2025, 11, 1, tzinfo=UTC)
+    monkeypatch.setattr("python.nwsc_proxy.src.vulnerability_store.datetime", mock_obj)
+    return mock_obj
+
+
 # tests
 def test_profile_store_loads_api_responses(store: VulnerabilityStore, base_dir: str):
     # pylint: disable=protected-access
@@ -75,6 +109,19 @@ def test_profile_store_loads_api_responses(store: VulnerabilityStore, base_dir:
         assert os.path.exists(filepath)
 
 
+def test_profile_store_skips_invalid_profiles(base_dir: str):
+    invalid_profile = deepcopy(EXAMPLE_PROFILE)
+    invalid_profile["id"] = str(uuid4())
+    invalid_profile["hazards"][0]["impactLevels"][0]["thresholdSet"][0]["units"] = "Parsecs"
+    with open(os.path.join(base_dir, "invalid.json"), "w", encoding="utf-8") as outfile:
+        json.dump([invalid_profile], outfile)
+
+    store = VulnerabilityStore(base_dir)
+
+    assert store.get(invalid_profile["id"]) is None
+    assert store.get(EXAMPLE_PROFILE["id"]) is not None
+
+
 def test_get_all_profiles(store: VulnerabilityStore):
     result = store.get_all()
     assert len(result) == 3
@@ -101,6 +148,47 @@ def test_get_profiles_by_office(store: VulnerabilityStore, mock_uuid: Mock):
     assert all(p["primaryOfficeId"] == expected_office for p in actual_profiles)
 
 
+def test_get_profiles_by_point(store: VulnerabilityStore):
+    # inside "GSL Test 2" polygon
+    actual_profiles = store.get_all(point=(-112.0, 46.6))
+    assert [p["id"] for p in actual_profiles] == ["a08370c6-ab87-4808-bd51-a8597e58410d"]
+
+    # inside bounding box of "GSL Test 2", but outside its polygon
+    assert store.get_all(point=(-112.25, 46.4)) == []
+
+
+def test_get_profiles_by_bbox(store: VulnerabilityStore):
+    # covers western Montana, so both Montana profiles but not Wyoming
+    actual_profiles = store.get_all(bbox=(-115, 46, -111, 48))
+    assert sorted(p["id"] for p in actual_profiles) == [
+        "a08370c6-ab87-4808-bd51-a8597e58410d",
+        "fd35adec-d2a0-49a9-a320-df20a7b6d681",
+    ]
+
+    # bbox and point must both match
+    actual_profiles = store.get_all(bbox=(-115, 46, -111, 48), point=(-113.9595, 46.8571))
+    assert [p["id"] for p in actual_profiles] == ["fd35adec-d2a0-49a9-a320-df20a7b6d681"]
+    assert store.get_all(bbox=(-80, 30, -70, 40)) == []
+
+
+def test_spatial_index_follows_save_update_delete(store: VulnerabilityStore, mock_uuid: Mock):
+    new_id = str(uuid4())
+    mock_uuid.return_value = UUID(new_id)
+    new_profile = deepcopy(EXAMPLE_PROFILE)
+    new_profile["geometry"] = "POLYGON ((-106 39, -104 39, -104 41, -106 41, -106 39))"
+    store.save(new_profile)
+
+    assert [p["id"] for p in store.get_all(point=(-105, 40))] == [new_id]
+
+    # move the profile to Florida
+    store.update(new_id, {"geometry": "POLYGON ((-82 27, -80 27, -80 29, -82 29, -82 27))"})
+    assert store.get_all(point=(-105, 40)) == []
+    assert [p["id"] for p in store.get_all(bbox=(-81.5, 27.5, -81, 28))] == [new_id]
+
+    store.delete(new_id)
+    assert store.get_all(bbox=(-81.5, 27.5, -81, 28)) == []
+
+
 def test_skips_expired_profile(store: VulnerabilityStore, mock_uuid: Mock):
     expected_id = str(uuid4())
     mock_uuid.return_value = expected_id
@@ -120,6 +208,112 @@ def test_skips_expired_profile(store: VulnerabilityStore, mock_uuid: Mock):
     assert expected_id not in actual_profile_ids
 
 
+def test_get_profiles_active_at(store: VulnerabilityStore, mock_uuid: Mock):
+    # fixture profiles have no startTime or endTime, so are always active
+    assert len(store.get_all(active_at=0)) == 3
+    assert len(store.get_all(active_at=parse_datetime("2099-01-01T00:00:00Z").timestamp())) == 3
+
+    # 2 hours every Saturday and Sunday, starting last weekend, so first occurrence has ended
+    recurring_id = str(uuid4())
+    mock_uuid.return_value = UUID(recurring_id)
+    saturday = datetime.now(UTC).replace(hour=10, minute=0, second=0, microsecond=0)
+    saturday -= timedelta(days=(saturday.weekday() - 5) % 7 or 7)
+    recurring_profile = deepcopy(EXAMPLE_PROFILE)
+    recurring_profile["activeTime"] = {
+        "startTime": to_iso(saturday),
+        "endTime": to_iso(saturday + timedelta(hours=2)),
+        "recurrenceRule": "FREQ=WEEKLY;BYDAY=SA,SU",
+    }
+    store.save(recurring_profile)
+
+    # still returned by default, since later occurrences haven't ended
+    assert recurring_id in [p["id"] for p in store.get_all()]
+
+    next_saturday = saturday + timedelta(days=7, hours=1)
+    actual_ids = [p["id"] for p in store.get_all(active_at=next_saturday.timestamp())]
+    assert recurring_id in actual_ids
+    assert len(actual_ids) == 4
+    next_monday = next_saturday + timedelta(days=2)
+    actual_ids = [p["id"] for p in store.get_all(active_at=next_monday.timestamp())]
+    assert recurring_id not in actual_ids
+    assert len(actual_ids) == 3
+
+
+def test_get_profiles_active_between(store: VulnerabilityStore, mock_uuid: Mock):
+    upcoming_id = str(uuid4())
+    mock_uuid.return_value = UUID(upcoming_id)
+    start = datetime.now(UTC).replace(microsecond=0) + timedelta(days=2)
+    upcoming_profile = deepcopy(EXAMPLE_PROFILE)
+    upcoming_profile["activeTime"] = {
+        "startTime": to_iso(start),
+        "endTime": to_iso(start + timedelta(hours=3)),
+        "recurrenceRule": "",
+    }
+    store.save(upcoming_profile)
+
+    window = (start - timedelta(days=1)).timestamp(), (start + timedelta(hours=1)).timestamp()
+    assert upcoming_id in [p["id"] for p in store.get_all(active_between=window)]
+    window = (start - timedelta(days=2)).timestamp(), (start - timedelta(days=1)).timestamp()
+    actual_ids = [p["id"] for p in store.get_all(active_between=window)]
+    assert upcoming_id not in actual_ids
+    assert len(actual_ids) == 3
+
+
+@mark.parametrize("max_cache_bytes", [None, 0])
+def test_get_gateway_profiles_active_at(
+    gateway_dir: str, mock_datetime: Mock, max_cache_bytes: int | None
+):
+    store = VulnerabilityStore(gateway_dir, max_cache_bytes=max_cache_bytes)
+
+    def active_ids(timestamp: str) -> set[str]:
+        return {p["id"] for p in store.get_all(active_at=parse_datetime(timestamp).timestamp())}
+
+    assert active_ids("2025-11-24T21:59:59Z") == {ANCHORAGE_ID}
+    # from the exact start, across midnight, to the exact end
+    for timestamp in (
+        "2025-11-24T22:00:00Z",
+        "2025-11-25T00:00:00Z",
+        "2025-11-25T03:00:00.000Z",
+    ):
+        assert active_ids(timestamp) == {ANCHORAGE_ID, BOSTON_AIRPORT_ID}
+    assert active_ids("2025-11-25T03:00:01Z") == {ANCHORAGE_ID}
+    assert active_ids("2026-07-01T21:59:59Z") == {ANCHORAGE_ID}
+    assert active_ids("2026-07-01T22:00:00Z") == {ANCHORAGE_ID, MULTI_HAZARD_ID}
+    assert active_ids("2026-08-01T03:00:00Z") == {ANCHORAGE_ID, MULTI_HAZARD_ID}
+    assert active_ids("2026-08-01T03:00:01Z") == {ANCHORAGE_ID}
+
+
+@mark.parametrize("max_cache_bytes", [None, 0])
+def test_get_gateway_profiles_active_between(
+    gateway_dir: str, mock_datetime: Mock, max_cache_bytes: int | None
+):
+    store = VulnerabilityStore(gateway_dir, max_cache_bytes=max_cache_bytes)
+
+    def active_ids(start: str, end: str) -> set[str]:
+        window = parse_datetime(start).timestamp(), parse_datetime(end).timestamp()
+        return {p["id"] for p in store.get_all(active_between=window)} - {ANCHORAGE_ID}
+
+    # windows that only touch a Profile's start or end still overlap it
+    assert active_ids("2025-11-24T12:00:00Z", "2025-11-24T22:00:00Z") == {BOSTON_AIRPORT_ID}
+    assert active_ids("2025-11-24T12:00:00Z", "2025-11-24T21:59:59Z") == set()
+    assert active_ids("2025-11-25T03:00:00Z", "2025-11-25T12:00:00Z") == {BOSTON_AIRPORT_ID}
+    assert active_ids("2025-11-25T03:00:01Z", "2026-07-01T21:59:59Z") == set()
+    assert active_ids("2026-07-31T00:00:00Z", "2026-08-02T00:00:00Z") == {MULTI_HAZARD_ID}
+    assert active_ids("2025-01-01T00:00:00Z", "2027-01-01T00:00:00Z") == {
+        BOSTON_AIRPORT_ID,
+        MULTI_HAZARD_ID,
+    }
+
+
+def test_gateway_profiles_ended(gateway_dir: str, mock_datetime: Mock):
+    store = VulnerabilityStore(gateway_dir)
+    mock_datetime.now.return_value = datetime(2025, 11, 25, 3, 0, 1, tzinfo=UTC)
+
+    # Boston airport has ended, so is skipped, however it is queried
+    assert {p["id"] for p in store.get_all()} == {ANCHORAGE_ID, MULTI_HAZARD_ID}
+    assert [p["id"] for p in store.get_all(active_at=0)] == [ANCHORAGE_ID]
+
+
 def test_get_one_profile(store: VulnerabilityStore):
     expected_id = EXAMPLE_PROFILE["id"]
 
@@ -161,6 +355,21 @@ def test_save_ignores_profile_id(store: VulnerabilityStore, mock_uuid: Mock):
     assert new_profile["id"] not in updated_profile_list
 
 
+def test_save_rejects_invalid_profile(store: VulnerabilityStore, base_dir: str):
+    new_profile = deepcopy(EXAMPLE_PROFILE)
+    new_profile["hazards"][0]["impactLevels"][0]["thresholdSet"][0]["operator"] = "ABOUT"
+
+    with raises(ProfileValidationError) as exc:
+        store.save(new_profile)
+
+    assert exc.value.errors == [
+        {
+            "path": "hazards[0].impactLevels[0].thresholdSet[0].operator",
+            "message": "unknown operator ABOUT",
+        }
+    ]
+
+
 def test_delete_profile(store: VulnerabilityStore, base_dir: str):
     existing_profile_list = store.get_all()
     profile_id = existing_profile_list[0]["id"]
@@ -196,11 +405,26 @@ def test_update_profile_success(store: VulnerabilityStore):
     # profile in cache should have indeed been changed
     refetched_profile = store._cache.get(profile_id)  # pylint: disable=protected-access
     assert refetched_profile.name == new_name
-    assert datetime.fromtimestamp(refetched_profile.start_timestamp, UTC) == dt_parse(new_start_dt)
+    assert datetime.fromtimestamp(refetched_profile.start_timestamp, UTC) == parse_datetime(
+        new_start_dt
+    )
     # attribute unrelated to the update was unmodified
     assert refetched_profile.office == expected_office
 
 
+def test_update_profile_clear_end_time(store: VulnerabilityStore):
+    profile_id = EXAMPLE_PROFILE["id"]
+
+    # null removes endTime (JSON merge patch), making the Profile never-ending
+    updated_profile = store.update(profile_id, {"activeTime": {"endTime": None}})
+
+    assert updated_profile is not None
+    assert "endTime" not in updated_profile["activeTime"]
+    refetched_profile = store._cache.get(profile_id)  # pylint: disable=protected-access
+    assert refetched_profile.end_timestamp == inf
+    assert profile_id in [profile["id"] for profile in store.get_all()]
+
+
 def test_update_profile_error_rollback(store: VulnerabilityStore):
     profile_id = EXAMPLE_PROFILE["id"]
     expected_office = EXAMPLE_PROFILE["primaryOfficeId"]
@@ -218,6 +442,17 @@ def test_update_profile_error_rollback(store: VulnerabilityStore):
     assert refetched_profile.office == expected_office
 
 
+def test_update_profile_invalid(store: VulnerabilityStore):
+    profile_id = EXAMPLE_PROFILE["id"]
+    update_data = {"name": "A different name", "activeTime": {"startTime": "next tuesday-ish"}}
+
+    with raises(ProfileValidationError):
+        store.update(profile_id, update_data)
+
+    # profile in cache was not changed
+    assert store.get(profile_id)["name"] == EXAMPLE_PROFILE["name"]
+
+
 def test_update_profile_not_found(store: VulnerabilityStore):
     profile_id = "11111111-2222-3333-444444444444"  # fake ID does not exist in ProfileStore
     new_profile_data = {"name": "A different name"}
@@ -226,3 +461,122 @@ def test_update_profile_not_found(store: VulnerabilityStore):
         _ = store.update(profile_id, new_profile_data)
 
     assert exc is not None
+
+
+# memory-bounded mode: only the largest example Profile (~14kB) fits in cache at once
+MAX_CACHE_BYTES = 16_000
+
+
+def test_bounded_store_evicts_least_recently_used(base_dir: str):
+    store = VulnerabilityStore(base_dir, max_cache_bytes=MAX_CACHE_BYTES)
+
+    info = store.cache_info()
+    assert info["bounded"]
+    assert info["profiles"] == 3
+    assert info["entries"] == 1
+    assert info["evictions"] == 2
+    assert 0 < info["bytes"] <= MAX_CACHE_BYTES
+
+    # every Profile is still returned in full, reading evicted ones from disk
+    assert store.get(EXAMPLE_PROFILE["id"]) == EXAMPLE_PROFILE
+    assert store.get(EXAMPLE_PROFILE["id"]) == EXAMPLE_PROFILE
+    assert len(store.get_all()) == 3
+
+    info = store.cache_info()
+    assert info["hits"] >= 1
+    assert info["misses"] >= 1
+    assert info["hitRate"] == info["hits"] / (info["hits"] + info["misses"])
+    assert info["entries"] == 1
+
+
+def test_bounded_store_filters_without_full_profiles(base_dir: str):
+    store = VulnerabilityStore(base_dir, max_cache_bytes=0)  # no full Profiles cached
+
+    assert [p["id"] for p in store.get_all(point=(-112.0, 46.6))] == [
+        "a08370c6-ab87-4808-bd51-a8597e58410d"
+    ]
+    assert store.get_all(point=(-112.25, 46.4)) == []
+    assert len(store.get_all(office=EXAMPLE_PROFILE["primaryOfficeId"])) >= 1
+    assert store.cache_info()["entries"] == 0
+
+
+def test_bounded_store_summaries_keep_only_bounds(base_dir: str):
+    store = VulnerabilityStore(base_dir, max_cache_bytes=0)
+
+    for summary in store._cache.values():  # pylint: disable=protected-access
+        assert summary.data is None
+        assert not hasattr(summary.geometry, "polygons")  # bounding box only
+
+
+def test_unbounded_store_does_not_measure_sizes(store: VulnerabilityStore):
+    info = store.cache_info()
+
+    assert not info["bounded"]
+    assert info["entries"] == info["profiles"] == 3
+    assert info["bytes"] is None
+
+
+def test_bounded_store_update_and_delete(base_dir: str):
+    store = VulnerabilityStore(base_dir, max_cache_bytes=MAX_CACHE_BYTES)
+    profile_id = EXAMPLE_PROFILE["id"]
+
+    updated_profile = store.update(profile_id, {"name": "A different name"})
+
+    assert updated_profile["name"] == "A different name"
+    assert store.get(profile_id)["name"] == "A different name"
+    assert store._cache[profile_id].data is None  # pylint: disable=protected-access
+
+    assert store.delete(profile_id)
+    assert store.get(profile_id) is None
+    assert store.cache_info()["profiles"] == 2
+
+
+def test_bounded_store_saves_profiles_to_own_files(base_dir: str):
+    # Profiles listed in an API response file in profile dir get their own files, to be re-read
+    profile_dir = os.path.join(base_dir, VulnerabilityStore.PROFILE_DIR)
+    os.makedirs(profile_dir)
+    new_profile = {**deepcopy(EXAMPLE_PROFILE), "id": str(uuid4())}
+    with open(os.path.join(profile_dir, "response.json"), "w", encoding="utf-8") as outfile:
+        json.dump([new_profile], outfile)
+
+    store = VulnerabilityStore(base_dir, max_cache_bytes=0)
+
+    assert os.path.exists(os.path.join(profile_dir, f'{new_profile["id"]}.json'))
+    assert store.get(new_profile["id"]) == new_profile
+
+
+def test_bounded_store_memory_flat_with_recurring_profiles(base_dir: str):
+    # a year of daily occurrences: about 25kB of intervals per Profile, if summaries held them
+    start = datetime.now(UTC).replace(hour=6, minute=0, second=0, microsecond=0)
+    recurring_profile = {
+        **deepcopy(EXAMPLE_PROFILE),
+        "activeTime": {
+            "startTime": to_iso(start),
+            "endTime": to_iso(start + timedelta(hours=2)),
+            "recurrenceRule": "FREQ=DAILY",
+        },
+    }
+    store = VulnerabilityStore(base_dir, max_cache_bytes=100_000)
+    batch_size = 5
+
+    def save_and_query() -> set[str]:
+        saved_ids = {store.save(recurring_profile)["id"] for _ in range(batch_size)}
+        active_at = (start + timedelta(days=3, hours=1)).timestamp()
+        assert saved_ids <= {p["id"] for p in store.get_all(active_at=active_at)}
+        return saved_ids
+
+    save_and_query()  # first batch fills the cache, and imports dateutil
+    tracemalloc.start()
+    try:
+        save_and_query()
+        before, _ = tracemalloc.get_traced_memory()
+        saved_ids = save_and_query()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # summaries hold no intervals; the cache holds them, and counts them towards its limit
+    assert after - before < batch_size * 10_000
+    assert store.cache_info()["bytes"] <= 100_000
+    # pylint: disable-next=protected-access
+    assert all(store._cache[profile_id].schedule.end == inf for profile_id in saved_ids)
@@ -70,6 +70,7 @@ setup(
         "pika",
         "jsonschema",
         "netcdf4",
+        "numpy",
         "h5netcdf",
         "python-logging-rabbitmq",
         "zarr",
@@ -80,7 +81,10 @@ setup(
         "develop": [
             "pytest",
             "pytest-cov",
-        ]
+        ],
+        "stream": ["ijson"],
+        "arrow": ["pyarrow"],
+        "grib": ["cfgrib"],
     },
     zip_safe=False,
 )